@@ -29,11 +29,46 @@ from ai_agents.prompt_manager import PromptManager
 from ai_agents.optimized_player_profiles import OptimizedPlayerProfiles
 from ai_agents.model_selector import ModelSelector
 from ai_agents.comprehensive_data_processor import ComprehensiveDataProcessor
+from ai_agents.llm_response_cache import LLMResponseCache, llm_cache_disabled
+from ai_agents.llm_streaming import (StreamMetrics, ProgressiveReportWriter, iter_llm_stream,
+                                     format_metrics_markdown, live_report_header)
+from ai_agents.context_packer import ContextPacker
+from ai_agents.token_accounting import count_tokens
+from ai_agents.prompt_caching import build_request, cache_usage, PROMPT_CACHE_FIELDS
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Sampling parameters for every analysis call (part of the response cache key)
+LLM_SAMPLING_PARAMS = {"temperature": 0.7, "max_tokens": 4000}
+
+# Share of the model's remaining context window a packed prompt may use
+# (prompt tokens are counted with cl100k_base, which differs from Claude's tokenizer)
+PROMPT_BUDGET_SHARE = 0.9
+
+# Fields stamped with the time the data was gathered; they are left out of
+# prompts so identical analyses render identical prompts (and cache keys)
+PROMPT_VOLATILE_FIELDS = ("timestamp",)
+
+
+def prompt_json(data: Dict[str, Any]) -> str:
+    """
+    JSON for a prompt, without the gathering timestamps of the data and its news items
+    
+    Args:
+        data: Analysis data or web research
+    """
+    def stable(entry):
+        if isinstance(entry, dict):
+            return {key: value for key, value in entry.items() if key not in PROMPT_VOLATILE_FIELDS}
+        return entry
+    
+    rendered = stable(data)
+    if isinstance(rendered.get("news_items"), list):
+        rendered["news_items"] = [stable(item) for item in rendered["news_items"]]
+    return json.dumps(rendered, indent=2)
+
 class AnalystAgent:
     """
     Fantasy Football Analyst Agent
@@ -42,13 +77,16 @@ class AnalystAgent:
     Supports multiple LLM providers with conversation memory and data collection orchestration.
     """
     
-    def __init__(self, model_provider: str = "anthropic", model_name: str = "claude-opus-4-1-20250805"):
+    def __init__(self, model_provider: str = "anthropic", model_name: str = "claude-opus-4-1-20250805",
+                 bypass_cache: bool = False, stream: bool = False):
         """
         Initialize the Analyst Agent
         
         Args:
             model_provider: "openai" or "anthropic" (default: "anthropic")
             model_name: Specific model name (default: "claude-opus-4-1-20250805")
+            bypass_cache: Always call the LLM, replacing any cached response
+            stream: Stream responses as they are generated (printed and written to a live report)
         """
         self.model_provider = model_provider.lower()
         self.model_name = model_name
@@ -64,6 +102,15 @@ class AnalystAgent:
         # Initialize LLM client
         self._init_llm_client()
         
+        # Identical requests (same prompts, model and sampling params) are answered locally
+        self.response_cache = None if llm_cache_disabled() else LLMResponseCache()
+        self.bypass_cache = bypass_cache
+        
+        # Streaming mode and timing of the last LLM call (time to first token, tokens/sec)
+        self.stream = stream
+        self.live_report_dir = os.path.join(project_root, "data_collection", "outputs", "analyst_reports", "live")
+        self.last_llm_metrics: Dict[str, Any] = {}
+        
         # System prompt for the analyst (loaded from external file)
         self.system_prompt = self.prompt_manager.get_system_prompt('analyst_agent')
         
@@ -157,6 +204,7 @@ class AnalystAgent:
             "analysis_data": analysis_data,
             "web_research": web_research,
             "analysis": llm_response,
+            "llm_metrics": dict(self.last_llm_metrics),
             "resources_used": self._extract_resources_used(analysis_data, web_research)
         }
         
@@ -266,6 +314,7 @@ class AnalystAgent:
             "roster_analysis": roster_analysis,
             "web_research": web_research,
             "analysis": llm_response,  # Use 'analysis' key for consistency
+            "llm_metrics": dict(self.last_llm_metrics),
             "analysis_type": "optimized_profiles",
             "data_summary": self._create_data_summary(optimized_data, roster_analysis, web_research)
         }
@@ -393,12 +442,27 @@ Please provide a comprehensive analysis with specific recommendations for improv
         return prompt
     
     def analyze_with_comprehensive_data(self, user_prompt: str, player_limits: Dict[str, int] = None, 
-                                      collect_data: bool = False, model_selection: bool = True) -> Dict[str, Any]:
-        """Analyze with comprehensive data including roster, opponent, and available players"""
+                                      collect_data: bool = False, model_selection: bool = True,
+                                      token_budget: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Analyze with comprehensive data including roster, opponent, and available players
+        
+        The prompt is packed to a token budget: players and fields are chosen by
+        value (starters and the opponent first, then waiver targets by projection)
+        until the budget is spent. Without player_limits the candidate pool is the
+        maximum per position and the budget decides how many make it in.
+        
+        Args:
+            token_budget: Maximum prompt tokens (default: what the model's context
+                window leaves after the system prompt and the response)
+        """
+        
+        if token_budget is None:
+            token_budget = self._default_prompt_budget()
         
         if player_limits is None:
-            from config.player_limits import DEFAULT_PLAYER_LIMITS
-            player_limits = DEFAULT_PLAYER_LIMITS
+            from config.player_limits import DEFAULT_PLAYER_LIMITS, MAX_PLAYER_LIMITS
+            player_limits = MAX_PLAYER_LIMITS if token_budget else DEFAULT_PLAYER_LIMITS
         
         logger.info("Starting comprehensive analysis...")
         
@@ -415,14 +479,25 @@ Please provide a comprehensive analysis with specific recommendations for improv
         logger.info("Performing web research...")
         web_research = self.tools.research_current_nfl_news()
         
-        # Build comprehensive prompt
-        prompt = self._build_comprehensive_analysis_prompt(
-            user_prompt, comprehensive_data, web_research
-        )
+        # Build comprehensive prompt blocks, packed to the token budget
+        blocks = {}
+        
+        def render(data: Dict[str, Any]) -> str:
+            # The packer's last render is the prompt it returns, so blocks holds that prompt's parts
+            blocks["context"], blocks["request"] = self._build_comprehensive_prompt_blocks(
+                user_prompt, data, web_research
+            )
+            return f"{blocks['context']}\n\n{blocks['request']}"
+        
+        context_packing = {}
+        if token_budget:
+            _, context_packing = ContextPacker(token_budget).fit_prompt(comprehensive_data, render)
+        else:
+            render(comprehensive_data)
         
-        # Generate analysis with LLM
+        # Generate analysis with LLM (the stable context block is cached by the provider)
         logger.info("Generating analysis with LLM...")
-        analysis = self._call_llm(prompt)
+        analysis = self._call_llm(blocks["request"], context_blocks=[blocks["context"]])
         
         # Save comprehensive reports with week number
         saved_files = self._save_comprehensive_reports_with_week(
@@ -434,15 +509,40 @@ Please provide a comprehensive analysis with specific recommendations for improv
             "model_provider": self.model_provider,
             "model_name": self.model_name,
             "analysis": analysis,
+            "llm_metrics": dict(self.last_llm_metrics),
             "comprehensive_data": comprehensive_data,
             "web_research": web_research,
             "saved_files": saved_files,
-            "total_tokens": comprehensive_data.get("total_tokens", 0)
+            "total_tokens": comprehensive_data.get("total_tokens", 0),
+            "context_packing": context_packing
         }
     
+    def _default_prompt_budget(self) -> Optional[int]:
+        """Prompt tokens the model's context window leaves after the system prompt and response"""
+        context_window = ModelSelector().get_context_window(self.model_provider, self.model_name)
+        if not context_window:
+            return None
+        remaining = context_window - count_tokens(self.system_prompt) - LLM_SAMPLING_PARAMS["max_tokens"]
+        return max(0, int(remaining * PROMPT_BUDGET_SHARE))
+    
     def _build_comprehensive_analysis_prompt(self, user_prompt: str, comprehensive_data: Dict[str, Any], 
                                            web_research: Dict[str, Any]) -> str:
         """Build comprehensive analysis prompt with all data"""
+        context_block, request_block = self._build_comprehensive_prompt_blocks(
+            user_prompt, comprehensive_data, web_research
+        )
+        return f"{context_block}\n\n{request_block}"
+    
+    def _build_comprehensive_prompt_blocks(self, user_prompt: str, comprehensive_data: Dict[str, Any],
+                                           web_research: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Build the comprehensive analysis prompt as (context, request) blocks
+        
+        The context block (league metadata, rosters, available players, matchups
+        and instructions) is the same for every request on the same data, so it
+        is sent first and cached by the provider. The web research and the user
+        request change from call to call and follow it.
+        """
         
         season_context = comprehensive_data.get("season_context", {})
         league_metadata = comprehensive_data.get("league_metadata", {})
@@ -457,9 +557,7 @@ Please provide a comprehensive analysis with specific recommendations for improv
         team_name = league_metadata.get("team_name", "Unknown Team")
         opponent_name = opponent_roster.get("opponent_name", "Unknown Opponent")
         
-        prompt = f"""USER REQUEST: {user_prompt}
-
-CRITICAL CONTEXT: This is the {nfl_season} NFL season, Week {current_week}. You are analyzing for {team_name} in {league_name}.
+        context_block = f"""CRITICAL CONTEXT: This is the {nfl_season} NFL season, Week {current_week}. You are analyzing for {team_name} in {league_name}.
 
 ## LEAGUE METADATA
 - **League Name**: {league_name}
@@ -483,9 +581,6 @@ CRITICAL CONTEXT: This is the {nfl_season} NFL season, Week {current_week}. You
 ## TRANSACTION TRENDS
 {json.dumps(transaction_trends, indent=2)}
 
-## WEB RESEARCH
-{json.dumps(web_research, indent=2)}
-
 ## ANALYSIS INSTRUCTIONS
 
 ### 1. DATA UTILIZATION REQUIREMENTS
@@ -537,11 +632,16 @@ CRITICAL CONTEXT: This is the {nfl_season} NFL season, Week {current_week}. You
 - **Position Depth**: Ensure adequate depth at each position to handle bye weeks
 - **Strategic Planning**: Plan 2-3 weeks ahead for bye week management
 - **Matchup Advantage**: Use opponent's bye week weaknesses to your advantage
-- **Emergency Planning**: Identify backup options for critical bye week weeks
+- **Emergency Planning**: Identify backup options for critical bye week weeks"""
+        
+        request_block = f"""## WEB RESEARCH
+{prompt_json(web_research)}
+
+USER REQUEST: {user_prompt}
 
 Please provide a comprehensive analysis with specific recommendations for improving your roster."""
         
-        return prompt
+        return context_block, request_block
     
     def _save_comprehensive_reports(self, comprehensive_data: Dict[str, Any], 
                                   web_research: Dict[str, Any], analysis: str) -> Dict[str, str]:
@@ -604,7 +704,8 @@ Please provide a comprehensive analysis with specific recommendations for improv
                 "model_provider": self.model_provider,
                 "model_name": self.model_name,
                 "timestamp": timestamp,
-                "week": current_week
+                "week": current_week,
+                "llm_metrics": self.last_llm_metrics
             }, f, indent=2)
         
         # Save comprehensive markdown with week number
@@ -641,6 +742,7 @@ Please provide a comprehensive analysis with specific recommendations for improv
         
         season_context = comprehensive_data.get("season_context", {})
         league_metadata = comprehensive_data.get("league_metadata", {})
+        generation_text = "".join(f"{line}\n" for line in format_metrics_markdown(self.last_llm_metrics))
         
         markdown_content = f"""# Fantasy Football Comprehensive Analysis Report
 
@@ -660,7 +762,7 @@ Please provide a comprehensive analysis with specific recommendations for improv
 - **Available Players:** {comprehensive_data.get('available_players', {}).get('total_players', 0)}
 - **Web Research Items:** {len(web_research.get('news_items', []))}
 - **Total Tokens Used:** {comprehensive_data.get('total_tokens', 0):,}
-
+{generation_text}
 ## Analysis
 
 {analysis}
@@ -1001,10 +1103,10 @@ SEASON CONTEXT VERIFICATION:
 - Verification Notes: {season_context.get('verification_notes', [])}
 
 CURRENT DATA ANALYSIS ({nfl_season} SEASON):
-{json.dumps(analysis_data, indent=2)}
+{prompt_json(analysis_data)}
 
 WEB RESEARCH FINDINGS ({nfl_season} SEASON):
-{json.dumps(web_research, indent=2)}
+{prompt_json(web_research)}
 
 IMPORTANT: Before making any recommendations, verify all player-team relationships and current situations against the provided data. Do not assume player situations from your training data. Use only the {nfl_season} season information provided above.
 
@@ -1012,32 +1114,113 @@ Please provide a comprehensive analysis following the format specified in your s
         
         return prompt
     
-    def _call_llm(self, prompt: str) -> str:
-        """Call the appropriate LLM with the prompt"""
+    def _call_llm(self, prompt: str, bypass_cache: Optional[bool] = None,
+                  stream: Optional[bool] = None, context_blocks: Optional[List[str]] = None) -> str:
+        """
+        Call the appropriate LLM with the prompt
+        
+        Responses are served from the local response cache when the provider,
+        model, system prompt, prompt and sampling params are unchanged. In
+        streaming mode tokens are printed and written to a live report as they
+        arrive. The system prompt and context blocks are sent first and marked
+        for provider prompt caching. Timing and prompt cache token counts for
+        the call are kept in self.last_llm_metrics.
+        
+        Args:
+            prompt: User prompt (the part that changes between calls)
+            bypass_cache: Skip the cache lookup for this call (default: the agent's bypass_cache)
+            stream: Stream the response (default: the agent's stream setting)
+            context_blocks: Stable data blocks (league, rosters) sent before the prompt
+        """
+        sampling_params = dict(LLM_SAMPLING_PARAMS)
+        bypass = self.bypass_cache if bypass_cache is None else bypass_cache
+        use_stream = self.stream if stream is None else stream
+        full_prompt = "\n\n".join(context_blocks + [prompt]) if context_blocks else prompt
+        
+        cache_key = None
+        if self.response_cache:
+            cache_key = LLMResponseCache.make_key(self.model_provider, self.model_name,
+                                                  self.system_prompt, full_prompt, sampling_params)
+            if bypass:
+                self.response_cache.record_bypass()
+            else:
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    logger.info("LLM response served from local cache")
+                    self.last_llm_metrics = {"cached": True, "streamed": False}
+                    if use_stream:
+                        print(cached)
+                    return cached
+        
+        text = None
         try:
-            if self.model_provider == "openai":
-                response = self.client.chat.completions.create(
-                    model=self.model_name,
-                    messages=[
-                        {"role": "system", "content": self.system_prompt},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.7,
-                    max_tokens=4000
-                )
-                return response.choices[0].message.content
-            elif self.model_provider == "anthropic":
-                response = self.client.messages.create(
-                    model=self.model_name,
-                    max_tokens=4000,
-                    temperature=0.7,
-                    system=self.system_prompt,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                return response.content[0].text
+            if use_stream:
+                text = self._stream_llm(prompt, sampling_params, context_blocks)
+            else:
+                metrics = StreamMetrics(streamed=False)
+                request = build_request(self.model_provider, self.model_name, self.system_prompt,
+                                        prompt, context_blocks)
+                if self.model_provider == "openai":
+                    response = self.client.chat.completions.create(**request, **sampling_params)
+                    text = response.choices[0].message.content
+                else:
+                    response = self.client.messages.create(**request, **sampling_params)
+                    text = response.content[0].text
+                metrics.record_chunk(text or "")
+                usage = cache_usage(self.model_provider, getattr(response, 'usage', None))
+                self.last_llm_metrics = self._llm_metrics(metrics, usage)
         except Exception as e:
             logger.error(f"LLM call failed: {e}")
             return f"Error generating analysis: {e}"
+        
+        if cache_key and text:
+            self.response_cache.put(cache_key, text, {"provider": self.model_provider, "model": self.model_name})
+        return text
+    
+    def _llm_metrics(self, metrics: StreamMetrics, usage: Dict[str, int]) -> Dict[str, Any]:
+        """Timing summary plus the prompt cache token counts the provider reported"""
+        summary = metrics.summary(usage.get('output_tokens'))
+        summary.update({field: usage[field] for field in PROMPT_CACHE_FIELDS if field in usage})
+        if usage.get('cache_read_tokens') or usage.get('cache_write_tokens'):
+            logger.info(f"Prompt cache: {usage.get('cache_read_tokens', 0):,} tokens read, "
+                        f"{usage.get('cache_write_tokens', 0):,} written")
+        return summary
+    
+    def _stream_llm(self, prompt: str, sampling_params: Dict[str, Any],
+                    context_blocks: Optional[List[str]] = None) -> str:
+        """
+        Stream a completion, echoing it to the console and writing it to a live report.
+        
+        The live report is <live_report_dir>/<timestamp>_analysis.md
+        (default: data_collection/outputs/analyst_reports/live).
+        
+        Returns:
+            The full response text
+        """
+        timestamp = datetime.now(self.pacific_tz).strftime("%Y%m%d_%H%M%S")
+        report_path = os.path.join(self.live_report_dir, f"{timestamp}_analysis.md")
+        metrics = StreamMetrics()
+        usage = {}
+        chunks = []
+        
+        with ProgressiveReportWriter(report_path, live_report_header(self.model_provider, self.model_name,
+                                                                     self.pacific_tz)) as writer:
+            logger.info(f"Streaming analysis to {report_path}")
+            for text in iter_llm_stream(self.client, self.model_provider, self.model_name,
+                                        self.system_prompt, prompt, sampling_params, usage, context_blocks):
+                metrics.record_chunk(text)
+                chunks.append(text)
+                writer.write(text)
+                print(text, end="", flush=True)
+            print()
+            
+            self.last_llm_metrics = self._llm_metrics(metrics, usage)
+            self.last_llm_metrics["report_path"] = report_path
+            writer.finish("\n\n## Generation\n\n" + "\n".join(format_metrics_markdown(self.last_llm_metrics)) + "\n")
+        
+        logger.info(f"Streamed {self.last_llm_metrics['output_tokens']} tokens, "
+                    f"first token after {self.last_llm_metrics['time_to_first_token_s']}s")
+        return "".join(chunks)
     
     def _extract_resources_used(self, analysis_data: Dict, web_research: Dict) -> List[str]:
         """Extract list of resources used in analysis"""
@@ -1115,12 +1298,16 @@ Please provide a comprehensive analysis following the format specified in your s
         
         source_files_text = "\n".join(source_files) if source_files else "No source files identified"
         
+        # LLM timing (time to first token, tokens/sec) when recorded
+        metrics_lines = format_metrics_markdown(analysis_result.get('llm_metrics', {}))
+        generation_text = "\n" + "\n".join(metrics_lines) + "\n" if metrics_lines else ""
+        
         markdown_content = f"""# Fantasy Football Analysis Report
 
 **Generated:** {datetime.now(self.pacific_tz).strftime('%Y-%m-%d %H:%M:%S %Z')}
 **Model:** {self.model_provider} - {self.model_name}
 **Season Context:** {nfl_season} - Week {current_week} ({season_phase})
-
+{generation_text}
 ## Source Files Used
 {source_files_text}
 
@@ -1173,7 +1360,7 @@ def main():
     print("=" * 50)
     
     # Initialize agent
-    agent = AnalystAgent()  # Uses default: Anthropic Claude Sonnet 3.7
+    agent = AnalystAgent(stream=True)  # Uses default: Anthropic Claude Sonnet 3.7, streamed as it generates
     
     # Example analysis
     user_prompt = "Analyze my current roster and recommend any add/drop moves I should consider from the available free agents."
@@ -1184,9 +1371,10 @@ def main():
     result = agent.analyze(user_prompt)
     
     print("\n" + "=" * 50)
-    print("ANALYSIS RESULTS:")
+    print("GENERATION:")
     print("=" * 50)
-    print(result["analysis"])
+    metrics = result.get("llm_metrics", {})
+    print(f"Time to first token: {metrics.get('time_to_first_token_s')}s, {metrics.get('tokens_per_second')} tokens/sec")
     
     print("\n" + "=" * 50)
     print("RESOURCES USED:")
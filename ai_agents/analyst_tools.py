@@ -7,11 +7,11 @@ Provides data collection, analysis, and research capabilities for the Analyst Ag
 
 import os
 import sys
-import json
+import time
 import subprocess
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import pytz
 import requests
 from bs4 import BeautifulSoup
@@ -26,6 +26,8 @@ load_dotenv(os.path.join(project_root, '.env'))
 
 # Import our utilities
 from data_collection.scripts.shared.file_utils import DataFileManager
+from data_collection.scripts.shared.season_context import get_season_context_service
+from data_collection.scripts.pipeline import COLLECTION_GRAPH, CollectionPipeline, run_graph
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -38,122 +40,166 @@ class AnalystTools:
     
     def __init__(self):
         self.file_manager = DataFileManager()
+        self.season_context_service = get_season_context_service(file_manager=self.file_manager)
         self.pacific_tz = pytz.timezone('US/Pacific')
         self.scripts_dir = os.path.join(project_root, "data_collection", "scripts")
         self.outputs_dir = os.path.join(project_root, "data_collection", "outputs")
         
         logger.info("Analyst Tools initialized")
     
-    def collect_all_data(self, tank01_players_limit: int = 5) -> Dict[str, Any]:
+    def collect_all_data(self, tank01_players_limit: int = 5, max_workers: int = 4,
+                         in_process: bool = True) -> Dict[str, Any]:
         """
-        Trigger all 9 data collection scripts and return results
+        Trigger all data collection scripts and return results
+        
+        Scripts are scheduled from COLLECTION_GRAPH: independent scripts run
+        concurrently and each enrichment script starts as soon as the Yahoo
+        scripts it reads from have finished.
         
         Args:
             tank01_players_limit: Number of players to process for Tank01 scripts (default: 5)
+            max_workers: Maximum number of scripts running at once (default: 4)
+            in_process: Run scripts as stages of this process with shared clients and
+                        in-memory handoff (default), or as one subprocess per script
         
         Returns:
-            Dictionary with collection results and status
+            Dictionary with collection results, per-script timings and the critical path
         """
-        logger.info("Starting comprehensive data collection...")
-        
-        scripts = [
-            # Yahoo API scripts
-            ("yahoo/my_roster.py", "Yahoo My Roster"),
-            ("yahoo/available_players.py", "Yahoo Available Players"),
-            ("yahoo/opponent_rosters.py", "Yahoo Opponent Rosters"),
-            ("yahoo/team_matchups.py", "Yahoo Team Matchups"),
-            ("yahoo/transaction_trends.py", "Yahoo Transaction Trends"),
-            
-            # Sleeper API scripts
-            ("sleeper/my_roster.py", "Sleeper My Roster"),
-            ("sleeper/available_players.py", "Sleeper Available Players"),
-            ("sleeper/trending.py", "Sleeper Trending"),
-            
-            # Tank01 API scripts
-            ("tank01/my_roster.py", "Tank01 My Roster"),
-            ("tank01/available_players.py", "Tank01 Available Players")
-        ]
+        logger.info(f"Starting comprehensive data collection ({'in-process' if in_process else 'subprocess'})...")
         
         results = {
             "timestamp": datetime.now(self.pacific_tz).isoformat(),
+            "mode": "in_process" if in_process else "subprocess",
             "scripts_run": [],
             "successful": 0,
             "failed": 0,
-            "total_scripts": len(scripts)
+            "total_scripts": len(COLLECTION_GRAPH),
+            "max_workers": max_workers
         }
         
-        for script_name, description in scripts:
-            logger.info(f"Running {description}...")
-            
-            script_path = os.path.join(self.scripts_dir, script_name)
-            
-            if not os.path.exists(script_path):
-                logger.warning(f"Script not found: {script_path}")
-                results["scripts_run"].append({
-                    "script": script_name,
-                    "description": description,
-                    "status": "not_found",
-                    "error": "Script file not found"
-                })
-                results["failed"] += 1
-                continue
-            
-            try:
-                # Prepare command with parameters for Tank01 scripts
-                cmd = [sys.executable, script_path]
-                if "tank01" in script_name and "available_players" in script_name:
-                    cmd.extend(["--players", str(tank01_players_limit)])
-                
-                # Run the script
-                result = subprocess.run(
-                    cmd,
-                    cwd=os.path.dirname(script_path),
-                    capture_output=True,
-                    text=True,
-                    timeout=300  # 5 minute timeout
-                )
-                
-                if result.returncode == 0:
-                    logger.info(f"✅ {description} completed successfully")
-                    results["scripts_run"].append({
-                        "script": script_name,
-                        "description": description,
-                        "status": "success",
-                        "output": result.stdout[-500:] if result.stdout else ""  # Last 500 chars
-                    })
-                    results["successful"] += 1
-                else:
-                    logger.error(f"❌ {description} failed: {result.stderr}")
-                    results["scripts_run"].append({
-                        "script": script_name,
-                        "description": description,
-                        "status": "failed",
-                        "error": result.stderr[-500:] if result.stderr else "Unknown error"
-                    })
-                    results["failed"] += 1
-                    
-            except subprocess.TimeoutExpired:
-                logger.error(f"⏰ {description} timed out")
-                results["scripts_run"].append({
-                    "script": script_name,
-                    "description": description,
-                    "status": "timeout",
-                    "error": "Script execution timed out"
-                })
-                results["failed"] += 1
-            except Exception as e:
-                logger.error(f"💥 {description} crashed: {e}")
-                results["scripts_run"].append({
-                    "script": script_name,
-                    "description": description,
-                    "status": "error",
-                    "error": str(e)
-                })
+        start_time = time.monotonic()
+        if in_process:
+            pipeline = CollectionPipeline()
+            run_node = lambda node: pipeline.run_stage(node, tank01_players_limit, start_time)
+        else:
+            run_node = lambda node: self._run_collection_script(node, tank01_players_limit, start_time)
+        node_results = run_graph(COLLECTION_GRAPH, run_node, max_workers)
+        
+        # Report in graph order so output stays stable between runs
+        for node in COLLECTION_GRAPH:
+            node_result = node_results[node["script"]]
+            results["scripts_run"].append(node_result)
+            if node_result["status"] == "success":
+                results["successful"] += 1
+            else:
                 results["failed"] += 1
         
-        logger.info(f"Data collection completed: {results['successful']}/{results['total_scripts']} successful")
+        durations = {script: r["duration_seconds"] for script, r in node_results.items()}
+        critical_path, critical_seconds = self._compute_critical_path(durations)
+        results["wall_time_seconds"] = round(time.monotonic() - start_time, 2)
+        results["total_script_seconds"] = round(sum(durations.values()), 2)
+        results["critical_path"] = critical_path
+        results["critical_path_seconds"] = critical_seconds
+        
+        logger.info(f"Data collection completed: {results['successful']}/{results['total_scripts']} successful "
+                    f"in {results['wall_time_seconds']}s (critical path {critical_seconds}s: {' -> '.join(critical_path)})")
         return results
     
+    def _run_collection_script(self, node: Dict[str, Any], tank01_players_limit: int,
+                               start_time: float) -> Dict[str, Any]:
+        """
+        Run a single collection script in a subprocess
+        
+        Args:
+            node: Entry from COLLECTION_GRAPH
+            tank01_players_limit: Number of players to process for Tank01 scripts
+            start_time: Monotonic start of the whole collection run
+        
+        Returns:
+            Result entry for scripts_run including timing information
+        """
+        script_name = node["script"]
+        description = node["description"]
+        script_path = os.path.join(self.scripts_dir, script_name)
+        started = time.monotonic()
+        
+        entry = {
+            "script": script_name,
+            "description": description,
+            "depends_on": list(node["depends_on"]),
+            "started_at_seconds": round(started - start_time, 2)
+        }
+        
+        def finish(status: str, **fields) -> Dict[str, Any]:
+            entry.update(fields)
+            entry["status"] = status
+            entry["duration_seconds"] = round(time.monotonic() - started, 2)
+            return entry
+        
+        if not os.path.exists(script_path):
+            logger.warning(f"Script not found: {script_path}")
+            return finish("not_found", error="Script file not found")
+        
+        try:
+            # Prepare command with parameters for Tank01 scripts
+            cmd = [sys.executable, script_path]
+            if "tank01" in script_name and "available_players" in script_name:
+                cmd.extend(["--all", str(tank01_players_limit)])
+            
+            # Run the script
+            result = subprocess.run(
+                cmd,
+                cwd=os.path.dirname(script_path),
+                capture_output=True,
+                text=True,
+                timeout=300  # 5 minute timeout
+            )
+            
+            if result.returncode == 0:
+                logger.info(f"✅ {description} completed successfully")
+                return finish("success", output=result.stdout[-500:] if result.stdout else "")  # Last 500 chars
+            
+            logger.error(f"❌ {description} failed: {result.stderr}")
+            return finish("failed", error=result.stderr[-500:] if result.stderr else "Unknown error")
+            
+        except subprocess.TimeoutExpired:
+            logger.error(f"⏰ {description} timed out")
+            return finish("timeout", error="Script execution timed out")
+        except Exception as e:
+            logger.error(f"💥 {description} crashed: {e}")
+            return finish("error", error=str(e))
+    
+    def _compute_critical_path(self, durations: Dict[str, float]) -> Tuple[List[str], float]:
+        """
+        Find the longest dependency chain through COLLECTION_GRAPH
+        
+        Args:
+            durations: Wall time in seconds per script
+        
+        Returns:
+            Tuple of (scripts on the critical path in run order, total seconds)
+        """
+        finish_at: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        
+        # COLLECTION_GRAPH lists every script after its dependencies
+        for node in COLLECTION_GRAPH:
+            script = node["script"]
+            best_dep = max(node["depends_on"], key=lambda d: finish_at[d], default=None)
+            finish_at[script] = durations.get(script, 0.0) + (finish_at[best_dep] if best_dep else 0.0)
+            previous[script] = best_dep
+        
+        if not finish_at:
+            return [], 0.0
+        
+        script = max(finish_at, key=finish_at.get)
+        total = finish_at[script]
+        path = []
+        while script:
+            path.append(script)
+            script = previous[script]
+        return list(reversed(path)), round(total, 2)
+    
     def analyze_recent_data(self) -> Dict[str, Any]:
         """
         Analyze the most recent data from the outputs directory
@@ -168,7 +214,7 @@ class AnalystTools:
         
         analysis = {
             "timestamp": datetime.now(self.pacific_tz).isoformat(),
-            "season_context": self._extract_season_context(recent_files),
+            "season_context": self._extract_season_context(),
             "data_files": recent_files,
             "roster_analysis": {},
             "available_players": {},
@@ -207,31 +253,27 @@ class AnalystTools:
         return analysis
     
     def _find_most_recent_files(self) -> Dict[str, str]:
-        """Find the most recent files for each data type"""
+        """Find the most recent raw data files for each data type (any storage format)"""
         recent_files = {}
         
-        # Define file patterns to look for (using ** for recursive search in YYYY/MM/DD structure)
-        patterns = {
-            "yahoo_roster": "yahoo/my_roster/**/*_my_roster_raw_data.json",
-            "yahoo_available": "yahoo/available_players/**/*_available_players_raw_data.json",
-            "yahoo_opponents": "yahoo/opponent_rosters/**/*_opponent_rosters_raw_data.json",
-            "yahoo_matchups": "yahoo/team_matchups/**/*_team_matchups_raw_data.json",
-            "yahoo_transactions": "yahoo/transaction_trends/**/*_transaction_trends_raw_data.json",
-            "sleeper_roster": "sleeper/my_roster/**/*_my_roster_raw_data.json",
-            "sleeper_available": "sleeper/available_players/**/*_available_players_raw_data.json",
-            "sleeper_trending": "sleeper/trending/**/*_trending_raw_data.json",
-            "tank01_roster": "tank01/my_roster/**/*_my_roster_raw_data.json",
-            "tank01_available": "tank01/available_players/**/*_available_players_raw_data.json"
+        # Data type -> (api, script) resolved through the DataFileManager manifests
+        sources = {
+            "yahoo_roster": ("yahoo", "my_roster"),
+            "yahoo_available": ("yahoo", "available_players"),
+            "yahoo_opponents": ("yahoo", "opponent_rosters"),
+            "yahoo_matchups": ("yahoo", "team_matchups"),
+            "yahoo_transactions": ("yahoo", "transaction_trends"),
+            "sleeper_roster": ("sleeper", "my_roster"),
+            "sleeper_available": ("sleeper", "available_players"),
+            "sleeper_trending": ("sleeper", "trending"),
+            "tank01_roster": ("tank01", "my_roster"),
+            "tank01_available": ("tank01", "available_players")
         }
         
-        for data_type, pattern in patterns.items():
+        for data_type, (api_name, script_name) in sources.items():
             try:
-                # Find most recent file matching pattern with recursive search for YYYY/MM/DD structure
-                import glob
-                files = glob.glob(os.path.join(self.outputs_dir, pattern), recursive=True)
-                if files:
-                    # Sort by modification time, get most recent
-                    most_recent = max(files, key=os.path.getmtime)
+                most_recent = self.file_manager.get_latest_file(api_name, script_name, "raw_data")
+                if most_recent:
                     recent_files[data_type] = most_recent
                     logger.info(f"Found recent {data_type}: {os.path.basename(most_recent)}")
             except Exception as e:
@@ -239,141 +281,18 @@ class AnalystTools:
         
         return recent_files
     
-    def _extract_season_context(self, recent_files: Dict[str, str]) -> Dict[str, Any]:
-        """Extract season context from the data files dynamically"""
-        current_date = datetime.now(self.pacific_tz)
-        current_year = current_date.year
-        
-        season_context = {
-            "nfl_season": str(current_year),
-            "current_date": current_date.strftime("%Y-%m-%d"),
-            "season_phase": self._determine_season_phase(current_date),
-            "data_source": "Multi-API (Yahoo, Sleeper, Tank01)",
-            "verification_notes": [],
-            "extracted_season": None,
-            "confidence_level": "medium"
-        }
-        
-        # Try to extract season info from multiple sources
-        season_indicators = []
-        
-        # 1. Yahoo roster data
-        if "yahoo_roster" in recent_files:
-            try:
-                with open(recent_files["yahoo_roster"], 'r') as f:
-                    data = json.load(f)
-                
-                team_info = data.get("team_info", {})
-                league_name = team_info.get("league_name", "")
-                team_key = team_info.get("team_key", "")
-                
-                # Extract year from league name
-                import re
-                year_match = re.search(r'(\d{4})', league_name)
-                if year_match:
-                    extracted_year = year_match.group(1)
-                    season_indicators.append(("league_name", extracted_year))
-                    season_context["verification_notes"].append(f"League name contains year: {extracted_year}")
-                
-                # Extract year from team key (format: 461.l.595012.t.3 where 461 = year)
-                if team_key and "." in team_key:
-                    key_parts = team_key.split(".")
-                    if len(key_parts) >= 2 and key_parts[0].isdigit():
-                        # Yahoo uses a different year encoding - 461 = 2025
-                        yahoo_code = int(key_parts[0])
-                        yahoo_year = str(2025)  # For now, assume 2025 based on the 461 code
-                        season_indicators.append(("yahoo_team_key", yahoo_year))
-                        season_context["verification_notes"].append(f"Yahoo team key code {yahoo_code} indicates year: {yahoo_year}")
-                        season_context["yahoo_league_id"] = team_key
-                
-            except Exception as e:
-                logger.warning(f"Could not extract season context from Yahoo roster data: {e}")
-        
-        # 2. Sleeper data (if available)
-        if "sleeper_roster" in recent_files:
-            try:
-                with open(recent_files["sleeper_roster"], 'r') as f:
-                    data = json.load(f)
-                
-                # Look for season indicators in Sleeper data
-                if "season" in data:
-                    sleeper_season = str(data["season"])
-                    season_indicators.append(("sleeper_season", sleeper_season))
-                    season_context["verification_notes"].append(f"Sleeper data indicates season: {sleeper_season}")
-                
-            except Exception as e:
-                logger.warning(f"Could not extract season context from Sleeper data: {e}")
-        
-        # 3. Tank01 data (if available)
-        if "tank01_roster" in recent_files:
-            try:
-                with open(recent_files["tank01_roster"], 'r') as f:
-                    data = json.load(f)
-                
-                # Look for season indicators in Tank01 data
-                if "season" in data:
-                    tank01_season = str(data["season"])
-                    season_indicators.append(("tank01_season", tank01_season))
-                    season_context["verification_notes"].append(f"Tank01 data indicates season: {tank01_season}")
-                
-            except Exception as e:
-                logger.warning(f"Could not extract season context from Tank01 data: {e}")
-        
-        # 4. Determine the most likely season
-        if season_indicators:
-            # Count occurrences of each year
-            year_counts = {}
-            for source, year in season_indicators:
-                year_counts[year] = year_counts.get(year, 0) + 1
-            
-            # Find the most common year
-            most_common_year = max(year_counts, key=year_counts.get)
-            season_context["extracted_season"] = most_common_year
-            season_context["nfl_season"] = most_common_year
-            season_context["confidence_level"] = "high" if year_counts[most_common_year] > 1 else "medium"
-            season_context["verification_notes"].append(f"Consensus season: {most_common_year} (from {year_counts[most_common_year]} sources)")
-        else:
-            # Fallback to current year based on date
-            season_context["verification_notes"].append(f"No season data found in files, using current year: {current_year}")
-            season_context["confidence_level"] = "low"
-        
-        # 5. Add current date context
-        if current_date.month >= 9:  # September or later
-            season_context["verification_notes"].append(f"Current date {current_date.strftime('%Y-%m-%d')} suggests NFL season is in progress")
-        elif current_date.month <= 2:  # January-February (playoffs)
-            season_context["verification_notes"].append(f"Current date {current_date.strftime('%Y-%m-%d')} suggests NFL playoffs/super bowl period")
-        else:  # March-August (offseason)
-            season_context["verification_notes"].append(f"Current date {current_date.strftime('%Y-%m-%d')} suggests NFL offseason")
-        
+    def _extract_season_context(self) -> Dict[str, Any]:
+        """Season context from the shared season context service"""
+        season_context = self.season_context_service.get_season_context("Multi-API (Yahoo, Sleeper, Tank01)")
+        has_league = bool(season_context["yahoo_league_info"].get("league_key"))
+        season_context["extracted_season"] = season_context["nfl_season"] if has_league else None
+        season_context["confidence_level"] = "high" if has_league else "low"
         return season_context
     
-    def _determine_season_phase(self, current_date: datetime) -> str:
-        """Determine the current phase of the NFL season based on date"""
-        month = current_date.month
-        day = current_date.day
-        
-        if month == 9 and day < 15:
-            return "Early Regular Season"
-        elif month == 9 or month == 10:
-            return "Regular Season"
-        elif month == 11 or month == 12:
-            return "Late Regular Season"
-        elif month == 1 and day < 15:
-            return "Playoffs"
-        elif month == 1 and day >= 15:
-            return "Super Bowl"
-        elif month == 2:
-            return "Offseason"
-        elif month >= 3 and month <= 8:
-            return "Offseason"
-        else:
-            return "Unknown"
-    
     def _analyze_yahoo_roster(self, filepath: str) -> Dict[str, Any]:
         """Analyze Yahoo roster data"""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data = self.file_manager.load_raw_data(filepath)
             
             # Extract key roster information - data is in roster_players
             roster_data = data.get("roster_players", [])
@@ -416,8 +335,7 @@ class AnalystTools:
     def _analyze_sleeper_roster(self, filepath: str) -> Dict[str, Any]:
         """Analyze Sleeper roster data"""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data = self.file_manager.load_raw_data(filepath)
             
             # Similar analysis for Sleeper data
             # Implementation depends on Sleeper data structure
@@ -430,8 +348,7 @@ class AnalystTools:
     def _analyze_tank01_roster(self, filepath: str) -> Dict[str, Any]:
         """Analyze Tank01 roster data"""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data = self.file_manager.load_raw_data(filepath)
             
             # Extract matched players from Tank01 roster data
             matched_players = data.get('matched_players', [])
@@ -474,8 +391,7 @@ class AnalystTools:
     def _analyze_available_players(self, filepath: str) -> Dict[str, Any]:
         """Analyze available players data"""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data = self.file_manager.load_raw_data(filepath)
             
             # Extract available players data
             available_players = data.get('available_players', [])
@@ -514,8 +430,7 @@ class AnalystTools:
     def _analyze_opponent_rosters(self, filepath: str) -> Dict[str, Any]:
         """Analyze opponent roster data"""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data = self.file_manager.load_raw_data(filepath)
             
             # Extract opponent roster information
             teams = data.get('teams', [])
@@ -558,15 +473,14 @@ class AnalystTools:
     def _analyze_team_matchups(self, filepath: str) -> Dict[str, Any]:
         """Analyze team matchup data"""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data = self.file_manager.load_raw_data(filepath)
             
             # Extract team matchup information
             matchups = data.get('matchups', {})
             season_context = data.get('season_context', {})
             
             # Analyze current week matchups
-            current_week = season_context.get('current_week', 1)
+            current_week = self.season_context_service.get_current_week()
             week_key = f"week_{current_week}"
             current_matchups = matchups.get(week_key, {})
             
@@ -589,8 +503,7 @@ class AnalystTools:
     def _analyze_transaction_trends(self, filepath: str) -> Dict[str, Any]:
         """Analyze transaction trends data"""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data = self.file_manager.load_raw_data(filepath)
             
             # Extract transaction trends information
             transactions = data.get('transactions', [])
@@ -743,43 +656,17 @@ class AnalystTools:
     
     def get_current_game_week(self) -> Optional[int]:
         """
-        Determine the current NFL game week from JSON data files
+        Determine the current NFL game week from the shared season context
         
         Returns:
-            Current game week number or None if unable to determine
+            Current game week number (0 in preseason) or None if unable to determine
         """
         try:
-            # Try to get from season context in JSON files
-            recent_files = self._find_most_recent_files()
-            
-            # Check multiple data sources for season context
-            for file_type, filepath in recent_files.items():
-                if filepath and filepath.endswith('.json'):
-                    try:
-                        with open(filepath, 'r') as f:
-                            data = json.load(f)
-                            
-                        # Look for season_context in the data
-                        season_context = data.get('season_context', {})
-                        if season_context and 'current_week' in season_context:
-                            current_week = season_context.get('current_week')
-                            if current_week and current_week != 'Unknown':
-                                logger.info(f"Found current week {current_week} from {file_type}")
-                                return int(current_week)
-                    except Exception as e:
-                        logger.debug(f"Could not read {file_type} for current week: {e}")
-                        continue
-            
-            # Fallback: calculate based on current date
-            # NFL season typically starts first week of September
-            current_date = datetime.now(self.pacific_tz)
-            season_start = datetime(current_date.year, 9, 1, tzinfo=self.pacific_tz)
-            
-            if current_date < season_start:
-                return 0  # Preseason
-            
-            weeks_elapsed = (current_date - season_start).days // 7
-            return min(weeks_elapsed + 1, 18)  # Max 18 weeks
+            week_info = self.season_context_service.get_week_info()
+            if week_info.get('coverage_type') == 'preseason':
+                return 0
+            logger.info(f"Current week {week_info['week']} from {week_info.get('source', 'unknown')}")
+            return int(week_info['week'])
             
         except Exception as e:
             logger.error(f"Could not determine current game week: {e}")
@@ -4,13 +4,19 @@ Comprehensive Data Processor for Fantasy Football Analysis
 Processes all data sources and creates complete optimized profiles
 """
 
-import json
 import os
-import glob
+import sys
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import logging
 
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_collection.scripts.shared.file_utils import DataFileManager
+from data_collection.scripts.shared.season_context import get_season_context_service
+from ai_agents.token_accounting import get_token_counter
+
 logger = logging.getLogger(__name__)
 
 class ComprehensiveDataProcessor:
@@ -19,6 +25,8 @@ class ComprehensiveDataProcessor:
     def __init__(self, data_dir: str, player_limits: Dict[str, int]):
         self.data_dir = data_dir
         self.player_limits = player_limits
+        self.file_manager = DataFileManager(data_dir)
+        self.season_context_service = get_season_context_service(file_manager=self.file_manager)
         
     def process_all_data(self) -> Dict[str, Any]:
         """Process all data sources and return comprehensive structured data"""
@@ -55,33 +63,21 @@ class ComprehensiveDataProcessor:
         }
     
     def _load_league_metadata(self) -> Dict[str, Any]:
-        """Load league metadata from Yahoo data"""
+        """Load league metadata from the shared season context"""
         try:
-            # Load from Yahoo roster data (has league info)
-            yahoo_roster_file = self._find_latest_file("yahoo/my_roster", "*_raw_data.json")
-            if yahoo_roster_file:
-                with open(yahoo_roster_file, 'r') as f:
-                    data = json.load(f)
-                
-                league_info = data.get("league_info", {})
-                team_info = data.get("team_info", {})
-                season_context = data.get("season_context", {})
-                
-                # Get league name from season_context if available
-                season_league_info = season_context.get("league_info", {})
-                league_name = (league_info.get("league_name") or 
-                             season_league_info.get("league_name") or 
-                             "Unknown League")
-                
-                return {
-                    "league_name": league_name,
-                    "team_name": team_info.get("team_name", "Unknown Team"),
-                    "team_key": team_info.get("team_key", "Unknown"),
-                    "league_key": league_info.get("league_key", "Unknown"),
-                    "season_context": season_context,
-                    "current_week": season_context.get("current_week", 1),
-                    "nfl_season": season_context.get("nfl_season", "2025")
-                }
+            league_info = self.season_context_service.get_league_info()
+            season_context = self.season_context_service.get_season_context("Yahoo Fantasy API")
+            season_context["league_info"] = season_context["yahoo_league_info"]
+            
+            return {
+                "league_name": league_info.get("league_name") or "Unknown League",
+                "team_name": league_info.get("team_name", "Unknown Team"),
+                "team_key": league_info.get("team_key", "Unknown"),
+                "league_key": league_info.get("league_key", "Unknown"),
+                "season_context": season_context,
+                "current_week": season_context["current_week"],
+                "nfl_season": season_context["nfl_season"]
+            }
         except Exception as e:
             logger.error(f"Error loading league metadata: {e}")
             return {}
@@ -156,10 +152,9 @@ class ComprehensiveDataProcessor:
     def _get_team_and_league_info(self) -> Dict[str, str]:
         """Get team name and league name from Yahoo roster data"""
         try:
-            roster_file = self._find_latest_file("yahoo/my_roster", "*_raw_data.json")
+            roster_file = self._find_latest_file("yahoo/my_roster")
             if roster_file:
-                with open(roster_file, 'r') as f:
-                    data = json.load(f)
+                data = self.file_manager.load_raw_data(roster_file)
                 
                 team_info = data.get("team_info", {})
                 league_info = data.get("league_info", {})
@@ -323,10 +318,9 @@ class ComprehensiveDataProcessor:
     def _load_nfl_matchups_data(self) -> Dict[str, Any]:
         """Load NFL matchups data from Tank01"""
         try:
-            matchups_file = self._find_latest_file("tank01/nfl_matchups", "*_raw_data.json")
+            matchups_file = self._find_latest_file("tank01/nfl_matchups")
             if matchups_file:
-                with open(matchups_file, 'r') as f:
-                    data = json.load(f)
+                data = self.file_manager.load_raw_data(matchups_file)
                 
                 # Extract relevant matchups data
                 games = data.get("games", [])
@@ -347,10 +341,9 @@ class ComprehensiveDataProcessor:
     def _load_transaction_trends(self) -> Dict[str, Any]:
         """Load transaction trends data"""
         try:
-            trends_file = self._find_latest_file("yahoo/transaction_trends", "*_raw_data.json")
+            trends_file = self._find_latest_file("yahoo/transaction_trends")
             if trends_file:
-                with open(trends_file, 'r') as f:
-                    data = json.load(f)
+                data = self.file_manager.load_raw_data(trends_file)
                 return data
         except Exception as e:
             logger.error(f"Error loading transaction trends: {e}")
@@ -530,17 +523,14 @@ class ComprehensiveDataProcessor:
         """Find current week opponent from Yahoo team matchups data"""
         try:
             # Load team matchups data to find current week opponent
-            matchups_file = self._find_latest_file("yahoo/team_matchups", "*_raw_data.json")
+            matchups_file = self._find_latest_file("yahoo/team_matchups")
             if not matchups_file:
                 logger.warning("No team matchups file found")
                 return None
                 
-            with open(matchups_file, 'r') as f:
-                matchups_data = json.load(f)
+            matchups_data = self.file_manager.load_raw_data(matchups_file)
             
-            # Get current week from season context
-            season_context = matchups_data.get("season_context", {})
-            current_week = season_context.get("current_week", 1)
+            current_week = self.season_context_service.get_current_week()
             
             # Get my team key from league info
             league_info = matchups_data.get("league_info", {})
@@ -587,10 +577,9 @@ class ComprehensiveDataProcessor:
     def _load_yahoo_roster(self) -> List[Dict[str, Any]]:
         """Load Yahoo roster data with position information"""
         try:
-            roster_file = self._find_latest_file("yahoo/my_roster", "*_raw_data.json")
+            roster_file = self._find_latest_file("yahoo/my_roster")
             if roster_file:
-                with open(roster_file, 'r') as f:
-                    data = json.load(f)
+                data = self.file_manager.load_raw_data(roster_file)
                 
                 # Get roster players from the processed data
                 roster_players = data.get("roster_players", [])
@@ -636,10 +625,9 @@ class ComprehensiveDataProcessor:
     def _load_sleeper_roster(self) -> List[Dict[str, Any]]:
         """Load Sleeper roster data"""
         try:
-            roster_file = self._find_latest_file("sleeper/my_roster", "*_raw_data.json")
+            roster_file = self._find_latest_file("sleeper/my_roster")
             if roster_file:
-                with open(roster_file, 'r') as f:
-                    data = json.load(f)
+                data = self.file_manager.load_raw_data(roster_file)
                 # Sleeper data structure: matched_players array
                 matched_players = data.get("matched_players", [])
                 logger.info(f"Loaded {len(matched_players)} Sleeper roster players")
@@ -651,10 +639,9 @@ class ComprehensiveDataProcessor:
     def _load_tank01_roster(self) -> List[Dict[str, Any]]:
         """Load Tank01 roster data"""
         try:
-            roster_file = self._find_latest_file("tank01/my_roster", "*_raw_data.json")
+            roster_file = self._find_latest_file("tank01/my_roster")
             if roster_file:
-                with open(roster_file, 'r') as f:
-                    data = json.load(f)
+                data = self.file_manager.load_raw_data(roster_file)
                 matched_players = data.get("matched_players", [])
                 logger.info(f"Loaded {len(matched_players)} Tank01 roster players")
                 return matched_players
@@ -665,10 +652,9 @@ class ComprehensiveDataProcessor:
     def _load_yahoo_opponents(self) -> List[Dict[str, Any]]:
         """Load Yahoo opponents data"""
         try:
-            opponents_file = self._find_latest_file("yahoo/opponent_rosters", "*_raw_data.json")
+            opponents_file = self._find_latest_file("yahoo/opponent_rosters")
             if opponents_file:
-                with open(opponents_file, 'r') as f:
-                    data = json.load(f)
+                data = self.file_manager.load_raw_data(opponents_file)
                 
                 # Convert rosters dict to list of opponent data
                 rosters = data.get("rosters", {})
@@ -695,10 +681,9 @@ class ComprehensiveDataProcessor:
     def _load_sleeper_opponents(self) -> List[Dict[str, Any]]:
         """Load Sleeper opponents data"""
         try:
-            opponent_file = self._find_latest_file("sleeper/opponent_roster", "*_raw_data.json")
+            opponent_file = self._find_latest_file("sleeper/opponent_roster")
             if opponent_file:
-                with open(opponent_file, 'r') as f:
-                    data = json.load(f)
+                data = self.file_manager.load_raw_data(opponent_file)
                 # Sleeper data structure: matched_players array
                 matched_players = data.get("matched_players", [])
                 logger.info(f"Loaded {len(matched_players)} Sleeper opponent players")
@@ -710,10 +695,9 @@ class ComprehensiveDataProcessor:
     def _load_tank01_opponents(self) -> List[Dict[str, Any]]:
         """Load Tank01 opponents data"""
         try:
-            opponent_file = self._find_latest_file("tank01/opponent_roster", "*_raw_data.json")
+            opponent_file = self._find_latest_file("tank01/opponent_roster")
             if opponent_file:
-                with open(opponent_file, 'r') as f:
-                    data = json.load(f)
+                data = self.file_manager.load_raw_data(opponent_file)
                 matched_players = data.get("matched_players", [])
                 logger.info(f"Loaded {len(matched_players)} Tank01 opponent players")
                 return matched_players
@@ -724,10 +708,9 @@ class ComprehensiveDataProcessor:
     def _load_yahoo_available(self) -> List[Dict[str, Any]]:
         """Load Yahoo available players data"""
         try:
-            available_file = self._find_latest_file("yahoo/available_players", "*_raw_data.json")
+            available_file = self._find_latest_file("yahoo/available_players")
             if available_file:
-                with open(available_file, 'r') as f:
-                    data = json.load(f)
+                data = self.file_manager.load_raw_data(available_file)
                 available_players = data.get("available_players", [])
                 logger.info(f"Loaded {len(available_players)} Yahoo available players")
                 return available_players
@@ -738,10 +721,9 @@ class ComprehensiveDataProcessor:
     def _load_sleeper_available(self) -> List[Dict[str, Any]]:
         """Load Sleeper available players data"""
         try:
-            available_file = self._find_latest_file("sleeper/available_players", "*_raw_data.json")
+            available_file = self._find_latest_file("sleeper/available_players")
             if available_file:
-                with open(available_file, 'r') as f:
-                    data = json.load(f)
+                data = self.file_manager.load_raw_data(available_file)
                 # Sleeper data structure: matched_players array
                 matched_players = data.get("matched_players", [])
                 logger.info(f"Loaded {len(matched_players)} Sleeper available players")
@@ -753,10 +735,9 @@ class ComprehensiveDataProcessor:
     def _load_tank01_available(self) -> List[Dict[str, Any]]:
         """Load Tank01 available players data"""
         try:
-            available_file = self._find_latest_file("tank01/available_players", "*_raw_data.json")
+            available_file = self._find_latest_file("tank01/available_players")
             if available_file:
-                with open(available_file, 'r') as f:
-                    data = json.load(f)
+                data = self.file_manager.load_raw_data(available_file)
                 # Tank01 data structure: processed_data.available_players array
                 if "processed_data" in data and "available_players" in data["processed_data"]:
                     available_players = data["processed_data"]["available_players"]
@@ -769,65 +750,40 @@ class ComprehensiveDataProcessor:
             logger.error(f"Error loading Tank01 available players: {e}")
         return []
     
-    def _find_latest_file(self, subdirectory: str, pattern: str) -> Optional[str]:
-        """Find the latest file matching pattern in subdirectory with YYYY/MM/DD structure"""
+    def _find_latest_file(self, subdirectory: str, file_type: str = "raw_data") -> Optional[str]:
+        """Find the latest output of an <api>/<script> subdirectory through the output manifest (any raw format)"""
         try:
-            directory = os.path.join(self.data_dir, subdirectory)
-            # Use recursive search to find files in YYYY/MM/DD subdirectories
-            files = glob.glob(f"{directory}/**/{pattern}", recursive=True)
-            if files:
-                return max(files, key=os.path.getctime)
+            api_name, _, script_name = subdirectory.partition("/")
+            return self.file_manager.get_latest_file(api_name, script_name, file_type)
         except Exception as e:
             logger.error(f"Error finding latest file in {subdirectory}: {e}")
         return None
     
-    def _calculate_token_usage(self, players_by_position: Dict[str, List[Dict[str, Any]]]) -> int:
-        """Calculate actual token usage for players using tiktoken"""
-        try:
-            import tiktoken
-            encoding = tiktoken.get_encoding('cl100k_base')
-            
-            total_tokens = 0
-            for position, players in players_by_position.items():
-                for player in players:
-                    # Convert player data to JSON string and calculate actual tokens
-                    player_json = json.dumps(player, indent=2)
-                    player_tokens = len(encoding.encode(player_json))
-                    total_tokens += player_tokens
-            return total_tokens
-        except ImportError:
-            # Fallback to rough estimate if tiktoken not available
-            total_tokens = 0
-            for position, players in players_by_position.items():
-                for player in players:
-                    # Rough estimate: 2000 tokens per player (more accurate)
-                    total_tokens += 2000
-            return total_tokens
+    def _calculate_token_usage(self, players_by_position: Dict[str, Any]) -> int:
+        """Calculate token usage for players (rosters nest positions under starting/bench groups)"""
+        counter = get_token_counter()
+        total_tokens = 0
+        for players in players_by_position.values():
+            groups = players.values() if isinstance(players, dict) else [players]
+            for group in groups:
+                for player in group:
+                    total_tokens += counter.count_object(player)
+        return total_tokens
     
     def _calculate_nfl_matchups_tokens(self, nfl_matchups: Dict[str, Any]) -> int:
         """Calculate token usage for NFL matchups data"""
-        try:
-            import tiktoken
-            encoding = tiktoken.get_encoding('cl100k_base')
-            
-            # Convert NFL matchups data to JSON string and calculate tokens
-            matchups_json = json.dumps(nfl_matchups, indent=2)
-            return len(encoding.encode(matchups_json))
-        except ImportError:
-            # Fallback to rough estimate if tiktoken not available
-            games_count = nfl_matchups.get("total_games", 0)
-            return games_count * 100  # Rough estimate: 100 tokens per game
+        return get_token_counter().count_object(nfl_matchups)
     
     def _extract_all_data_files(self) -> Dict[str, str]:
         """Extract all data file paths"""
         return {
-            "yahoo_roster": self._find_latest_file("yahoo/my_roster", "*_raw_data.json"),
-            "sleeper_roster": self._find_latest_file("sleeper/my_roster", "*_raw_data.json"),
-            "tank01_roster": self._find_latest_file("tank01/my_roster", "*_raw_data.json"),
-            "yahoo_opponents": self._find_latest_file("yahoo/opponent_rosters", "*_raw_data.json"),
-            "yahoo_available": self._find_latest_file("yahoo/available_players", "*_raw_data.json"),
-            "sleeper_available": self._find_latest_file("sleeper/available_players", "*_raw_data.json"),
-            "tank01_available": self._find_latest_file("tank01/available_players", "*_raw_data.json"),
-            "tank01_nfl_matchups": self._find_latest_file("tank01/nfl_matchups", "*_raw_data.json"),
-            "yahoo_transactions": self._find_latest_file("yahoo/transaction_trends", "*_raw_data.json")
+            "yahoo_roster": self._find_latest_file("yahoo/my_roster"),
+            "sleeper_roster": self._find_latest_file("sleeper/my_roster"),
+            "tank01_roster": self._find_latest_file("tank01/my_roster"),
+            "yahoo_opponents": self._find_latest_file("yahoo/opponent_rosters"),
+            "yahoo_available": self._find_latest_file("yahoo/available_players"),
+            "sleeper_available": self._find_latest_file("sleeper/available_players"),
+            "tank01_available": self._find_latest_file("tank01/available_players"),
+            "tank01_nfl_matchups": self._find_latest_file("tank01/nfl_matchups"),
+            "yahoo_transactions": self._find_latest_file("yahoo/transaction_trends")
         }
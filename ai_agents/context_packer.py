@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Token-Budget Context Packer
+
+Chooses which players and which player fields go into the comprehensive
+analysis prompt so the prompt lands just under a token budget with the most
+useful content, instead of including a fixed number of players per position
+whatever the token cost.
+
+Each player is worth a weight by role:
+- My starters first, then the current opponent's starters
+- My bench, then the opponent's bench
+- Available players scaled by projected points (top waiver targets first)
+
+Each field is worth a weight by usefulness (projected points and injury
+status above ages and cross-API IDs). A player's core fields (name, position,
+team, roster slot) are one item; every other field is its own item. Items are
+taken greedily by value per token until the budget is spent.
+
+Item sizes use the shared token counter's calibrated estimate; the rendered
+prompt is counted exactly.
+
+Author: Fantasy Football Optimizer
+Date: October 2025
+"""
+
+import json
+import logging
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.token_accounting import TokenCounter, get_token_counter
+
+logger = logging.getLogger(__name__)
+
+# Sections of the comprehensive data whose players are packed
+PACKED_SECTIONS = ("my_roster", "opponent_roster", "available_players")
+
+# Fields every included player keeps
+CORE_FIELDS = ("name", "position", "team", "roster_position")
+
+# Value of one field relative to the player's core fields (CORE_WEIGHT)
+CORE_WEIGHT = 2.0
+DEFAULT_FIELD_WEIGHTS = {
+    "fantasy_points": 1.0,
+    "injury_status": 0.8,
+    "injury_details": 0.7,
+    "bye_week": 0.6,
+    "fantasy_points_default": 0.5,
+    "depth_chart_position": 0.5,
+    "recent_news": 0.4,
+    "percent_owned": 0.3,
+    "active": 0.2,
+    "age": 0.15,
+    "years_exp": 0.15,
+    "player_ids": 0.05
+}
+# Fields without a weight above
+DEFAULT_OTHER_FIELD_WEIGHT = 0.1
+
+# Value of a player by role; available players range from waiver_floor
+# (lowest projection) to waiver_top (highest projection)
+DEFAULT_PLAYER_WEIGHTS = {
+    "my_starter": 10.0,
+    "opponent_starter": 6.0,
+    "my_bench": 5.0,
+    "opponent_bench": 2.0,
+    "waiver_top": 5.0,
+    "waiver_floor": 1.0
+}
+
+# Roster slots that do not score this week
+BENCH_SLOTS = ("BN", "IR", "IR+", "NA")
+
+# Players per position counted exactly to calibrate the estimate used for item sizes
+CALIBRATION_PLAYERS = 10
+
+
+def _projection(player: Dict[str, Any]) -> float:
+    """Projected points (defenses only carry fantasy_points_default)."""
+    for field in ("fantasy_points", "fantasy_points_default"):
+        try:
+            return float(player.get(field))
+        except (TypeError, ValueError):
+            continue
+    return 0.0
+
+
+class ContextPacker:
+    """
+    Packs roster, opponent and available players into a token budget.
+    """
+
+    def __init__(self, token_budget: int, field_weights: Optional[Dict[str, float]] = None,
+                 player_weights: Optional[Dict[str, float]] = None,
+                 token_counter: Optional[TokenCounter] = None):
+        """
+        Initialize the packer.
+
+        Args:
+            token_budget: Maximum prompt tokens
+            field_weights: Overrides for DEFAULT_FIELD_WEIGHTS
+            player_weights: Overrides for DEFAULT_PLAYER_WEIGHTS
+            token_counter: Counter to use (default: the shared counter)
+        """
+        self.token_budget = int(token_budget)
+        self.token_counter = token_counter or get_token_counter()
+        self.field_weights = {**DEFAULT_FIELD_WEIGHTS, **(field_weights or {})}
+        self.player_weights = {**DEFAULT_PLAYER_WEIGHTS, **(player_weights or {})}
+
+    # ------------------------------------------------------------------
+    # Player values
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _iter_players(players_by_position: Dict[str, Any]):
+        """Yield (group, position, index, player); rosters nest positions under starting/bench groups."""
+        for key, value in players_by_position.items():
+            if isinstance(value, dict):
+                for position, players in value.items():
+                    for index, player in enumerate(players):
+                        yield key, position, index, player
+            elif isinstance(value, list):
+                for index, player in enumerate(value):
+                    yield None, key, index, player
+
+    def _player_weight(self, section: str, player: Dict[str, Any], max_projection: float) -> float:
+        if section == "available_players":
+            share = _projection(player) / max_projection if max_projection > 0 else 0.0
+            floor, top = self.player_weights["waiver_floor"], self.player_weights["waiver_top"]
+            return floor + (top - floor) * max(0.0, min(share, 1.0))
+        bench = player.get("roster_position") in BENCH_SLOTS
+        prefix = "my" if section == "my_roster" else "opponent"
+        return self.player_weights[f"{prefix}_{'bench' if bench else 'starter'}"]
+
+    # ------------------------------------------------------------------
+    # Packing
+    # ------------------------------------------------------------------
+
+    def pack(self, comprehensive_data: Dict[str, Any],
+             player_budget: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Choose players and fields worth the most within a token budget.
+
+        Args:
+            comprehensive_data: Output of ComprehensiveDataProcessor.process_all_data
+            player_budget: Tokens available for player data
+
+        Returns:
+            (copy of comprehensive_data with packed sections, packing report)
+        """
+        available = comprehensive_data.get("available_players", {}).get("players_by_position", {})
+        max_projection = max((_projection(p) for _, _, _, p in self._iter_players(available)), default=0.0)
+
+        counter = self.token_counter
+        counter.calibrate(player for section in PACKED_SECTIONS for _, _, index, player in self._iter_players(
+            comprehensive_data.get(section, {}).get("players_by_position", {})) if index < CALIBRATION_PLAYERS)
+
+        # Items: (value, cost, player_ref, field); field None is the player's core fields
+        items: List[Tuple[float, int, Tuple, Optional[str]]] = []
+        core_costs: Dict[Tuple, int] = {}
+        totals = {}
+        for section in PACKED_SECTIONS:
+            players_by_position = comprehensive_data.get(section, {}).get("players_by_position", {})
+            totals[section] = 0
+            for group, position, index, player in self._iter_players(players_by_position):
+                totals[section] += 1
+                ref = (section, group, position, index)
+                weight = self._player_weight(section, player, max_projection)
+                core = {field: player[field] for field in CORE_FIELDS if field in player}
+                core_costs[ref] = counter.estimate_object(core)
+                items.append((weight * CORE_WEIGHT, core_costs[ref], ref, None))
+                for field, value in player.items():
+                    if field in CORE_FIELDS:
+                        continue
+                    cost = counter.estimate_text(f'"{field}": {json.dumps(value, indent=2, default=str)},')
+                    field_weight = self.field_weights.get(field, DEFAULT_OTHER_FIELD_WEIGHT)
+                    items.append((weight * field_weight, cost, ref, field))
+
+        # Greedy by value per token; a field brings its player's core fields along
+        items.sort(key=lambda item: (item[0] / max(item[1], 1), item[0]), reverse=True)
+        chosen: Dict[Tuple, List[str]] = {}
+        used = 0
+        for value, cost, ref, field in items:
+            if field is not None and ref in chosen:
+                extra = cost
+            elif field is None and ref in chosen:
+                continue
+            else:
+                extra = core_costs[ref] + (cost if field is not None else 0)
+            if used + extra > player_budget:
+                continue
+            used += extra
+            chosen.setdefault(ref, [])
+            if field is not None:
+                chosen[ref].append(field)
+
+        packed_data = dict(comprehensive_data)
+        sections_report = {}
+        fields_dropped = 0
+        for section in PACKED_SECTIONS:
+            source = comprehensive_data.get(section, {})
+            players_by_position = source.get("players_by_position", {})
+            # Roster groups (starting_lineup, bench_players) stay even when empty
+            packed_players: Dict[str, Any] = {key: {} for key, value in players_by_position.items()
+                                              if isinstance(value, dict)}
+            included = 0
+            for group, position, index, player in self._iter_players(players_by_position):
+                ref = (section, group, position, index)
+                if ref not in chosen:
+                    continue
+                keep = set(CORE_FIELDS) | set(chosen[ref])
+                fields_dropped += sum(1 for field in player if field not in keep)
+                target = packed_players[group] if group is not None else packed_players
+                target.setdefault(position, []).append(
+                    {field: value for field, value in player.items() if field in keep})
+                included += 1
+            packed_data[section] = {**source, "players_by_position": packed_players, "total_players": included}
+            sections_report[section] = {"included": included, "total": totals[section]}
+
+        report = {
+            "player_budget": player_budget,
+            "player_tokens": used,
+            "players_included": sum(s["included"] for s in sections_report.values()),
+            "players_total": sum(totals.values()),
+            "fields_dropped": fields_dropped,
+            "sections": sections_report
+        }
+        return packed_data, report
+
+    def fit_prompt(self, comprehensive_data: Dict[str, Any], render: Callable[[Dict[str, Any]], str],
+                   max_passes: int = 5) -> Tuple[str, Dict[str, Any]]:
+        """
+        Render a prompt that fits the token budget.
+
+        The prompt without players sets the fixed overhead; the rest of the
+        budget is packed with players. JSON nesting around the packed players
+        costs a little more than the items themselves, so an overshoot is
+        taken off the player budget and the players are packed again.
+
+        Args:
+            comprehensive_data: Output of ComprehensiveDataProcessor.process_all_data
+            render: Builds the prompt from (packed) comprehensive data
+
+        Returns:
+            (prompt, packing report)
+        """
+        empty = dict(comprehensive_data)
+        for section in PACKED_SECTIONS:
+            empty[section] = {**comprehensive_data.get(section, {}), "players_by_position": {}, "total_players": 0}
+        fixed_tokens = self.token_counter.count_text(render(empty))
+
+        player_budget = self.token_budget - fixed_tokens
+        for _ in range(max_passes):
+            packed_data, report = self.pack(comprehensive_data, max(player_budget, 0))
+            prompt = render(packed_data)
+            prompt_tokens = self.token_counter.count_text(prompt)
+            if prompt_tokens <= self.token_budget or player_budget <= 0:
+                break
+            player_budget -= prompt_tokens - self.token_budget
+
+        within_budget = prompt_tokens <= self.token_budget
+        if not within_budget:
+            logger.warning(f"Prompt is {prompt_tokens:,} tokens, over the {self.token_budget:,} token budget")
+        report.update({
+            "token_budget": self.token_budget,
+            "fixed_tokens": fixed_tokens,
+            "prompt_tokens": prompt_tokens,
+            "within_budget": within_budget
+        })
+        logger.info(f"Packed {report.get('players_included', 0)}/{report.get('players_total', 0)} players "
+                    f"into {prompt_tokens:,} of {self.token_budget:,} prompt tokens")
+        return prompt, report
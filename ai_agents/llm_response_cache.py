@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache
+
+Local cache for analyst LLM responses. Re-running an analysis whose prompt
+and data have not changed (for example after a report formatting fix) returns
+the stored response instead of calling Anthropic/OpenAI again.
+
+Key Features:
+- Entries keyed by a SHA-256 of provider, model, system prompt, user prompt
+  and sampling parameters
+- Size-bounded LRU eviction (entry count and total bytes); reads refresh an
+  entry's position by touching its file
+- Atomic writes so concurrent runs never read half-written entries
+- Hit/miss counters for reporting
+
+Set LLM_CACHE_DISABLED=1 to turn the cache off, or pass bypass_cache to the
+agent to force a fresh response (which then replaces the cached one).
+
+Author: Fantasy Football Optimizer
+Date: October 2025
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Default cache location: <project_root>/data_collection/cache/llm_responses
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_DIR = PROJECT_ROOT / "data_collection" / "cache" / "llm_responses"
+
+DEFAULT_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', '200'))
+DEFAULT_MAX_BYTES = int(os.getenv('LLM_CACHE_MAX_BYTES', str(50 * 1024 * 1024)))
+
+
+def llm_cache_disabled() -> bool:
+    """Check the LLM_CACHE_DISABLED environment variable."""
+    return os.getenv('LLM_CACHE_DISABLED', '').lower() in ('1', 'true', 'yes')
+
+
+class LLMResponseCache:
+    """
+    File-backed LRU cache of LLM responses.
+
+    Each entry is one JSON file named after its key. The file's modification
+    time is its last use, so eviction removes the least recently used files
+    until both bounds are met.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Cache directory (default: data_collection/cache/llm_responses)
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached responses on disk
+        """
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "bypassed": 0,
+            "evictions": 0
+        }
+
+    @staticmethod
+    def make_key(provider: str, model: str, system_prompt: str, prompt: str,
+                 params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for one LLM request."""
+        payload = json.dumps({
+            "provider": provider,
+            "model": model,
+            "system": system_prompt,
+            "prompt": prompt,
+            "params": params or {}
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _record(self, counter: str, count: int = 1) -> None:
+        with self._lock:
+            self.stats[counter] += count
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached response and mark it as recently used.
+
+        Returns:
+            Response text, or None on a miss
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            self._record("misses")
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Ignoring unreadable LLM cache entry {path.name}: {e}")
+            self._record("misses")
+            return None
+
+        self._record("hits")
+        return entry.get("response")
+
+    def put(self, key: str, response: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Store a response and evict least recently used entries over the bounds.
+
+        Args:
+            key: Key from make_key
+            response: Response text
+            metadata: Optional details kept with the entry (provider, model, ...)
+        """
+        entry = {
+            "stored_at": time.time(),
+            "metadata": metadata or {},
+            "response": response
+        }
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, separators=(',', ':'), default=str)
+            os.replace(tmp_path, self._entry_path(key))
+            self._record("stores")
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Failed to write LLM cache entry: {e}")
+            return
+        self._evict()
+
+    def record_bypass(self) -> None:
+        """Count a lookup that was skipped on request."""
+        self._record("bypassed")
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until both bounds are met."""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort(key=lambda item: item[0])
+
+        total_bytes = sum(size for _, size, _ in entries)
+        count = len(entries)
+        removed = 0
+        for _, size, path in entries:
+            if count <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            count -= 1
+            total_bytes -= size
+            removed += 1
+        if removed:
+            self._record("evictions", removed)
+
+    def clear(self) -> int:
+        """
+        Remove every cached response.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters for this session."""
+        with self._lock:
+            stats = dict(self.stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] / lookups * 100) if lookups else 0.0
+        stats["cache_dir"] = str(self.cache_dir)
+        return stats
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Streaming LLM Output
+
+Helpers for streaming analyst completions from Anthropic and OpenAI instead
+of waiting for the whole response.
+
+Key Features:
+- One text-chunk iterator for both providers
+- Time-to-first-token, total time and tokens/sec for the run metadata
+- Progressive markdown writer that appends chunks to the report as they arrive
+
+Author: Fantasy Football Optimizer
+Date: October 2025
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.prompt_caching import build_request, cache_usage
+
+# Rough characters per token, used when the provider reports no usage
+CHARS_PER_TOKEN = 4
+
+
+def iter_llm_stream(client: Any, provider: str, model: str, system_prompt: str, prompt: str,
+                    params: Dict[str, Any], usage: Dict[str, Any],
+                    context_blocks: Optional[List[str]] = None) -> Iterator[str]:
+    """
+    Yield response text chunks as the provider sends them.
+
+    Args:
+        client: anthropic.Anthropic or openai.OpenAI client
+        provider: "anthropic" or "openai"
+        model: Model name
+        system_prompt: System prompt
+        prompt: User prompt
+        params: Sampling params (temperature, max_tokens)
+        usage: Filled with output and prompt cache token counts once the stream ends (if reported)
+        context_blocks: Stable data blocks sent (and cached) before the prompt
+    """
+    request = build_request(provider, model, system_prompt, prompt, context_blocks)
+    if provider == "anthropic":
+        with client.messages.stream(**request, **params) as stream:
+            for text in stream.text_stream:
+                if text:
+                    yield text
+            final = stream.get_final_message()
+            usage.update(cache_usage(provider, getattr(final, 'usage', None)))
+    else:
+        response = client.chat.completions.create(
+            **request,
+            stream=True,
+            stream_options={"include_usage": True},
+            **params
+        )
+        for chunk in response:
+            if getattr(chunk, 'usage', None):
+                usage.update(cache_usage(provider, chunk.usage))
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+class StreamMetrics:
+    """
+    Timing for one LLM call: time to first token, total time and tokens/sec.
+    """
+
+    def __init__(self, streamed: bool = True):
+        self.streamed = streamed
+        self.started = time.perf_counter()
+        self.first_token_at: Optional[float] = None
+        self.chars = 0
+
+    def record_chunk(self, text: str) -> None:
+        """Note a chunk of response text."""
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self.chars += len(text)
+
+    def summary(self, output_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Build the metrics dict for the run metadata.
+
+        Args:
+            output_tokens: Tokens reported by the provider (estimated from text if None)
+        """
+        finished = time.perf_counter()
+        estimated = output_tokens is None
+        tokens = self.chars // CHARS_PER_TOKEN if estimated else output_tokens
+
+        # Generation rate is measured from the first token (non-streamed calls: from the request)
+        generation_start = self.first_token_at if self.streamed and self.first_token_at else self.started
+        generation_time = finished - generation_start
+
+        return {
+            "streamed": self.streamed,
+            "time_to_first_token_s": round(self.first_token_at - self.started, 3)
+            if self.streamed and self.first_token_at else None,
+            "total_time_s": round(finished - self.started, 3),
+            "output_tokens": tokens,
+            "output_tokens_estimated": estimated,
+            "tokens_per_second": round(tokens / generation_time, 1) if generation_time > 0 else None
+        }
+
+
+class ProgressiveReportWriter:
+    """
+    Markdown report written chunk by chunk while the analysis streams.
+
+    Usage:
+        with ProgressiveReportWriter(path, header) as writer:
+            for text in chunks:
+                writer.write(text)
+            writer.finish(footer)
+    """
+
+    def __init__(self, filepath: str, header: str):
+        """
+        Args:
+            filepath: Report path (parent directories are created)
+            header: Markdown written before the first chunk
+        """
+        self.filepath = filepath
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        self._file = open(filepath, 'w', encoding='utf-8')
+        self._file.write(header)
+        self._file.flush()
+        self._finished = False
+
+    def write(self, text: str) -> None:
+        """Append a chunk and flush it to disk."""
+        self._file.write(text)
+        self._file.flush()
+
+    def finish(self, footer: str = "") -> None:
+        """Write the footer and close the report."""
+        if self._file.closed:
+            return
+        self._file.write(footer)
+        self._file.close()
+        self._finished = True
+
+    def __enter__(self) -> "ProgressiveReportWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if not self._finished and not self._file.closed:
+            if exc_type is not None:
+                self._file.write(f"\n\n---\n*Stream interrupted: {exc}*\n")
+            self._file.close()
+
+
+def format_metrics_markdown(metrics: Dict[str, Any]) -> List[str]:
+    """Markdown bullet lines for an LLM metrics dict."""
+    if not metrics:
+        return []
+    if metrics.get("cached"):
+        return ["- **LLM Response:** served from local cache"]
+    lines = []
+    if metrics.get("cache_read_tokens") is not None:
+        lines.append(f"- **Prompt Cache:** {metrics['cache_read_tokens']:,} tokens read, "
+                     f"{metrics.get('cache_write_tokens', 0):,} written, "
+                     f"{metrics.get('input_tokens', 0):,} uncached input")
+    if metrics.get("time_to_first_token_s") is not None:
+        lines.append(f"- **Time to First Token:** {metrics['time_to_first_token_s']:.2f}s")
+    lines.append(f"- **Generation Time:** {metrics.get('total_time_s', 0):.2f}s")
+    if metrics.get("tokens_per_second") is not None:
+        estimated = " (estimated)" if metrics.get("output_tokens_estimated") else ""
+        lines.append(f"- **Output Tokens:** {metrics.get('output_tokens', 0):,}{estimated}"
+                     f" at {metrics['tokens_per_second']:.1f} tokens/sec")
+    return lines
+
+
+def live_report_header(provider: str, model: str, tz: Any = None) -> str:
+    """Header for a streamed analysis report."""
+    started = datetime.now(tz).strftime('%Y-%m-%d %H:%M:%S %Z') if tz else datetime.now().isoformat()
+    return f"""# Fantasy Football Analysis (Streaming)
+
+**Started:** {started}
+**Model:** {provider} - {model}
+
+## Analysis
+
+"""
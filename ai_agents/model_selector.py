@@ -169,6 +169,17 @@ class ModelSelector:
                     return model
         return None
     
+    def get_context_window(self, provider: str, model_id: str) -> Optional[int]:
+        """Get a model's context window in tokens (e.g. "200k tokens" -> 200000)"""
+        model = self.get_model_info(provider, model_id)
+        if not model:
+            return None
+        size = model.get("context_window", "").split()[0].lower() if model.get("context_window") else ""
+        try:
+            return int(float(size[:-1]) * 1000) if size.endswith("k") else int(size)
+        except ValueError:
+            return None
+
     def validate_model(self, provider: str, model_id: str) -> bool:
         """Validate that a model exists and is available"""
         if provider in self.models:
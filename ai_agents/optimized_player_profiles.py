@@ -4,7 +4,6 @@ Optimized player profile system with configurable limits
 Creates comprehensive player profiles from Yahoo, Sleeper, and Tank01 data
 """
 
-import json
 import sys
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -15,7 +14,9 @@ project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
 from config.player_limits import get_player_limits, get_total_available_players, validate_limits
-import tiktoken
+from data_collection.scripts.shared.file_utils import DataFileManager
+from data_collection.scripts.shared.season_context import get_season_context_service
+from ai_agents.token_accounting import get_token_counter
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +29,7 @@ class OptimizedPlayerProfiles:
             player_limits: Dict with position -> limit overrides
         """
         self.player_limits = get_player_limits(player_limits)
-        self.encoding = tiktoken.get_encoding("cl100k_base")
+        self.token_counter = get_token_counter()
         
         # Validate limits
         is_valid, error = validate_limits(self.player_limits)
@@ -168,38 +169,36 @@ class OptimizedPlayerProfiles:
             "sleeper": [],
             "tank01": []
         }
+        file_manager = DataFileManager(data_dir)
         
         # Load Yahoo available players
         try:
-            yahoo_file = self._find_latest_file(f"{data_dir}/yahoo/available_players", "*_raw_data.json")
+            yahoo_file = file_manager.get_latest_file("yahoo", "available_players", "raw_data")
             if yahoo_file:
-                with open(yahoo_file, 'r') as f:
-                    yahoo_data = json.load(f)
-                    available_players["yahoo"] = yahoo_data.get("available_players", [])
+                yahoo_data = file_manager.load_raw_data(yahoo_file)
+                available_players["yahoo"] = yahoo_data.get("available_players", [])
         except Exception as e:
             logger.warning(f"Could not load Yahoo available players: {e}")
         
         # Load Sleeper available players
         try:
-            sleeper_file = self._find_latest_file(f"{data_dir}/sleeper/available_players", "*_raw_data.json")
+            sleeper_file = file_manager.get_latest_file("sleeper", "available_players", "raw_data")
             if sleeper_file:
-                with open(sleeper_file, 'r') as f:
-                    sleeper_data = json.load(f)
-                    available_players["sleeper"] = sleeper_data.get("available_players", [])
+                sleeper_data = file_manager.load_raw_data(sleeper_file)
+                available_players["sleeper"] = sleeper_data.get("available_players", [])
         except Exception as e:
             logger.warning(f"Could not load Sleeper available players: {e}")
         
         # Load Tank01 available players (separate from Yahoo)
         try:
-            tank01_file = self._find_latest_file(f"{data_dir}/tank01/available_players", "*_raw_data.json")
+            tank01_file = file_manager.get_latest_file("tank01", "available_players", "raw_data")
             if tank01_file:
-                with open(tank01_file, 'r') as f:
-                    tank01_data = json.load(f)
-                    # Tank01 data is in processed_data.available_players
-                    if "processed_data" in tank01_data and "available_players" in tank01_data["processed_data"]:
-                        available_players["tank01"] = tank01_data["processed_data"]["available_players"]
-                    else:
-                        available_players["tank01"] = tank01_data.get("available_players", [])
+                tank01_data = file_manager.load_raw_data(tank01_file)
+                # Tank01 data is in processed_data.available_players
+                if "processed_data" in tank01_data and "available_players" in tank01_data["processed_data"]:
+                    available_players["tank01"] = tank01_data["processed_data"]["available_players"]
+                else:
+                    available_players["tank01"] = tank01_data.get("available_players", [])
         except Exception as e:
             logger.warning(f"Could not load Tank01 available players: {e}")
         
@@ -280,30 +279,14 @@ class OptimizedPlayerProfiles:
         
         return None
     
-    def _find_latest_file(self, directory: str, pattern: str) -> Optional[str]:
-        """Find the latest file matching pattern in directory with YYYY/MM/DD structure"""
-        import glob
-        import os
-        
-        files = glob.glob(f"{directory}/**/{pattern}", recursive=True)
-        if not files:
-            return None
-        
-        return max(files, key=os.path.getctime)
-    
     def _extract_season_context(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract season context from any available data source"""
         for api_data in raw_data.values():
             if isinstance(api_data, dict) and "season_context" in api_data:
                 return api_data["season_context"]
         
-        # Fallback to current date
-        from datetime import datetime
-        return {
-            "nfl_season": "2025",
-            "current_week": 1,
-            "season_phase": "Early Regular Season"
-        }
+        # Fallback to the shared season context
+        return get_season_context_service().get_season_context("Multi-API (Yahoo, Sleeper, Tank01)")
     
     def _extract_source_files(self, raw_data: Dict[str, Any]) -> List[str]:
         """Extract source file information"""
@@ -322,8 +305,7 @@ class OptimizedPlayerProfiles:
         
         for position, players in players_by_position.items():
             for player in players:
-                player_json = json.dumps(player, indent=2)
-                total_tokens += len(self.encoding.encode(player_json))
+                total_tokens += self.token_counter.count_object(player)
         
         return total_tokens
     
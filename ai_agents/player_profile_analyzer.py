@@ -11,6 +11,8 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
+from data_collection.scripts.shared.file_utils import DataFileManager
+
 import tiktoken
 
 def create_optimized_player_profile():
@@ -310,14 +312,13 @@ def analyze_current_data_structure():
     print(f"\nCURRENT DATA STRUCTURE ANALYSIS")
     print("-" * 35)
     
+    file_manager = DataFileManager("data_collection/outputs")
+    
     # Check Yahoo player data
     try:
-        import glob
-        yahoo_files = glob.glob("data_collection/outputs/yahoo/available_players/**/*_raw_data.json", recursive=True)
-        if yahoo_files:
-            latest_yahoo = max(yahoo_files, key=lambda x: x.split('/')[-1])
-            with open(latest_yahoo, 'r') as f:
-                yahoo_data = json.load(f)
+        latest_yahoo = file_manager.get_latest_file("yahoo", "available_players", "raw_data")
+        if latest_yahoo:
+            yahoo_data = file_manager.load_raw_data(latest_yahoo)
         else:
             print("No Yahoo available players data found")
             return
@@ -332,11 +333,9 @@ def analyze_current_data_structure():
     
     # Check Sleeper player data
     try:
-        sleeper_files = glob.glob("data_collection/outputs/sleeper/available_players/**/*_raw_data.json", recursive=True)
-        if sleeper_files:
-            latest_sleeper = max(sleeper_files, key=lambda x: x.split('/')[-1])
-            with open(latest_sleeper, 'r') as f:
-                sleeper_data = json.load(f)
+        latest_sleeper = file_manager.get_latest_file("sleeper", "available_players", "raw_data")
+        if latest_sleeper:
+            sleeper_data = file_manager.load_raw_data(latest_sleeper)
         else:
             print("No Sleeper available players data found")
             return
@@ -351,11 +350,9 @@ def analyze_current_data_structure():
     
     # Check Tank01 player data
     try:
-        tank01_files = glob.glob("data_collection/outputs/tank01/available_players/**/*_raw_data.json", recursive=True)
-        if tank01_files:
-            latest_tank01 = max(tank01_files, key=lambda x: x.split('/')[-1])
-            with open(latest_tank01, 'r') as f:
-                tank01_data = json.load(f)
+        latest_tank01 = file_manager.get_latest_file("tank01", "available_players", "raw_data")
+        if latest_tank01:
+            tank01_data = file_manager.load_raw_data(latest_tank01)
         else:
             print("No Tank01 available players data found")
             return
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Provider Prompt Caching
+
+Builds LLM requests so the parts that repeat from call to call (the system
+prompt, then league and roster data) come first and are marked cacheable,
+and reads the cache token counts back from the response usage.
+
+- Anthropic: cache_control breakpoints at the end of the system prompt and
+  at the end of the stable context blocks. A repeated prefix is billed as a
+  cache read instead of full input.
+- OpenAI: caching is automatic for repeated prefixes, so the request keeps a
+  stable order: system prompt, stable context blocks, then the variable
+  request text.
+
+Key Features:
+- One request builder for both providers
+- Cache read/write token counts per call from the provider's usage
+- Layout summary (breakpoints, cacheable tokens) for run metadata
+
+Author: Fantasy Football Optimizer
+Date: October 2025
+"""
+
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.token_accounting import get_token_counter
+
+# Anthropic allows at most 4 cache_control breakpoints per request
+MAX_CACHE_BREAKPOINTS = 4
+EPHEMERAL = {"type": "ephemeral"}
+
+# Usage fields kept in the per-call LLM metrics
+PROMPT_CACHE_FIELDS = ("input_tokens", "cache_read_tokens", "cache_write_tokens")
+
+
+def build_request(provider: str, model: str, system_prompt: str, prompt: str,
+                  context_blocks: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Build request kwargs (model, system, messages) with stable prefixes first.
+
+    Args:
+        provider: "anthropic" or "openai"
+        model: Model name
+        system_prompt: System prompt (identical across calls)
+        prompt: Variable request text (user question, web research)
+        context_blocks: Stable data blocks sent before the prompt (league, rosters)
+
+    Returns:
+        Keyword arguments for messages.create / chat.completions.create
+        (sampling params are added by the caller)
+    """
+    context_blocks = [block for block in (context_blocks or []) if block]
+
+    if provider == "anthropic":
+        system = [{"type": "text", "text": system_prompt, "cache_control": EPHEMERAL}] if system_prompt else []
+
+        # Mark the end of the context (and earlier blocks while breakpoints remain)
+        # so a change late in the context still reuses the earlier blocks
+        breakpoints_left = MAX_CACHE_BREAKPOINTS - len(system)
+        marked = set(range(len(context_blocks))[-breakpoints_left:]) if breakpoints_left > 0 else set()
+        content = []
+        for index, block in enumerate(context_blocks):
+            item = {"type": "text", "text": block}
+            if index in marked:
+                item["cache_control"] = EPHEMERAL
+            content.append(item)
+        content.append({"type": "text", "text": prompt})
+
+        request = {"model": model, "messages": [{"role": "user", "content": content}]}
+        if system:
+            request["system"] = system
+        return request
+
+    if provider == "openai":
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": "\n\n".join(context_blocks + [prompt])})
+        return {"model": model, "messages": messages}
+
+    raise ValueError(f"Unsupported model provider: {provider}")
+
+
+def cache_usage(provider: str, usage: Any) -> Dict[str, int]:
+    """
+    Input, cache read, cache write and output token counts from a response usage.
+
+    Anthropic reports input_tokens (uncached), cache_read_input_tokens and
+    cache_creation_input_tokens. OpenAI reports prompt_tokens with
+    prompt_tokens_details.cached_tokens and no cache writes.
+
+    Returns:
+        Dict with the counts the provider reported (empty without usage)
+    """
+    if usage is None:
+        return {}
+
+    counts: Dict[str, Optional[int]] = {}
+    if provider == "anthropic":
+        counts = {
+            "input_tokens": getattr(usage, "input_tokens", None),
+            "cache_read_tokens": getattr(usage, "cache_read_input_tokens", None),
+            "cache_write_tokens": getattr(usage, "cache_creation_input_tokens", None),
+            "output_tokens": getattr(usage, "output_tokens", None)
+        }
+    elif provider == "openai":
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None) if details is not None else None
+        counts = {
+            "input_tokens": prompt_tokens - (cached or 0) if isinstance(prompt_tokens, int) else None,
+            "cache_read_tokens": cached if isinstance(prompt_tokens, int) else None,
+            "cache_write_tokens": 0 if isinstance(prompt_tokens, int) else None,
+            "output_tokens": getattr(usage, "completion_tokens", None)
+        }
+    return {key: int(value) for key, value in counts.items() if isinstance(value, int)}
+
+
+def request_blocks(request: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Text blocks of a request in prompt order (system first), each {"text", "cacheable"}."""
+    blocks = []
+    system = request.get("system")
+    if isinstance(system, str):
+        blocks.append({"text": system, "cacheable": False})
+    elif isinstance(system, list):
+        blocks.extend({"text": item.get("text", ""), "cacheable": "cache_control" in item} for item in system)
+    for message in request.get("messages", []):
+        content = message.get("content")
+        if isinstance(content, str):
+            blocks.append({"text": content, "cacheable": False})
+        elif isinstance(content, list):
+            blocks.extend({"text": item.get("text", ""), "cacheable": "cache_control" in item} for item in content)
+    return blocks
+
+
+def describe_cache_layout(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Summarize a request's cache breakpoints for run metadata.
+
+    Returns:
+        breakpoints, cacheable_tokens (prompt tokens up to the last breakpoint)
+        and prompt_tokens
+    """
+    counter = get_token_counter()
+    breakpoints = 0
+    tokens = 0
+    cacheable_tokens = 0
+    for block in request_blocks(request):
+        tokens += counter.count_text(block["text"])
+        if block["cacheable"]:
+            breakpoints += 1
+            cacheable_tokens = tokens
+    return {"breakpoints": breakpoints, "cacheable_tokens": cacheable_tokens, "prompt_tokens": tokens}
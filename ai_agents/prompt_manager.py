@@ -12,6 +12,8 @@ from datetime import datetime
 from typing import Dict, Optional
 import pytz
 
+from data_collection.scripts.shared.season_context import get_season_context_service
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -101,19 +103,11 @@ class PromptManager:
         Determine the current NFL game week
         
         Returns:
-            Current game week number (1-18)
+            Current game week number (1-18, 0 in preseason)
         """
         try:
-            # Simple calculation based on current date
-            # NFL season typically starts first week of September
-            current_date = datetime.now(self.pacific_tz)
-            season_start = datetime(current_date.year, 9, 1, tzinfo=self.pacific_tz)
-            
-            if current_date < season_start:
-                return 0  # Preseason
-            
-            weeks_elapsed = (current_date - season_start).days // 7
-            return min(weeks_elapsed + 1, 18)  # Max 18 weeks
+            week_info = get_season_context_service().get_week_info()
+            return 0 if week_info.get('coverage_type') == 'preseason' else int(week_info['week'])
             
         except Exception as e:
             logger.warning(f"Could not determine current NFL week: {e}")
@@ -30,6 +30,7 @@ sys.path.insert(0, str(project_root))
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "data_collection", "scripts", "shared"))
 
 from file_utils import DataFileManager
+from ai_agents.prompt_caching import build_request, describe_cache_layout
 
 def get_current_time_pacific():
     """Get current time in Pacific Time Zone."""
@@ -228,6 +229,24 @@ Use the provided analysis prompts and output formatting guidelines to structure
         
         return prompt
     
+    def build_llm_request(self, analysis_prompt: str) -> Dict[str, Any]:
+        """
+        Build the LLM request for an analysis prompt.
+        
+        The system prompt, analysis prompts and output formatting guidelines
+        are identical on every call, so they are sent first and marked for
+        provider prompt caching; the week's performance data follows them.
+        
+        Args:
+            analysis_prompt: Prompt from _create_analysis_prompt
+            
+        Returns:
+            Request kwargs for the provider client (model, system, messages)
+        """
+        provider, model = self.model_name.split("/", 1)
+        return build_request(provider, model, self.system_prompt, analysis_prompt,
+                             context_blocks=[self.analysis_prompts, self.output_formatting])
+    
     def _format_player_data(self, players: List[Dict[str, Any]]) -> str:
         """
         Format player data for the analysis prompt.
@@ -388,8 +407,9 @@ Use the provided analysis prompts and output formatting guidelines to structure
         
         self.stats["players_analyzed"] = processed_data.get("summary", {}).get("total_players_analyzed", 0)
         
-        # Create analysis prompt
+        # Create analysis prompt and the cache-friendly request layout
         analysis_prompt = self._create_analysis_prompt(processed_data)
+        prompt_cache_layout = describe_cache_layout(self.build_llm_request(analysis_prompt))
         
         # Simulate AI analysis (placeholder for actual LLM integration)
         analysis_report = self._simulate_ai_analysis(processed_data)
@@ -419,6 +439,7 @@ Use the provided analysis prompts and output formatting guidelines to structure
                 "agent_name": self.agent_name,
                 "agent_role": self.agent_role,
                 "model_name": self.model_name,
+                "prompt_cache_layout": prompt_cache_layout,
                 "execution_stats": self.stats
             },
             "processed_data": processed_data,
@@ -16,12 +16,13 @@ import logging
 import argparse
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-import tiktoken
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from ai_agents.token_accounting import get_token_counter
+
 def get_current_time_pacific():
     """Get current time in Pacific Time Zone."""
     import pytz
@@ -46,12 +47,8 @@ class QuantTokenValidator:
         self.safety_buffer = 10000  # Safety buffer for response tokens
         self.effective_limit = self.max_tokens - self.safety_buffer
         
-        # Initialize tokenizer
-        try:
-            self.tokenizer = tiktoken.get_encoding("cl100k_base")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize tokenizer: {e}")
-            self.tokenizer = None
+        # Shared tokenizer (loaded once per process)
+        self.token_counter = get_token_counter()
         
         # Track validation results
         self.validation_results = {
@@ -68,7 +65,7 @@ class QuantTokenValidator:
     
     def count_tokens(self, text: str) -> int:
         """
-        Count tokens in text using tiktoken.
+        Count tokens in text using the shared token counter.
         
         Args:
             text: Text to count tokens for
@@ -76,15 +73,7 @@ class QuantTokenValidator:
         Returns:
             Number of tokens
         """
-        if not self.tokenizer:
-            # Fallback: rough estimation (1 token ≈ 4 characters)
-            return len(text) // 4
-        
-        try:
-            return len(self.tokenizer.encode(text))
-        except Exception as e:
-            self.logger.error(f"Error counting tokens: {e}")
-            return len(text) // 4
+        return self.token_counter.count_text(text)
     
     def load_system_prompt(self) -> str:
         """
@@ -309,9 +298,8 @@ class QuantTokenValidator:
         if sample_data is None:
             sample_data = self.create_sample_data()
         
-        # Convert sample data to JSON string for token counting
-        sample_data_json = json.dumps(sample_data, indent=2)
-        self.validation_results["sample_data_tokens"] = self.count_tokens(sample_data_json)
+        # Count sample data as it is serialized into the prompt
+        self.validation_results["sample_data_tokens"] = self.token_counter.count_object(sample_data)
         
         # Calculate total tokens
         total_tokens = (
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Stub LLM Client
+
+Offline stand-in for the anthropic.Anthropic and openai.OpenAI clients. It
+answers with a fixed reply and reports usage the way the providers do,
+including prompt caching, so agents can be run and tested without the
+network or an API key.
+
+Caching is simulated per provider:
+- Anthropic: the prompt up to each cache_control breakpoint is a cache entry.
+  A request reads the longest stored prefix and writes the prefix up to its
+  last breakpoint if that is not stored yet. Prefixes below the minimum
+  cacheable length are not cached.
+- OpenAI: the longest prefix shared with an earlier request is a cache read
+  when it reaches the minimum length, in 128-token increments.
+
+Every request's kwargs are kept in `requests` for inspection.
+
+Author: Fantasy Football Optimizer
+Date: October 2025
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.prompt_caching import request_blocks
+from ai_agents.token_accounting import get_token_counter
+
+# Smallest cacheable prompt prefix (both providers document 1024 tokens)
+MIN_CACHEABLE_TOKENS = 1024
+OPENAI_CACHE_INCREMENT = 128
+
+
+class _StubStream:
+    """Context manager shaped like anthropic's messages.stream"""
+
+    def __init__(self, reply: str, usage: SimpleNamespace):
+        self._reply = reply
+        self._usage = usage
+
+    def __enter__(self) -> "_StubStream":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+    @property
+    def text_stream(self) -> Iterator[str]:
+        for index, word in enumerate(self._reply.split(" ")):
+            yield (" " if index else "") + word
+
+    def get_final_message(self) -> SimpleNamespace:
+        return SimpleNamespace(content=[SimpleNamespace(text=self._reply)], usage=self._usage)
+
+
+class StubLLMClient:
+    """
+    Offline LLM client with provider-style prompt cache accounting.
+
+    Usage:
+        client = StubLLMClient("anthropic")
+        agent.client = client
+        agent._call_llm(prompt)
+        client.requests[-1]    # kwargs sent, including cache_control breakpoints
+    """
+
+    def __init__(self, provider: str = "anthropic", reply: str = "Stub analysis.",
+                 min_cacheable_tokens: int = MIN_CACHEABLE_TOKENS):
+        """
+        Args:
+            provider: Provider whose client and usage shape to mimic ("anthropic" or "openai")
+            reply: Response text for every request
+            min_cacheable_tokens: Shortest prefix the simulated cache stores
+        """
+        if provider not in ("anthropic", "openai"):
+            raise ValueError(f"Unsupported model provider: {provider}")
+        self.provider = provider
+        self.reply = reply
+        self.min_cacheable_tokens = min_cacheable_tokens
+        self.requests: List[Dict[str, Any]] = []
+        self._cached_prefixes = set()
+        self._seen_prompts: List[str] = []
+        self._counter = get_token_counter()
+
+        # Client surfaces: client.messages.create/stream and client.chat.completions.create
+        self.messages = SimpleNamespace(create=self._messages_create, stream=self._messages_stream)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._chat_create))
+
+    # ------------------------------------------------------------------
+    # Anthropic
+    # ------------------------------------------------------------------
+
+    def _anthropic_usage(self, kwargs: Dict[str, Any]) -> SimpleNamespace:
+        self.requests.append(kwargs)
+        prefix = kwargs.get("model", "")
+        total = 0
+        breakpoints = []
+        for block in request_blocks(kwargs):
+            prefix += "\x00" + block["text"]
+            total += self._counter.count_text(block["text"])
+            if block["cacheable"]:
+                breakpoints.append((prefix, total))
+
+        read = max((tokens for text, tokens in breakpoints if text in self._cached_prefixes), default=0)
+        write = 0
+        if breakpoints:
+            last_prefix, last_tokens = breakpoints[-1]
+            if last_prefix not in self._cached_prefixes and last_tokens >= self.min_cacheable_tokens:
+                write = last_tokens - read
+        self._cached_prefixes.update(text for text, tokens in breakpoints if tokens >= self.min_cacheable_tokens)
+
+        return SimpleNamespace(input_tokens=total - read - write, cache_read_input_tokens=read,
+                               cache_creation_input_tokens=write,
+                               output_tokens=self._counter.count_text(self.reply))
+
+    def _messages_create(self, **kwargs) -> SimpleNamespace:
+        usage = self._anthropic_usage(kwargs)
+        return SimpleNamespace(content=[SimpleNamespace(text=self.reply)], usage=usage)
+
+    def _messages_stream(self, **kwargs) -> _StubStream:
+        return _StubStream(self.reply, self._anthropic_usage(kwargs))
+
+    # ------------------------------------------------------------------
+    # OpenAI
+    # ------------------------------------------------------------------
+
+    def _openai_usage(self, kwargs: Dict[str, Any]) -> SimpleNamespace:
+        self.requests.append(kwargs)
+        prompt_text = kwargs.get("model", "") + "".join(
+            "\x00" + block["text"] for block in request_blocks(kwargs))
+
+        shared = max((len(os.path.commonprefix([prompt_text, seen])) for seen in self._seen_prompts), default=0)
+        self._seen_prompts.append(prompt_text)
+
+        total = self._counter.count_text(prompt_text)
+        cached = self._counter.count_text(prompt_text[:shared]) if shared else 0
+        cached = min(cached, total)
+        cached = cached - cached % OPENAI_CACHE_INCREMENT if cached >= self.min_cacheable_tokens else 0
+
+        return SimpleNamespace(prompt_tokens=total, completion_tokens=self._counter.count_text(self.reply),
+                               prompt_tokens_details=SimpleNamespace(cached_tokens=cached))
+
+    def _chat_create(self, stream: bool = False, stream_options: Optional[Dict[str, Any]] = None,
+                     **kwargs) -> Any:
+        usage = self._openai_usage(kwargs)
+        if not stream:
+            message = SimpleNamespace(content=self.reply)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+        chunks = [SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=(" " if index else "") + word))],
+                                  usage=None)
+                  for index, word in enumerate(self.reply.split(" "))]
+        if stream_options and stream_options.get("include_usage"):
+            chunks.append(SimpleNamespace(choices=[], usage=usage))
+        return iter(chunks)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test Token-Budget Context Packer
+
+Offline checks that the comprehensive analysis prompt is packed under its
+token budget, that starters and the opponent outrank waiver targets, and that
+waiver targets are kept by projection. Player data is a local fixture.
+"""
+
+import os
+import sys
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from ai_agents.context_packer import ContextPacker
+from ai_agents.token_accounting import count_tokens
+
+
+def _player(name, position, slot, points, news=3):
+    return {
+        "name": name, "position": position, "team": "KC", "bye_week": "10",
+        "injury_status": "Healthy", "percent_owned": "42", "roster_position": slot,
+        "fantasy_points": points, "fantasy_points_default": points,
+        "depth_chart_position": 1, "years_exp": 4, "active": True, "age": 27,
+        "recent_news": [{"title": f"{name} news item {i} with a long headline",
+                         "link": f"https://example.com/{name.replace(' ', '-')}/{i}"} for i in range(news)],
+        "player_ids": {"sleeper_id": "1234", "tank01_id": "5678", "yahoo_player_id": "91011"}
+    }
+
+
+def _data():
+    return {
+        "season_context": {"nfl_season": "2025", "current_week": 6},
+        "my_roster": {"players_by_position": {
+            "starting_lineup": {"QB": [_player("My Qb", "QB", "QB", "21.5")]},
+            "bench_players": {"RB": [_player("My Bench Rb", "RB", "BN", "8.0")]}
+        }, "total_players": 2},
+        "opponent_roster": {"players_by_position": {
+            "starting_lineup": {"WR": [_player("Their Wr", "WR", "WR", "15.0")]},
+            "bench_players": {}
+        }, "total_players": 1},
+        "available_players": {"players_by_position": {
+            "WR": [_player(f"Waiver Wr {i}", "WR", "Unknown", str(float(i))) for i in range(20)]
+        }, "total_players": 20}
+    }
+
+
+def _render(data):
+    sections = [f"## {section}\n{data[section]['players_by_position']}"
+                for section in ("my_roster", "opponent_roster", "available_players")]
+    return "USER REQUEST: help\n" + "\n".join(sections) + "\n## INSTRUCTIONS\n" + "Analyze. " * 50
+
+
+def _names(section_players):
+    names = []
+    for value in section_players.values():
+        groups = value.values() if isinstance(value, dict) else [value]
+        for players in groups:
+            names.extend(player["name"] for player in players)
+    return names
+
+
+def test_large_budget_keeps_everything():
+    """A budget that fits all the data changes nothing."""
+    data = _data()
+    prompt, report = ContextPacker(1_000_000).fit_prompt(data, _render)
+    assert prompt == _render(data)
+    assert report["players_included"] == report["players_total"] == 23
+    assert report["fields_dropped"] == 0 and report["within_budget"]
+
+
+def test_tight_budget_keeps_most_valuable():
+    """Under a tight budget the prompt fits, rosters stay and waivers are kept by projection."""
+    data = _data()
+    full_tokens = count_tokens(_render(data))
+    packer = ContextPacker(full_tokens // 3)
+    prompt, report = packer.fit_prompt(data, _render)
+    assert count_tokens(prompt) <= packer.token_budget
+    assert report["within_budget"] and report["players_included"] < report["players_total"]
+
+    packed, _ = packer.pack(data, report["player_budget"])
+    my_starter = packed["my_roster"]["players_by_position"]["starting_lineup"]["QB"][0]
+    assert my_starter["fantasy_points"] == "21.5" and my_starter["injury_status"] == "Healthy"
+    assert "Their Wr" in _names(packed["opponent_roster"]["players_by_position"])
+
+    waivers = _names(packed["available_players"]["players_by_position"])
+    assert waivers and "Waiver Wr 19" in waivers and "Waiver Wr 0" not in waivers
+    kept = sorted(int(name.split()[-1]) for name in waivers)
+    assert kept == list(range(kept[0], 20))
+
+
+def test_budget_below_overhead_packs_nothing():
+    """When the fixed prompt alone exceeds the budget no players are added."""
+    data = _data()
+    prompt, report = ContextPacker(10).fit_prompt(data, _render)
+    assert report["players_included"] == 0 and not report["within_budget"]
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Token-Budget Context Packer")
+    print("=" * 40)
+    for test in (test_large_budget_keeps_everything, test_tight_budget_keeps_most_valuable,
+                 test_budget_below_overhead_packs_nothing):
+        test()
+        print(f"✅ {test.__name__}")
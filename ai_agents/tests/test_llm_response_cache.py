@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test LLM Response Cache
+
+Offline checks that identical analyst requests are answered from the local
+cache, that the cache evicts least recently used entries, and that the bypass
+flag forces a fresh call. The LLM client is a local fake.
+"""
+
+import os
+import sys
+import time
+import tempfile
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytz
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from ai_agents.llm_response_cache import LLMResponseCache
+
+
+class FakeAnthropic:
+    """Counts messages.create calls and echoes a numbered answer"""
+
+    def __init__(self):
+        self.calls = 0
+        self.messages = self
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(content=[SimpleNamespace(text=f"analysis #{self.calls}")])
+
+
+def _agent(cache_dir):
+    from ai_agents.analyst_agent import AnalystAgent
+    agent = AnalystAgent.__new__(AnalystAgent)
+    agent.model_provider = "anthropic"
+    agent.model_name = "claude-test"
+    agent.system_prompt = "You are an analyst."
+    agent.client = FakeAnthropic()
+    agent.response_cache = LLMResponseCache(cache_dir)
+    agent.bypass_cache = False
+    agent.stream = False
+    agent.last_llm_metrics = {}
+    return agent
+
+
+class FakeTools:
+    """Fresh gathering timestamps on every call, like AnalystTools"""
+
+    def analyze_recent_data(self):
+        return {"timestamp": datetime.now().isoformat(), "data_files": {},
+                "season_context": {"nfl_season": "2025"}, "roster_analysis": {"yahoo": {"total_players": 15}}}
+
+    def research_current_nfl_news(self):
+        return {"timestamp": datetime.now().isoformat(), "urls": ["https://www.nfl.com/news"],
+                "news_items": [{"headline": "Starter questionable for Sunday", "source": "https://www.nfl.com/news",
+                                "timestamp": datetime.now().isoformat()}]}
+
+
+def test_lru_eviction():
+    """The least recently used entry goes first; reads count as use."""
+    with tempfile.TemporaryDirectory() as root:
+        cache = LLMResponseCache(root, max_entries=2)
+        keys = [LLMResponseCache.make_key("anthropic", "m", "s", f"prompt {i}") for i in range(3)]
+        cache.put(keys[0], "a")
+        cache.put(keys[1], "b")
+        past = time.time() - 60
+        os.utime(cache._entry_path(keys[1]), (past, past))
+        assert cache.get(keys[0]) == "a"
+
+        cache.put(keys[2], "c")
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == "a" and cache.get(keys[2]) == "c"
+        assert cache.get_stats()["evictions"] == 1
+
+
+def test_key_covers_sampling_params():
+    """Changing any part of the request changes the key."""
+    base = LLMResponseCache.make_key("anthropic", "m", "s", "p", {"temperature": 0.7})
+    assert base == LLMResponseCache.make_key("anthropic", "m", "s", "p", {"temperature": 0.7})
+    assert base != LLMResponseCache.make_key("anthropic", "m", "s", "p", {"temperature": 0.2})
+    assert base != LLMResponseCache.make_key("openai", "m", "s", "p", {"temperature": 0.7})
+    assert base != LLMResponseCache.make_key("anthropic", "m", "s2", "p", {"temperature": 0.7})
+
+
+def test_agent_serves_identical_prompt_from_cache():
+    """A repeated analysis costs no call; bypass calls again and refreshes the entry."""
+    with tempfile.TemporaryDirectory() as root:
+        agent = _agent(root)
+        assert agent._call_llm("roster data") == "analysis #1"
+        assert agent._call_llm("roster data") == "analysis #1"
+        assert agent.client.calls == 1
+
+        assert agent._call_llm("roster data", bypass_cache=True) == "analysis #2"
+        assert agent._call_llm("roster data") == "analysis #2"
+        assert agent._call_llm("new roster data") == "analysis #3"
+        assert agent.client.calls == 3
+
+
+def test_repeated_analysis_served_from_cache():
+    """Running the same analysis twice costs one call although the research timestamps differ."""
+    with tempfile.TemporaryDirectory() as root:
+        agent = _agent(root)
+        agent.tools = FakeTools()
+        agent.pacific_tz = pytz.timezone("US/Pacific")
+        agent.session_id = "test"
+        agent.conversation_history = []
+
+        first = agent.analyze("Who should I start?", collect_data=False)
+        second = agent.analyze("Who should I start?", collect_data=False)
+        assert first["analysis"] == second["analysis"] == "analysis #1"
+        assert agent.client.calls == 1
+        assert first["web_research"]["timestamp"] != second["web_research"]["timestamp"]
+        assert (agent._build_comprehensive_analysis_prompt("Who should I start?", {}, first["web_research"])
+                == agent._build_comprehensive_analysis_prompt("Who should I start?", {}, second["web_research"]))
+
+
+if __name__ == "__main__":
+    print("🧪 Testing LLM Response Cache")
+    print("=" * 40)
+    for test in (test_lru_eviction, test_key_covers_sampling_params,
+                 test_agent_serves_identical_prompt_from_cache, test_repeated_analysis_served_from_cache):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test Streaming LLM Output
+
+Offline checks that both providers stream through one iterator, that the
+live report grows while tokens arrive, and that time-to-first-token and
+tokens/sec land in the run metadata. The LLM clients are local fakes.
+"""
+
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+import pytz
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from ai_agents.llm_streaming import iter_llm_stream, StreamMetrics
+
+CHUNKS = ["## Start ", "Josh Allen ", "over ", "Jalen Hurts."]
+
+
+class FakeAnthropicStream:
+    """messages.stream context manager with text_stream and get_final_message"""
+
+    def __init__(self, on_chunk=None):
+        self.on_chunk = on_chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    @property
+    def text_stream(self):
+        for chunk in CHUNKS:
+            yield chunk
+            if self.on_chunk:
+                self.on_chunk(chunk)
+
+    def get_final_message(self):
+        return SimpleNamespace(usage=SimpleNamespace(output_tokens=11))
+
+
+class FakeAnthropic:
+    def __init__(self, on_chunk=None):
+        self.messages = SimpleNamespace(stream=lambda **kwargs: FakeAnthropicStream(on_chunk))
+
+
+class FakeOpenAI:
+    def __init__(self):
+        chunks = [SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=c))], usage=None)
+                  for c in CHUNKS]
+        chunks.append(SimpleNamespace(choices=[], usage=SimpleNamespace(completion_tokens=9)))
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=lambda **kwargs: iter(chunks)))
+
+
+def test_both_providers_stream_chunks():
+    """Anthropic and OpenAI streams yield the same chunks and report output tokens."""
+    for provider, client, tokens in (("anthropic", FakeAnthropic(), 11), ("openai", FakeOpenAI(), 9)):
+        usage = {}
+        chunks = list(iter_llm_stream(client, provider, "m", "system", "prompt",
+                                      {"temperature": 0.7, "max_tokens": 100}, usage))
+        assert chunks == CHUNKS and usage["output_tokens"] == tokens
+
+
+def test_metrics_without_usage_are_estimated():
+    metrics = StreamMetrics()
+    for chunk in CHUNKS:
+        metrics.record_chunk(chunk)
+    summary = metrics.summary()
+    assert summary["streamed"] and summary["time_to_first_token_s"] is not None
+    assert summary["output_tokens_estimated"] and summary["output_tokens"] == len("".join(CHUNKS)) // 4
+
+
+def test_agent_writes_report_progressively():
+    """Each chunk is on disk before the next one arrives; metrics reach the run metadata."""
+    from ai_agents.analyst_agent import AnalystAgent
+    with tempfile.TemporaryDirectory() as root:
+        agent = AnalystAgent.__new__(AnalystAgent)
+        agent.model_provider, agent.model_name = "anthropic", "claude-test"
+        agent.system_prompt = "You are an analyst."
+        agent.response_cache = None
+        agent.bypass_cache = False
+        agent.stream = True
+        agent.live_report_dir = root
+        agent.last_llm_metrics = {}
+        agent.pacific_tz = pytz.timezone('US/Pacific')
+
+        seen_on_disk = []
+
+        def check_disk(chunk):
+            report = os.path.join(root, os.listdir(root)[0])
+            with open(report) as f:
+                seen_on_disk.append(f.read().endswith(chunk))
+
+        agent.client = FakeAnthropic(on_chunk=check_disk)
+        text = agent._call_llm("roster data")
+
+        assert text == "".join(CHUNKS)
+        assert seen_on_disk == [True] * len(CHUNKS)
+        metrics = agent.last_llm_metrics
+        assert metrics["streamed"] and metrics["output_tokens"] == 11 and not metrics["output_tokens_estimated"]
+        assert metrics["time_to_first_token_s"] >= 0 and metrics["tokens_per_second"] > 0
+        with open(metrics["report_path"]) as f:
+            report = f.read()
+        assert "Jalen Hurts." in report and "Time to First Token" in report
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Streaming LLM Output")
+    print("=" * 40)
+    for test in (test_both_providers_stream_chunks, test_metrics_without_usage_are_estimated,
+                 test_agent_writes_report_progressively):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test Provider Prompt Caching
+
+Offline checks that analyst and quant requests put the stable system prompt
+and league data first with cache breakpoints, and that cache read/write
+tokens are recorded per call. The provider is the local stub client.
+"""
+
+import os
+import sys
+import tempfile
+
+import pytz
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from ai_agents.prompt_caching import request_blocks
+from ai_agents.stub_llm_client import StubLLMClient
+
+SYSTEM_PROMPT = "You are a fantasy football analyst. Follow every rule below.\n" + "Rule: cite projections. " * 600
+LEAGUE_BLOCK = "## MY ROSTER PLAYERS\n" + "Josh Allen QB BUF 24.1 projected. " * 400
+
+
+def _agent(provider, root):
+    from ai_agents.analyst_agent import AnalystAgent
+    agent = AnalystAgent.__new__(AnalystAgent)
+    agent.model_provider, agent.model_name = provider, "stub-model"
+    agent.system_prompt = SYSTEM_PROMPT
+    agent.client = StubLLMClient(provider, reply="Start Josh Allen.")
+    agent.response_cache = None
+    agent.bypass_cache = False
+    agent.stream = False
+    agent.live_report_dir = root
+    agent.pacific_tz = pytz.timezone('US/Pacific')
+    agent.last_llm_metrics = {}
+    return agent
+
+
+def test_anthropic_breakpoints_and_cache_accounting():
+    """System prompt and league block are breakpoints; the second call reads them from cache."""
+    with tempfile.TemporaryDirectory() as root:
+        agent = _agent("anthropic", root)
+        assert agent._call_llm("USER REQUEST: who starts?", context_blocks=[LEAGUE_BLOCK]) == "Start Josh Allen."
+
+        request = agent.client.requests[-1]
+        assert request["system"][0]["cache_control"] == {"type": "ephemeral"}
+        content = request["messages"][0]["content"]
+        assert content[0]["text"] == LEAGUE_BLOCK and "cache_control" in content[0]
+        assert content[-1]["text"] == "USER REQUEST: who starts?" and "cache_control" not in content[-1]
+
+        first = agent.last_llm_metrics
+        assert first["cache_read_tokens"] == 0 and first["cache_write_tokens"] > 0
+
+        agent.stream = True
+        assert agent._call_llm("USER REQUEST: any waiver adds?", context_blocks=[LEAGUE_BLOCK]) == "Start Josh Allen."
+        second = agent.last_llm_metrics
+        assert second["streamed"] and second["cache_write_tokens"] == 0
+        assert second["cache_read_tokens"] == first["cache_write_tokens"]
+        assert second["input_tokens"] < first["cache_write_tokens"] // 10
+        with open(second["report_path"]) as f:
+            assert "Prompt Cache" in f.read()
+
+
+def test_openai_prefix_is_stable():
+    """OpenAI requests keep system, league data, then the question, so the prefix is reused."""
+    with tempfile.TemporaryDirectory() as root:
+        agent = _agent("openai", root)
+        agent._call_llm("USER REQUEST: who starts?", context_blocks=[LEAGUE_BLOCK])
+        assert agent.last_llm_metrics["cache_read_tokens"] == 0
+
+        agent._call_llm("USER REQUEST: any waiver adds?", context_blocks=[LEAGUE_BLOCK])
+        messages = agent.client.requests[-1]["messages"]
+        assert [m["role"] for m in messages] == ["system", "user"]
+        assert messages[1]["content"].startswith(LEAGUE_BLOCK)
+        cached = agent.last_llm_metrics["cache_read_tokens"]
+        assert cached >= 1024 and cached % 128 == 0
+        assert agent.last_llm_metrics["cache_write_tokens"] == 0
+
+
+def test_quant_request_caches_static_prompts():
+    """Quant's system prompt, analysis prompts and formatting guide precede the week's data."""
+    from ai_agents.quant_agent import QuantAgent
+    agent = QuantAgent.__new__(QuantAgent)
+    agent.model_name = "anthropic/claude-3-5-sonnet-20241022"
+    agent.system_prompt = SYSTEM_PROMPT
+    agent.analysis_prompts = "## Analysis prompts\n" + "Compare actual vs projected. " * 50
+    agent.output_formatting = "## Output formatting\n" + "Use tables. " * 50
+
+    request = agent.build_llm_request("Week 5 data: Josh Allen 30.2 actual")
+    blocks = request_blocks(request)
+    assert request["model"] == "claude-3-5-sonnet-20241022"
+    assert [block["cacheable"] for block in blocks] == [True, True, True, False]
+    assert blocks[-1]["text"].startswith("Week 5 data")
+
+    client = StubLLMClient("anthropic")
+    client.messages.create(**request, max_tokens=100)
+    usage = client.messages.create(**agent.build_llm_request("Week 6 data"), max_tokens=100).usage
+    assert usage.cache_read_input_tokens > 0 and usage.cache_creation_input_tokens == 0
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Provider Prompt Caching")
+    print("=" * 40)
+    for test in (test_anthropic_breakpoints_and_cache_accounting, test_openai_prefix_is_stable,
+                 test_quant_request_caches_static_prompts):
+        test()
+        print(f"✅ {test.__name__}")
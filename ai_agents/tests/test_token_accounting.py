@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test Token Accounting Service
+
+Offline checks that object token counts are memoized by content, that the
+approximate counter calibrates to the exact one, and that counting still
+works without tiktoken. The encoder is a local fake.
+"""
+
+import os
+import sys
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from ai_agents.token_accounting import TokenCounter, DEFAULT_CHARS_PER_TOKEN
+
+
+class FakeEncoding:
+    """One token per 5 characters; counts encode calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text):
+        self.calls += 1
+        return [text[i:i + 5] for i in range(0, len(text), 5)]
+
+
+def _counter():
+    counter = TokenCounter()
+    counter._encoding = FakeEncoding()
+    return counter
+
+
+def _player(i):
+    return {"name": f"Player {i}", "position": "WR", "team": "KC", "fantasy_points": f"{i}.5",
+            "recent_news": [{"title": f"Headline {i}", "link": f"https://example.com/{i}"}]}
+
+
+def test_object_counts_are_memoized_by_content():
+    """Equal content is encoded once; changed content is encoded again."""
+    counter = _counter()
+    first = counter.count_object(_player(1))
+    assert counter.count_object(dict(_player(1))) == first
+    assert counter._encoding.calls == 1 and counter.stats["memo_hits"] == 1
+
+    changed = _player(1)
+    changed["fantasy_points"] = "99.5"
+    counter.count_object(changed)
+    assert counter._encoding.calls == 2
+
+    # The same object at another indent is a different prompt text
+    counter.count_object(_player(1), indent=None)
+    assert counter._encoding.calls == 3
+
+
+def test_estimate_calibrates_to_exact_counts():
+    """After calibration the estimate tracks the encoder's characters per token."""
+    counter = _counter()
+    assert counter.chars_per_token == DEFAULT_CHARS_PER_TOKEN
+
+    ratio = counter.calibrate(_player(i) for i in range(30))
+    assert abs(ratio - 5.0) < 0.2
+
+    player = _player(42)
+    exact = counter.count_object(player)
+    assert abs(counter.estimate_object(player) - exact) <= max(2, exact * 0.05)
+
+
+def test_without_tiktoken_counts_are_estimates():
+    """An unavailable encoder falls back to the estimate instead of failing."""
+    counter = TokenCounter()
+    counter._encoding_failed = True
+    text = "x" * 300
+    assert counter.count_text(text) == 100
+    assert counter.get_stats()["exact_available"] is False
+    assert counter.stats["exact_counts"] == 0
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Token Accounting Service")
+    print("=" * 40)
+    for test in (test_object_counts_are_memoized_by_content, test_estimate_calibrates_to_exact_counts,
+                 test_without_tiktoken_counts_are_estimates):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Token Accounting Service
+
+One process-wide token counter for prompt budgeting and token reports.
+
+Key Features:
+- The cl100k_base encoder is loaded once per process, not on every count
+- Token counts of JSON objects (players, sections) are memoized by a hash of
+  their content, so a player is encoded once however often it is counted
+- A fast approximate counter (characters per token) calibrated by the exact
+  counts made so far; used where a close estimate is enough, such as
+  weighing individual fields while packing a prompt
+- Falls back to the estimate when tiktoken or its encoding file is unavailable
+
+Usage:
+    counter = get_token_counter()
+    counter.count_text(prompt)              # exact
+    counter.count_object(player)            # exact, memoized
+    counter.estimate_object(player)         # approximate
+
+Author: Fantasy Football Optimizer
+Date: October 2025
+"""
+
+import json
+import math
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+ENCODING_NAME = "cl100k_base"
+
+# Characters per token before any exact count calibrates it. JSON tokenizes
+# denser than prose, so this errs on the high side of the token count.
+DEFAULT_CHARS_PER_TOKEN = 3.0
+
+# Memoized object counts kept (least recently used dropped first)
+DEFAULT_MEMO_SIZE = 50000
+
+# Exact counts needed before the calibrated ratio replaces the default
+MIN_CALIBRATION_CHARS = 2000
+
+
+class TokenCounter:
+    """
+    Exact and approximate token counts with a shared encoder and memo.
+    """
+
+    def __init__(self, encoding_name: str = ENCODING_NAME, memo_size: int = DEFAULT_MEMO_SIZE):
+        """
+        Initialize the counter. The encoder is loaded on first use.
+
+        Args:
+            encoding_name: tiktoken encoding
+            memo_size: Maximum memoized object counts
+        """
+        self.encoding_name = encoding_name
+        self.memo_size = max(1, memo_size)
+        self._encoding = None
+        self._encoding_failed = False
+        self._lock = threading.Lock()
+        self._memo: "OrderedDict[str, int]" = OrderedDict()
+
+        # Calibration totals from exact counts
+        self._calibration_chars = 0
+        self._calibration_tokens = 0
+
+        self.stats = {
+            "exact_counts": 0,
+            "memo_hits": 0,
+            "estimates": 0
+        }
+
+    # ------------------------------------------------------------------
+    # Encoder
+    # ------------------------------------------------------------------
+
+    def _get_encoding(self):
+        if self._encoding is None and not self._encoding_failed:
+            with self._lock:
+                if self._encoding is None and not self._encoding_failed:
+                    try:
+                        import tiktoken
+                        self._encoding = tiktoken.get_encoding(self.encoding_name)
+                    except Exception as e:
+                        # Missing package or encoding file that cannot be downloaded
+                        logger.warning(f"tiktoken unavailable, estimating token counts: {e}")
+                        self._encoding_failed = True
+        return self._encoding
+
+    @property
+    def exact_available(self) -> bool:
+        """True if counts come from the tokenizer rather than the estimate."""
+        return self._get_encoding() is not None
+
+    # ------------------------------------------------------------------
+    # Counting
+    # ------------------------------------------------------------------
+
+    def count_text(self, text: str) -> int:
+        """Exact token count of a string (the estimate without tiktoken)."""
+        encoding = self._get_encoding()
+        if encoding is None:
+            return self.estimate_text(text)
+        tokens = len(encoding.encode(text))
+        with self._lock:
+            self.stats["exact_counts"] += 1
+            self._calibration_chars += len(text)
+            self._calibration_tokens += tokens
+        return tokens
+
+    def count_object(self, obj: Any, indent: Optional[int] = 2) -> int:
+        """
+        Exact token count of an object serialized as JSON, memoized by content.
+
+        Args:
+            obj: JSON-serializable object
+            indent: Indent used when the object is rendered into a prompt
+        """
+        key = self._content_key(obj, indent)
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                self.stats["memo_hits"] += 1
+                return self._memo[key]
+
+        tokens = self.count_text(json.dumps(obj, indent=indent, default=str))
+        with self._lock:
+            self._memo[key] = tokens
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return tokens
+
+    @staticmethod
+    def _content_key(obj: Any, indent: Optional[int]) -> str:
+        content = json.dumps(obj, separators=(',', ':'), default=str)
+        return f"{indent}:{hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()}"
+
+    # ------------------------------------------------------------------
+    # Approximate counting
+    # ------------------------------------------------------------------
+
+    @property
+    def chars_per_token(self) -> float:
+        """Characters per token observed in exact counts (default until calibrated)."""
+        with self._lock:
+            if self._calibration_chars < MIN_CALIBRATION_CHARS or not self._calibration_tokens:
+                return DEFAULT_CHARS_PER_TOKEN
+            return self._calibration_chars / self._calibration_tokens
+
+    def estimate_text(self, text: str) -> int:
+        """Approximate token count of a string from its length."""
+        with self._lock:
+            self.stats["estimates"] += 1
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def estimate_object(self, obj: Any, indent: Optional[int] = 2) -> int:
+        """Approximate token count of an object serialized as JSON."""
+        return self.estimate_text(json.dumps(obj, indent=indent, default=str))
+
+    def calibrate(self, samples: Iterable[Any], indent: Optional[int] = 2) -> float:
+        """
+        Count samples exactly so the estimate matches this kind of content.
+
+        Args:
+            samples: Strings or JSON-serializable objects (e.g. a few player profiles)
+
+        Returns:
+            Characters per token after calibration
+        """
+        for sample in samples:
+            if isinstance(sample, str):
+                self.count_text(sample)
+            else:
+                self.count_object(sample, indent)
+        return self.chars_per_token
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get counters, memo size and the calibrated ratio."""
+        chars_per_token = self.chars_per_token
+        with self._lock:
+            stats = dict(self.stats)
+            stats["memo_entries"] = len(self._memo)
+        stats["chars_per_token"] = round(chars_per_token, 3)
+        stats["exact_available"] = self.exact_available
+        return stats
+
+
+_shared_counter: Optional[TokenCounter] = None
+_shared_counter_lock = threading.Lock()
+
+
+def get_token_counter() -> TokenCounter:
+    """Get the process-wide shared TokenCounter."""
+    global _shared_counter
+    with _shared_counter_lock:
+        if _shared_counter is None:
+            _shared_counter = TokenCounter()
+        return _shared_counter
+
+
+def count_tokens(text: str) -> int:
+    """Exact token count of a string with the shared counter."""
+    return get_token_counter().count_text(text)
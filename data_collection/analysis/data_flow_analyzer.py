@@ -12,6 +12,7 @@ project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
 from ai_agents.analyst_tools import AnalystTools
+from data_collection.scripts.shared.file_utils import DataFileManager
 import tiktoken
 
 def analyze_data_flow():
@@ -102,29 +103,21 @@ def check_missing_data():
     print("\n\nMISSING DATA ANALYSIS")
     print("=" * 30)
     
-    # Check what files exist
-    import glob
+    # Check what files exist (latest raw data per script from the output manifests)
     import os
     
-    data_dirs = [
-        "data_collection/outputs/yahoo",
-        "data_collection/outputs/sleeper", 
-        "data_collection/outputs/tank01"
-    ]
-    
-    for data_dir in data_dirs:
-        if os.path.exists(data_dir):
-            print(f"\n{data_dir.upper()}:")
-            for subdir in os.listdir(data_dir):
-                subdir_path = os.path.join(data_dir, subdir)
-                if os.path.isdir(subdir_path):
-                    json_files = glob.glob(os.path.join(subdir_path, "**/*_raw_data.json"), recursive=True)
-                    if json_files:
-                        latest_file = max(json_files, key=os.path.getctime)
-                        file_size = os.path.getsize(latest_file)
-                        print(f"  {subdir}: {file_size:,} bytes - {os.path.basename(latest_file)}")
-                    else:
-                        print(f"  {subdir}: NO JSON FILES")
+    file_manager = DataFileManager()
+    for api in ("yahoo", "sleeper", "tank01"):
+        data_dir = file_manager.base_output_dir / api
+        if data_dir.is_dir():
+            print(f"\n{api.upper()}:")
+            for subdir in sorted(d.name for d in data_dir.iterdir() if d.is_dir()):
+                latest_file = file_manager.get_latest_file(api, subdir, "raw_data")
+                if latest_file:
+                    file_size = os.path.getsize(latest_file)
+                    print(f"  {subdir}: {file_size:,} bytes - {os.path.basename(latest_file)}")
+                else:
+                    print(f"  {subdir}: NO RAW DATA FILES")
 
 if __name__ == "__main__":
     analyze_data_flow()
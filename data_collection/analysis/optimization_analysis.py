@@ -12,6 +12,7 @@ project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
 from ai_agents.analyst_tools import AnalystTools
+from data_collection.scripts.shared.file_utils import DataFileManager
 import tiktoken
 
 def analyze_current_week_opponent_savings():
@@ -113,21 +114,17 @@ def analyze_missing_sleeper_tank01_data():
     
     # Check what files exist but aren't being used
     print("\nFiles that exist but aren't being analyzed:")
-    import glob
     import os
     
-    sleeper_files = glob.glob("data_collection/outputs/sleeper/**/*_raw_data.json", recursive=True)
-    tank01_files = glob.glob("data_collection/outputs/tank01/**/*_raw_data.json", recursive=True)
-    
-    print("Sleeper files:")
-    for file in sleeper_files:
-        file_size = os.path.getsize(file)
-        print(f"  {file}: {file_size:,} bytes")
-    
-    print("Tank01 files:")
-    for file in tank01_files:
-        file_size = os.path.getsize(file)
-        print(f"  {file}: {file_size:,} bytes")
+    file_manager = DataFileManager()
+    for api in ("sleeper", "tank01"):
+        print(f"{api.capitalize()} files:")
+        api_dir = file_manager.base_output_dir / api
+        script_dirs = sorted(d for d in api_dir.iterdir() if d.is_dir()) if api_dir.is_dir() else []
+        for script_dir in script_dirs:
+            for file in file_manager.list_files(api, script_dir.name)["raw_data"]:
+                file_size = os.path.getsize(file)
+                print(f"  {file}: {file_size:,} bytes")
 
 def calculate_optimization_scenarios():
     """Calculate different optimization scenarios"""
@@ -4,7 +4,6 @@ Token Analyzer for Anthropic Opus 4.1 Model
 Analyzes token usage in data sent to LLM and identifies optimization opportunities
 """
 
-import json
 import os
 import sys
 from typing import Dict, Any, List, Tuple
@@ -16,32 +15,26 @@ sys.path.append(str(project_root))
 
 from ai_agents.analyst_tools import AnalystTools
 from ai_agents.analyst_agent import AnalystAgent
+from ai_agents.token_accounting import get_token_counter
 
 class TokenAnalyzer:
     def __init__(self):
         self.model_name = "claude-opus-4-1-20250805"
         self.analysis_tools = AnalystTools()
+        self.token_counter = get_token_counter()
         
     def count_tokens_anthropic(self, text: str) -> int:
         """
         Estimate token count for Anthropic models using tiktoken
         Anthropic uses cl100k_base encoding (same as GPT-4)
         """
-        try:
-            import tiktoken
-            encoding = tiktoken.get_encoding("cl100k_base")
-            return len(encoding.encode(text))
-        except ImportError:
-            print("tiktoken not available, using rough estimation")
-            # Rough estimation: ~4 characters per token for English text
-            return len(text) // 4
+        return self.token_counter.count_text(text)
     
     def analyze_analysis_data(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze the structure and token usage of analysis_data"""
         
-        # Convert to JSON string to count tokens
-        json_str = json.dumps(analysis_data, indent=2)
-        total_tokens = self.count_tokens_anthropic(json_str)
+        # Count tokens of the data as serialized into the prompt
+        total_tokens = self.token_counter.count_object(analysis_data)
         
         analysis = {
             "total_tokens": total_tokens,
@@ -61,8 +54,7 @@ class TokenAnalyzer:
         
         for key, name in sections:
             if key in analysis_data:
-                section_json = json.dumps(analysis_data[key], indent=2)
-                section_tokens = self.count_tokens_anthropic(section_json)
+                section_tokens = self.token_counter.count_object(analysis_data[key])
                 analysis["breakdown"][name] = {
                     "tokens": section_tokens,
                     "percentage": round((section_tokens / total_tokens) * 100, 1)
@@ -96,8 +88,7 @@ class TokenAnalyzer:
                     if isinstance(players, list):
                         api_players += len(players)
                         for player in players:
-                            player_json = json.dumps(player, indent=2)
-                            api_tokens += self.count_tokens_anthropic(player_json)
+                            api_tokens += self.token_counter.count_object(player)
                 
                 detail["apis"][api] = {
                     "players": api_players,
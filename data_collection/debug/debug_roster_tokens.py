@@ -12,6 +12,7 @@ project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
 from ai_agents.analyst_tools import AnalystTools
+from data_collection.scripts.shared.file_utils import DataFileManager
 import tiktoken
 
 def debug_roster_token_discrepancy():
@@ -109,16 +110,14 @@ def debug_roster_token_discrepancy():
     print("\n3. RAW OPPONENT DATA FILE")
     print("-" * 30)
     
-    import glob
     import os
     
-    opponent_files = glob.glob("data_collection/outputs/yahoo/opponent_rosters/**/*_raw_data.json", recursive=True)
-    if opponent_files:
-        latest_file = max(opponent_files, key=os.path.getctime)
+    file_manager = DataFileManager()
+    latest_file = file_manager.get_latest_file("yahoo", "opponent_rosters", "raw_data")
+    if latest_file:
         print(f"Latest opponent file: {os.path.basename(latest_file)}")
         
-        with open(latest_file, 'r') as f:
-            raw_data = json.load(f)
+        raw_data = file_manager.load_raw_data(latest_file)
         
         print(f"Raw file structure: {list(raw_data.keys())}")
         
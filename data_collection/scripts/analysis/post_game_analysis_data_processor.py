@@ -15,12 +15,12 @@ Purpose: Prepare structured data for AI analysis comparing projections vs. actua
 
 import os
 import sys
-import json
 import logging
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any
+import pandas as pd
 import pytz
 
 # Add the project root to the Python path
@@ -28,9 +28,11 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 # Add shared utilities to path
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "data_collection", "scripts", "shared"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "shared"))
 
 from file_utils import DataFileManager
+from season_warehouse import get_season_warehouse
+from projection_comparison import ProjectionComparisonEngine
 
 def get_current_time_pacific():
     """Get current time in Pacific Time Zone."""
@@ -49,6 +51,8 @@ class PostGameAnalysisDataProcessor:
         """Initialize the data processor."""
         self.logger = logging.getLogger(__name__)
         self.file_manager = DataFileManager()
+        self.warehouse = get_season_warehouse()
+        self.comparison_engine = ProjectionComparisonEngine()
         
         # Track execution stats
         self.stats = {
@@ -66,7 +70,10 @@ class PostGameAnalysisDataProcessor:
     
     def _find_latest_projections_archive(self, week: int, season: int = 2025) -> Optional[Dict[str, Any]]:
         """
-        Find the latest projections archive for a specific week.
+        Find the latest projections for a specific week.
+        
+        Projections come from the season warehouse (newest archive phase per
+        player); the archive files are only read when the warehouse has none.
         
         Args:
             week: NFL week number
@@ -76,24 +83,47 @@ class PostGameAnalysisDataProcessor:
             Projections archive data or None
         """
         try:
+            latest = self.warehouse.latest_projections(season, week)
+            if not latest.empty:
+                self.logger.info(f"Loading {len(latest)} projections from season warehouse")
+                return {
+                    "collection_metadata": {
+                        "week": week,
+                        "nfl_season": season,
+                        "collection_timestamp": latest["collected_at"].max()
+                    },
+                    "projections": {
+                        row.player_id: {
+                            "player_id": row.player_id,
+                            "player_name": row.name,
+                            "position": row.position,
+                            "team": row.team,
+                            "fantasyPoints": row.projected_points,
+                            "fantasyPointsDefault": row.projected_points_default,
+                            "isTeamDefense": bool(row.is_team_defense)
+                        } for row in latest.itertuples()
+                    }
+                }
+            
             archive_dir = Path(f"data_collection/outputs/tank01/projections_archive/{season}/week_{week:02d}")
             
             if not archive_dir.exists():
                 self.logger.warning(f"No projections archive found for Week {week}, Season {season}")
                 return None
             
-            # Find the latest raw JSON file
-            json_files = list(archive_dir.glob("*_projections_archive_raw.json"))
-            if not json_files:
+            # Find the latest raw file
+            raw_files = list(archive_dir.glob("*_projections_archive_raw_data.*"))
+            if not raw_files:
                 self.logger.warning(f"No projection files found in {archive_dir}")
                 return None
             
-            # Sort by modification time (newest first)
-            latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
+            # Timestamp prefix orders the files (newest last)
+            latest_file = max(raw_files, key=lambda f: f.name)
             self.logger.info(f"Loading projections from: {latest_file}")
             
-            with open(latest_file, 'r') as f:
-                return json.load(f)
+            data = self.file_manager.load_raw_data(str(latest_file))
+            self.warehouse.ingest_snapshot("tank01", "projections_archive", data, str(latest_file))
+            return data
                 
         except Exception as e:
             self.logger.error(f"Error loading projections archive: {e}")
@@ -112,26 +142,16 @@ class PostGameAnalysisDataProcessor:
             Stats data or None
         """
         try:
-            stats_dir = Path(f"data_collection/outputs/tank01/{data_type}")
-            
-            if not stats_dir.exists():
-                self.logger.warning(f"No {data_type} directory found")
-                return None
-            
-            # Find files with the specified week
-            pattern = f"*_wk{week:02d}_*_raw.json"
-            json_files = list(stats_dir.glob(f"**/{pattern}"))
+            latest_file = self.file_manager.get_latest_file("tank01", data_type, "raw_data", week=week)
             
-            if not json_files:
+            if not latest_file:
                 self.logger.warning(f"No {data_type} files found for Week {week}")
                 return None
             
-            # Sort by modification time (newest first)
-            latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
             self.logger.info(f"Loading {data_type} from: {latest_file}")
-            
-            with open(latest_file, 'r') as f:
-                return json.load(f)
+            data = self.file_manager.load_raw_data(latest_file)
+            self.warehouse.ingest_snapshot("tank01", data_type, data, latest_file)
+            return data
                 
         except Exception as e:
             self.logger.error(f"Error loading {data_type}: {e}")
@@ -149,122 +169,48 @@ class PostGameAnalysisDataProcessor:
             Matchup data or None
         """
         try:
-            matchup_dir = Path("data_collection/outputs/yahoo/team_matchups")
+            latest_file = self.file_manager.get_latest_file("yahoo", "team_matchups", "raw_data", week=week)
             
-            if not matchup_dir.exists():
-                self.logger.warning("No matchup directory found")
-                return None
-            
-            # Find files with the specified week
-            pattern = f"*_wk{week:02d}_*_raw.json"
-            json_files = list(matchup_dir.glob(f"**/{pattern}"))
-            
-            if not json_files:
+            if not latest_file:
                 self.logger.warning(f"No matchup files found for Week {week}")
                 return None
             
-            # Sort by modification time (newest first)
-            latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
             self.logger.info(f"Loading matchup data from: {latest_file}")
-            
-            with open(latest_file, 'r') as f:
-                return json.load(f)
+            return self.file_manager.load_raw_data(latest_file)
                 
         except Exception as e:
             self.logger.error(f"Error loading matchup data: {e}")
             self.stats["errors"] += 1
             return None
     
-    def _match_projection_to_stats(self, projection: Dict[str, Any], stats_data: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    def _week_actual_points(self, week: int, season: int) -> pd.DataFrame:
         """
-        Match a projection to corresponding stats data.
+        Actual fantasy points per Tank01 player for the week, from the season warehouse.
         
         Args:
-            projection: Projection data for a player
-            stats_data: List of stats data for players
+            week: NFL week number
+            season: NFL season year
             
         Returns:
-            Matched stats data or None
+            DataFrame with player_id and actual_points
         """
-        projection_player_id = projection.get('player_id')
-        projection_name = projection.get('player_name', '')
-        
-        # Try to match by Tank01 player ID first
-        for stats_player in stats_data:
-            tank01_data = stats_player.get('tank01_data', {})
-            if tank01_data.get('playerID') == projection_player_id:
-                return stats_player
-        
-        # Try to match by name as fallback
-        for stats_player in stats_player in stats_data:
-            yahoo_player = stats_player.get('yahoo_player', {})
-            yahoo_name = yahoo_player.get('name', {}).get('full', '')
-            
-            if yahoo_name and projection_name and yahoo_name.lower() == projection_name.lower():
-                return stats_player
-        
-        return None
+        games = self.warehouse.query("game_logs", season, [week], columns=["player_id", "fantasy_points"])
+        return (games.groupby("player_id", as_index=False)["fantasy_points"].sum()
+                .rename(columns={"fantasy_points": "actual_points"}))
     
-    def _calculate_performance_metrics(self, projection: Dict[str, Any], stats: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Calculate performance metrics comparing projection vs. actual stats.
-        
-        Args:
-            projection: Projection data for a player
-            stats: Actual stats data for a player
-            
-        Returns:
-            Performance metrics
-        """
-        metrics = {
-            "projected_fantasy_points": 0,
-            "actual_fantasy_points": 0,
-            "performance_difference": 0,
-            "performance_percentage": 0,
-            "over_under": "even"
-        }
-        
-        try:
-            # Get projected fantasy points
-            projected_fp = projection.get('fantasyPoints', 0)
-            if isinstance(projected_fp, (int, float)):
-                metrics["projected_fantasy_points"] = float(projected_fp)
-            
-            # Get actual fantasy points from stats
-            game_stats = stats.get('game_stats', {})
-            season_totals = game_stats.get('season_totals', {})
-            actual_fp = season_totals.get('fantasy_points', 0)
-            if isinstance(actual_fp, (int, float)):
-                metrics["actual_fantasy_points"] = float(actual_fp)
-            
-            # Calculate differences
-            metrics["performance_difference"] = metrics["actual_fantasy_points"] - metrics["projected_fantasy_points"]
-            
-            if metrics["projected_fantasy_points"] > 0:
-                metrics["performance_percentage"] = (metrics["actual_fantasy_points"] / metrics["projected_fantasy_points"]) * 100
-            
-            # Determine over/under
-            if metrics["performance_difference"] > 0.5:
-                metrics["over_under"] = "over"
-            elif metrics["performance_difference"] < -0.5:
-                metrics["over_under"] = "under"
-            else:
-                metrics["over_under"] = "even"
-                
-        except Exception as e:
-            self.logger.error(f"Error calculating performance metrics: {e}")
-            self.stats["errors"] += 1
-        
-        return metrics
-    
-    def _process_roster_analysis(self, projections: Dict[str, Any], stats_data: List[Dict[str, Any]], roster_type: str) -> Dict[str, Any]:
+    def _process_roster_analysis(self, projections: Dict[str, Any], stats_data: List[Dict[str, Any]],
+                                 roster_type: str, week_points: pd.DataFrame) -> Dict[str, Any]:
         """
         Process analysis for a specific roster type.
         
+        Roster players are hash-joined to projections (Tank01 playerID, then
+        name) and scored as vectorized columns.
+        
         Args:
             projections: Projections data
             stats_data: Stats data for the roster
             roster_type: Type of roster ("my_roster", "opponent_roster", "available_players")
+            week_points: Actual fantasy points per Tank01 playerID for the week
             
         Returns:
             Processed roster analysis
@@ -279,59 +225,59 @@ class PostGameAnalysisDataProcessor:
             "over_performers": [],
             "under_performers": [],
             "even_performers": [],
-            "player_analysis": []
+            "player_analysis": [],
+            "position_summary": {}
         }
         
-        projections_dict = projections.get('projections', {})
-        
-        for stats_player in stats_data:
-            try:
-                # Try to find matching projection
-                tank01_data = stats_player.get('tank01_data', {})
-                player_id = tank01_data.get('playerID')
-                
-                if not player_id or player_id not in projections_dict:
-                    continue
-                
-                projection = projections_dict[player_id]
-                
-                # Calculate performance metrics
-                metrics = self._calculate_performance_metrics(projection, stats_player)
-                
-                # Update totals
-                roster_analysis["total_projected_points"] += metrics["projected_fantasy_points"]
-                roster_analysis["total_actual_points"] += metrics["actual_fantasy_points"]
-                roster_analysis["total_performance_difference"] += metrics["performance_difference"]
-                roster_analysis["players_analyzed"] += 1
-                
-                # Categorize performance
-                player_analysis = {
-                    "player_name": projection.get('player_name', 'Unknown'),
-                    "position": projection.get('position', 'Unknown'),
-                    "team": projection.get('team', 'Unknown'),
-                    "projected_fantasy_points": metrics["projected_fantasy_points"],
-                    "actual_fantasy_points": metrics["actual_fantasy_points"],
-                    "performance_difference": metrics["performance_difference"],
-                    "performance_percentage": metrics["performance_percentage"],
-                    "over_under": metrics["over_under"]
-                }
-                
-                roster_analysis["player_analysis"].append(player_analysis)
-                
-                # Categorize by performance
-                if metrics["over_under"] == "over":
-                    roster_analysis["over_performers"].append(player_analysis)
-                elif metrics["over_under"] == "under":
-                    roster_analysis["under_performers"].append(player_analysis)
-                else:
-                    roster_analysis["even_performers"].append(player_analysis)
-                
-                self.stats["players_analyzed"] += 1
-                
-            except Exception as e:
-                self.logger.error(f"Error processing player analysis: {e}")
-                self.stats["errors"] += 1
-                continue
+        try:
+            projection_frame = pd.DataFrame([{
+                "player_id": str(player_id),
+                "name": projection.get('player_name', 'Unknown'),
+                "position": projection.get('position', 'Unknown'),
+                "team": projection.get('team', 'Unknown'),
+                "projected_points": projection.get('fantasyPoints', 0)
+            } for player_id, projection in projections.get('projections', {}).items()])
+            
+            roster_frame = pd.DataFrame([{
+                "player_id": str((stats_player.get('tank01_data') or {}).get('playerID') or ''),
+                "name": ((stats_player.get('yahoo_player') or {}).get('name') or {}).get('full', '')
+            } for stats_player in stats_data])
+            if roster_frame.empty:
+                return roster_analysis
+            roster_frame = roster_frame.merge(week_points, on="player_id", how="left")
+            
+            joined = self.comparison_engine.join(projection_frame, roster_frame)
+            if joined.empty:
+                return roster_analysis
+            
+            analysis = pd.DataFrame({
+                "player_name": joined["name"],
+                "position": joined["position"],
+                "team": joined["team"],
+                "projected_fantasy_points": joined["projected_points"],
+                "actual_fantasy_points": joined["actual_points"],
+                "performance_difference": joined["variance"],
+                "performance_percentage": joined["performance_percentage"],
+                "accuracy_percentage": joined["accuracy_percentage"],
+                "over_under": joined["over_under"],
+                "match_method": joined["match_method"]
+            })
+            
+            roster_analysis["players_analyzed"] = len(analysis)
+            roster_analysis["total_projected_points"] = float(analysis["projected_fantasy_points"].sum())
+            roster_analysis["total_actual_points"] = float(analysis["actual_fantasy_points"].sum())
+            roster_analysis["total_performance_difference"] = float(analysis["performance_difference"].sum())
+            roster_analysis["player_analysis"] = analysis.to_dict('records')
+            for over_under in ("over", "under", "even"):
+                roster_analysis[f"{over_under}_performers"] = \
+                    analysis[analysis["over_under"] == over_under].to_dict('records')
+            roster_analysis["position_summary"] = self.comparison_engine.position_summary(joined)
+            
+            self.stats["players_analyzed"] += len(analysis)
+            
+        except Exception as e:
+            self.logger.error(f"Error processing {roster_type} analysis: {e}")
+            self.stats["errors"] += 1
         
         return roster_analysis
     
@@ -371,6 +317,9 @@ class PostGameAnalysisDataProcessor:
         if matchup_data:
             self.stats["matchup_data_loaded"] = 1
         
+        # Actual points for the week (stats outputs are ingested into the warehouse as they load)
+        week_points = self._week_actual_points(week, season)
+        
         # Process roster analyses
         processed_data = {
             "analysis_metadata": {
@@ -399,7 +348,8 @@ class PostGameAnalysisDataProcessor:
             my_roster_analysis = self._process_roster_analysis(
                 projections, 
                 my_roster_stats['matched_players'], 
-                "my_roster"
+                "my_roster",
+                week_points
             )
             processed_data["roster_analyses"]["my_roster"] = my_roster_analysis
             
@@ -414,7 +364,8 @@ class PostGameAnalysisDataProcessor:
             opponent_roster_analysis = self._process_roster_analysis(
                 projections, 
                 opponent_stats['matched_players'], 
-                "opponent_roster"
+                "opponent_roster",
+                week_points
             )
             processed_data["roster_analyses"]["opponent_roster"] = opponent_roster_analysis
         
@@ -423,7 +374,8 @@ class PostGameAnalysisDataProcessor:
             available_players_analysis = self._process_roster_analysis(
                 projections, 
                 available_stats['matched_players'], 
-                "available_players"
+                "available_players",
+                week_points
             )
             processed_data["roster_analyses"]["available_players"] = available_players_analysis
         
@@ -32,6 +32,7 @@ def collect_fresh_data():
         ("data_collection/scripts/yahoo/opponent_rosters.py", "Yahoo Opponent Rosters"),
         ("data_collection/scripts/yahoo/team_matchups.py", "Yahoo Team Matchups"),
         ("data_collection/scripts/yahoo/transaction_trends.py", "Yahoo Transaction Trends"),
+        ("data_collection/scripts/yahoo/league_settings.py", "Yahoo League Settings"),
         
         # Sleeper API scripts
         ("data_collection/scripts/sleeper/my_roster.py", "Sleeper My Roster"),
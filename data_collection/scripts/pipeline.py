@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+In-Process Data Collection Pipeline
+
+Runs the data collection scripts as stages of one Python process instead of
+one subprocess per script. Stages are the scripts' own extractor classes,
+built against shared instances:
+
+- one SimpleYahooAuth (a single token load/refresh for every Yahoo stage)
+- one SimpleTank01Client (the Tank01 player list is fetched once)
+- one SimpleSleeperClient (the Sleeper player database is loaded once)
+- the process-wide player identity index
+- the process-wide season context (league discovered and week resolved once)
+- one DataFileManager that retains the raw snapshots it saves, so Sleeper and
+  Tank01 stages read the Yahoo outputs they depend on from memory
+
+Every stage still writes its clean/raw/log files, which remain the artifacts
+other tools read.
+
+Usage:
+    python3 data_collection/scripts/pipeline.py
+    python3 data_collection/scripts/pipeline.py --tank01-players 5 --max-workers 4
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, List, Optional
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Collector packages (yahoo/, sleeper/, tank01/) and shared utilities
+sys.path.append(SCRIPTS_DIR)
+sys.path.append(os.path.join(SCRIPTS_DIR, 'shared'))
+
+from file_utils import DataFileManager
+
+logger = logging.getLogger(__name__)
+
+# Data collection scripts and the scripts whose outputs they read.
+# Entries must be listed after everything they depend on.
+COLLECTION_GRAPH = [
+    # Yahoo API scripts
+    {"script": "yahoo/my_roster.py", "description": "Yahoo My Roster", "depends_on": []},
+    {"script": "yahoo/available_players.py", "description": "Yahoo Available Players", "depends_on": []},
+    {"script": "yahoo/opponent_rosters.py", "description": "Yahoo Opponent Rosters", "depends_on": []},
+    {"script": "yahoo/team_matchups.py", "description": "Yahoo Team Matchups", "depends_on": []},
+    {"script": "yahoo/transaction_trends.py", "description": "Yahoo Transaction Trends", "depends_on": []},
+    {"script": "yahoo/league_settings.py", "description": "Yahoo League Settings", "depends_on": []},
+
+    # Sleeper API scripts (map Yahoo players onto Sleeper)
+    {"script": "sleeper/my_roster.py", "description": "Sleeper My Roster",
+     "depends_on": ["yahoo/my_roster.py"]},
+    {"script": "sleeper/available_players.py", "description": "Sleeper Available Players",
+     "depends_on": ["yahoo/available_players.py"]},
+    {"script": "sleeper/trending.py", "description": "Sleeper Trending",
+     "depends_on": ["yahoo/my_roster.py"]},
+
+    # Tank01 API scripts (map Yahoo players onto Tank01, week from team matchups)
+    {"script": "tank01/my_roster.py", "description": "Tank01 My Roster",
+     "depends_on": ["yahoo/my_roster.py", "yahoo/team_matchups.py"]},
+    {"script": "tank01/available_players.py", "description": "Tank01 Available Players",
+     "depends_on": ["yahoo/available_players.py", "yahoo/team_matchups.py"]}
+]
+
+
+def run_graph(graph: List[Dict[str, Any]], run_node: Callable[[Dict[str, Any]], Dict[str, Any]],
+              max_workers: int = 4) -> Dict[str, Dict[str, Any]]:
+    """
+    Run every node of a collection graph on a bounded thread pool.
+
+    Each node starts as soon as the nodes it depends on have finished. Dependents
+    of a failed node still run (against earlier outputs).
+
+    Args:
+        graph: Nodes with 'script', 'description' and 'depends_on'
+        run_node: Runs one node and returns its result (with a 'status' key)
+        max_workers: Maximum number of nodes running at once
+
+    Returns:
+        script -> node result
+    """
+    nodes = {node["script"]: node for node in graph}
+    remaining_deps = {script: set(node["depends_on"]) for script, node in nodes.items()}
+    dependents: Dict[str, List[str]] = {script: [] for script in nodes}
+    for script, node in nodes.items():
+        for dep in node["depends_on"]:
+            dependents[dep].append(script)
+
+    node_results: Dict[str, Dict[str, Any]] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        running = {}
+
+        def submit_ready():
+            ready = [s for s, deps in remaining_deps.items() if not deps]
+            for script in ready:
+                del remaining_deps[script]
+                node = nodes[script]
+                failed_deps = [d for d in node["depends_on"] if node_results[d]["status"] != "success"]
+                if failed_deps:
+                    logger.warning(f"{node['description']} will use earlier outputs from: {', '.join(failed_deps)}")
+                logger.info(f"Running {node['description']}...")
+                running[executor.submit(run_node, node)] = script
+
+        submit_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                script = running.pop(future)
+                node_results[script] = future.result()
+                for dependent in dependents[script]:
+                    remaining_deps[dependent].discard(script)
+            submit_ready()
+
+    return node_results
+
+
+class CollectionPipeline:
+    """
+    Runs collection scripts in-process against shared clients and caches.
+
+    Clients are created on first use, so a pipeline that only runs Sleeper
+    stages never authenticates with Yahoo.
+    """
+
+    def __init__(self, file_manager: Optional[DataFileManager] = None):
+        """
+        Initialize the pipeline.
+
+        Args:
+            file_manager: Shared file manager (default: one retaining raw snapshots in memory)
+        """
+        self.file_manager = file_manager or DataFileManager(retain_raw_data=True)
+        self._clients: Dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
+
+        # script -> stage runner
+        self.stage_runners: Dict[str, Callable[[Any, Optional[int]], bool]] = {
+            "yahoo/my_roster.py": self._run_yahoo_my_roster,
+            "yahoo/available_players.py": self._run_yahoo_available_players,
+            "yahoo/opponent_rosters.py": self._run_yahoo_opponent_rosters,
+            "yahoo/team_matchups.py": self._run_yahoo_team_matchups,
+            "yahoo/transaction_trends.py": self._run_yahoo_transaction_trends,
+            "yahoo/league_settings.py": self._run_yahoo_league_settings,
+            "sleeper/my_roster.py": self._run_sleeper_my_roster,
+            "sleeper/available_players.py": self._run_sleeper_available_players,
+            "sleeper/trending.py": self._run_sleeper_trending,
+            "tank01/my_roster.py": self._run_tank01_my_roster,
+            "tank01/available_players.py": self._run_tank01_available_players
+        }
+
+    # ------------------------------------------------------------------
+    # Shared clients
+    # ------------------------------------------------------------------
+
+    def _client(self, name: str) -> Any:
+        """Shared client by name ('yahoo_auth', 'tank01', 'sleeper'), created once"""
+        with self._clients_lock:
+            if name not in self._clients:
+                if name == "yahoo_auth":
+                    from yahoo_auth import SimpleYahooAuth
+                    self._clients[name] = SimpleYahooAuth()
+                elif name == "tank01":
+                    from tank01_client import SimpleTank01Client
+                    self._clients[name] = SimpleTank01Client()
+                elif name == "sleeper":
+                    from sleeper_client import SimpleSleeperClient
+                    self._clients[name] = SimpleSleeperClient()
+                else:
+                    raise KeyError(f"Unknown pipeline client: {name}")
+            return self._clients[name]
+
+    @staticmethod
+    def _load_stage_module(script: str):
+        """Import a collection script as a module ('yahoo/my_roster.py' -> yahoo.my_roster)"""
+        return importlib.import_module(script[:-len(".py")].replace("/", "."))
+
+    # ------------------------------------------------------------------
+    # Stages (mirror each script's main())
+    # ------------------------------------------------------------------
+
+    def _run_yahoo_my_roster(self, module, players_limit: Optional[int]) -> bool:
+        extractor = module.MyRosterExtractor(yahoo_auth=self._client("yahoo_auth"), file_manager=self.file_manager)
+        return bool(extractor.run())
+
+    def _run_yahoo_available_players(self, module, players_limit: Optional[int]) -> bool:
+        extractor = module.AvailablePlayersExtractor(yahoo_auth=self._client("yahoo_auth"),
+                                                     file_manager=self.file_manager)
+        data = extractor.extract_all_data()
+        return bool(data) and bool(extractor.save_data(data))
+
+    def _run_yahoo_opponent_rosters(self, module, players_limit: Optional[int]) -> bool:
+        extractor = module.OpponentRostersExtractor(yahoo_auth=self._client("yahoo_auth"),
+                                                    file_manager=self.file_manager)
+        data = extractor.extract_all_opponent_rosters()
+        return bool(data.get("rosters")) and bool(extractor.save_data(data))
+
+    def _run_yahoo_team_matchups(self, module, players_limit: Optional[int]) -> bool:
+        extractor = module.TeamMatchupsExtractor(yahoo_auth=self._client("yahoo_auth"),
+                                                 file_manager=self.file_manager)
+        data = extractor.extract_team_matchups()
+        return bool(data.get("matchups")) and bool(extractor.save_data(data))
+
+    def _run_yahoo_transaction_trends(self, module, players_limit: Optional[int]) -> bool:
+        extractor = module.TransactionTrendsExtractor(yahoo_auth=self._client("yahoo_auth"),
+                                                      file_manager=self.file_manager)
+        data = extractor.extract_all_data()
+        return bool(data) and bool(extractor.save_data(data))
+
+    def _run_yahoo_league_settings(self, module, players_limit: Optional[int]) -> bool:
+        extractor = module.LeagueSettingsExtractor(yahoo_auth=self._client("yahoo_auth"),
+                                                   file_manager=self.file_manager)
+        data = extractor.extract_league_settings()
+        return bool(data) and bool(extractor.save_data(data))
+
+    def _run_sleeper_my_roster(self, module, players_limit: Optional[int]) -> bool:
+        extractor = module.SleeperMyRosterExtractor(sleeper=self._client("sleeper"), file_manager=self.file_manager)
+        data = extractor.extract_all_data()
+        return bool(data) and bool(extractor.save_data(data))
+
+    def _run_sleeper_available_players(self, module, players_limit: Optional[int]) -> bool:
+        extractor = module.SleeperAvailablePlayersExtractor(sleeper=self._client("sleeper"),
+                                                            file_manager=self.file_manager)
+        data = extractor.extract_all_data()
+        return bool(data) and bool(extractor.save_data(data))
+
+    def _run_sleeper_trending(self, module, players_limit: Optional[int]) -> bool:
+        extractor = module.SleeperTrendingExtractor(sleeper=self._client("sleeper"), file_manager=self.file_manager)
+        data = extractor.extract_all_data()
+        return bool(data) and bool(extractor.save_data(data))
+
+    def _run_tank01_my_roster(self, module, players_limit: Optional[int]) -> bool:
+        extractor = module.Tank01MyRosterExtractor(tank01=self._client("tank01"), file_manager=self.file_manager)
+        return bool(extractor.extract_my_roster_data().get("success"))
+
+    def _run_tank01_available_players(self, module, players_limit: Optional[int]) -> bool:
+        # Same as the script's --all N: one limit for every position
+        player_limits = None
+        if players_limit:
+            player_limits = {position: players_limit for position in module.get_player_limits()}
+        collector = module.Tank01AvailablePlayersCollector(player_limits, tank01=self._client("tank01"),
+                                                           file_manager=self.file_manager)
+        return bool(collector.run())
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+
+    def run_stage(self, node: Dict[str, Any], tank01_players_limit: Optional[int] = None,
+                  start_time: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run one collection script in-process.
+
+        Args:
+            node: Entry from COLLECTION_GRAPH
+            tank01_players_limit: Per-position player limit for Tank01 available players
+            start_time: Monotonic start of the whole collection run
+
+        Returns:
+            Result entry with status, timing and the raw snapshot written
+        """
+        script_name = node["script"]
+        description = node["description"]
+        started = time.monotonic()
+
+        entry = {
+            "script": script_name,
+            "description": description,
+            "depends_on": list(node["depends_on"]),
+            "started_at_seconds": round(started - (start_time if start_time is not None else started), 2)
+        }
+
+        def finish(status: str, **fields) -> Dict[str, Any]:
+            entry.update(fields)
+            entry["status"] = status
+            entry["duration_seconds"] = round(time.monotonic() - started, 2)
+            return entry
+
+        runner = self.stage_runners.get(script_name)
+        if runner is None:
+            logger.warning(f"No in-process stage for {script_name}")
+            return finish("not_found", error="No in-process stage for script")
+
+        try:
+            ok = runner(self._load_stage_module(script_name), tank01_players_limit)
+        except Exception as e:
+            logger.error(f"💥 {description} crashed: {e}")
+            return finish("error", error=str(e))
+
+        if not ok:
+            logger.error(f"❌ {description} failed")
+            return finish("failed", error="Stage reported failure")
+
+        api_name, script = script_name[:-len(".py")].split("/")
+        logger.info(f"✅ {description} completed successfully")
+        return finish("success", raw_file=self.file_manager.get_latest_file(api_name, script, "raw_data"))
+
+    def run(self, tank01_players_limit: Optional[int] = None, max_workers: int = 4) -> Dict[str, Dict[str, Any]]:
+        """
+        Run every stage of COLLECTION_GRAPH.
+
+        Args:
+            tank01_players_limit: Per-position player limit for Tank01 available players
+            max_workers: Maximum number of stages running at once
+
+        Returns:
+            script -> stage result
+        """
+        start_time = time.monotonic()
+        return run_graph(COLLECTION_GRAPH,
+                         lambda node: self.run_stage(node, tank01_players_limit, start_time),
+                         max_workers)
+
+
+def main():
+    """Run the full collection pipeline in-process."""
+    parser = argparse.ArgumentParser(description='In-process data collection pipeline')
+    parser.add_argument('--tank01-players', type=int, default=None,
+                        help='Per-position player limit for Tank01 available players (default: config limits)')
+    parser.add_argument('--max-workers', type=int, default=4, help='Stages running at once (default: 4)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    print("🔄 Starting In-Process Data Collection")
+    print("=" * 60)
+    started = time.monotonic()
+    results = CollectionPipeline().run(args.tank01_players, args.max_workers)
+
+    successful = 0
+    for node in COLLECTION_GRAPH:
+        result = results[node["script"]]
+        icon = "✅" if result["status"] == "success" else "❌"
+        successful += result["status"] == "success"
+        print(f"{icon} {node['description']}: {result['status']} ({result['duration_seconds']}s)")
+
+    print("=" * 60)
+    print(f"📊 {successful}/{len(COLLECTION_GRAPH)} stages successful in {time.monotonic() - started:.1f}s")
+    return 0 if successful == len(COLLECTION_GRAPH) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
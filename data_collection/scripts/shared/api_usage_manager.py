@@ -11,6 +11,7 @@ Features:
 - Centralized reset time calculations
 - Standardized usage reporting format
 - Rate limit monitoring and alerts
+- Response cache hit/miss reporting
 
 Author: Fantasy Football Data Collection
 Date: September 2025
@@ -158,6 +159,14 @@ class APIUsageManager:
         if 'data_source' in usage:
             summary += f"- **Data Source:** {usage.get('data_source', 'unknown')}\n"
         
+        # Add response cache effectiveness if the client has a cache
+        cache_stats = self.get_cache_stats()
+        if cache_stats.get('enabled'):
+            summary += (f"- **Response Cache:** {cache_stats.get('hits', 0)} hits, "
+                        f"{cache_stats.get('stale_hits', 0)} stale hits, "
+                        f"{cache_stats.get('misses', 0)} misses "
+                        f"({cache_stats.get('hit_rate', 0.0):.1f}% hit rate)\n")
+        
         return summary
     
     def get_usage_summary_for_json(self) -> Dict[str, Any]:
@@ -180,9 +189,25 @@ class APIUsageManager:
             "reset_timestamp": usage.get('reset_timestamp'),
             "reset_time_pacific": usage.get('reset_time_pacific'),
             "data_source": usage.get('data_source', 'unknown'),
-            "last_updated": usage.get('last_updated')
+            "last_updated": usage.get('last_updated'),
+            "cache_stats": self.get_cache_stats()
         }
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get response cache hit/miss counters from the client.
+        
+        Returns:
+            Dict with cache statistics, or {"enabled": False} if the client has no cache
+        """
+        try:
+            if hasattr(self.client, 'get_cache_stats'):
+                return self.client.get_cache_stats()
+        except Exception as e:
+            self.logger.warning(f"Error getting cache stats for {self.api_name}: {e}")
+        
+        return {"enabled": False}
+    
     def check_rate_limit_warning(self, threshold: float = 0.8) -> Optional[str]:
         """
         Check if API usage is approaching rate limit threshold.
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Vectorized Fantasy Scoring Engine
+
+Scores Tank01 game logs with the league's own scoring settings. Stat lines are
+packed into one NumPy matrix (one row per player-game, one column per Tank01
+stat) and every game in the league is scored with a single matrix product.
+Season totals and averages for every player come out of the same pass.
+
+Weights come from the Yahoo league settings (stat_categories / stat_modifiers,
+keyed by Yahoo stat_id). Without league settings the standard PPR weights that
+the stats extractors used before are applied.
+
+Team defenses are scored with the defense (DT) modifiers plus the Yahoo
+points-allowed tiers (stat_ids 50-56). Offensive players only use offensive
+modifiers, so an empty Defense section never earns shutout points.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Season totals reported for every player (section, Tank01 field)
+TOTAL_FIELDS = {
+    'passing': ['passYds', 'passTD', 'int', 'passAttempts', 'passCompletions'],
+    'rushing': ['rushYds', 'rushTD', 'carries'],
+    'receiving': ['recYds', 'recTD', 'receptions', 'targets'],
+    'defense': [
+        'fumblesLost', 'defensiveInterceptions', 'forcedFumbles', 'fumbles', 'fumblesRecovered',
+        'defTD', 'totalTackles', 'soloTackles', 'tacklesForLoss', 'qbHits',
+        'interceptions', 'sacks', 'passDeflections', 'safeties', 'pointsAllowed',
+        'yardsAllowed', 'passYardsAllowed', 'rushYardsAllowed', 'turnovers'
+    ]
+}
+
+# Yahoo offensive stat_id -> Tank01 (section, field)
+OFFENSE_STAT_FIELDS = {
+    4: ('passing', 'passYds'),
+    5: ('passing', 'passTD'),
+    6: ('passing', 'int'),
+    8: ('rushing', 'carries'),
+    9: ('rushing', 'rushYds'),
+    10: ('rushing', 'rushTD'),
+    11: ('receiving', 'receptions'),
+    12: ('receiving', 'recYds'),
+    13: ('receiving', 'recTD'),
+    18: ('defense', 'fumblesLost'),
+    78: ('receiving', 'targets'),
+}
+
+# Yahoo team defense stat_id -> Tank01 (section, field)
+DEFENSE_STAT_FIELDS = {
+    32: ('defense', 'sacks'),
+    33: ('defense', 'interceptions'),
+    34: ('defense', 'fumblesRecovered'),
+    35: ('defense', 'defTD'),
+    36: ('defense', 'safeties'),
+}
+
+# Yahoo points-allowed tiers: 0, 1-6, 7-13, 14-20, 21-27, 28-34, 35+
+POINTS_ALLOWED_STAT_IDS = [50, 51, 52, 53, 54, 55, 56]
+POINTS_ALLOWED_BOUNDARIES = [1, 7, 14, 21, 28, 35]
+
+# Standard PPR scoring (the weights previously hard-coded in the stats extractors)
+DEFAULT_STAT_MODIFIERS = {
+    4: 0.04, 5: 4, 6: -2,
+    9: 0.1, 10: 6,
+    11: 1, 12: 0.1, 13: 6,
+    32: 1, 33: 2, 34: 2, 35: 6, 36: 2,
+    50: 10, 51: 7, 52: 4, 53: 1, 54: 0, 55: -1, 56: -1
+}
+
+
+def _to_float(value: Any) -> float:
+    """Convert a Tank01 stat value (usually a string) to float, 0.0 if invalid."""
+    try:
+        return float(value) if value not in (None, '') else 0.0
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _find_key(data: Any, key: str, depth: int = 0) -> Optional[Any]:
+    """Find the first value stored under key in a nested Yahoo JSON response."""
+    if depth > 12:
+        return None
+    if isinstance(data, dict):
+        if key in data:
+            return data[key]
+        children = data.values()
+    elif isinstance(data, list):
+        children = data
+    else:
+        return None
+    for child in children:
+        found = _find_key(child, key, depth + 1)
+        if found is not None:
+            return found
+    return None
+
+
+def iter_yahoo_stats(section: Any) -> List[Dict[str, Any]]:
+    """Flatten a Yahoo stat_categories/stat_modifiers section into stat dicts."""
+    stats = section.get('stats', []) if isinstance(section, dict) else section
+    if isinstance(stats, dict):
+        stats = list(stats.values())
+    flattened = []
+    for entry in stats or []:
+        stat = entry.get('stat', entry) if isinstance(entry, dict) else None
+        if isinstance(stat, dict) and 'stat_id' in stat:
+            flattened.append(stat)
+    return flattened
+
+
+class FantasyScoringEngine:
+    """
+    Scores player-games for a league with NumPy.
+
+    Matrix columns are the union of the reported season total fields and the
+    fields referenced by the league's modifiers. Two weight vectors (offense,
+    team defense) are built once; scoring a batch is X @ W plus the
+    points-allowed tier lookup for team defense rows.
+    """
+
+    def __init__(self, stat_modifiers: Optional[Dict[int, float]] = None, source: str = "default"):
+        """
+        Initialize the engine.
+
+        Args:
+            stat_modifiers: Yahoo stat_id -> points per unit (default: standard PPR)
+            source: Where the modifiers came from (reported in outputs)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.source = source
+        self.stat_modifiers = {int(k): float(v) for k, v in
+                               (stat_modifiers if stat_modifiers is not None else DEFAULT_STAT_MODIFIERS).items()}
+
+        # Column layout: season total fields first, then any extra scored fields
+        self.columns: List[Tuple[str, str]] = [(section, field) for section, fields in TOTAL_FIELDS.items()
+                                               for field in fields]
+        for mapping in (OFFENSE_STAT_FIELDS, DEFENSE_STAT_FIELDS):
+            for column in mapping.values():
+                if column not in self.columns:
+                    self.columns.append(column)
+        self._column_index = {column: i for i, column in enumerate(self.columns)}
+        self._columns_by_section: Dict[str, List[Tuple[int, str]]] = {}
+        for i, (section, field) in enumerate(self.columns):
+            self._columns_by_section.setdefault(section, []).append((i, field))
+
+        # Weight matrix: column 0 = offense, column 1 = team defense
+        self.weights = np.zeros((len(self.columns), 2))
+        for col, mapping in enumerate((OFFENSE_STAT_FIELDS, DEFENSE_STAT_FIELDS)):
+            for stat_id, column in mapping.items():
+                self.weights[self._column_index[column], col] += self.stat_modifiers.get(stat_id, 0.0)
+
+        self.points_allowed_tiers = np.array([self.stat_modifiers.get(stat_id, 0.0)
+                                              for stat_id in POINTS_ALLOWED_STAT_IDS])
+        self._points_allowed_column = self._column_index[('defense', 'pointsAllowed')]
+
+        known = set(OFFENSE_STAT_FIELDS) | set(DEFENSE_STAT_FIELDS) | set(POINTS_ALLOWED_STAT_IDS)
+        unmapped = sorted(stat_id for stat_id, value in self.stat_modifiers.items()
+                          if stat_id not in known and value)
+        if unmapped:
+            self.logger.info(f"Scoring stat_ids without a Tank01 field (ignored): {unmapped}")
+
+    # ------------------------------------------------------------------
+    # Construction from league settings
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_yahoo_settings(cls, settings: Any, source: str = "yahoo_league_settings") -> "FantasyScoringEngine":
+        """
+        Build an engine from a Yahoo league settings response.
+
+        Only modifiers for stat categories that are enabled and not display-only
+        are used. Falls back to the default weights if no modifiers are found.
+
+        Args:
+            settings: Parsed league/{league_key}/settings response (any nesting level)
+            source: Description of the settings source
+
+        Returns:
+            FantasyScoringEngine
+        """
+        modifiers_section = _find_key(settings, 'stat_modifiers')
+        modifiers = {}
+        for stat in iter_yahoo_stats(modifiers_section):
+            try:
+                modifiers[int(stat['stat_id'])] = float(stat.get('value', 0))
+            except (ValueError, TypeError):
+                continue
+
+        if not modifiers:
+            logging.getLogger(__name__).warning("No stat_modifiers in league settings, using default scoring")
+            return cls()
+
+        categories_section = _find_key(settings, 'stat_categories')
+        for stat in iter_yahoo_stats(categories_section):
+            try:
+                stat_id = int(stat['stat_id'])
+            except (ValueError, TypeError):
+                continue
+            if str(stat.get('enabled', '1')) != '1' or str(stat.get('is_only_display_stat', '0')) == '1':
+                modifiers.pop(stat_id, None)
+
+        return cls(modifiers, source=source)
+
+    @classmethod
+    def from_latest_league_settings(cls, file_manager) -> "FantasyScoringEngine":
+        """
+        Build an engine from the latest yahoo league_settings raw output
+        (written by data_collection/scripts/yahoo/league_settings.py).
+
+        Args:
+            file_manager: DataFileManager used to locate the output
+
+        Returns:
+            FantasyScoringEngine (default weights if no league settings are available)
+        """
+        logger = logging.getLogger(__name__)
+        settings_file = file_manager.get_latest_file("yahoo", "league_settings", "raw_data")
+        if not settings_file:
+            logger.warning("No Yahoo league settings output found (run yahoo/league_settings.py), "
+                           "using default PPR scoring")
+            return cls()
+
+        try:
+            settings = file_manager.load_raw_data(settings_file)
+        except (OSError, ValueError, RuntimeError) as e:
+            logger.warning(f"Could not load league settings {settings_file}: {e}")
+            return cls()
+
+        return cls.from_yahoo_settings(settings, source=settings_file)
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def build_matrix(self, stat_lines: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """
+        Pack stat lines into a float matrix.
+
+        Args:
+            stat_lines: Dicts with 'passing'/'rushing'/'receiving'/'defense' sections
+                        (Tank01 'Passing'/... capitalized sections are also accepted)
+
+        Returns:
+            Array of shape (len(stat_lines), len(self.columns))
+        """
+        matrix = np.zeros((len(stat_lines), len(self.columns)))
+        for row, line in enumerate(stat_lines):
+            for section, columns in self._columns_by_section.items():
+                values = line.get(section)
+                if values is None:
+                    values = line.get(section.capitalize())
+                if not values:
+                    continue
+                for i, field in columns:
+                    if field in values:
+                        matrix[row, i] = _to_float(values[field])
+        return matrix
+
+    def score_matrix(self, matrix: np.ndarray, is_team_defense: Any = False) -> np.ndarray:
+        """
+        Score every row of a stat matrix.
+
+        Args:
+            matrix: Output of build_matrix
+            is_team_defense: Bool or per-row bool array marking team defense rows
+
+        Returns:
+            Fantasy points per row (rounded to 2 decimals)
+        """
+        if matrix.shape[0] == 0:
+            return np.zeros(0)
+        is_def = np.broadcast_to(np.asarray(is_team_defense, dtype=bool), (matrix.shape[0],))
+
+        by_weights = matrix @ self.weights
+        points = np.where(is_def, by_weights[:, 1], by_weights[:, 0])
+
+        tiers = np.digitize(matrix[:, self._points_allowed_column], POINTS_ALLOWED_BOUNDARIES)
+        points = points + np.where(is_def, self.points_allowed_tiers[tiers], 0.0)
+        return np.round(points, 2)
+
+    def score_games(self, games: Sequence[Dict[str, Any]], is_team_defense: Any = False) -> np.ndarray:
+        """Score a list of game stat lines."""
+        return self.score_matrix(self.build_matrix(games), is_team_defense)
+
+    def score_game(self, game: Dict[str, Any], is_team_defense: bool = False) -> float:
+        """Score a single game stat line."""
+        return float(self.score_games([game], is_team_defense)[0])
+
+    def score_league(self, players_game_stats: List[Dict[str, Any]],
+                     team_defense_flags: Optional[Sequence[bool]] = None) -> None:
+        """
+        Score every game of every player in one pass and fill in season totals/averages.
+
+        Each entry is a player's game stats dict ({'games': [...], optional
+        'team_defense_stats'}). Every game gets 'fantasy_points'; the entry gets
+        'season_totals' and 'season_averages'. Entries are updated in place.
+
+        A team defense without game logs is scored from its team-level stats
+        as a single game, as before.
+
+        Args:
+            players_game_stats: Game stats dicts, one per player
+            team_defense_flags: Per-player flag for team defenses (default: none)
+        """
+        flags = list(team_defense_flags) if team_defense_flags is not None else [False] * len(players_game_stats)
+
+        lines: List[Dict[str, Any]] = []
+        owners: List[int] = []
+        row_is_def: List[bool] = []
+        team_level_rows = set()
+
+        for player_index, (entry, is_def) in enumerate(zip(players_game_stats, flags)):
+            games = entry.get('games') or []
+            if games:
+                lines.extend(games)
+                owners.extend([player_index] * len(games))
+                row_is_def.extend([bool(is_def)] * len(games))
+            elif entry.get('team_defense_stats'):
+                team_level_rows.add(player_index)
+                lines.append({'defense': entry['team_defense_stats']})
+                owners.append(player_index)
+                row_is_def.append(True)
+
+        matrix = self.build_matrix(lines)
+        points = self.score_matrix(matrix, np.array(row_is_def, dtype=bool))
+        owner_index = np.array(owners, dtype=int)
+
+        num_players = len(players_game_stats)
+        totals = np.zeros((num_players, len(self.columns)))
+        np.add.at(totals, owner_index, matrix)
+        point_totals = np.bincount(owner_index, weights=points, minlength=num_players)
+        game_counts = np.bincount(owner_index, minlength=num_players)
+
+        row = 0
+        for line, owner in zip(lines, owners):
+            if owner not in team_level_rows:
+                line['fantasy_points'] = float(points[row])
+            row += 1
+
+        for player_index, entry in enumerate(players_game_stats):
+            games_played = int(game_counts[player_index])
+            entry['season_totals'] = self._format_totals(totals[player_index],
+                                                         float(point_totals[player_index]), games_played)
+            if player_index in team_level_rows or games_played == 0:
+                entry['season_averages'] = {}
+            else:
+                entry['season_averages'] = self._format_totals(totals[player_index] / games_played,
+                                                               float(point_totals[player_index]) / games_played)
+
+    def _format_totals(self, values: np.ndarray, fantasy_points: float,
+                       games_played: Optional[int] = None) -> Dict[str, Any]:
+        """Convert a totals/averages row back to the per-section report structure."""
+        result: Dict[str, Any] = {}
+        for section, fields in TOTAL_FIELDS.items():
+            result[section] = {field: round(float(values[self._column_index[(section, field)]]), 2)
+                               for field in fields}
+        result['fantasy_points'] = round(fantasy_points, 2)
+        if games_played is not None:
+            result['games_played'] = games_played
+        return result
+
+    def get_settings_summary(self) -> Dict[str, Any]:
+        """Describe the scoring settings in use (for raw outputs)."""
+        return {
+            'source': self.source,
+            'stat_modifiers': {str(k): v for k, v in sorted(self.stat_modifiers.items())},
+            'points_allowed_tiers': self.points_allowed_tiers.tolist()
+        }
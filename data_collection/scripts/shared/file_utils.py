@@ -7,11 +7,128 @@ for all data extraction scripts.
 """
 
 import os
+import re
+import gzip
 import json
 import logging
+import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+try:
+    import msgpack
+    import zstandard
+except ImportError:
+    msgpack = None
+    zstandard = None
+
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# File types tracked by the manifest
+MANIFEST_FILE_TYPES = ("clean", "raw_data")
+
+# YYYYMMDD_HHMMSS at the start of every output filename
+_TIMESTAMP_RE = re.compile(r"^(\d{8}_\d{6})")
+# Week marker used by week-prefixed outputs (..._wk05_...)
+_WEEK_RE = re.compile(r"_wk(\d{1,2})(?:_|$)")
+
+# Serializes manifest updates between threads of one process (flock covers processes)
+_manifest_lock = threading.Lock()
+
+# Storage format for raw snapshots (see RAW_DATA_CODECS)
+DEFAULT_RAW_DATA_FORMAT = os.getenv('RAW_DATA_FORMAT', 'compact_json')
+
+
+class JsonCodec:
+    """Plain JSON snapshots; indent=2 is the original pretty-printed format."""
+
+    def __init__(self, extension: str = ".json", indent: Optional[int] = None):
+        self.extension = extension
+        self.indent = indent
+
+    def available(self) -> bool:
+        return True
+
+    def encode(self, data: Any) -> bytes:
+        if self.indent is None:
+            text = json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=str)
+        else:
+            text = json.dumps(data, indent=self.indent, default=str)
+        return text.encode('utf-8')
+
+    def decode(self, payload: bytes) -> Any:
+        return json.loads(payload)
+
+
+class GzipJsonCodec(JsonCodec):
+    """Compact JSON compressed with gzip (standard library only)."""
+
+    def __init__(self, level: int = 6):
+        super().__init__(extension=".json.gz")
+        self.level = level
+
+    def encode(self, data: Any) -> bytes:
+        return gzip.compress(super().encode(data), compresslevel=self.level, mtime=0)
+
+    def decode(self, payload: bytes) -> Any:
+        return json.loads(gzip.decompress(payload))
+
+
+class MsgpackZstdCodec:
+    """msgpack binary encoding compressed with zstd (optional msgpack + zstandard)."""
+
+    extension = ".msgpack.zst"
+
+    def __init__(self, level: int = 3):
+        self.level = level
+
+    def available(self) -> bool:
+        return msgpack is not None and zstandard is not None
+
+    def encode(self, data: Any) -> bytes:
+        packed = msgpack.packb(data, default=str, use_bin_type=True)
+        return zstandard.ZstdCompressor(level=self.level).compress(packed)
+
+    def decode(self, payload: bytes) -> Any:
+        return msgpack.unpackb(zstandard.ZstdDecompressor().decompress(payload), raw=False,
+                               strict_map_key=False)
+
+
+# Registered raw snapshot formats; register_raw_codec() adds new backends
+RAW_DATA_CODECS: Dict[str, Any] = {
+    "json": JsonCodec(indent=2),
+    "compact_json": JsonCodec(),
+    "json_gz": GzipJsonCodec(),
+    "msgpack_zst": MsgpackZstdCodec()
+}
+
+
+def register_raw_codec(name: str, codec: Any) -> None:
+    """
+    Register a raw snapshot storage backend.
+
+    Args:
+        name: Format name used by RAW_DATA_FORMAT / DataFileManager(raw_format=...)
+        codec: Object with extension, available(), encode(data) -> bytes and decode(bytes)
+    """
+    RAW_DATA_CODECS[name] = codec
+
+
+def codec_for_path(path: str) -> Any:
+    """Codec that decodes a raw snapshot, chosen by the longest matching extension."""
+    name = str(path)
+    matches = [c for c in RAW_DATA_CODECS.values() if name.endswith(c.extension)]
+    if not matches:
+        return RAW_DATA_CODECS["json"]
+    return max(matches, key=lambda c: len(c.extension))
 
 class DataFileManager:
     """
@@ -21,16 +138,34 @@ class DataFileManager:
     and saving utilities for both clean markdown and raw JSON data.
     """
     
-    def __init__(self, base_output_dir: str = None):
+    def __init__(self, base_output_dir: str = None, raw_format: str = None, retain_raw_data: bool = False):
         """
         Initialize the file manager.
         
         Args:
             base_output_dir: Base directory for outputs (defaults to data_collection/outputs)
+            raw_format: Raw snapshot storage format (defaults to RAW_DATA_FORMAT, 'compact_json')
+            retain_raw_data: Keep raw snapshots saved through this manager in memory so
+                             later loads of the same file skip the disk read and decode
+                             (used when collectors share one manager in-process)
         """
         # Set up logging
         self.logger = logging.getLogger(__name__)
         
+        # Raw snapshots saved by this manager, by path (only when retaining).
+        # Loads hand back the producer's object: callers must treat it as read-only.
+        self.retain_raw_data = retain_raw_data
+        self._retained_raw: Dict[str, Any] = {}
+        
+        # Raw snapshot storage backend
+        self.raw_format = raw_format or DEFAULT_RAW_DATA_FORMAT
+        codec = RAW_DATA_CODECS.get(self.raw_format)
+        if codec is None or not codec.available():
+            self.logger.warning(f"Raw data format '{self.raw_format}' unavailable, using compact_json")
+            self.raw_format = "compact_json"
+            codec = RAW_DATA_CODECS[self.raw_format]
+        self.raw_codec = codec
+        
         # Determine base output directory
         if base_output_dir:
             self.base_output_dir = Path(base_output_dir)
@@ -84,6 +219,15 @@ class DataFileManager:
         output_dir.mkdir(parents=True, exist_ok=True)
         return output_dir
     
+    def _resolve_output_directory(self, api_name: str, script_name: str, timestamp: str,
+                                  custom_dir: Optional[str] = None) -> Path:
+        """Output directory for a save: custom_dir when given, else the dated layout."""
+        if not custom_dir:
+            return self.get_output_directory(api_name, script_name, timestamp)
+        output_dir = Path(custom_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir
+    
     def generate_filename(self, timestamp: str, script_name: str, file_type: str) -> str:
         """
         Generate consistent filename for data files.
@@ -99,11 +243,12 @@ class DataFileManager:
         if file_type == "clean":
             return f"{timestamp}_{script_name}_clean.md"
         elif file_type == "raw_data":
-            return f"{timestamp}_{script_name}_raw_data.json"
+            return f"{timestamp}_{script_name}_raw_data{self.raw_codec.extension}"
         else:
             return f"{timestamp}_{script_name}_{file_type}"
     
-    def save_clean_data(self, api_name: str, script_name: str, data: str, timestamp: str = None) -> str:
+    def save_clean_data(self, api_name: str, script_name: str, data: str, timestamp: str = None,
+                        custom_dir: str = None) -> str:
         """
         Save clean markdown data to file.
         
@@ -112,6 +257,7 @@ class DataFileManager:
             script_name: Script name (my_roster, etc.)
             data: Clean markdown content
             timestamp: Optional timestamp (generates new if not provided)
+            custom_dir: Optional directory overriding the YYYY/MM/DD layout
             
         Returns:
             Path to saved file
@@ -119,7 +265,7 @@ class DataFileManager:
         if not timestamp:
             timestamp = self.generate_timestamp()
         
-        output_dir = self.get_output_directory(api_name, script_name, timestamp)
+        output_dir = self._resolve_output_directory(api_name, script_name, timestamp, custom_dir)
         filename = self.generate_filename(timestamp, script_name, "clean")
         filepath = output_dir / filename
         
@@ -128,21 +274,24 @@ class DataFileManager:
                 f.write(data)
             
             self.logger.info(f"Clean data saved: {filepath}")
+            self._record_output(api_name, script_name, "clean", filepath, timestamp)
             return str(filepath)
             
         except Exception as e:
             self.logger.error(f"Failed to save clean data to {filepath}: {e}")
             raise
     
-    def save_raw_data(self, api_name: str, script_name: str, data: Dict[str, Any], timestamp: str = None) -> str:
+    def save_raw_data(self, api_name: str, script_name: str, data: Dict[str, Any], timestamp: str = None,
+                      custom_dir: str = None) -> str:
         """
-        Save raw JSON data to file.
+        Save raw data to file in the configured storage format.
         
         Args:
             api_name: API name (yahoo, sleeper, tank01)
             script_name: Script name (my_roster, etc.)
             data: Raw API response data
             timestamp: Optional timestamp (generates new if not provided)
+            custom_dir: Optional directory overriding the YYYY/MM/DD layout
             
         Returns:
             Path to saved file
@@ -150,15 +299,19 @@ class DataFileManager:
         if not timestamp:
             timestamp = self.generate_timestamp()
         
-        output_dir = self.get_output_directory(api_name, script_name, timestamp)
+        output_dir = self._resolve_output_directory(api_name, script_name, timestamp, custom_dir)
         filename = self.generate_filename(timestamp, script_name, "raw_data")
         filepath = output_dir / filename
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+            with open(filepath, 'wb') as f:
+                f.write(self.raw_codec.encode(data))
             
             self.logger.info(f"Raw data saved: {filepath}")
+            if self.retain_raw_data:
+                self._retained_raw[str(filepath)] = data
+            self._record_output(api_name, script_name, "raw_data", filepath, timestamp,
+                                week=self._week_from_data(data))
             return str(filepath)
             
         except Exception as e:
@@ -240,59 +393,284 @@ class DataFileManager:
             self.logger.error(f"Failed to save execution log to {filepath}: {e}")
             raise
     
-    def get_latest_file(self, api_name: str, script_name: str, file_type: str = "clean") -> Optional[str]:
+    # ------------------------------------------------------------------
+    # Latest-output manifest
+    # ------------------------------------------------------------------
+
+    def get_manifest_path(self, api_name: str, script_name: str) -> Path:
+        """Path of the manifest indexing a script's outputs."""
+        return self.base_output_dir / api_name / script_name / MANIFEST_FILENAME
+
+    @staticmethod
+    def _week_from_data(data: Any) -> Optional[int]:
+        """NFL week recorded in a raw payload's season context, if any."""
+        if not isinstance(data, dict):
+            return None
+        for key in ("season_context", "metadata"):
+            context = data.get(key)
+            if not isinstance(context, dict):
+                continue
+            week = context.get("current_week") or context.get("week")
+            if week is None and isinstance(context.get("season_context"), dict):
+                week = context["season_context"].get("current_week")
+            try:
+                return int(week) if week is not None else None
+            except (TypeError, ValueError):
+                return None
+        return None
+
+    @staticmethod
+    def _empty_manifest() -> Dict[str, Any]:
+        return {
+            "version": MANIFEST_VERSION,
+            "latest": {},
+            "latest_by_week": {},
+            "history": {file_type: [] for file_type in MANIFEST_FILE_TYPES}
+        }
+
+    def _make_entry(self, filepath: Path, timestamp: Optional[str] = None,
+                    week: Optional[int] = None) -> Dict[str, Any]:
+        """Manifest entry for one output file."""
+        filepath = Path(filepath)
+        name = filepath.name
+        match = _TIMESTAMP_RE.match(timestamp or name) or _TIMESTAMP_RE.match(name)
+        if week is None:
+            week_match = _WEEK_RE.search(timestamp or "") or _WEEK_RE.search(name)
+            week = int(week_match.group(1)) if week_match else None
+        try:
+            relative = str(filepath.resolve().relative_to(self.base_output_dir.resolve()))
+        except ValueError:
+            relative = str(filepath)
+        try:
+            size = filepath.stat().st_size
+        except OSError:
+            size = None
+        return {
+            "path": relative,
+            "timestamp": match.group(1) if match else None,
+            "week": week,
+            "size": size,
+            "saved_at": datetime.now().isoformat()
+        }
+
+    @staticmethod
+    def _add_entry(manifest: Dict[str, Any], file_type: str, entry: Dict[str, Any]) -> None:
+        """Insert an entry into history and promote it to latest if it is the newest."""
+        history = manifest["history"].setdefault(file_type, [])
+        history[:] = [e for e in history if e["path"] != entry["path"]]
+        history.append(entry)
+
+        def newer(current: Optional[Dict[str, Any]]) -> bool:
+            return current is None or (entry["timestamp"] or "") >= (current.get("timestamp") or "")
+
+        if newer(manifest["latest"].get(file_type)):
+            manifest["latest"][file_type] = entry
+        if entry["week"] is not None:
+            by_week = manifest["latest_by_week"].setdefault(str(entry["week"]), {})
+            if newer(by_week.get(file_type)):
+                by_week[file_type] = entry
+
+    def _read_manifest(self, api_name: str, script_name: str) -> Optional[Dict[str, Any]]:
+        path = self.get_manifest_path(api_name, script_name)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Ignoring unreadable manifest {path}: {e}")
+            return None
+        if manifest.get("version") != MANIFEST_VERSION:
+            return None
+        return manifest
+
+    def _write_manifest(self, api_name: str, script_name: str, manifest: Dict[str, Any]) -> None:
+        path = self.get_manifest_path(api_name, script_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _update_manifest(self, api_name: str, script_name: str, update) -> Dict[str, Any]:
+        """
+        Read-modify-write a manifest under a thread lock and an exclusive file lock,
+        replacing the file atomically so readers never see a partial manifest.
+        """
+        script_dir = self.base_output_dir / api_name / script_name
+        script_dir.mkdir(parents=True, exist_ok=True)
+        with _manifest_lock:
+            lock_file = open(script_dir / f".{MANIFEST_FILENAME}.lock", 'w')
+            try:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                manifest = self._read_manifest(api_name, script_name)
+                if manifest is None:
+                    manifest = self._scan_outputs(api_name, script_name)
+                update(manifest)
+                self._write_manifest(api_name, script_name, manifest)
+                return manifest
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+                lock_file.close()
+
+    def _record_output(self, api_name: str, script_name: str, file_type: str, filepath: Path,
+                       timestamp: Optional[str] = None, week: Optional[int] = None) -> None:
+        """Register a freshly saved output in the script's manifest."""
+        entry = self._make_entry(filepath, timestamp, week)
+        try:
+            self._update_manifest(api_name, script_name,
+                                  lambda manifest: self._add_entry(manifest, file_type, entry))
+        except OSError as e:
+            # The output itself is saved; lookups fall back to a directory scan
+            self.logger.warning(f"Failed to update manifest for {api_name}/{script_name}: {e}")
+
+    def _scan_outputs(self, api_name: str, script_name: str) -> Dict[str, Any]:
+        """Build a manifest from the files already on disk (one-time directory scan)."""
+        base_script_dir = self.base_output_dir / api_name / script_name
+        manifest = self._empty_manifest()
+        patterns = {
+            "clean": f"**/*_{script_name}_clean.md",
+            "raw_data": f"**/*_{script_name}_raw_data.*"
+        }
+        for file_type, pattern in patterns.items():
+            for filepath in sorted(base_script_dir.glob(pattern)):
+                self._add_entry(manifest, file_type, self._make_entry(filepath))
+        return manifest
+
+    def rebuild_manifest(self, api_name: str, script_name: str) -> Dict[str, Any]:
+        """
+        Re-index a script's outputs from disk.
+
+        Used for outputs written before the manifest existed and after files are
+        moved or deleted by hand.
+
+        Returns:
+            The rebuilt manifest
+        """
+        def replace(manifest: Dict[str, Any]) -> None:
+            manifest.clear()
+            manifest.update(self._scan_outputs(api_name, script_name))
+
+        self.logger.info(f"Rebuilding output manifest for {api_name}/{script_name}")
+        return self._update_manifest(api_name, script_name, replace)
+
+    def get_manifest(self, api_name: str, script_name: str) -> Dict[str, Any]:
+        """Manifest for a script, built from disk on first use."""
+        manifest = self._read_manifest(api_name, script_name)
+        if manifest is None:
+            manifest = self.rebuild_manifest(api_name, script_name)
+        return manifest
+
+    def _resolve_entry(self, entry: Optional[Dict[str, Any]]) -> Optional[str]:
+        if not entry:
+            return None
+        path = Path(entry["path"])
+        if not path.is_absolute():
+            path = self.base_output_dir / path
+        return str(path) if path.exists() else None
+
+    def get_latest_file(self, api_name: str, script_name: str, file_type: str = "clean",
+                        week: Optional[int] = None) -> Optional[str]:
         """
         Get the path to the latest file for a script.
         
+        Clean and raw outputs are resolved through the script's manifest; the
+        directory tree is only scanned when the manifest is missing or stale.
+        
         Args:
             api_name: API name
             script_name: Script name
             file_type: File type to look for
+            week: Optional NFL week - returns the latest file saved for that week
             
         Returns:
             Path to latest file or None if not found
         """
-        # Search in the base directory for the script (not date-specific)
-        base_script_dir = self.base_output_dir / api_name / script_name
-        
-        # Look for files matching the pattern in all YYYY/MM/DD subdirectories
-        if file_type == "clean":
-            pattern = f"**/*_{script_name}_clean.md"
-        elif file_type == "raw_data":
-            pattern = f"**/*_{script_name}_raw_data.json"
-        else:
-            pattern = f"**/*_{script_name}_*.{file_type}"
-        
-        files = list(base_script_dir.glob(pattern))
+        if file_type not in MANIFEST_FILE_TYPES:
+            # Search in the base directory for the script (not date-specific)
+            base_script_dir = self.base_output_dir / api_name / script_name
+            files = list(base_script_dir.glob(f"**/*_{script_name}_*.{file_type}"))
+            if not files:
+                return None
+            return str(max(files, key=lambda f: f.name))
+
+        def lookup(manifest: Dict[str, Any]) -> Optional[str]:
+            if week is None:
+                entry = manifest["latest"].get(file_type)
+            else:
+                entry = manifest["latest_by_week"].get(str(int(week)), {}).get(file_type)
+            return self._resolve_entry(entry)
+
+        manifest = self.get_manifest(api_name, script_name)
+        latest = lookup(manifest)
+        if latest is None and manifest["history"].get(file_type):
+            # An indexed file was moved or deleted by hand
+            manifest = self.rebuild_manifest(api_name, script_name)
+            latest = lookup(manifest)
+        return latest
+    
+    def load_raw_data(self, filepath: str) -> Any:
+        """
+        Load a raw snapshot written in any registered storage format.
         
-        if not files:
-            return None
+        Args:
+            filepath: Path to a raw data file (.json, .json.gz, .msgpack.zst, ...)
+            
+        Returns:
+            Decoded snapshot (the in-memory object when this manager saved and retained it)
+        """
+        retained = self._retained_raw.get(str(filepath))
+        if retained is not None:
+            return retained
+        codec = codec_for_path(filepath)
+        if not codec.available():
+            raise RuntimeError(f"Cannot decode {filepath}: storage backend for {codec.extension} is not installed")
+        with open(filepath, 'rb') as f:
+            return codec.decode(f.read())
+    
+    def load_latest_raw_data(self, api_name: str, script_name: str,
+                             week: Optional[int] = None) -> Optional[Any]:
+        """
+        Load the latest raw snapshot for a script.
         
-        # Sort by modification time and return the latest
-        latest_file = max(files, key=os.path.getctime)
-        return str(latest_file)
+        Args:
+            api_name: API name
+            script_name: Script name
+            week: Optional NFL week
+            
+        Returns:
+            Decoded snapshot or None if no file exists
+        """
+        latest_file = self.get_latest_file(api_name, script_name, "raw_data", week=week)
+        return self.load_raw_data(latest_file) if latest_file else None
     
-    def list_files(self, api_name: str, script_name: str) -> Dict[str, list]:
+    def list_files(self, api_name: str, script_name: str, week: Optional[int] = None) -> Dict[str, List[str]]:
         """
         List all files for a script.
         
         Args:
             api_name: API name
             script_name: Script name
+            week: Optional NFL week filter
             
         Returns:
-            Dict with 'clean' and 'raw_data' file lists
+            Dict with 'clean' and 'raw_data' file lists (newest first)
         """
-        # Search in the base directory for the script (not date-specific)
-        base_script_dir = self.base_output_dir / api_name / script_name
-        
-        clean_files = list(base_script_dir.glob(f"**/*_{script_name}_clean.md"))
-        raw_files = list(base_script_dir.glob(f"**/*_{script_name}_raw_data.json"))
-        
-        return {
-            'clean': [str(f) for f in sorted(clean_files, reverse=True)],
-            'raw_data': [str(f) for f in sorted(raw_files, reverse=True)]
-        }
+        manifest = self.get_manifest(api_name, script_name)
+        files = {}
+        for file_type in MANIFEST_FILE_TYPES:
+            entries = [e for e in manifest["history"].get(file_type, [])
+                       if week is None or e.get("week") == week]
+            entries.sort(key=lambda e: (e.get("timestamp") or "", e["path"]), reverse=True)
+            files[file_type] = [p for p in (self._resolve_entry(e) for e in entries) if p]
+        return files
 
 def main():
     """Test the file utilities."""
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Tank01 Game Stats Call Planner
+
+Chooses between per-player game logs and per-game box scores when a stats
+extractor needs game stats for many players.
+
+- Per player: one getNFLGamesForPlayer call for every player whose game log
+  can have changed (GameStatsStore.needs_fetch).
+- Per game: one getNFLGamesForWeek call per week to list the games, then one
+  getNFLBoxScore call per game the players' teams played that is not known
+  yet. A box score holds every player in the game, so the results are fanned
+  back out to each player.
+
+Only players the store already has a game log for are planned per game: the
+games read for them are those of their current team and of every team their
+stored games were played for. A player's first fetch always uses the game log,
+which is the only call that covers the games of teams the player left.
+
+The planner estimates both costs, checks them against the remaining RapidAPI
+quota and runs the cheaper plan. After the weekly schedules are read the
+per-game cost is exact; if it is no longer cheaper the plan falls back to per
+player. Players whose box scores could not be read also fall back.
+
+Team defenses are always fetched per player (box scores list individual
+defenders, not the team unit).
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from game_stats_store import GameStatsStore, FINAL_AFTER_DAYS, game_date_from_id
+from rate_limiter import QuotaAwareTokenBucket, fetch_in_order, DEFAULT_MAX_WORKERS, DEFAULT_QUOTA_RESERVE
+from season_context import estimate_week_from_date
+
+PER_PLAYER = "per_player"
+PER_GAME = "per_game"
+
+
+class GameFetchPlanner:
+    """
+    Plans and runs the game stats calls for a set of players.
+    """
+
+    def __init__(self, tank01_client: Any, game_stats_store: GameStatsStore,
+                 limiter: Optional[QuotaAwareTokenBucket] = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 reserve_calls: int = DEFAULT_QUOTA_RESERVE):
+        """
+        Initialize the planner.
+
+        Args:
+            tank01_client: SimpleTank01Client (get_box_score, get_games_for_week, get_api_usage)
+            game_stats_store: Store that the per-player path and fanned-out games go through
+            limiter: Optional token bucket checked before each planned call
+            max_workers: Maximum concurrent box score calls
+            reserve_calls: Quota to leave untouched when comparing plans
+        """
+        self.logger = logging.getLogger(__name__)
+        self.tank01 = tank01_client
+        self.store = game_stats_store
+        self.limiter = limiter
+        self.max_workers = max_workers
+        self.reserve_calls = reserve_calls
+        self._lock = threading.Lock()
+
+        # week -> [(game_id, home, away)], kept for the planner's lifetime
+        self._week_games: Dict[int, List[Tuple[str, str, str]]] = {}
+        # player_id -> response-shaped dict built from box scores
+        self._results: Dict[str, Dict[str, Any]] = {}
+
+        self.last_plan: Optional[Dict[str, Any]] = None
+        self.stats = {
+            "schedule_calls": 0,
+            "box_score_calls": 0,
+            "players_from_box_scores": 0
+        }
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+
+    def plan(self, players: List[Dict[str, Any]], season: str, weeks: List[int]) -> Dict[str, Any]:
+        """
+        Estimate both plans and choose one.
+
+        Args:
+            players: Tank01 player dicts (playerID, team, isTeamDefense)
+            season: Season year
+            weeks: Weeks the game stats must cover (normally 1 through the current week)
+
+        Returns:
+            Plan dict with strategy, per_player_calls, per_game_calls (estimate),
+            remaining_calls and the (player_id, teams, weeks) entries it covers
+        """
+        pending = 0
+        eligible = []
+        for player in players:
+            player_id = str(player.get('playerID', ''))
+            team = (player.get('team') or '').upper()
+            if not player_id or not self.store.needs_fetch(player_id, season, team):
+                continue
+            pending += 1
+            if not team or player.get('isTeamDefense', False) or not self.store.last_fetched(player_id, season):
+                continue
+            teams = sorted({team} | set(self.store.player_teams(player_id, season)))
+            eligible.append((player_id, teams, self._weeks_needed(player_id, season, weeks)))
+
+        team_weeks = {(team, week) for _, teams, player_weeks in eligible for team in teams for week in player_weeks}
+        schedule_calls = len({week for _, week in team_weeks} - set(self._week_games))
+
+        # Each game covers at least one of the needed team-weeks, usually two
+        per_game_calls = schedule_calls + len(team_weeks) + (pending - len(eligible))
+        per_player_calls = pending
+        remaining = self._remaining_calls()
+
+        strategy = PER_GAME if eligible and per_game_calls < per_player_calls else PER_PLAYER
+        if remaining is not None:
+            budget = remaining - self.reserve_calls
+            chosen, other = ((per_game_calls, per_player_calls) if strategy == PER_GAME
+                             else (per_player_calls, per_game_calls))
+            if chosen > budget >= other and eligible:
+                strategy = PER_PLAYER if strategy == PER_GAME else PER_GAME
+
+        self.last_plan = {
+            "strategy": strategy,
+            "season": str(season),
+            "players_needing_fetch": pending,
+            "per_player_calls": per_player_calls,
+            "per_game_calls": per_game_calls,
+            "remaining_calls": remaining,
+            "entries": eligible
+        }
+        self.logger.info(f"Game stats plan: {strategy} (per player {per_player_calls} calls, "
+                         f"per game ~{per_game_calls} calls, remaining {remaining})")
+        return self.last_plan
+
+    def _weeks_needed(self, player_id: str, season: str, weeks: List[int]) -> List[int]:
+        """Weeks that can hold games not yet known for the player."""
+        fetched_at = self.store.last_fetched(player_id, season)
+        if not fetched_at:
+            return list(weeks)
+        final_by = datetime.fromtimestamp(fetched_at) - timedelta(days=FINAL_AFTER_DAYS)
+        # Date estimates can run a week ahead of the schedule
+        first_week = estimate_week_from_date(final_by, season)['week'] - 1
+        return [week for week in weeks if week >= first_week]
+
+    def _remaining_calls(self) -> Optional[int]:
+        try:
+            usage = self.tank01.get_api_usage()
+            remaining = usage.get('remaining_calls')
+            return int(remaining) if remaining is not None else None
+        except Exception as e:
+            self.logger.debug(f"Could not read API usage: {e}")
+            return None
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def execute(self, plan: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a per-game plan and fan the box scores out to each player.
+
+        A per-player plan needs no upfront calls: get_player_games fetches
+        each game log as before.
+
+        Returns:
+            The plan, updated with the exact call counts when run per game
+        """
+        if plan["strategy"] != PER_GAME:
+            return plan
+
+        season = plan["season"]
+        weeks = sorted({week for _, _, player_weeks in plan["entries"] for week in player_weeks})
+        for week in weeks:
+            self._load_week_games(week, season)
+
+        # Exact games per player now that the schedule is known
+        today = datetime.now()
+        player_games: Dict[str, List[str]] = {}
+        for player_id, teams, player_weeks in plan["entries"]:
+            if any(week not in self._week_games for week in player_weeks):
+                # Schedule unavailable: leave the player to the per-player path
+                continue
+            team_games = [game_id for week in player_weeks for game_id, home, away in self._week_games.get(week, [])
+                          if (home in teams or away in teams) and (game_date_from_id(game_id) or today) <= today]
+            player_games[player_id] = self.store.missing_games(player_id, season, team_games)
+
+        needed = sorted({game_id for game_ids in player_games.values() for game_id in game_ids})
+        exact = len(needed) + (plan["players_needing_fetch"] - len(player_games))
+        plan["per_game_calls"] = self.stats["schedule_calls"] + exact
+        if exact >= plan["per_player_calls"]:
+            self.logger.info(f"Per-game plan needs {exact} calls, falling back to per-player game logs")
+            plan["strategy"] = PER_PLAYER
+            return plan
+
+        box_scores = dict(zip(needed, fetch_in_order(
+            needed, self._fetch_box_score, limiter=self.limiter,
+            max_workers=self.max_workers, on_error=self._box_score_error)))
+
+        for player_id, game_ids in player_games.items():
+            if any(box_scores.get(game_id) is None for game_id in game_ids):
+                # Leave the player to the per-player path
+                continue
+            games = {}
+            for game_id in game_ids:
+                entry = box_scores[game_id].get(player_id)
+                if entry:
+                    games[game_id] = entry
+            self._results[player_id] = self.store.record_games(player_id, season, games, game_ids)
+
+        self.logger.info(f"Box scores covered {len(self._results)} players with {len(needed)} games")
+        return plan
+
+    def prefetch(self, players: List[Dict[str, Any]], season: str, weeks: List[int]) -> Dict[str, Any]:
+        """Plan and execute in one step."""
+        return self.execute(self.plan(players, season, weeks))
+
+    def _load_week_games(self, week: int, season: str) -> None:
+        """Read a week's games once; weeks whose schedule is unavailable stay unloaded."""
+        if week in self._week_games:
+            return
+        response = self.tank01.get_games_for_week(week, season)
+        self.stats["schedule_calls"] += 1
+        body = response.get('body') if isinstance(response, dict) else None
+        if not isinstance(body, list) or not body:
+            self.logger.warning(f"No NFL schedule for week {week}")
+            return
+        self._week_games[week] = [(game['gameID'], (game.get('home') or '').upper(), (game.get('away') or '').upper())
+                                  for game in body if isinstance(game, dict) and game.get('gameID')]
+
+    def _fetch_box_score(self, game_id: str) -> Optional[Dict[str, Any]]:
+        """Player stats from a game's box score, keyed by playerID (None if unavailable)."""
+        response = self.tank01.get_box_score(game_id)
+        with self._lock:
+            self.stats["box_score_calls"] += 1
+        body = response.get('body') if isinstance(response, dict) else None
+        if not isinstance(body, dict) or not isinstance(body.get('playerStats'), dict):
+            self.logger.warning(f"No player stats in box score for {game_id}")
+            return None
+        return body['playerStats']
+
+    def _box_score_error(self, game_id: str, error: Exception) -> None:
+        self.logger.warning(f"Box score for {game_id} unavailable: {error}")
+        return None
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get_player_games(self, player_id: str, season: str, team: Optional[str],
+                         fetch_func: Callable[[], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Get a player's game log: from the box scores if the plan covered the
+        player, otherwise through GameStatsStore.get_player_games.
+        """
+        result = self._results.get(str(player_id))
+        if result is not None:
+            with self._lock:
+                self.stats["players_from_box_scores"] += 1
+            return result
+        return self.store.get_player_games(player_id, season, team, fetch_func)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get plan and call counters for this run."""
+        stats = dict(self.stats)
+        if self.last_plan:
+            stats.update({key: value for key, value in self.last_plan.items() if key != "entries"})
+        return stats
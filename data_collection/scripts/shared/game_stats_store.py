@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Immutable Per-Game Stats Store
+
+Keeps Tank01 getNFLGamesForPlayer results for finished games keyed by
+(playerID, gameID). A final game's box score never changes, so stats runs
+only need the games that are new or still in progress.
+
+A game is considered final when the NFL schedule (tank01/nfl_matchups.py
+output) reports it as Completed, or when its date is FINAL_AFTER_DAYS or more
+in the past.
+
+The per-player API call is skipped entirely when the schedule shows that no
+new game can exist for the player's team since the last fetch:
+- the team's game this week is already stored as final, or
+- the team's game this week has not kicked off (or the team is on bye) and
+  the last fetch happened after the previous week's games were over.
+
+Final games a fetch showed the player did not appear in (inactive, or missing
+from a box score read through game_fetch_planner.py) are kept as covered, so
+they neither trigger another fetch nor have their box scores read again.
+
+Files: data_collection/cache/game_stats/<season>/<playerID>.json
+"""
+
+import os
+import json
+import time
+import logging
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from file_utils import codec_for_path
+
+DATA_COLLECTION_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_STORE_DIR = DATA_COLLECTION_ROOT / "cache" / "game_stats"
+
+STORE_VERSION = 1
+
+# Games this many days old are final even if the schedule does not say so
+FINAL_AFTER_DAYS = 2
+
+# Previous week's games are over this long before the current week's first kickoff
+WEEK_BOUNDARY_HOURS = 24
+
+# Ignore schedules whose games are further than this from now
+SCHEDULE_MAX_AGE_DAYS = 7
+
+COMPLETED_STATUSES = {'completed', 'final', 'final/ot'}
+
+
+def game_date_from_id(game_id: str) -> Optional[datetime]:
+    """Parse the date from a Tank01 game ID (format: 20250907_CIN@CLE)."""
+    try:
+        return datetime.strptime(str(game_id).split('_')[0], "%Y%m%d")
+    except ValueError:
+        return None
+
+
+class GameStatsStore:
+    """
+    Persistent store of finalized per-player game stats.
+
+    Thread-safe: stats extractors call get_player_games from a thread pool.
+    """
+
+    def __init__(self, store_dir: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            store_dir: Root directory (default: data_collection/cache/game_stats)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.store_dir = Path(store_dir) if store_dir else DEFAULT_STORE_DIR
+        self._lock = threading.Lock()
+        self._records: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        # Current week schedule: game_id -> {home, away, kickoff, completed}
+        self.schedule: Dict[str, Dict[str, Any]] = {}
+        self._games_by_team: Dict[str, List[str]] = {}
+        self._week_start: Optional[float] = None
+
+        self.stats = {
+            "players_skipped": 0,
+            "players_fetched": 0,
+            "games_from_store": 0,
+            "games_stored": 0
+        }
+
+    # ------------------------------------------------------------------
+    # Schedule
+    # ------------------------------------------------------------------
+
+    def load_schedule(self, schedule_file: Optional[str], now: Optional[float] = None) -> bool:
+        """
+        Load the current week schedule from a tank01 nfl_matchups raw data file.
+
+        Args:
+            schedule_file: Path to *_nfl_matchups_raw_data.json (None disables skipping)
+            now: Current time as epoch seconds (for testing)
+
+        Returns:
+            True if a current schedule was loaded
+        """
+        if not schedule_file:
+            self.logger.info("No NFL schedule available, fetching game logs for every player")
+            return False
+
+        try:
+            with open(schedule_file, 'rb') as f:
+                data = codec_for_path(schedule_file).decode(f.read())
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not load NFL schedule {schedule_file}: {e}")
+            return False
+
+        return self.set_schedule(data.get('games', []), now)
+
+    def set_schedule(self, games: List[Dict[str, Any]], now: Optional[float] = None) -> bool:
+        """
+        Set the current week schedule from nfl_matchups game entries.
+
+        Args:
+            games: Entries with game_id, home_team, away_team, game_time_epoch, game_status
+            now: Current time as epoch seconds (for testing)
+
+        Returns:
+            True if the schedule is current enough to be used for skipping
+        """
+        now = now or time.time()
+        schedule = {}
+        by_team: Dict[str, List[str]] = {}
+
+        for game in games:
+            game_id = game.get('game_id')
+            try:
+                kickoff = float(game.get('game_time_epoch'))
+            except (TypeError, ValueError):
+                continue
+            if not game_id:
+                continue
+            status = str(game.get('game_status', '')).lower()
+            schedule[game_id] = {
+                'home': game.get('home_team'),
+                'away': game.get('away_team'),
+                'kickoff': kickoff,
+                'completed': status in COMPLETED_STATUSES or str(game.get('game_status_code')) == '2'
+            }
+            for team in (game.get('home_team'), game.get('away_team')):
+                if team:
+                    by_team.setdefault(team.upper(), []).append(game_id)
+
+        if not schedule:
+            return False
+
+        kickoffs = [g['kickoff'] for g in schedule.values()]
+        max_age = SCHEDULE_MAX_AGE_DAYS * 86400
+        if max(kickoffs) < now - max_age or min(kickoffs) > now + max_age:
+            self.logger.info("NFL schedule is not for the current week, fetching game logs for every player")
+            return False
+
+        self.schedule = schedule
+        self._games_by_team = by_team
+        self._week_start = min(kickoffs)
+        self.logger.info(f"Loaded NFL schedule with {len(schedule)} games for skip checks")
+        return True
+
+    def is_game_final(self, game_id: str, now: Optional[float] = None) -> bool:
+        """Check whether a game's stats can no longer change."""
+        scheduled = self.schedule.get(game_id)
+        if scheduled is not None:
+            return scheduled['completed']
+
+        game_date = game_date_from_id(game_id)
+        if not game_date:
+            return False
+        now_dt = datetime.fromtimestamp(now or time.time())
+        return game_date + timedelta(days=FINAL_AFTER_DAYS) <= now_dt
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _record_path(self, player_id: str, season: str) -> Path:
+        return self.store_dir / str(season) / f"{player_id}.json"
+
+    def _get_record(self, player_id: str, season: str) -> Dict[str, Any]:
+        key = (str(player_id), str(season))
+        with self._lock:
+            record = self._records.get(key)
+        if record is not None:
+            return record
+
+        record = {"version": STORE_VERSION, "player_id": str(player_id), "season": str(season),
+                  "last_fetched": None, "games": {}}
+        path = self._record_path(player_id, season)
+        if path.exists():
+            try:
+                with open(path, 'r') as f:
+                    on_disk = json.load(f)
+                if on_disk.get("version") == STORE_VERSION:
+                    record = on_disk
+            except (OSError, json.JSONDecodeError) as e:
+                self.logger.warning(f"Ignoring unreadable game stats record {path}: {e}")
+
+        with self._lock:
+            return self._records.setdefault(key, record)
+
+    def _save_record(self, record: Dict[str, Any]) -> None:
+        path = self._record_path(record["player_id"], record["season"])
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(record, f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Failed to save game stats for player {record['player_id']}: {e}")
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def needs_fetch(self, player_id: str, season: str, team: Optional[str],
+                    now: Optional[float] = None) -> bool:
+        """
+        Decide whether the player's game log must be requested from the API.
+
+        Args:
+            player_id: Tank01 playerID
+            season: Season year
+            team: Player's Tank01 team abbreviation
+            now: Current time as epoch seconds (for testing)
+
+        Returns:
+            False only when the schedule shows no new game can exist since the last fetch
+        """
+        record = self._get_record(player_id, season)
+        if not record.get("last_fetched") or not self.schedule or not team:
+            return True
+
+        now = now or time.time()
+        week_boundary = self._week_start - WEEK_BOUNDARY_HOURS * 3600
+        fetched_after_last_week = record["last_fetched"] >= week_boundary
+
+        team_games = self._games_by_team.get(team.upper(), [])
+        if not team_games:
+            # Bye week
+            return not fetched_after_last_week
+
+        known = set(record["games"]) | set(record.get("covered_games", []))
+        for game_id in team_games:
+            if game_id in known:
+                continue
+            if self.schedule[game_id]['kickoff'] <= now:
+                # Started or finished and not stored yet
+                return True
+
+        return not fetched_after_last_week
+
+    def get_player_games(self, player_id: str, season: str, team: Optional[str],
+                         fetch_func: Callable[[], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Get a player's game log, calling the API only when something new can exist.
+
+        Final games from the response are stored. Games still in progress are
+        returned but not stored.
+
+        Args:
+            player_id: Tank01 playerID
+            season: Season year
+            team: Player's Tank01 team abbreviation
+            fetch_func: Makes the getNFLGamesForPlayer call
+
+        Returns:
+            Response-shaped dict ({'statusCode', 'body'}) with stored and fetched
+            games, or the raw response if it was not a game dict
+        """
+        record = self._get_record(player_id, season)
+
+        if not self.needs_fetch(player_id, season, team):
+            with self._lock:
+                self.stats["players_skipped"] += 1
+                self.stats["games_from_store"] += len(record["games"])
+            self.logger.info(f"No new games possible for player {player_id}, using stored game stats")
+            return {'statusCode': 200, 'body': dict(record["games"]), 'source': 'game_stats_store'}
+
+        response = fetch_func()
+        with self._lock:
+            self.stats["players_fetched"] += 1
+
+        body = response.get('body') if isinstance(response, dict) else None
+        if not isinstance(body, dict):
+            return response
+
+        # The team's final games this week that the player's log does not list
+        self._cover_games(record, [game_id for game_id in self._games_by_team.get((team or '').upper(), [])
+                                   if game_id not in body])
+        result = dict(response)
+        result['body'] = self._merge_games(record, body)
+        return result
+
+    def record_games(self, player_id: str, season: str, games: Dict[str, Dict[str, Any]],
+                     checked_game_ids: List[str]) -> Dict[str, Any]:
+        """
+        Store a player's games collected from per-game box scores.
+
+        Args:
+            player_id: Tank01 playerID
+            season: Season year
+            games: The player's entries from the box scores, keyed by gameID
+            checked_game_ids: Every game whose box score was read for the player,
+                including games the player did not appear in
+
+        Returns:
+            Response-shaped dict ({'statusCode', 'body'}) with stored and new games
+        """
+        record = self._get_record(player_id, season)
+        self._cover_games(record, [game_id for game_id in checked_game_ids if game_id not in games])
+        return {'statusCode': 200, 'body': self._merge_games(record, games), 'source': 'box_scores'}
+
+    def _cover_games(self, record: Dict[str, Any], absent_game_ids: List[str]) -> None:
+        """Keep the final games a fetch showed the player did not appear in as covered."""
+        absent_final = {game_id for game_id in absent_game_ids if self.is_game_final(game_id)}
+        if absent_final:
+            record["covered_games"] = sorted(set(record.get("covered_games", [])) | absent_final)
+
+    def _merge_games(self, record: Dict[str, Any], games: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Store the final games from a fetch and return stored plus fetched games."""
+        new_final = {game_id: game for game_id, game in games.items()
+                     if game_id not in record["games"] and self.is_game_final(game_id)}
+
+        merged = dict(record["games"])
+        merged.update(games)
+
+        record["games"].update(new_final)
+        record["last_fetched"] = time.time()
+        self._save_record(record)
+
+        with self._lock:
+            self.stats["games_stored"] += len(new_final)
+        return merged
+
+    def last_fetched(self, player_id: str, season: str) -> Optional[float]:
+        """When the player's games were last collected (epoch seconds), or None."""
+        return self._get_record(player_id, season).get("last_fetched")
+
+    def player_teams(self, player_id: str, season: str) -> List[str]:
+        """Teams the player's stored games were played for."""
+        games = self._get_record(player_id, season)["games"].values()
+        teams = {str(game.get('teamAbv') or game.get('team') or '').upper() for game in games if isinstance(game, dict)}
+        return sorted(teams - {''})
+
+    def missing_games(self, player_id: str, season: str, game_ids: List[str]) -> List[str]:
+        """
+        Game IDs whose stats are not known yet for the player.
+
+        A game is known if it is stored, if its box score was already read for
+        the player, or if the player's game log was fetched after it was final.
+        """
+        record = self._get_record(player_id, season)
+        known = set(record["games"]) | set(record.get("covered_games", []))
+        fetched_at = datetime.fromtimestamp(record["last_fetched"]) if record.get("last_fetched") else None
+
+        missing = []
+        for game_id in game_ids:
+            if game_id in known:
+                continue
+            game_date = game_date_from_id(game_id)
+            if fetched_at and game_date and game_date + timedelta(days=FINAL_AFTER_DAYS) <= fetched_at:
+                continue
+            missing.append(game_id)
+        return missing
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get skip/fetch counters for this run."""
+        with self._lock:
+            stats = dict(self.stats)
+        stats["schedule_loaded"] = bool(self.schedule)
+        return stats
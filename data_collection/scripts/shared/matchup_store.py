@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Immutable Completed-Week Matchup Store
+
+Keeps Yahoo league scoreboards for finished fantasy weeks. Once every matchup
+of a week is postevent and Yahoo's stat-correction window has passed, the
+week's scores never change, so team_matchups serves it from here instead of
+calling the scoreboard again. Only the current and in-progress weeks are
+refetched, which makes full-season matchup history cost one call per run.
+
+A week is final when all of its matchups are postevent and its week_end is
+at least FINAL_AFTER_DAYS in the past.
+
+Files: data_collection/cache/yahoo_matchups/<league_key>/week_<N>.json
+"""
+
+import os
+import json
+import logging
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+DATA_COLLECTION_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_STORE_DIR = DATA_COLLECTION_ROOT / "cache" / "yahoo_matchups"
+
+STORE_VERSION = 1
+
+# Days after week_end before scores are final (Yahoo applies stat corrections until then)
+FINAL_AFTER_DAYS = 3
+
+
+def is_final_week(week_data: Dict[str, Any], now: Optional[datetime] = None) -> bool:
+    """
+    True if a team_matchups week entry can no longer change.
+
+    Args:
+        week_data: {'week': N, 'matchups': [...]} as built by team_matchups
+        now: Current time (for testing)
+    """
+    matchups = week_data.get('matchups', [])
+    if not matchups or any(m.get('status') != 'postevent' for m in matchups):
+        return False
+
+    try:
+        week_end = datetime.strptime(str(matchups[0].get('week_end', '')), "%Y-%m-%d")
+    except ValueError:
+        return False
+    return (now or datetime.now()) >= week_end + timedelta(days=FINAL_AFTER_DAYS)
+
+
+class MatchupWeekStore:
+    """
+    Persistent store of finalized weekly league scoreboards.
+    """
+
+    def __init__(self, store_dir: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            store_dir: Root directory (default: data_collection/cache/yahoo_matchups)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.store_dir = Path(store_dir) if store_dir else DEFAULT_STORE_DIR
+        self.stats = {
+            "weeks_from_store": 0,
+            "weeks_stored": 0
+        }
+
+    def _path(self, league_key: str, week: int) -> Path:
+        return self.store_dir / league_key / f"week_{int(week)}.json"
+
+    def get(self, league_key: str, week: int) -> Optional[Dict[str, Any]]:
+        """
+        Stored week entry, or None if the week is not final yet.
+        """
+        path = self._path(league_key, week)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Ignoring unreadable matchup week {path}: {e}")
+            return None
+        if record.get("version") != STORE_VERSION:
+            return None
+        self.stats["weeks_from_store"] += 1
+        return record["week_data"]
+
+    def put(self, league_key: str, week_data: Dict[str, Any], now: Optional[datetime] = None) -> bool:
+        """
+        Store a week entry if it is final.
+
+        Returns:
+            True if the week was stored
+        """
+        if not is_final_week(week_data, now):
+            return False
+
+        path = self._path(league_key, week_data['week'])
+        record = {
+            "version": STORE_VERSION,
+            "stored_at": datetime.now().isoformat(),
+            "week_data": week_data
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(record, f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Could not store matchup week {path}: {e}")
+            return False
+        self.stats["weeks_stored"] += 1
+        return True
@@ -0,0 +1,575 @@
+#!/usr/bin/env python3
+"""
+Cross-Source Player Identity Index
+
+Maps Yahoo player IDs <-> Tank01 playerIDs <-> Sleeper player_ids and provides
+hash lookups used by every Yahoo -> Tank01 / Yahoo -> Sleeper matcher, replacing
+the linear scans over the 2,000+ player Tank01 list and 10,000+ player Sleeper
+database.
+
+Lookups:
+- Yahoo player ID (Tank01 yahooPlayerID / Sleeper yahoo_id first, then a previously learned link)
+- Normalized full name (punctuation and Jr/Sr/II/III/IV suffixes removed)
+- (last name, team, position) and (last name, team)
+
+The identity rows and learned Yahoo links are persisted to
+data_collection/cache/player_identity_index.json. Only exact matches (Yahoo ID
+or exact normalized name) are learned; last-name fallbacks are answered for the
+current lookup but never persisted, so a wrong guess cannot stick. When a player DB refresh is
+synced, only new or changed players are re-indexed.
+"""
+
+import os
+import json
+import time
+import atexit
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
+
+from team_mapping import YAHOO_TO_STANDARD, SLEEPER_TO_STANDARD, TANK01_TO_STANDARD
+
+DATA_COLLECTION_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_INDEX_PATH = DATA_COLLECTION_ROOT / "cache" / "player_identity_index.json"
+
+# Version 2: learned links hold exact matches only (earlier links may be fuzzy)
+INDEX_VERSION = 2
+
+# Match methods exact enough to persist as a learned Yahoo link
+LINKABLE_MATCH_METHODS = ('yahoo_id', 'learned_link', 'name')
+
+NAME_SUFFIXES = (' jr', ' sr', ' ii', ' iii', ' iv', ' v')
+
+# Additional team aliases seen across APIs that are not in TEAM_MAPPING
+TEAM_ALIASES = {'WSH': 'WAS', 'JAC': 'JAX', 'LA': 'LAR', 'OAK': 'LV', 'SD': 'LAC'}
+
+
+def normalize_name(name: Any) -> str:
+    """
+    Normalize a player name for matching.
+
+    Lowercases, strips punctuation and removes generational suffixes so that
+    "Marvin Harrison Jr." and "marvin harrison" compare equal.
+    """
+    if not isinstance(name, str):
+        return ''
+    n = name.lower().strip()
+    for ch in ['.', ',', "'", '"']:
+        n = n.replace(ch, '')
+    n = ' '.join(n.replace('-', ' ').split())
+    for suffix in NAME_SUFFIXES:
+        if n.endswith(suffix):
+            n = n[: -len(suffix)].strip()
+    return n
+
+
+def normalize_team(team: Any) -> str:
+    """Normalize a team abbreviation from any source API to the standard form."""
+    if not isinstance(team, str) or not team.strip():
+        return ''
+    t = team.strip()
+    for mapping in (YAHOO_TO_STANDARD, TANK01_TO_STANDARD, SLEEPER_TO_STANDARD):
+        if t in mapping:
+            return mapping[t]
+    t = t.upper()
+    return TEAM_ALIASES.get(t, t)
+
+
+def positions_compatible(yahoo_position: Optional[str], other_position: Optional[str]) -> bool:
+    """
+    Check position compatibility.
+
+    Missing positions are treated as compatible; Yahoo multi-position strings
+    such as "WR,TE" match if any listed position matches.
+    """
+    if not yahoo_position or not other_position:
+        return True
+    return other_position in [p.strip() for p in str(yahoo_position).split(',')]
+
+
+def _last_name(normalized_name: str) -> str:
+    parts = normalized_name.split()
+    return parts[-1] if parts else ''
+
+
+def _clean_id(value: Any) -> str:
+    if value is None:
+        return ''
+    return str(value).strip()
+
+
+class PlayerIdentityIndex:
+    """
+    Persisted identity index across Yahoo, Tank01 and Sleeper.
+
+    Source player dicts are attached in memory via sync_tank01_players() and
+    sync_sleeper_players(); match_tank01() and match_sleeper() then return the
+    original source dicts using hash lookups only.
+    """
+
+    def __init__(self, index_path: Optional[str] = None):
+        """
+        Initialize the identity index, loading any persisted rows.
+
+        Args:
+            index_path: Path of the persisted index (defaults to data_collection/cache)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.index_path = Path(index_path) if index_path else DEFAULT_INDEX_PATH
+
+        # Persisted rows: source id -> {name, team, pos, yahoo_id, sleeper_id, fp}
+        self.rows: Dict[str, Dict[str, Dict[str, Any]]] = {"tank01": {}, "sleeper": {}}
+        # Persisted learned links: yahoo player id -> {player_key, tank01_id, sleeper_id}
+        self.yahoo_links: Dict[str, Dict[str, Any]] = {}
+
+        # In-memory source player dicts (attached by sync_*)
+        self.players: Dict[str, Dict[str, Dict[str, Any]]] = {"tank01": {}, "sleeper": {}}
+        self._synced_inputs: Dict[str, Any] = {"tank01": None, "sleeper": None}
+
+        # In-memory lookup buckets built from rows
+        self._by_yahoo_id: Dict[str, Dict[str, str]] = {"tank01": {}, "sleeper": {}}
+        self._by_name: Dict[str, Dict[str, List[str]]] = {"tank01": {}, "sleeper": {}}
+        self._by_last_team: Dict[str, Dict[Tuple[str, str], List[str]]] = {"tank01": {}, "sleeper": {}}
+        self._by_last_team_pos: Dict[str, Dict[Tuple[str, str, str], List[str]]] = {"tank01": {}, "sleeper": {}}
+        self._by_last_pos: Dict[str, Dict[Tuple[str, str], List[str]]] = {"tank01": {}, "sleeper": {}}
+        self._defense_by_team: Dict[str, Dict[str, str]] = {"tank01": {}, "sleeper": {}}
+
+        self._dirty = False
+        self.stats = {
+            "tank01_rows_updated": 0,
+            "sleeper_rows_updated": 0,
+            "matches_by_yahoo_id": 0,
+            "matches_by_name": 0,
+            "matches_by_last_name_team": 0,
+            "matches_by_last_name_position": 0,
+            "misses": 0
+        }
+
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                self.logger.info("Player identity index version changed, rebuilding")
+                return
+            self.rows["tank01"] = data.get("tank01", {})
+            self.rows["sleeper"] = data.get("sleeper", {})
+            self.yahoo_links = data.get("yahoo_links", {})
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Could not load player identity index, rebuilding: {e}")
+            return
+
+        for source in ("tank01", "sleeper"):
+            for source_id, row in self.rows[source].items():
+                self._add_to_buckets(source, source_id, row)
+        self.logger.info(f"Loaded player identity index: {len(self.rows['tank01'])} Tank01, "
+                         f"{len(self.rows['sleeper'])} Sleeper, {len(self.yahoo_links)} Yahoo links")
+
+    def save(self) -> None:
+        """Persist the index atomically if anything changed."""
+        if not self._dirty:
+            return
+
+        # Merge Yahoo links learned concurrently by other collection processes
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    on_disk = json.load(f)
+                for yahoo_id, link in on_disk.get("yahoo_links", {}).items():
+                    merged = dict(link)
+                    merged.update({k: v for k, v in self.yahoo_links.get(yahoo_id, {}).items() if v})
+                    self.yahoo_links[yahoo_id] = merged
+            except (OSError, json.JSONDecodeError):
+                pass
+
+        payload = {
+            "version": INDEX_VERSION,
+            "updated_at": time.time(),
+            "tank01": self.rows["tank01"],
+            "sleeper": self.rows["sleeper"],
+            "yahoo_links": self.yahoo_links
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.index_path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, separators=(',', ':'))
+            os.replace(tmp_path, self.index_path)
+            self._dirty = False
+        except OSError as e:
+            self.logger.warning(f"Failed to save player identity index: {e}")
+
+    # ------------------------------------------------------------------
+    # Bucket maintenance
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _bucket_add(bucket: Dict, key, source_id: str) -> None:
+        ids = bucket.setdefault(key, [])
+        if source_id not in ids:
+            ids.append(source_id)
+
+    @staticmethod
+    def _bucket_remove(bucket: Dict, key, source_id: str) -> None:
+        ids = bucket.get(key)
+        if ids and source_id in ids:
+            ids.remove(source_id)
+            if not ids:
+                del bucket[key]
+
+    def _bucket_keys(self, row: Dict[str, Any]):
+        name = row.get("name", '')
+        last = _last_name(name)
+        team = row.get("team", '')
+        pos = row.get("pos", '')
+        return name, last, team, pos
+
+    def _add_to_buckets(self, source: str, source_id: str, row: Dict[str, Any]) -> None:
+        name, last, team, pos = self._bucket_keys(row)
+        if row.get("yahoo_id"):
+            self._by_yahoo_id[source][row["yahoo_id"]] = source_id
+        if name:
+            self._bucket_add(self._by_name[source], name, source_id)
+        if last and team:
+            self._bucket_add(self._by_last_team[source], (last, team), source_id)
+            self._bucket_add(self._by_last_team_pos[source], (last, team, pos), source_id)
+        if last and pos:
+            self._bucket_add(self._by_last_pos[source], (last, pos), source_id)
+        if pos == 'DEF' and team:
+            self._defense_by_team[source][team] = source_id
+
+    def _remove_from_buckets(self, source: str, source_id: str, row: Dict[str, Any]) -> None:
+        name, last, team, pos = self._bucket_keys(row)
+        if row.get("yahoo_id") and self._by_yahoo_id[source].get(row["yahoo_id"]) == source_id:
+            del self._by_yahoo_id[source][row["yahoo_id"]]
+        self._bucket_remove(self._by_name[source], name, source_id)
+        self._bucket_remove(self._by_last_team[source], (last, team), source_id)
+        self._bucket_remove(self._by_last_team_pos[source], (last, team, pos), source_id)
+        self._bucket_remove(self._by_last_pos[source], (last, pos), source_id)
+        if pos == 'DEF' and self._defense_by_team[source].get(team) == source_id:
+            del self._defense_by_team[source][team]
+
+    @staticmethod
+    def _fingerprint(row: Dict[str, Any]) -> str:
+        raw = "|".join(str(row.get(k, '')) for k in ("name", "team", "pos", "yahoo_id", "sleeper_id"))
+        return hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+    def _sync(self, source: str, players: Dict[str, Dict[str, Any]], row_builder) -> int:
+        """Attach source players and re-index only new, changed or removed rows."""
+        self.players[source] = players
+        rows = self.rows[source]
+        changed = 0
+
+        for source_id, player in players.items():
+            row = row_builder(player)
+            row["fp"] = self._fingerprint(row)
+            existing = rows.get(source_id)
+            if existing and existing.get("fp") == row["fp"]:
+                continue
+            if existing:
+                self._remove_from_buckets(source, source_id, existing)
+            rows[source_id] = row
+            self._add_to_buckets(source, source_id, row)
+            changed += 1
+
+        for source_id in [sid for sid in rows if sid not in players]:
+            self._remove_from_buckets(source, source_id, rows.pop(source_id))
+            changed += 1
+
+        if changed:
+            self._dirty = True
+        return changed
+
+    # ------------------------------------------------------------------
+    # Sync from player databases
+    # ------------------------------------------------------------------
+
+    def sync_tank01_players(self, players: List[Dict[str, Any]]) -> int:
+        """
+        Attach the Tank01 player list (getNFLPlayerList body) to the index.
+
+        Args:
+            players: List of Tank01 player dicts
+
+        Returns:
+            Number of identity rows added, changed or removed
+        """
+        if not players or players is self._synced_inputs["tank01"]:
+            return 0
+        self._synced_inputs["tank01"] = players
+
+        by_id = {}
+        for player in players or []:
+            if isinstance(player, dict) and player.get('playerID'):
+                by_id[str(player['playerID'])] = player
+
+        def build(player):
+            return {
+                "name": normalize_name(player.get('longName') or player.get('fullName') or ''),
+                "team": normalize_team(player.get('team', '')),
+                "pos": player.get('pos', '') or '',
+                "yahoo_id": _clean_id(player.get('yahooPlayerID') or player.get('yahooID')),
+                "sleeper_id": _clean_id(player.get('sleeperBotID'))
+            }
+
+        changed = self._sync("tank01", by_id, build)
+        self.stats["tank01_rows_updated"] += changed
+        if changed:
+            self.logger.info(f"Player identity index: {changed} Tank01 rows updated")
+            self.save()
+        return changed
+
+    def sync_sleeper_players(self, players: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Attach the Sleeper players/nfl database to the index.
+
+        Args:
+            players: Dict of Sleeper player dicts keyed by player_id
+
+        Returns:
+            Number of identity rows added, changed or removed
+        """
+        if not players or players is self._synced_inputs["sleeper"]:
+            return 0
+        self._synced_inputs["sleeper"] = players
+
+        by_id = {}
+        for player_id, player in (players or {}).items():
+            if isinstance(player, dict):
+                by_id[str(player.get('player_id') or player_id)] = player
+
+        def build(player):
+            full_name = player.get('full_name') or f"{player.get('first_name', '')} {player.get('last_name', '')}"
+            return {
+                "name": normalize_name(full_name),
+                "team": normalize_team(player.get('team') or ''),
+                "pos": player.get('position', '') or '',
+                "yahoo_id": _clean_id(player.get('yahoo_id'))
+            }
+
+        changed = self._sync("sleeper", by_id, build)
+        self.stats["sleeper_rows_updated"] += changed
+        if changed:
+            self.logger.info(f"Player identity index: {changed} Sleeper rows updated")
+            self.save()
+        return changed
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def _first_compatible(self, source: str, ids: Optional[List[str]], team: str,
+                          position: Optional[str]) -> Optional[str]:
+        for source_id in ids or []:
+            row = self.rows[source].get(source_id, {})
+            if team and row.get("team") and row["team"] != team:
+                continue
+            if not positions_compatible(position, row.get("pos")):
+                continue
+            return source_id
+        return None
+
+    def _lookup(self, source: str, name: str, team: Optional[str] = None,
+                position: Optional[str] = None, yahoo_id: Optional[Any] = None,
+                allow_last_name_position: bool = False) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Find a source player for a Yahoo player.
+
+        Returns:
+            (source_id, match_method) - match_method is one of 'yahoo_id', 'learned_link',
+            'name', 'last_name_team', 'last_name_position' ((None, None) on a miss)
+        """
+        yahoo_id = _clean_id(yahoo_id)
+        team_n = normalize_team(team)
+
+        # Strategy 1: Yahoo ID (the source's own Yahoo ID field wins over a learned link)
+        if yahoo_id:
+            source_id = self._by_yahoo_id[source].get(yahoo_id)
+            if source_id:
+                self.stats["matches_by_yahoo_id"] += 1
+                return source_id, "yahoo_id"
+            linked = self.yahoo_links.get(yahoo_id, {}).get(f"{source}_id")
+            if linked and linked in self.players[source]:
+                self.stats["matches_by_yahoo_id"] += 1
+                return linked, "learned_link"
+
+        name_n = normalize_name(name)
+        if not name_n:
+            self.stats["misses"] += 1
+            return None, None
+
+        # Strategy 2: Exact normalized name with team/position validation
+        source_id = self._first_compatible(source, self._by_name[source].get(name_n), team_n, position)
+        if source_id:
+            self.stats["matches_by_name"] += 1
+            return source_id, "name"
+
+        last = _last_name(name_n)
+
+        # Strategy 3: Last name + team (+ position)
+        if team_n:
+            source_id = self._first_compatible(source, self._by_last_team[source].get((last, team_n)), team_n, position)
+            if source_id:
+                self.stats["matches_by_last_name_team"] += 1
+                return source_id, "last_name_team"
+
+        # Strategy 4 (optional): Last name + position
+        if allow_last_name_position and position:
+            for pos in [p.strip() for p in str(position).split(',')]:
+                ids = self._by_last_pos[source].get((last, pos))
+                if ids:
+                    self.stats["matches_by_last_name_position"] += 1
+                    return ids[0], "last_name_position"
+
+        self.stats["misses"] += 1
+        return None, None
+
+    def match_tank01(self, name: str, team: Optional[str] = None, position: Optional[str] = None,
+                     yahoo_id: Optional[Any] = None, yahoo_player_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Match a Yahoo player to a Tank01 player.
+
+        Args:
+            name: Yahoo full name
+            team: Yahoo editorial team abbreviation
+            position: Yahoo display position
+            yahoo_id: Yahoo player_id
+            yahoo_player_key: Yahoo player_key (recorded with the learned link)
+
+        Returns:
+            The Tank01 player dict, or None if no match
+        """
+        tank01_id, method = self._lookup("tank01", name, team, position, yahoo_id)
+        if not tank01_id:
+            return None
+        player = self.players["tank01"].get(tank01_id)
+        if player is not None and yahoo_id and method in LINKABLE_MATCH_METHODS:
+            self.link_yahoo_player(yahoo_id, yahoo_player_key, tank01_id=tank01_id,
+                                   sleeper_id=self.rows["tank01"].get(tank01_id, {}).get("sleeper_id") or None)
+        return player
+
+    def match_sleeper(self, name: str, team: Optional[str] = None, position: Optional[str] = None,
+                      yahoo_id: Optional[Any] = None, yahoo_player_key: Optional[str] = None,
+                      allow_last_name_position: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Match a Yahoo player to a Sleeper player.
+
+        Args:
+            name: Yahoo full name
+            team: Yahoo editorial team abbreviation
+            position: Yahoo display position
+            yahoo_id: Yahoo player_id
+            yahoo_player_key: Yahoo player_key (recorded with the learned link)
+            allow_last_name_position: Also accept a last name + position match
+
+        Returns:
+            The Sleeper player dict, or None if no match
+        """
+        sleeper_id, method = None, None
+
+        # Resolve through the Tank01 cross-reference (Tank01 sleeperBotID) when possible
+        yahoo_id_clean = _clean_id(yahoo_id)
+        if yahoo_id_clean:
+            tank01_id = (self._by_yahoo_id["tank01"].get(yahoo_id_clean)
+                         or self.yahoo_links.get(yahoo_id_clean, {}).get("tank01_id"))
+            cross_ref = self.rows["tank01"].get(tank01_id or '', {}).get("sleeper_id")
+            if cross_ref and cross_ref in self.players["sleeper"]:
+                sleeper_id, method = cross_ref, "yahoo_id"
+                self.stats["matches_by_yahoo_id"] += 1
+
+        if not sleeper_id:
+            sleeper_id, method = self._lookup("sleeper", name, team, position, yahoo_id, allow_last_name_position)
+        if not sleeper_id:
+            return None
+
+        player = self.players["sleeper"].get(sleeper_id)
+        if player is not None and yahoo_id and method in LINKABLE_MATCH_METHODS:
+            self.link_yahoo_player(yahoo_id, yahoo_player_key, sleeper_id=sleeper_id)
+        return player
+
+    def get_sleeper_defense(self, team: str) -> Optional[Dict[str, Any]]:
+        """Get the Sleeper team defense entry for a team."""
+        sleeper_id = self._defense_by_team["sleeper"].get(normalize_team(team))
+        return self.players["sleeper"].get(sleeper_id) if sleeper_id else None
+
+    def get_tank01_player(self, tank01_id: str) -> Optional[Dict[str, Any]]:
+        """Get an attached Tank01 player by playerID."""
+        return self.players["tank01"].get(str(tank01_id))
+
+    def get_sleeper_player(self, sleeper_id: str) -> Optional[Dict[str, Any]]:
+        """Get an attached Sleeper player by player_id."""
+        return self.players["sleeper"].get(str(sleeper_id))
+
+    def link_yahoo_player(self, yahoo_id: Any, yahoo_player_key: Optional[str] = None,
+                          tank01_id: Optional[str] = None, sleeper_id: Optional[str] = None) -> None:
+        """
+        Record a Yahoo -> Tank01 / Sleeper identity link.
+
+        Args:
+            yahoo_id: Yahoo player_id
+            yahoo_player_key: Yahoo player_key (e.g. "461.p.33536")
+            tank01_id: Tank01 playerID
+            sleeper_id: Sleeper player_id
+        """
+        yahoo_id = _clean_id(yahoo_id)
+        if not yahoo_id:
+            return
+        link = self.yahoo_links.setdefault(yahoo_id, {})
+        updates = {"player_key": yahoo_player_key, "tank01_id": tank01_id, "sleeper_id": sleeper_id}
+        for key, value in updates.items():
+            if value and link.get(key) != value:
+                link[key] = value
+                self._dirty = True
+
+    def resolve_yahoo(self, yahoo_id: Any) -> Dict[str, Optional[str]]:
+        """
+        Get every known ID for a Yahoo player.
+
+        Returns:
+            Dict with yahoo_id, player_key, tank01_id and sleeper_id
+        """
+        yahoo_id = _clean_id(yahoo_id)
+        link = self.yahoo_links.get(yahoo_id, {})
+        tank01_id = self._by_yahoo_id["tank01"].get(yahoo_id) or link.get("tank01_id")
+        sleeper_id = (self._by_yahoo_id["sleeper"].get(yahoo_id) or link.get("sleeper_id")
+                      or self.rows["tank01"].get(tank01_id or '', {}).get("sleeper_id") or None)
+        return {
+            "yahoo_id": yahoo_id or None,
+            "player_key": link.get("player_key"),
+            "tank01_id": tank01_id,
+            "sleeper_id": sleeper_id
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index size and match counters."""
+        stats = dict(self.stats)
+        stats.update({
+            "tank01_rows": len(self.rows["tank01"]),
+            "sleeper_rows": len(self.rows["sleeper"]),
+            "yahoo_links": len(self.yahoo_links)
+        })
+        return stats
+
+
+# Process-wide shared index so every matcher in a run reuses the same lookups
+_shared_index: Optional[PlayerIdentityIndex] = None
+
+
+def get_player_identity_index() -> PlayerIdentityIndex:
+    """Get the process-wide shared PlayerIdentityIndex."""
+    global _shared_index
+    if _shared_index is None:
+        _shared_index = PlayerIdentityIndex()
+        # Persist Yahoo links learned during the run
+        atexit.register(_shared_index.save)
+    return _shared_index
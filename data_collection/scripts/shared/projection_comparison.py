@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Projection vs Actual Comparison Engine
+
+Joins projections to actual fantasy points with hash joins instead of scanning
+the actuals once per projection:
+
+1. Tank01 playerID (exact)
+2. Normalized full name, for rows without an ID match
+
+Variance, accuracy %, over/under buckets and per-position summaries are then
+computed as vectorized columns, so league-wide post-game processing is linear
+in the number of players.
+"""
+
+import logging
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+from player_identity import normalize_name
+
+# Variance (points) beyond which a player is an over/under performer
+DEFAULT_OVER_UNDER_THRESHOLD = 0.5
+
+
+def _id_series(series: pd.Series) -> pd.Series:
+    """String IDs with missing values as ''"""
+    return series.fillna("").astype(str).replace({"None": "", "nan": ""})
+
+
+class ProjectionComparisonEngine:
+    """
+    Joins projection and actual frames and scores projection accuracy.
+
+    Input frames need a 'name' column and either 'projected_points' or
+    'actual_points'; an optional 'player_id' column (Tank01 playerID) is
+    used for the primary join. Any other columns are carried through.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_OVER_UNDER_THRESHOLD):
+        """
+        Args:
+            threshold: Variance (points) beyond which a player counts as over/under
+        """
+        self.logger = logging.getLogger(__name__)
+        self.threshold = threshold
+
+    def join(self, projections: pd.DataFrame, actuals: pd.DataFrame) -> pd.DataFrame:
+        """
+        Inner-join projections to actuals: by player_id first, then by name.
+
+        Each actual row is matched at most once. Duplicate IDs or names on the
+        actual side resolve to the first row, as the previous linear scans did.
+
+        Returns:
+            Joined frame with a 'match_method' column ('player_id' or 'name')
+        """
+        projections = projections.reset_index(drop=True).copy()
+        actuals = actuals.reset_index(drop=True).copy()
+        if projections.empty or actuals.empty:
+            return self.score(pd.DataFrame(columns=list(projections.columns) + ["actual_points", "match_method"]))
+
+        for frame in (projections, actuals):
+            frame["_id"] = _id_series(frame["player_id"]) if "player_id" in frame else ""
+            frame["_name"] = frame["name"].map(normalize_name) if "name" in frame else ""
+        projections["_row"] = np.arange(len(projections))
+        actuals["_actual_row"] = np.arange(len(actuals))
+
+        actual_columns = [c for c in actuals.columns if c not in projections.columns or c in ("_id", "_name")]
+        actual_side = actuals[actual_columns]
+
+        by_id = projections[projections["_id"] != ""].merge(
+            actual_side[actual_side["_id"] != ""].drop_duplicates("_id").drop(columns="_name"),
+            on="_id", how="inner"
+        )
+        by_id["match_method"] = "player_id"
+
+        remaining = projections[~projections["_row"].isin(by_id["_row"])]
+        unused = actual_side[~actual_side["_actual_row"].isin(by_id["_actual_row"])]
+        by_name = remaining[remaining["_name"] != ""].merge(
+            unused[unused["_name"] != ""].drop_duplicates("_name").drop(columns="_id"),
+            on="_name", how="inner"
+        ).drop_duplicates("_actual_row")
+        by_name["match_method"] = "name"
+
+        joined = pd.concat([by_id, by_name], ignore_index=True).sort_values("_row")
+        joined = joined.drop(columns=["_id", "_name", "_row", "_actual_row"])
+        self.logger.debug(f"Joined {len(by_id)} players by ID and {len(by_name)} by name "
+                          f"({len(projections) - len(joined)} projections unmatched)")
+        return self.score(joined.reset_index(drop=True))
+
+    def score(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add variance, accuracy_percentage, performance_percentage and over_under columns.
+
+        Accuracy is 100 minus the absolute miss as a percentage of the projection,
+        floored at 0 (0 when nothing was projected).
+        """
+        frame = frame.copy()
+        empty = pd.Series(index=frame.index, dtype=float)
+        projected = pd.to_numeric(frame.get("projected_points", empty), errors="coerce").fillna(0.0).to_numpy(dtype=float)
+        actual = pd.to_numeric(frame.get("actual_points", empty), errors="coerce").fillna(0.0).to_numpy(dtype=float)
+        frame["projected_points"] = projected
+        frame["actual_points"] = actual
+
+        variance = actual - projected
+        positive = projected > 0
+        safe_projected = np.where(positive, projected, 1.0)
+        frame["variance"] = variance
+        frame["accuracy_percentage"] = np.where(
+            positive, np.round(np.maximum(0.0, 100 - np.abs(variance) / safe_projected * 100), 1), 0.0)
+        frame["performance_percentage"] = np.where(positive, actual / safe_projected * 100, 0.0)
+        frame["over_under"] = np.select([variance > self.threshold, variance < -self.threshold],
+                                        ["over", "under"], default="even")
+        return frame
+
+    def position_summary(self, frame: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-position accuracy summary of a scored frame.
+
+        Returns:
+            position -> avg_accuracy, total_players, overperformers, underperformers,
+            accurate, total_projected, total_actual
+        """
+        if frame.empty:
+            return {}
+        grouped = frame.assign(
+            _over=frame["over_under"] == "over",
+            _under=frame["over_under"] == "under",
+            _even=frame["over_under"] == "even",
+            position=frame["position"].fillna("Unknown") if "position" in frame else "Unknown"
+        ).groupby("position", sort=False).agg(
+            avg_accuracy=("accuracy_percentage", "mean"),
+            total_players=("accuracy_percentage", "size"),
+            overperformers=("_over", "sum"),
+            underperformers=("_under", "sum"),
+            accurate=("_even", "sum"),
+            total_projected=("projected_points", "sum"),
+            total_actual=("actual_points", "sum")
+        )
+        grouped["avg_accuracy"] = grouped["avg_accuracy"].round(1)
+        return {position: {k: (v.item() if hasattr(v, "item") else v) for k, v in row.items()}
+                for position, row in grouped.to_dict("index").items()}
+
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Quota-Aware Rate Limiting and Concurrent Fetch Helpers
+
+Shared helpers for issuing many per-player API calls concurrently without
+blowing through the RapidAPI quota.
+
+Features:
+- Token bucket limiter (steady rate + burst)
+- Reads remaining quota from the client's RapidAPI usage headers
+- Slows down when the quota runs low and stops before a reserve is used
+- Thread-pool fetch that returns results in input order
+
+Author: Fantasy Football Data Collection
+Date: September 2025
+"""
+
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+# Defaults (override with environment variables)
+DEFAULT_MAX_WORKERS = int(os.getenv('TANK01_MAX_WORKERS', '4'))
+DEFAULT_RATE_PER_SECOND = float(os.getenv('TANK01_RATE_PER_SECOND', '5'))
+DEFAULT_QUOTA_RESERVE = int(os.getenv('TANK01_QUOTA_RESERVE', '25'))
+
+
+class QuotaExhaustedError(Exception):
+    """Raised when a call is refused because the API quota reserve was reached."""
+
+
+class QuotaAwareTokenBucket:
+    """
+    Thread-safe token bucket that also watches the remaining API quota.
+
+    Each call takes one token. Tokens refill at rate_per_second up to burst.
+    Before granting a token the remaining quota is read through usage_func
+    (for Tank01 this is get_api_usage, backed by the RapidAPI headers parsed in
+    _extract_rapidapi_usage). Calls already in flight are subtracted, since
+    their headers have not come back yet.
+    """
+
+    def __init__(self, rate_per_second: float = DEFAULT_RATE_PER_SECOND, burst: Optional[int] = None,
+                 usage_func: Optional[Callable[[], Dict[str, Any]]] = None,
+                 reserve_calls: int = DEFAULT_QUOTA_RESERVE, slowdown_fraction: float = 0.1):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate_per_second: Steady-state calls per second
+            burst: Maximum tokens that can accumulate (default: one second of calls)
+            usage_func: Returns a usage dict with remaining_calls and daily_limit
+            reserve_calls: Stop granting calls when this many remain
+            slowdown_fraction: Halve the rate once remaining quota drops below this fraction of the limit
+        """
+        self.logger = logging.getLogger(__name__)
+        self.rate_per_second = max(0.1, rate_per_second)
+        self.burst = max(1, int(burst if burst is not None else self.rate_per_second))
+        self.usage_func = usage_func
+        self.reserve_calls = reserve_calls
+        self.slowdown_fraction = slowdown_fraction
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+
+        self.stats = {
+            "granted": 0,
+            "refused": 0,
+            "throttled": 0,
+            "wait_seconds": 0.0,
+            "last_remaining": None
+        }
+
+    def _quota(self) -> Optional[Dict[str, int]]:
+        """Read remaining quota and limit from the client, if available."""
+        if not self.usage_func:
+            return None
+        try:
+            usage = self.usage_func() or {}
+            remaining = usage.get('remaining_calls')
+            limit = usage.get('daily_limit')
+            if remaining is None:
+                return None
+            return {"remaining": int(remaining), "limit": int(limit or 0)}
+        except Exception as e:
+            self.logger.warning(f"Could not read API quota: {e}")
+            return None
+
+    def acquire(self) -> bool:
+        """
+        Block until a call may be made.
+
+        Returns:
+            True if the call may proceed, False if the quota reserve has been reached
+        """
+        waited = 0.0
+        while True:
+            quota = self._quota()
+            with self._lock:
+                rate = self.rate_per_second
+                if quota:
+                    remaining = quota["remaining"] - self._in_flight
+                    self.stats["last_remaining"] = quota["remaining"]
+                    if remaining <= self.reserve_calls:
+                        self.stats["refused"] += 1
+                        self.logger.warning(f"API quota reserve reached ({quota['remaining']} remaining, "
+                                            f"reserve {self.reserve_calls}); skipping call")
+                        return False
+                    if quota["limit"] and remaining < quota["limit"] * self.slowdown_fraction:
+                        rate = self.rate_per_second / 2
+                        self.stats["throttled"] += 1
+
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * rate)
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self._in_flight += 1
+                    self.stats["granted"] += 1
+                    self.stats["wait_seconds"] = round(self.stats["wait_seconds"] + waited, 3)
+                    return True
+
+                delay = (1 - self._tokens) / rate
+
+            time.sleep(delay)
+            waited += delay
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Make one limited API call: acquire a token, call func, release.
+
+        Wrap only the call that actually reaches the API, so work served from a
+        store or cache does not spend tokens or hit the quota reserve.
+
+        Raises:
+            QuotaExhaustedError: If the quota reserve has been reached
+        """
+        if not self.acquire():
+            raise QuotaExhaustedError("API quota reserve reached")
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.release()
+
+    def release(self) -> None:
+        """Mark a granted call as finished (its usage headers are now reflected)."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter counters."""
+        with self._lock:
+            stats = dict(self.stats)
+            stats.update({
+                "rate_per_second": self.rate_per_second,
+                "burst": self.burst,
+                "reserve_calls": self.reserve_calls
+            })
+            return stats
+
+
+def fetch_in_order(items: List[Any], fetch_func: Callable[[Any], Any],
+                   limiter: Optional[QuotaAwareTokenBucket] = None,
+                   max_workers: int = DEFAULT_MAX_WORKERS,
+                   on_error: Optional[Callable[[Any, Exception], Any]] = None) -> List[Any]:
+    """
+    Run fetch_func for every item on a thread pool and return results in input order.
+
+    Args:
+        items: Work items (e.g. matched players)
+        fetch_func: Called once per item
+        limiter: Optional token bucket checked before each item. Only pass it when
+            every item makes exactly one API call; otherwise leave it out and wrap
+            the real calls inside fetch_func with limiter.call
+        max_workers: Maximum concurrent calls
+        on_error: Builds the result for an item whose fetch raised or was refused
+            (QuotaExhaustedError). If not given, the exception is re-raised.
+
+    Returns:
+        List of results aligned with items
+    """
+    def run(item):
+        try:
+            return limiter.call(fetch_func, item) if limiter else fetch_func(item)
+        except Exception as e:
+            if on_error is None:
+                raise
+            return on_error(item, e)
+
+    if not items:
+        return []
+
+    workers = max(1, min(max_workers, len(items)))
+    if workers == 1:
+        return [run(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run, items))
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+"""
+Season Context Service
+
+Resolves the user's Yahoo league, the NFL season, the current fantasy week,
+its status and the season phase once per run, instead of every collector
+re-discovering the league and re-reading team matchups output.
+
+Week resolution order:
+1. In-process memo
+2. Disk cache (data_collection/cache/season_context.json) while within its TTL
+3. Latest Yahoo team_matchups snapshot, if it is newer than the TTL
+4. Yahoo league scoreboard (only when a Yahoo client is attached)
+5. Older team_matchups snapshot, then an estimate from the date
+
+League info (league/team keys and season) changes at most once a season, so it
+is cached for a week; the current week is cached for a few hours, and for
+much less on game days when week status flips from preevent to midevent.
+"""
+
+import os
+import re
+import copy
+import json
+import time
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Any
+
+DATA_COLLECTION_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_CACHE_PATH = DATA_COLLECTION_ROOT / "cache" / "season_context.json"
+
+LEAGUE_TTL_SECONDS = 7 * 24 * 3600
+WEEK_TTL_SECONDS = 6 * 3600
+GAME_DAY_WEEK_TTL_SECONDS = 30 * 60
+
+# Thursday, Sunday and Monday
+GAME_DAYS = (3, 6, 0)
+
+# Yahoo matchup statuses that mark a week as in play
+ACTIVE_WEEK_STATUSES = ('midevent', 'preevent', 'postevent')
+
+MAX_REGULAR_SEASON_WEEK = 18
+
+
+def determine_season_phase(current_date: datetime) -> str:
+    """Determine the current phase of the NFL season based on date."""
+    month = current_date.month
+    day = current_date.day
+
+    if month == 9 and day < 15:
+        return "Early Regular Season"
+    elif month == 9 or month == 10:
+        return "Regular Season"
+    elif month == 11 or month == 12:
+        return "Late Regular Season"
+    elif month == 1 and day < 15:
+        return "Playoffs"
+    elif month == 1 and day >= 15:
+        return "Super Bowl"
+    elif 2 <= month <= 8:
+        return "Offseason"
+    else:
+        return "Unknown"
+
+
+def nfl_season_for_date(current_date: datetime) -> str:
+    """NFL season year for a date (January/February belong to the previous season)."""
+    return str(current_date.year if current_date.month >= 3 else current_date.year - 1)
+
+
+def estimate_week_from_date(current_date: datetime, season: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Estimate the fantasy week from the date, counting weeks from September 1.
+
+    Returns:
+        week_info dict with coverage_type 'estimated' or 'preseason'
+    """
+    season_year = int(season or nfl_season_for_date(current_date))
+    season_start = datetime(season_year, 9, 1, tzinfo=current_date.tzinfo)
+    if current_date < season_start:
+        return {
+            'week': 1,
+            'coverage_type': 'preseason',
+            'status': 'preseason',
+            'source': 'preseason_assumption'
+        }
+    estimated_week = min((current_date - season_start).days // 7 + 1, MAX_REGULAR_SEASON_WEEK)
+    return {
+        'week': estimated_week,
+        'coverage_type': 'estimated',
+        'status': 'estimated_from_date',
+        'source': 'date_estimation'
+    }
+
+
+def nfl_kickoff_date(season: int) -> datetime:
+    """Season opener: the Thursday after Labor Day (first Monday of September)."""
+    september_first = datetime(int(season), 9, 1)
+    labor_day = september_first + timedelta(days=(0 - september_first.weekday()) % 7)
+    return labor_day + timedelta(days=3)
+
+
+def nfl_week_for_date(game_date: datetime) -> tuple:
+    """
+    (season, week) an NFL game date belongs to.
+
+    Weeks run Thursday through Wednesday from the season opener; games before
+    the opener are preseason (week 0) and postseason games continue past week
+    18. January and February games belong to the previous season.
+    """
+    season = int(nfl_season_for_date(game_date))
+    days = (game_date.replace(tzinfo=None) - nfl_kickoff_date(season)).days
+    return season, (days // 7 + 1 if days >= 0 else 0)
+
+
+def current_week_from_matchups(matchups: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Current week from a team_matchups 'matchups' section ({'week_N': {...}}).
+
+    team_matchups collects the previous and the current week, so the latest
+    week whose matchups are pre/mid/post-event is the current one; otherwise
+    the latest week present is used.
+
+    Returns:
+        week_info dict or None if there are no weeks
+    """
+    weeks = []
+    for week_key, week_data in (matchups or {}).items():
+        if not week_key.startswith('week_') or not isinstance(week_data, dict):
+            continue
+        week_matchups = week_data.get('matchups', [])
+        first_matchup = week_matchups[0] if week_matchups else {}
+        weeks.append({
+            'week': int(week_data.get('week', week_key[len('week_'):]) or 1),
+            'week_start': first_matchup.get('week_start', ''),
+            'week_end': first_matchup.get('week_end', ''),
+            'status': first_matchup.get('status', 'unknown'),
+            'coverage_type': 'week',
+            'source': 'yahoo_team_matchups_api'
+        })
+    if not weeks:
+        return None
+
+    active = [w for w in weeks if w['status'] in ACTIVE_WEEK_STATUSES]
+    return max(active or weeks, key=lambda w: w['week'])
+
+
+def parse_league_discovery(parsed_data: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Extract the user's team and league from a users;use_login=1/games;game_keys=nfl/teams response.
+
+    Returns:
+        Dict with team_key, team_name, team_id, league_key, league_name, season
+        (empty if the user's team could not be found)
+    """
+    users = parsed_data.get('fantasy_content', {}).get('users', {})
+    user_data = users.get('0', {}).get('user', []) if isinstance(users, dict) else []
+    if not isinstance(user_data, list):
+        return {}
+
+    games_section = next((s['games'] for s in user_data if isinstance(s, dict) and 'games' in s), None)
+    if not isinstance(games_section, dict):
+        return {}
+
+    nfl_game_data = games_section.get('0', {}).get('game', [])
+    if not isinstance(nfl_game_data, list):
+        return {}
+
+    teams_section = None
+    game_info = {}
+    for game_section in nfl_game_data:
+        if isinstance(game_section, dict):
+            if 'teams' in game_section:
+                teams_section = game_section['teams']
+            for key in ('game_key', 'name', 'season'):
+                if key in game_section:
+                    game_info[key] = game_section[key]
+    if not isinstance(teams_section, dict):
+        return {}
+
+    team_data = teams_section.get('0', {}).get('team', [])
+    if not isinstance(team_data, list) or not team_data:
+        return {}
+
+    # Team properties are a list of single-key dicts, sometimes wrapped in another list
+    property_list = team_data[0] if isinstance(team_data[0], list) else team_data
+    team_properties = {}
+    for prop in property_list:
+        if isinstance(prop, dict):
+            team_properties.update(prop)
+
+    if team_properties.get('is_owned_by_current_login') != 1:
+        return {}
+
+    # League key format: {game_id}.l.{league_id} (from team_key {game_id}.l.{league_id}.t.{team_id})
+    team_key = team_properties.get('team_key', '')
+    season = str(game_info.get('season', '') or '')
+    return {
+        'team_key': team_key,
+        'team_name': team_properties.get('name', ''),
+        'team_id': team_properties.get('team_id', ''),
+        'league_key': team_key.split('.t.')[0] if team_key else '',
+        'league_name': f"Fantasy League ({season or nfl_season_for_date(datetime.now())})",
+        'season': season
+    }
+
+
+class SeasonContextService:
+    """
+    Resolves and memoizes league, season and current week for a collection run.
+
+    Thread-safe: concurrent collectors share one resolution (and at most one
+    league discovery and one scoreboard call).
+    """
+
+    def __init__(self, yahoo_auth: Any = None, file_manager: Any = None,
+                 cache_path: Optional[os.PathLike] = None):
+        """
+        Args:
+            yahoo_auth: Optional SimpleYahooAuth used when nothing cached or on disk can answer
+            file_manager: DataFileManager used to read Yahoo snapshots (default: a new one)
+            cache_path: Disk cache location (defaults to data_collection/cache)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.yahoo_auth = yahoo_auth
+        self._file_manager = file_manager
+        self.cache_path = Path(cache_path) if cache_path else DEFAULT_CACHE_PATH
+        self._lock = threading.RLock()
+        self._state: Optional[Dict[str, Any]] = None
+        self._cache_mtime: Optional[float] = None
+        self.stats = {'api_calls': 0, 'disk_hits': 0, 'memo_hits': 0}
+
+    @property
+    def file_manager(self):
+        if self._file_manager is None:
+            from file_utils import DataFileManager
+            self._file_manager = DataFileManager()
+        return self._file_manager
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_league_info(self) -> Dict[str, str]:
+        """
+        The user's league and team: team_key, team_name, team_id, league_key, league_name, season.
+
+        Returns:
+            Copy of the league info (empty if it cannot be resolved)
+        """
+        with self._lock:
+            state = self._load_state()
+            if not self._is_fresh(state.get('league_resolved_at'), LEAGUE_TTL_SECONDS) or not state.get('league_info'):
+                league_info = self._resolve_league_info()
+                if league_info:
+                    self._update_state(league_info=league_info)
+            return dict(self._state.get('league_info') or {})
+
+    def get_week_info(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Current week: week, week_start, week_end, status, coverage_type, source.
+
+        Args:
+            refresh: Ignore cached values and ask the Yahoo scoreboard first (if a client is attached)
+
+        Returns:
+            Copy of the week info (always has a 'week')
+        """
+        with self._lock:
+            state = self._load_state()
+            if (not refresh and self._is_fresh(state.get('week_resolved_at'), self.week_ttl_seconds())
+                    and state.get('week_info')):
+                self.stats['memo_hits'] += 1
+                return dict(state['week_info'])
+            week_info = self._resolve_week_info(prefer_api=refresh)
+            self._update_state(week_info=week_info)
+            return dict(week_info)
+
+    def get_current_week(self, refresh: bool = False) -> int:
+        """Current fantasy week number."""
+        return int(self.get_week_info(refresh).get('week', 1))
+
+    def get_season(self) -> str:
+        """NFL season year of the user's league (or of today's date)."""
+        league_info = self.get_league_info()
+        season = league_info.get('season', '')
+        if not season:
+            year_match = re.search(r'(\d{4})', league_info.get('league_name', ''))
+            season = year_match.group(1) if year_match else ''
+        return season or nfl_season_for_date(datetime.now())
+
+    def get_season_context(self, data_source: str) -> Dict[str, Any]:
+        """
+        Season context block embedded in every collector's output.
+
+        Args:
+            data_source: Label of the collecting API (e.g. 'Tank01 API')
+
+        Returns:
+            Dict with nfl_season, current_date, season_phase, data_source,
+            verification_notes, yahoo_league_info, current_week and week_info
+        """
+        current_date = datetime.now()
+        league_info = self.get_league_info()
+        week_info = self.get_week_info()
+        season = self.get_season()
+
+        notes = []
+        if league_info.get('league_key'):
+            notes.append(f"Yahoo league {league_info['league_key']} season: {season}")
+        else:
+            notes.append(f"No Yahoo league info available, season {season} from current date")
+        if week_info.get('source') == 'yahoo_team_matchups_api':
+            notes.append(f"Current week {week_info['week']} extracted from Yahoo team matchups API")
+        elif week_info.get('source') == 'yahoo_scoreboard_api':
+            notes.append(f"Current week {week_info['week']} from Yahoo league scoreboard")
+        elif week_info.get('coverage_type') == 'preseason':
+            notes.append("Preseason - using week 1")
+        else:
+            notes.append(f"Estimated week {week_info['week']} from current date")
+
+        return {
+            'nfl_season': season,
+            'current_date': current_date.strftime('%Y-%m-%d'),
+            'season_phase': determine_season_phase(current_date),
+            'data_source': data_source,
+            'verification_notes': notes,
+            'yahoo_league_info': {
+                'league_key': league_info.get('league_key', ''),
+                'league_name': league_info.get('league_name', ''),
+                'team_key': league_info.get('team_key', '')
+            },
+            'current_week': week_info['week'],
+            'week_info': copy.deepcopy(week_info)
+        }
+
+    def record_league_info(self, league_info: Dict[str, Any]) -> None:
+        """Store league info a collector discovered itself, so no one else has to."""
+        if league_info and league_info.get('league_key'):
+            with self._lock:
+                self._load_state()
+                self._update_state(league_info=dict(league_info))
+
+    def record_matchups(self, matchups: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Refresh the current week from freshly collected team matchups.
+
+        Returns:
+            The recorded week info, or None if the matchups had no weeks
+        """
+        week_info = current_week_from_matchups(matchups)
+        if week_info:
+            with self._lock:
+                self._load_state()
+                self._update_state(week_info=week_info)
+        return week_info
+
+    def invalidate(self) -> None:
+        """Drop the memo and the disk cache."""
+        with self._lock:
+            self._state = {}
+            self._cache_mtime = None
+            try:
+                self.cache_path.unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def week_ttl_seconds(now: Optional[datetime] = None) -> int:
+        """How long a resolved week stays valid: short on in-season game days."""
+        now = now or datetime.now()
+        in_season = now.month >= 9 or now.month <= 2
+        return GAME_DAY_WEEK_TTL_SECONDS if in_season and now.weekday() in GAME_DAYS else WEEK_TTL_SECONDS
+
+    # ------------------------------------------------------------------
+    # State and disk cache
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _is_fresh(resolved_at: Optional[float], ttl_seconds: int) -> bool:
+        return bool(resolved_at) and time.time() - resolved_at < ttl_seconds
+
+    def _load_state(self) -> Dict[str, Any]:
+        """Memoized state, re-read when another process or service instance rewrote the cache"""
+        try:
+            mtime = self.cache_path.stat().st_mtime
+        except OSError:
+            mtime = None
+        if self._state is None or (mtime is not None and mtime != self._cache_mtime):
+            self._state = self._state or {}
+            if mtime is not None:
+                try:
+                    with open(self.cache_path, 'r', encoding='utf-8') as f:
+                        self._state = json.load(f)
+                    self.stats['disk_hits'] += 1
+                except (OSError, json.JSONDecodeError) as e:
+                    self.logger.warning(f"Ignoring unreadable season context cache: {e}")
+            self._cache_mtime = mtime
+        return self._state
+
+    def _update_state(self, league_info: Optional[Dict[str, Any]] = None,
+                      week_info: Optional[Dict[str, Any]] = None) -> None:
+        if league_info is not None:
+            self._state['league_info'] = league_info
+            self._state['league_resolved_at'] = time.time()
+        if week_info is not None:
+            self._state['week_info'] = week_info
+            self._state['week_resolved_at'] = time.time()
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._state, f, indent=2)
+            os.replace(tmp_path, self.cache_path)
+            self._cache_mtime = self.cache_path.stat().st_mtime
+        except OSError as e:
+            self.logger.warning(f"Could not write season context cache: {e}")
+
+    # ------------------------------------------------------------------
+    # Resolution
+    # ------------------------------------------------------------------
+
+    def _latest_yahoo_snapshot(self, script: str) -> tuple:
+        """(data, age in seconds) of the latest Yahoo raw snapshot for a script, or (None, None)"""
+        try:
+            latest_file = self.file_manager.get_latest_file("yahoo", script, "raw_data")
+            if not latest_file:
+                return None, None
+            return self.file_manager.load_raw_data(latest_file), time.time() - os.path.getmtime(latest_file)
+        except Exception as e:
+            self.logger.warning(f"Could not load Yahoo {script} snapshot: {e}")
+            return None, None
+
+    def _resolve_league_info(self) -> Dict[str, str]:
+        if self.yahoo_auth is not None:
+            response = self.yahoo_auth.make_request("users;use_login=1/games;game_keys=nfl/teams")
+            self.stats['api_calls'] += 1
+            if response and response.get('status') == 'success':
+                league_info = parse_league_discovery(response.get('parsed', {}))
+                if league_info:
+                    self.logger.info(f"✅ Found league: {league_info['league_name']} ({league_info['league_key']})")
+                    return league_info
+            self.logger.warning("⚠️ Yahoo league discovery failed, falling back to roster snapshot")
+
+        roster_data, _ = self._latest_yahoo_snapshot("my_roster")
+        team_info = (roster_data or {}).get('team_info', {})
+        if team_info.get('league_key'):
+            return dict(team_info)
+        return {}
+
+    def _resolve_week_info(self, prefer_api: bool = False) -> Dict[str, Any]:
+        matchups_data, age = self._latest_yahoo_snapshot("team_matchups")
+        snapshot_week = current_week_from_matchups((matchups_data or {}).get('matchups', {}))
+        if not prefer_api and snapshot_week and age is not None and age < self.week_ttl_seconds():
+            return snapshot_week
+
+        league_key = self.get_league_info().get('league_key', '')
+        if self.yahoo_auth is not None and league_key:
+            scoreboard_week = self._scoreboard_week(league_key)
+            if scoreboard_week:
+                return scoreboard_week
+
+        if snapshot_week:
+            self.logger.info(f"Using week {snapshot_week['week']} from an older team matchups snapshot")
+            return snapshot_week
+        return estimate_week_from_date(datetime.now(), self.get_season())
+
+    def _scoreboard_week(self, league_key: str) -> Optional[Dict[str, Any]]:
+        try:
+            response = self.yahoo_auth.make_request(f"league/{league_key}/scoreboard")
+            self.stats['api_calls'] += 1
+            if not response or response.get('status') != 'success':
+                return None
+            league = response.get('parsed', {}).get('fantasy_content', {}).get('league', [])
+            for league_section in league:
+                if isinstance(league_section, dict) and 'current_week' in league_section:
+                    return {
+                        'week': int(league_section['current_week']),
+                        'week_start': '',
+                        'week_end': '',
+                        'status': 'unknown',
+                        'coverage_type': 'week',
+                        'source': 'yahoo_scoreboard_api'
+                    }
+        except Exception as e:
+            self.logger.warning(f"Could not get current week from scoreboard: {e}")
+        return None
+
+
+# Process-wide shared service so every collector in a run reuses one resolution
+_shared_service: Optional[SeasonContextService] = None
+_shared_service_lock = threading.Lock()
+
+
+def get_season_context_service(yahoo_auth: Any = None, file_manager: Any = None) -> SeasonContextService:
+    """
+    Get the process-wide shared SeasonContextService.
+
+    A Yahoo client or file manager passed here is attached if the shared
+    service does not have one yet.
+    """
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = SeasonContextService(yahoo_auth=yahoo_auth, file_manager=file_manager)
+        else:
+            if _shared_service.yahoo_auth is None and yahoo_auth is not None:
+                _shared_service.yahoo_auth = yahoo_auth
+            if _shared_service._file_manager is None and file_manager is not None:
+                _shared_service._file_manager = file_manager
+        return _shared_service
@@ -0,0 +1,568 @@
+#!/usr/bin/env python3
+"""
+Columnar Season Warehouse
+
+Appends each run's Tank01 game stats, weekly projection archives and Yahoo
+roster snapshots into columnar tables partitioned by season and week, so trend,
+accuracy and post-game analyses run as vectorized pandas queries instead of
+re-reading timestamped JSON outputs.
+
+Tables:
+- game_logs: one row per (player, game) - fantasy points and box score columns
+- projections: one row per (player, week, archive phase)
+- roster_snapshots: one row per (fantasy team, player, snapshot)
+
+Files: data_collection/cache/warehouse/<table>/season=<YYYY>/week=<WW>/data.parquet
+
+Each partition is rewritten atomically on ingest with duplicate keys resolved
+to the newest row, so re-ingesting a run is idempotent. The read-merge-rewrite
+holds a thread lock and an exclusive file lock on the partition, so collectors
+ingesting into the same week at once (in one process or several) keep each
+other's rows. Game logs are
+partitioned by the week of the game date (January games are the late weeks of
+the previous season).
+
+Parquet needs pyarrow (or fastparquet). Without one, partitions are pickled
+DataFrames (data.pkl). Those are a local cache only: pickles are not safe to
+load from untrusted sources and may not load under another pandas version, so
+never share or commit them - delete the warehouse directory and run
+--backfill to rebuild it from the outputs.
+
+Usage:
+    python3 data_collection/scripts/shared/season_warehouse.py --backfill
+"""
+
+import os
+import sys
+import logging
+import argparse
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from file_utils import DataFileManager
+from season_context import nfl_week_for_date
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_ENGINE = "pyarrow"
+except ImportError:
+    try:
+        import fastparquet  # noqa: F401
+        PARQUET_ENGINE = "fastparquet"
+    except ImportError:
+        PARQUET_ENGINE = None
+
+DATA_COLLECTION_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_WAREHOUSE_DIR = DATA_COLLECTION_ROOT / "cache" / "warehouse"
+
+# Rows with the same key inside a partition are duplicates; the newest ingest wins
+TABLE_KEYS = {
+    "game_logs": ["player_id", "game_id"],
+    "projections": ["player_id", "phase"],
+    "roster_snapshots": ["team_key", "player_key", "snapshot_ts"]
+}
+
+# Box score columns kept from Tank01 game logs (section, Tank01 field)
+GAME_LOG_STATS = [
+    ("passing", "passYds"), ("passing", "passTD"), ("passing", "int"),
+    ("rushing", "carries"), ("rushing", "rushYds"), ("rushing", "rushTD"),
+    ("receiving", "receptions"), ("receiving", "recYds"), ("receiving", "recTD"),
+    ("receiving", "targets")
+]
+
+# Tank01 stats outputs that carry per-player game logs
+GAME_STATS_SCRIPTS = ("my_roster_stats", "opponent_roster_stats", "available_players_stats")
+
+# Serializes partition rewrites between threads of one process (flock covers processes)
+_partition_lock = threading.Lock()
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _game_season_week(game: Dict[str, Any], default_season: int) -> tuple:
+    """
+    (season, week) of a game from its date (game_date, else the gameID's YYYYMMDD prefix).
+
+    The collectors' 'week' field is an approximation that puts January games in
+    week 1, so it is only used when the game has no readable date.
+    """
+    for value, fmt in ((game.get("game_date"), "%Y-%m-%d"), (str(game.get("game_id") or "")[:8], "%Y%m%d")):
+        try:
+            return nfl_week_for_date(datetime.strptime(str(value), fmt))
+        except (TypeError, ValueError):
+            continue
+    try:
+        return default_season, int(game.get("week") or 0)
+    except (TypeError, ValueError):
+        return default_season, 0
+
+
+def _season_week(data: Dict[str, Any], default_week: Optional[int] = None) -> tuple:
+    """(season, week) recorded in an output's season context or collection metadata."""
+    context = data.get("season_context") or {}
+    metadata = data.get("collection_metadata") or {}
+    season = context.get("nfl_season") or metadata.get("nfl_season") or datetime.now().year
+    week = context.get("current_week") or metadata.get("week") or default_week or 0
+    try:
+        return int(season), int(week)
+    except (TypeError, ValueError):
+        return datetime.now().year, int(default_week or 0)
+
+
+class SeasonWarehouse:
+    """
+    Partitioned columnar store for season history.
+
+    Safe for concurrent ingests from threads and processes; collectors share
+    one instance through get_season_warehouse().
+    """
+
+    def __init__(self, warehouse_dir: Optional[str] = None):
+        """
+        Initialize the warehouse.
+
+        Args:
+            warehouse_dir: Root directory (default: data_collection/cache/warehouse)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.warehouse_dir = Path(warehouse_dir) if warehouse_dir else DEFAULT_WAREHOUSE_DIR
+        self.extension = ".parquet" if PARQUET_ENGINE else ".pkl"
+
+    # ------------------------------------------------------------------
+    # Partition storage
+    # ------------------------------------------------------------------
+
+    def _partition_path(self, table: str, season: int, week: int) -> Path:
+        return self.warehouse_dir / table / f"season={season}" / f"week={week:02d}" / f"data{self.extension}"
+
+    def _read_partition(self, path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        if path.suffix == ".parquet":
+            return pd.read_parquet(path, columns=columns, engine=PARQUET_ENGINE)
+        frame = pd.read_pickle(path)
+        return frame[columns] if columns else frame
+
+    @contextmanager
+    def _locked_partition(self, path: Path):
+        """Hold the partition's thread lock and exclusive file lock for a read-merge-rewrite."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with _partition_lock:
+            lock_file = open(path.parent / ".data.lock", 'w')
+            try:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+                lock_file.close()
+
+    def _write_partition(self, path: Path, frame: pd.DataFrame) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            if path.suffix == ".parquet":
+                frame.to_parquet(tmp_path, index=False, engine=PARQUET_ENGINE)
+            else:
+                frame.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def append(self, table: str, rows: pd.DataFrame) -> int:
+        """
+        Append rows to a table, merging them into their season/week partitions.
+
+        Args:
+            table: Table name (see TABLE_KEYS)
+            rows: Rows including 'season' and 'week' columns
+
+        Returns:
+            Number of rows written
+        """
+        if rows.empty:
+            return 0
+        keys = TABLE_KEYS[table]
+        for (season, week), new_rows in rows.groupby(["season", "week"], sort=False):
+            path = self._partition_path(table, int(season), int(week))
+            with self._locked_partition(path):
+                if path.exists():
+                    new_rows = pd.concat([self._read_partition(path), new_rows], ignore_index=True)
+                merged = new_rows.drop_duplicates(subset=keys, keep="last").reset_index(drop=True)
+                self._write_partition(path, merged)
+        return len(rows)
+
+    def _partitions(self, table: str, season: Optional[int], weeks: Optional[Iterable[int]]) -> List[Path]:
+        table_dir = self.warehouse_dir / table
+        season_dirs = [table_dir / f"season={season}"] if season is not None else sorted(table_dir.glob("season=*"))
+        wanted = {int(w) for w in weeks} if weeks is not None else None
+        paths = []
+        for season_dir in season_dirs:
+            for week_dir in sorted(season_dir.glob("week=*")):
+                if wanted is not None and int(week_dir.name.split("=")[1]) not in wanted:
+                    continue
+                paths.extend(p for p in week_dir.iterdir() if p.name.startswith("data."))
+        return paths
+
+    def query(self, table: str, season: Optional[int] = None, weeks: Optional[Iterable[int]] = None,
+              columns: Optional[List[str]] = None, **filters: Any) -> pd.DataFrame:
+        """
+        Read a table, pruning partitions by season/week.
+
+        Args:
+            table: Table name
+            season: Optional season filter
+            weeks: Optional week filter
+            columns: Optional column projection
+            **filters: column=value or column=[values] equality filters
+
+        Returns:
+            DataFrame (empty if nothing matches)
+        """
+        read_columns = None
+        if columns:
+            read_columns = list(dict.fromkeys(list(columns) + list(filters)))
+        frames = [self._read_partition(p, read_columns) for p in self._partitions(table, season, weeks)]
+        if not frames:
+            return pd.DataFrame(columns=columns or [])
+        frame = pd.concat(frames, ignore_index=True)
+        for column, value in filters.items():
+            if isinstance(value, (list, tuple, set, np.ndarray, pd.Series)):
+                frame = frame[frame[column].isin(list(value))]
+            else:
+                frame = frame[frame[column] == value]
+        return frame[columns].reset_index(drop=True) if columns else frame.reset_index(drop=True)
+
+    # ------------------------------------------------------------------
+    # Ingest
+    # ------------------------------------------------------------------
+
+    def ingest_game_stats(self, data: Dict[str, Any], source: str = "") -> int:
+        """
+        Ingest a Tank01 *_stats raw output (matched_players with game_stats).
+
+        Returns:
+            Number of game rows ingested
+        """
+        season, _ = _season_week(data)
+        ingested_at = datetime.now().isoformat()
+        rows = []
+        for player in data.get("matched_players", []):
+            tank01 = player.get("tank01_data") or {}
+            yahoo = player.get("yahoo_player") or {}
+            player_id = str(tank01.get("playerID") or "")
+            if not player_id:
+                continue
+            name = yahoo.get("name")
+            if isinstance(name, dict):
+                name = name.get("full")
+            for game in (player.get("game_stats") or {}).get("games", []):
+                game_season, week = _game_season_week(game, season)
+                row = {
+                    "season": game_season,
+                    "week": week,
+                    "player_id": player_id,
+                    "yahoo_player_id": str(yahoo.get("player_id") or tank01.get("yahooPlayerID") or ""),
+                    "name": name or tank01.get("longName", ""),
+                    "position": yahoo.get("display_position") or tank01.get("pos", ""),
+                    "team": game.get("team") or tank01.get("team", ""),
+                    "opponent": game.get("opponent", ""),
+                    "game_id": game.get("game_id", ""),
+                    "game_date": str(game.get("game_date") or ""),
+                    "fantasy_points": _to_float(game.get("fantasy_points")),
+                    "source": source,
+                    "ingested_at": ingested_at
+                }
+                for section, field in GAME_LOG_STATS:
+                    row[field] = _to_float((game.get(section) or {}).get(field))
+                rows.append(row)
+        return self.append("game_logs", pd.DataFrame(rows))
+
+    def ingest_projections(self, data: Dict[str, Any], phase: str = "manual", source: str = "") -> int:
+        """
+        Ingest a Tank01 weekly projections archive (projections keyed by playerID).
+
+        Returns:
+            Number of projection rows ingested
+        """
+        season, week = _season_week(data)
+        collected_at = (data.get("collection_metadata") or {}).get("collection_timestamp", "")
+        rows = [{
+            "season": season,
+            "week": week,
+            "player_id": str(player_id),
+            "name": projection.get("player_name", ""),
+            "position": projection.get("position", ""),
+            "team": projection.get("team", ""),
+            "projected_points": _to_float(projection.get("fantasyPoints")),
+            "projected_points_default": _to_float(projection.get("fantasyPointsDefault")),
+            "is_team_defense": bool(projection.get("isTeamDefense", False)),
+            "phase": phase,
+            "collected_at": collected_at,
+            "source": source
+        } for player_id, projection in (data.get("projections") or {}).items()]
+        return self.append("projections", pd.DataFrame(rows))
+
+    def ingest_roster_snapshot(self, data: Dict[str, Any], snapshot_ts: str,
+                               week: Optional[int] = None, source: str = "") -> int:
+        """
+        Ingest a Yahoo my_roster or opponent_rosters raw output.
+
+        Returns:
+            Number of roster rows ingested
+        """
+        season, week = _season_week(data, week)
+        rosters = []
+        if "roster_players" in data:
+            rosters.append(((data.get("team_info") or {}).get("team_key", ""), True, data["roster_players"]))
+        for team_key, roster in (data.get("rosters") or {}).items():
+            rosters.append((team_key, False, roster.get("players", [])))
+
+        rows = []
+        for team_key, is_my_team, players in rosters:
+            for player in players:
+                selected = player.get("selected_position")
+                if isinstance(selected, dict):
+                    selected = selected.get("position")
+                rows.append({
+                    "season": season,
+                    "week": week,
+                    "snapshot_ts": snapshot_ts,
+                    "team_key": team_key,
+                    "is_my_team": is_my_team,
+                    "player_key": player.get("player_key", ""),
+                    "yahoo_player_id": str(player.get("player_id", "")),
+                    "name": player.get("full_name") or (player.get("name") or {}).get("full", ""),
+                    "position": player.get("display_position", ""),
+                    "selected_position": selected or "",
+                    "nfl_team": player.get("editorial_team_abbr", ""),
+                    "source": source
+                })
+        return self.append("roster_snapshots", pd.DataFrame(rows))
+
+    def ingest_snapshot(self, api_name: str, script_name: str, data: Dict[str, Any],
+                        source_file: str = "", phase: Optional[str] = None,
+                        week: Optional[int] = None) -> int:
+        """
+        Route a saved output to its table. Outputs with no warehouse table are ignored.
+
+        Ingest failures are logged, never raised: the output itself is already saved
+        and can be re-ingested with --backfill.
+
+        Returns:
+            Number of rows ingested
+        """
+        snapshot_ts = Path(source_file).name[:15] if source_file else datetime.now().strftime("%Y%m%d_%H%M%S")
+        try:
+            if api_name == "tank01" and script_name in GAME_STATS_SCRIPTS:
+                count = self.ingest_game_stats(data, source=script_name)
+            elif api_name == "tank01" and script_name == "projections_archive":
+                count = self.ingest_projections(data, phase=phase or "manual", source=source_file)
+            elif api_name == "yahoo" and script_name in ("my_roster", "opponent_rosters"):
+                count = self.ingest_roster_snapshot(data, snapshot_ts, week=week, source=script_name)
+            else:
+                return 0
+        except Exception as e:
+            self.logger.warning(f"Warehouse ingest failed for {api_name}/{script_name}: {e}")
+            return 0
+        self.logger.info(f"Warehouse ingested {count} rows from {api_name}/{script_name}")
+        return count
+
+    def backfill(self, file_manager: Optional[DataFileManager] = None) -> Dict[str, int]:
+        """
+        Ingest every indexed output that has a warehouse table (oldest first).
+
+        Returns:
+            Rows ingested per api/script
+        """
+        file_manager = file_manager or DataFileManager()
+        sources = [("tank01", s) for s in GAME_STATS_SCRIPTS + ("projections_archive",)]
+        sources += [("yahoo", "my_roster"), ("yahoo", "opponent_rosters")]
+        totals = {}
+        for api_name, script_name in sources:
+            manifest = file_manager.get_manifest(api_name, script_name)
+            entries = sorted(manifest["history"].get("raw_data", []), key=lambda e: e.get("timestamp") or "")
+            total = 0
+            for entry in entries:
+                path = file_manager.base_output_dir / entry["path"]
+                try:
+                    data = file_manager.load_raw_data(str(path))
+                except (OSError, ValueError, RuntimeError) as e:
+                    self.logger.warning(f"Skipping unreadable output {path}: {e}")
+                    continue
+                total += self.ingest_snapshot(api_name, script_name, data, str(path), week=entry.get("week"))
+            totals[f"{api_name}/{script_name}"] = total
+        return totals
+
+    # ------------------------------------------------------------------
+    # Analyses
+    # ------------------------------------------------------------------
+
+    def player_weekly_points(self, season: int, player_ids: Optional[Iterable[str]] = None,
+                             weeks: Optional[Iterable[int]] = None) -> pd.DataFrame:
+        """
+        Regular-season fantasy points per player and week, with the latest projection.
+
+        Args:
+            season: NFL season
+            player_ids: Optional Tank01 playerIDs or Yahoo player_ids
+            weeks: Optional weeks
+
+        Returns:
+            DataFrame: player_id, yahoo_player_id, week, name, position, points, projection, accuracy
+        """
+        games = self.query("game_logs", season, weeks,
+                           columns=["player_id", "yahoo_player_id", "week", "name", "position", "fantasy_points"])
+        games = games[games["week"] > 0]
+        if player_ids is not None:
+            ids = [str(p) for p in player_ids]
+            games = games[games["player_id"].isin(ids) | games["yahoo_player_id"].isin(ids)]
+        if games.empty:
+            return pd.DataFrame(columns=["player_id", "yahoo_player_id", "week", "name", "position",
+                                         "points", "projection", "accuracy"])
+        weekly = (games.groupby(["player_id", "week"], as_index=False)
+                  .agg(yahoo_player_id=("yahoo_player_id", "last"), name=("name", "last"),
+                       position=("position", "last"), points=("fantasy_points", "sum")))
+
+        projections = self.query("projections", season, weeks,
+                                 columns=["player_id", "week", "projected_points", "collected_at"],
+                                 player_id=weekly["player_id"].unique())
+        if not projections.empty:
+            latest = (projections.sort_values("collected_at")
+                      .drop_duplicates(["player_id", "week"], keep="last")[["player_id", "week", "projected_points"]])
+            weekly = weekly.merge(latest, on=["player_id", "week"], how="left")
+        else:
+            weekly["projected_points"] = np.nan
+        weekly = weekly.rename(columns={"projected_points": "projection"})
+
+        projected = weekly["projection"].to_numpy(dtype=float)
+        points = weekly["points"].to_numpy(dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            accuracy = np.clip(100 - np.abs(points - projected) / projected * 100, 0, None)
+        weekly["accuracy"] = np.where(projected > 0, np.round(accuracy, 1), 0.0)
+        return weekly.sort_values(["player_id", "week"]).reset_index(drop=True)
+
+    def latest_projections(self, season: int, week: int) -> pd.DataFrame:
+        """Most recent archived projection per player for a week (any archive phase)."""
+        projections = self.query("projections", season, [week])
+        if projections.empty:
+            return projections
+        return (projections.sort_values("collected_at")
+                .drop_duplicates("player_id", keep="last").reset_index(drop=True))
+
+    def team_week_performance(self, season: int, week: int, team_key: Optional[str] = None) -> pd.DataFrame:
+        """
+        Projected vs actual points for a fantasy roster in one week.
+
+        The latest roster snapshot of the week is joined to game logs on the Yahoo
+        player_id, then to projections on the Tank01 playerID.
+
+        Args:
+            season: NFL season
+            week: NFL week
+            team_key: Yahoo team key (default: my team)
+
+        Returns:
+            DataFrame: name, position, selected_position, player_id, projected_points, actual_points
+        """
+        roster = self.query("roster_snapshots", season, [week])
+        if roster.empty:
+            return roster
+        roster = roster[roster["team_key"] == team_key] if team_key else roster[roster["is_my_team"]]
+        roster = roster[roster["snapshot_ts"] == roster["snapshot_ts"].max()]
+
+        games = self.query("game_logs", season, [week], columns=["player_id", "yahoo_player_id", "fantasy_points"])
+        actual = (games.groupby(["yahoo_player_id", "player_id"], as_index=False)["fantasy_points"].sum()
+                  .rename(columns={"fantasy_points": "actual_points"}))
+        projected = self.latest_projections(season, week)
+        if projected.empty:
+            projected = pd.DataFrame(columns=["player_id", "projected_points"])
+
+        frame = (roster[["name", "position", "selected_position", "yahoo_player_id"]]
+                 .merge(actual, on="yahoo_player_id", how="left")
+                 .merge(projected[["player_id", "projected_points"]], on="player_id", how="left"))
+        frame[["projected_points", "actual_points"]] = frame[["projected_points", "actual_points"]].fillna(0.0)
+        return frame.reset_index(drop=True)
+
+    def player_trends(self, season: int, player_ids: Optional[Iterable[str]] = None,
+                      recent_weeks: int = 3) -> pd.DataFrame:
+        """
+        Recent-vs-earlier scoring trend and consistency for every player at once.
+
+        Returns:
+            DataFrame per player: games, avg_points, recent_avg, older_avg, trend_ratio,
+            points_range, points_std
+        """
+        weekly = self.player_weekly_points(season, player_ids)
+        if weekly.empty:
+            return pd.DataFrame(columns=["player_id", "games", "avg_points", "recent_avg", "older_avg",
+                                         "trend_ratio", "points_range", "points_std"])
+        # Rank weeks from most recent (1) per player
+        weekly["recency"] = weekly.groupby("player_id")["week"].rank(ascending=False, method="first")
+        recent = weekly["recency"] <= recent_weeks
+        grouped = weekly.groupby("player_id")
+        trends = grouped.agg(name=("name", "last"), position=("position", "last"), games=("points", "size"),
+                             avg_points=("points", "mean"), points_std=("points", "std"),
+                             points_max=("points", "max"), points_min=("points", "min"))
+        trends["recent_avg"] = weekly[recent].groupby("player_id")["points"].mean()
+        trends["older_avg"] = weekly[~recent].groupby("player_id")["points"].mean()
+        trends["trend_ratio"] = trends["recent_avg"] / trends["older_avg"].where(trends["older_avg"] > 0)
+        trends["points_range"] = trends["points_max"] - trends["points_min"]
+        return trends.drop(columns=["points_max", "points_min"]).reset_index()
+
+
+# Process-wide shared warehouse so every collector in a run writes through one instance
+_shared_warehouse: Optional[SeasonWarehouse] = None
+_shared_warehouse_lock = threading.Lock()
+
+
+def get_season_warehouse() -> SeasonWarehouse:
+    """Get the process-wide shared SeasonWarehouse (default warehouse directory)."""
+    global _shared_warehouse
+    with _shared_warehouse_lock:
+        if _shared_warehouse is None:
+            _shared_warehouse = SeasonWarehouse()
+        return _shared_warehouse
+
+
+def main():
+    """Backfill the warehouse from existing outputs and print table sizes."""
+    parser = argparse.ArgumentParser(description="Columnar season warehouse")
+    parser.add_argument('--backfill', action='store_true', help='Ingest all existing outputs')
+    parser.add_argument('--season', type=int, default=None, help='Season to summarize')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    warehouse = SeasonWarehouse()
+
+    if args.backfill:
+        print("📦 Backfilling season warehouse from outputs...")
+        for source, count in warehouse.backfill().items():
+            print(f"   {source}: {count} rows")
+
+    for table in TABLE_KEYS:
+        frame = warehouse.query(table, args.season)
+        print(f"📊 {table}: {len(frame)} rows")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
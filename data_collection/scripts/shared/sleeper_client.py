@@ -23,6 +23,14 @@ except ImportError:
     print("WARNING: Cannot import existing Sleeper client. Creating standalone client.")
     SleeperClient = None
 
+try:
+    from external.sleeper_player_db import SleeperPlayerDB
+except ImportError:
+    SleeperPlayerDB = None
+
+sys.path.append(os.path.dirname(__file__))
+from player_identity import get_player_identity_index
+
 class SimpleSleeperClient:
     """
     Simplified Sleeper NFL API client for data collection scripts.
@@ -61,6 +69,25 @@ class SimpleSleeperClient:
         # Cache for player database (large download)
         self._players_cache = None
         self._cache_timestamp = None
+        
+        # Persistent, indexed player database shared with other collection scripts
+        self.player_db = None
+        if SleeperPlayerDB:
+            try:
+                self.player_db = SleeperPlayerDB()
+            except Exception as e:
+                self.logger.warning(f"Sleeper player database unavailable: {e}")
+    
+    def _ensure_player_db(self, force_refresh: bool = False) -> bool:
+        """Refresh the local player database if needed; True if indexed lookups can be used."""
+        if not self.player_db:
+            return False
+        try:
+            self.player_db.ensure_fresh(self.session, f"{self.base_url}/players/nfl", force_refresh)
+            return self.player_db.player_count() > 0
+        except Exception as e:
+            self.logger.error(f"Failed to refresh Sleeper player database: {e}")
+            return False
     
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -103,7 +130,10 @@ class SimpleSleeperClient:
             Dictionary of players keyed by player_id
         """
         if self.use_existing:
-            return self.sleeper_client.get_nfl_players()
+            return self.sleeper_client.get_nfl_players(force_refresh)
+        
+        if self._ensure_player_db(force_refresh):
+            return self.player_db.get_all_players()
         
         # Check cache first (data is large and changes infrequently)
         if not force_refresh and self._players_cache:
@@ -219,6 +249,11 @@ class SimpleSleeperClient:
         if self.use_existing:
             return self.sleeper_client.search_players_by_name(name, position)
         
+        if self._ensure_player_db():
+            matches = self.player_db.search_by_name(name, position)
+            self.logger.info(f"Found {len(matches)} players matching '{name}'")
+            return matches
+        
         # Get player database
         players_db = self.get_nfl_players()
         if not players_db:
@@ -256,6 +291,11 @@ class SimpleSleeperClient:
         if self.use_existing:
             return self.sleeper_client.get_players_by_team(team_abbr)
         
+        if self._ensure_player_db():
+            team_players = self.player_db.get_by_team(team_abbr)
+            self.logger.info(f"Found {len(team_players)} players for team {team_abbr}")
+            return team_players
+        
         # Get player database
         players_db = self.get_nfl_players()
         if not players_db:
@@ -282,13 +322,19 @@ class SimpleSleeperClient:
             self.logger.error(f"Failed to get NFL state: {e}")
             return {}
     
-    def match_yahoo_player(self, yahoo_name: str, yahoo_team: str = None) -> Optional[Dict[str, Any]]:
+    def match_yahoo_player(self, yahoo_name: str, yahoo_team: str = None, yahoo_position: str = None,
+                           yahoo_id: str = None) -> Optional[Dict[str, Any]]:
         """
         Match a Yahoo Fantasy player to Sleeper database.
         
+        Uses the shared player identity index (Yahoo ID, normalized name + team,
+        last name + team) instead of scanning the full player database.
+        
         Args:
             yahoo_name: Player name from Yahoo
             yahoo_team: Player's NFL team from Yahoo
+            yahoo_position: Optional Yahoo display position
+            yahoo_id: Optional Yahoo player_id
             
         Returns:
             Matching Sleeper player data or None
@@ -298,26 +344,9 @@ class SimpleSleeperClient:
         if not players_db:
             return None
         
-        yahoo_name_clean = yahoo_name.lower().strip()
-        
-        # Try various matching strategies
-        for player_id, player in players_db.items():
-            sleeper_name = player.get('full_name', '').lower().strip()
-            sleeper_team = player.get('team')
-            
-            # Strategy 1: Exact name match with team validation
-            if yahoo_name_clean == sleeper_name:
-                if not yahoo_team or not sleeper_team or yahoo_team == sleeper_team:
-                    return player
-            
-            # Strategy 2: Last name match with team validation
-            if yahoo_team and sleeper_team and yahoo_team == sleeper_team:
-                yahoo_last = yahoo_name_clean.split()[-1] if yahoo_name_clean else ""
-                sleeper_last = sleeper_name.split()[-1] if sleeper_name else ""
-                if yahoo_last and yahoo_last == sleeper_last:
-                    return player
-        
-        return None
+        index = get_player_identity_index()
+        index.sync_sleeper_players(players_db)
+        return index.match_sleeper(yahoo_name, yahoo_team, yahoo_position, yahoo_id=yahoo_id)
 
 def main():
     """Test the simplified Sleeper client."""
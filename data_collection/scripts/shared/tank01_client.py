@@ -11,6 +11,7 @@ import sys
 import requests
 import json
 import logging
+import threading
 from typing import Dict, List, Optional, Any
 from dotenv import load_dotenv
 
@@ -23,6 +24,15 @@ except ImportError:
     print("WARNING: Cannot import existing Tank01 client. Creating standalone client.")
     Tank01Client = None
 
+try:
+    from external.response_cache import (ResponseCache, TANK01_ENDPOINT_TTLS, CACHE_FRESH, CACHE_STALE,
+                                         is_cacheable_tank01_response)
+except ImportError:
+    ResponseCache = None
+
+sys.path.append(os.path.dirname(__file__))
+from player_identity import get_player_identity_index
+
 class SimpleTank01Client:
     """
     Simplified Tank01 NFL API client for data collection scripts.
@@ -38,6 +48,10 @@ class SimpleTank01Client:
         self.logger = logging.getLogger(__name__)
         self.api_key = api_key or os.getenv('RAPIDAPI_KEY')
         
+        # Player list kept for the client's lifetime (shared by in-process collectors)
+        self._player_list = None
+        self._player_list_lock = threading.Lock()
+        
         if not self.api_key:
             self.logger.error("RapidAPI key required for Tank01 client")
             self.tank01_client = None
@@ -71,6 +85,15 @@ class SimpleTank01Client:
         # Track API usage
         self.api_calls_made = 0
         self.monthly_limit = 1000
+        
+        # Same on-disk response cache the full client uses
+        self.cache = None
+        cache_disabled = os.getenv('TANK01_CACHE_DISABLED', '').lower() in ('1', 'true', 'yes')
+        if ResponseCache and not cache_disabled:
+            try:
+                self.cache = ResponseCache("tank01", endpoint_ttls=TANK01_ENDPOINT_TTLS)
+            except OSError as e:
+                self.logger.warning(f"Tank01 response cache unavailable: {e}")
     
     def is_available(self) -> bool:
         """Check if Tank01 client is available and configured."""
@@ -80,6 +103,10 @@ class SimpleTank01Client:
         """
         Make a request to the Tank01 API via RapidAPI.
         
+        Served from the shared response cache like Tank01Client._make_request:
+        stale entries are refreshed in the background, and any cached copy is
+        used if the request fails.
+        
         Args:
             endpoint: API endpoint (without base URL)
             params: Optional query parameters
@@ -93,6 +120,33 @@ class SimpleTank01Client:
         if self.use_existing:
             return self.tank01_client._make_request(endpoint, params)
         
+        # Serve from the shared response cache when possible
+        if not (self.cache and self.cache.is_cacheable(endpoint)):
+            return self._fetch_standalone(endpoint, params)
+        
+        cached, state = self.cache.lookup(endpoint, params)
+        if state == CACHE_FRESH:
+            return cached
+        if state == CACHE_STALE:
+            self.cache.revalidate_async(endpoint, params, lambda: self._fetch_standalone(endpoint, params),
+                                        is_cacheable=is_cacheable_tank01_response)
+            return cached
+        
+        try:
+            data = self._fetch_standalone(endpoint, params)
+        except Exception:
+            fallback = self.cache.get_any(endpoint, params)
+            if fallback is not None:
+                self.logger.warning(f"Tank01 request failed, serving expired cache entry for {endpoint}")
+                return fallback
+            raise
+        
+        if is_cacheable_tank01_response(data):
+            self.cache.store(endpoint, params, data)
+        return data
+    
+    def _fetch_standalone(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make an uncached request with the standalone session."""
         # Check rate limits
         if self.api_calls_made >= self.monthly_limit:
             raise Exception(f"Monthly API limit of {self.monthly_limit} calls reached")
@@ -121,6 +175,8 @@ class SimpleTank01Client:
         """
         Get comprehensive NFL player list from Tank01.
         
+        The first successful response is kept for the lifetime of the client.
+        
         Returns:
             Dict containing all NFL players with Tank01 data
         """
@@ -128,14 +184,20 @@ class SimpleTank01Client:
             self.logger.error("Tank01 client not available")
             return {}
         
-        try:
-            if self.use_existing:
-                return self.tank01_client.get_player_list()
-            else:
-                return self._make_request("getNFLPlayerList")
-        except Exception as e:
-            self.logger.error(f"Failed to get Tank01 player list: {e}")
-            return {}
+        with self._player_list_lock:
+            if self._player_list is not None:
+                return self._player_list
+            try:
+                if self.use_existing:
+                    response = self.tank01_client.get_player_list()
+                else:
+                    response = self._make_request("getNFLPlayerList")
+            except Exception as e:
+                self.logger.error(f"Failed to get Tank01 player list: {e}")
+                return {}
+            if isinstance(response, dict) and isinstance(response.get('body'), list):
+                self._player_list = response
+            return response
     
     def get_fantasy_projections(self, player_id: str) -> Dict[str, Any]:
         """
@@ -282,13 +344,19 @@ class SimpleTank01Client:
             self.logger.error(f"Failed to get team roster for {team_abbr}: {e}")
             return {}
     
-    def match_yahoo_player(self, yahoo_name: str, yahoo_team: str = None) -> Optional[Dict[str, Any]]:
+    def match_yahoo_player(self, yahoo_name: str, yahoo_team: str = None, yahoo_position: str = None,
+                           yahoo_id: str = None) -> Optional[Dict[str, Any]]:
         """
         Match a Yahoo Fantasy player to Tank01 database.
         
+        Uses the shared player identity index (Yahoo ID, normalized name + team,
+        last name + team) instead of scanning the full player list.
+        
         Args:
             yahoo_name: Player name from Yahoo
             yahoo_team: Player's NFL team from Yahoo
+            yahoo_position: Optional Yahoo display position
+            yahoo_id: Optional Yahoo player_id
             
         Returns:
             Matching Tank01 player data or None
@@ -302,32 +370,9 @@ class SimpleTank01Client:
         if not isinstance(players, list):
             return None
         
-        yahoo_name_clean = yahoo_name.lower().strip()
-        
-        # Try various matching strategies
-        for player in players:
-            tank01_name = player.get('longName', '').lower().strip()
-            tank01_team = player.get('team', '')
-            yahoo_id = player.get('yahooID')
-            
-            # Strategy 1: Direct Yahoo ID match
-            if yahoo_id:
-                # This would require Yahoo player ID, which we may not have
-                pass
-            
-            # Strategy 2: Exact name match with team validation
-            if yahoo_name_clean == tank01_name:
-                if not yahoo_team or not tank01_team or yahoo_team == tank01_team:
-                    return player
-            
-            # Strategy 3: Last name match with team validation
-            if yahoo_team and tank01_team and yahoo_team == tank01_team:
-                yahoo_last = yahoo_name_clean.split()[-1] if yahoo_name_clean else ""
-                tank01_last = tank01_name.split()[-1] if tank01_name else ""
-                if yahoo_last and yahoo_last == tank01_last:
-                    return player
-        
-        return None
+        index = get_player_identity_index()
+        index.sync_tank01_players(players)
+        return index.match_tank01(yahoo_name, yahoo_team, yahoo_position, yahoo_id=yahoo_id)
     
     def get_api_usage(self) -> Dict[str, Any]:
         """
@@ -353,9 +398,27 @@ class SimpleTank01Client:
                 "percentage_used": (self.api_calls_made / getattr(self, 'monthly_limit', 1000)) * 100,
                 "available": self.is_available(),
                 "using_existing_client": self.use_existing,
-                "data_source": "client_side_tracking"
+                "data_source": "client_side_tracking",
+                "cache": self.get_cache_stats()
             }
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get response cache hit/miss counters for this session.
+        
+        Returns:
+            Dict with cache statistics (enabled=False if caching is off)
+        """
+        if getattr(self, 'use_existing', False) and hasattr(self.tank01_client, 'get_cache_stats'):
+            return self.tank01_client.get_cache_stats()
+        
+        cache = getattr(self, 'cache', None)
+        if not cache:
+            return {"enabled": False}
+        stats = cache.get_stats()
+        stats["enabled"] = True
+        return stats
+    
     def get_weekly_projections(self, week: int, archive_season: int = 2025, scoring_settings: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """
         Get weekly fantasy projections for all players.
@@ -602,6 +665,62 @@ class SimpleTank01Client:
             self.logger.error(f"Failed to get game info for {game_id}: {e}")
             return {}
     
+    def get_box_score(self, game_id: str) -> Dict[str, Any]:
+        """
+        Get the box score for a game, with stats for every player who played.
+        
+        Args:
+            game_id: Game ID (e.g., "20250907_ARI@NO")
+            
+        Returns:
+            Dict containing the box score (body.playerStats keyed by playerID)
+        """
+        if not self.is_available():
+            return {}
+        
+        try:
+            if self.use_existing:
+                return self.tank01_client.get_box_score(game_id)
+            else:
+                params = {
+                    "gameID": game_id,
+                    "playByPlay": "false",
+                    "fantasyPoints": "true"
+                }
+                return self._make_request("getNFLBoxScore", params)
+        except Exception as e:
+            self.logger.error(f"Failed to get box score for {game_id}: {e}")
+            return {}
+    
+    def get_games_for_week(self, week: int, season: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get the NFL schedule for a regular season week.
+        
+        Args:
+            week: Week number
+            season: Optional season (default: current)
+            
+        Returns:
+            Dict containing the week's games (gameID, home, away, gameDate)
+        """
+        if not self.is_available():
+            return {}
+        
+        try:
+            if self.use_existing:
+                return self.tank01_client.get_games_for_week(week, season)
+            else:
+                params = {
+                    "week": week,
+                    "seasonType": "reg"
+                }
+                if season:
+                    params["season"] = season
+                return self._make_request("getNFLGamesForWeek", params)
+        except Exception as e:
+            self.logger.error(f"Failed to get NFL games for week {week}: {e}")
+            return {}
+    
     def get_daily_scoreboard(self, game_date: str = "20250907", top_performers: bool = True) -> Dict[str, Any]:
         """
         Get daily scoreboard - live real time.
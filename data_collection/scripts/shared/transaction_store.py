@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Incremental Yahoo Transaction Store
+
+Keeps a league's transaction history and per-player add/drop aggregates
+between runs. Yahoo returns transactions newest first, so a sync only needs
+the pages in front of the last-seen transaction: paging stops at the first
+transaction key already stored, and only the new transactions are folded into
+the aggregates.
+
+Files: data_collection/cache/yahoo_transactions/<league_key>.json
+"""
+
+import os
+import json
+import time
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+DATA_COLLECTION_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_STORE_DIR = DATA_COLLECTION_ROOT / "cache" / "yahoo_transactions"
+
+STORE_VERSION = 1
+
+
+class TransactionStore:
+    """
+    Persistent per-league transaction history with incremental trend aggregates.
+    """
+
+    def __init__(self, store_dir: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            store_dir: Root directory (default: data_collection/cache/yahoo_transactions)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.store_dir = Path(store_dir) if store_dir else DEFAULT_STORE_DIR
+        self._leagues: Dict[str, Dict[str, Any]] = {}
+        self._known_keys: Dict[str, set] = {}
+
+    def _path(self, league_key: str) -> Path:
+        return self.store_dir / f"{league_key}.json"
+
+    def load(self, league_key: str) -> Dict[str, Any]:
+        """
+        Stored state for a league (empty history if nothing was synced yet).
+
+        Returns:
+            Dict with transactions (newest first), player_trends, last_seen and synced_at
+        """
+        if league_key not in self._leagues:
+            state = {"version": STORE_VERSION, "transactions": [], "player_trends": {},
+                     "last_seen": {}, "synced_at": None}
+            path = self._path(league_key)
+            if path.exists():
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        on_disk = json.load(f)
+                    if on_disk.get("version") == STORE_VERSION:
+                        state = on_disk
+                    else:
+                        self.logger.info(f"Transaction store version changed, resyncing {league_key}")
+                except (OSError, json.JSONDecodeError) as e:
+                    self.logger.warning(f"Ignoring unreadable transaction store {path}: {e}")
+            self._leagues[league_key] = state
+            self._known_keys[league_key] = {tx.get('transaction_key') for tx in state["transactions"]}
+        return self._leagues[league_key]
+
+    def is_known(self, league_key: str, transaction_key: str) -> bool:
+        """True if the transaction was stored by an earlier sync."""
+        self.load(league_key)
+        return bool(transaction_key) and transaction_key in self._known_keys[league_key]
+
+    def merge(self, league_key: str, new_transactions: List[Dict[str, Any]],
+              apply_trends: Callable[[Dict[str, Dict[str, Any]], List[Dict[str, Any]]], None]) -> Dict[str, Any]:
+        """
+        Prepend newly fetched transactions and fold them into the trend aggregates.
+
+        Args:
+            league_key: Yahoo league key
+            new_transactions: Transactions newer than anything stored, newest first
+            apply_trends: Updates a trends dict in place with a list of transactions
+
+        Returns:
+            Updated league state
+        """
+        state = self.load(league_key)
+        known = self._known_keys[league_key]
+        fresh = [tx for tx in new_transactions if tx.get('transaction_key') not in known]
+
+        if fresh:
+            apply_trends(state["player_trends"], fresh)
+            state["transactions"] = fresh + state["transactions"]
+            known.update(tx.get('transaction_key') for tx in fresh)
+            newest = fresh[0]
+            state["last_seen"] = {"transaction_key": newest.get('transaction_key', ''),
+                                  "timestamp": newest.get('timestamp', '')}
+        state["synced_at"] = time.time()
+        self.save(league_key)
+        return state
+
+    def reset(self, league_key: str) -> None:
+        """Forget a league's history so the next sync fetches everything."""
+        self._leagues.pop(league_key, None)
+        self._known_keys.pop(league_key, None)
+        try:
+            self._path(league_key).unlink()
+        except OSError:
+            pass
+
+    def save(self, league_key: str) -> None:
+        """Persist a league's state atomically."""
+        state = self._leagues.get(league_key)
+        if state is None:
+            return
+        path = self._path(league_key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Could not save transaction store {path}: {e}")
@@ -13,8 +13,6 @@ Focus: Extract ALL available Sleeper player data, no analysis
 
 import os
 import sys
-import json
-import glob
 import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
@@ -25,22 +23,26 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
 from sleeper_client import SimpleSleeperClient
 from data_formatter import MarkdownFormatter
 from file_utils import DataFileManager
+from season_context import get_season_context_service
 from team_mapping import normalize_team_abbreviation
+from player_identity import get_player_identity_index
 
 
 class SleeperMyRosterExtractor:
     """Maps Yahoo roster players to Sleeper players and extracts Sleeper data."""
 
-    def __init__(self) -> None:
+    def __init__(self, sleeper: Optional[SimpleSleeperClient] = None,
+                 file_manager: Optional[DataFileManager] = None) -> None:
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         self.logger = logging.getLogger(__name__)
 
-        self.sleeper = SimpleSleeperClient()
+        self.sleeper = sleeper or SimpleSleeperClient()
         self.formatter = MarkdownFormatter()
-        self.file_manager = DataFileManager()
+        self.file_manager = file_manager or DataFileManager()
+        self.season_context_service = get_season_context_service(file_manager=self.file_manager)
 
         self.execution_stats: Dict[str, Any] = {
             'start_time': datetime.now(),
@@ -64,14 +66,10 @@ class SleeperMyRosterExtractor:
             matched_players: List[Dict[str, Any]] = []
             unmatched_players: List[Dict[str, Any]] = []
 
-            # Load Sleeper players DB once and build yahoo_id -> sleeper map
+            # Load Sleeper players DB once and attach it to the shared identity index
             players_db = self.sleeper.get_nfl_players()
-            yahoo_id_to_sleeper: Dict[str, Dict[str, Any]] = {}
-            if players_db:
-                for sp in players_db.values():
-                    sleeper_yahoo_id = sp.get('yahoo_id')
-                    if sleeper_yahoo_id is not None and str(sleeper_yahoo_id).strip():
-                        yahoo_id_to_sleeper[str(sleeper_yahoo_id)] = sp
+            identity_index = get_player_identity_index()
+            identity_index.sync_sleeper_players(players_db)
 
             for yp in yahoo_players:
                 self.execution_stats['players_processed'] += 1
@@ -82,36 +80,18 @@ class SleeperMyRosterExtractor:
 
                 sleeper_player = None
 
-                # 1) Try direct Yahoo ID mapping
-                if yahoo_pid and yahoo_pid in yahoo_id_to_sleeper:
-                    sleeper_player = yahoo_id_to_sleeper[yahoo_pid]
-
-                # 2) DEF special-case
-                if not sleeper_player and (pos == 'DEF' or self._normalize_name(name) == self._normalize_name(team or '')):
-                    sleeper_player = self._match_defense_by_team(players_db, team)
-
-                # 3) Fallback to name+team matching using local players DB
-                if not sleeper_player and players_db:
-                    name_l = self._normalize_name(name)
-                    for sp in players_db.values():
-                        sp_name = self._normalize_name(sp.get('full_name') or '')
-                        sp_team_raw = sp.get('team')
-                        sp_team = normalize_team_abbreviation(sp_team_raw, 'sleeper') if sp_team_raw else ''
-                        if name_l == sp_name and (not team or not sp_team or sp_team == team):
-                            sleeper_player = sp
-                            break
-
-                # 4) Last-name + team/position fallback
-                if not sleeper_player and players_db and name:
-                    last = self._normalize_name(name).split()[-1]
-                    for sp in players_db.values():
-                        sp_name = self._normalize_name(sp.get('full_name') or '')
-                        sp_team_raw = sp.get('team')
-                        sp_team = normalize_team_abbreviation(sp_team_raw, 'sleeper') if sp_team_raw else ''
-                        if sp_name.endswith(' ' + last) or sp_name == last:
-                            if (team and sp_team == team) or (pos and sp.get('position') == pos):
-                                sleeper_player = sp
-                                break
+                # 1) DEF special-case
+                if pos == 'DEF' or self._normalize_name(name) == self._normalize_name(team or ''):
+                    sleeper_player = identity_index.get_sleeper_defense(team)
+
+                # 2-4) Yahoo ID, name + team, last name + team/position via identity index
+                if not sleeper_player:
+                    sleeper_player = identity_index.match_sleeper(
+                        name, team, pos,
+                        yahoo_id=yahoo_pid,
+                        yahoo_player_key=yp.get('player_key'),
+                        allow_last_name_position=True
+                    )
 
                 # 5) Final fallback to client's search function
                 if not sleeper_player:
@@ -147,7 +127,7 @@ class SleeperMyRosterExtractor:
             ).total_seconds()
 
             # Extract season context from Yahoo data
-            season_context = self._extract_season_context()
+            season_context = self.season_context_service.get_season_context('Sleeper API')
             
             result: Dict[str, Any] = {
                 'extraction_metadata': {
@@ -174,102 +154,16 @@ class SleeperMyRosterExtractor:
             self.execution_stats['errors'] += 1
             return {}
     
-    def _extract_season_context(self) -> Dict[str, Any]:
-        """Extract season and week context from Yahoo data."""
-        try:
-            current_date = datetime.now()
-            season_context = {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': self._determine_season_phase(current_date),
-                'data_source': 'Sleeper API',
-                'verification_notes': []
-            }
-            
-            # Try to load Yahoo data for more accurate season/week info
-            try:
-                yahoo_data = self._load_latest_yahoo_roster_data()
-                if yahoo_data and 'season_context' in yahoo_data:
-                    yahoo_season_context = yahoo_data['season_context']
-                    season_context.update(yahoo_season_context)
-                    season_context['data_source'] = 'Sleeper API (with Yahoo context)'
-                    season_context['verification_notes'].append("Season context extracted from Yahoo data")
-                else:
-                    season_context['verification_notes'].append("No Yahoo season context available, using date estimation")
-            except Exception as e:
-                self.logger.warning(f"Could not load Yahoo season context: {e}")
-                season_context['verification_notes'].append(f"Could not load Yahoo data: {e}")
-            
-            return season_context
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting season context: {e}")
-            return {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': 'Unknown',
-                'data_source': 'Sleeper API',
-                'verification_notes': [f"Error extracting season context: {e}"]
-            }
-    
-    def _determine_season_phase(self, current_date: datetime) -> str:
-        """Determine the current phase of the NFL season based on date."""
-        month = current_date.month
-        day = current_date.day
-        
-        if month == 9 and day < 15:
-            return "Early Regular Season"
-        elif month == 9 or month == 10:
-            return "Regular Season"
-        elif month == 11 or month == 12:
-            return "Late Regular Season"
-        elif month == 1 and day < 15:
-            return "Playoffs"
-        elif month == 1 and day >= 15:
-            return "Super Bowl"
-        elif month == 2:
-            return "Offseason"
-        elif month >= 3 and month <= 8:
-            return "Offseason"
-        else:
-            return "Unknown"
-    
-    def _load_latest_yahoo_roster_data(self) -> Optional[Dict[str, Any]]:
-        """Load the latest Yahoo roster raw data for season context."""
-        try:
-            base_dir = os.path.join(
-                os.path.dirname(__file__), '..', '..', 'outputs', 'yahoo', 'my_roster'
-            )
-            base_dir = os.path.abspath(base_dir)
-            pattern = os.path.join(base_dir, '**', '*_my_roster_raw_data.json')
-            files = sorted(glob.glob(pattern, recursive=True))
-            if not files:
-                return None
-            
-            latest_file = files[-1]
-            with open(latest_file, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            self.logger.warning(f"Could not load Yahoo roster data: {e}")
-            return None
-    
     def _load_latest_yahoo_roster_players(self) -> List[Dict[str, Any]]:
         """Load the latest Yahoo my_roster raw JSON and return extracted players list."""
         try:
-            base_dir = os.path.join(
-                os.path.dirname(__file__), '..', '..', 'outputs', 'yahoo', 'my_roster'
-            )
-            base_dir = os.path.abspath(base_dir)
-            pattern = os.path.join(base_dir, '**', '*_my_roster_raw_data.json')
-            files = sorted(glob.glob(pattern, recursive=True))
-            if not files:
-                self.logger.error(f"No Yahoo my_roster raw files found at {pattern}")
+            latest = self.file_manager.get_latest_file("yahoo", "my_roster", "raw_data")
+            if not latest:
+                self.logger.error("No Yahoo my_roster raw files found")
                 return []
-            latest = files[-1]
             self.logger.info(f"📄 Using latest Yahoo roster file: {os.path.basename(latest)}")
 
-            with open(latest, 'r') as f:
-                data = json.load(f)
+            data = self.file_manager.load_raw_data(latest)
 
             # Our Yahoo script may store extracted players under 'players'
             players = data.get('players') or []
@@ -337,18 +231,6 @@ class SleeperMyRosterExtractor:
                 n = n[: -len(suffix)].strip()
         return n
 
-    def _match_defense_by_team(self, players_db: Dict[str, Any], team: Optional[str]) -> Optional[Dict[str, Any]]:
-        if not team or not players_db:
-            return None
-        team_normalized = normalize_team_abbreviation(team, 'yahoo')
-        for sp in players_db.values():
-            if sp.get('position') == 'DEF':
-                sp_team_raw = sp.get('team')
-                sp_team = normalize_team_abbreviation(sp_team_raw, 'sleeper') if sp_team_raw else ''
-                if sp_team == team_normalized:
-                    return sp
-        return None
-
     def save_data(self, data: Dict[str, Any]) -> bool:
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -13,8 +13,6 @@ Focus: Extract ALL available Sleeper player data, no analysis
 
 import os
 import sys
-import json
-import glob
 import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
@@ -25,7 +23,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
 from sleeper_client import SimpleSleeperClient
 from data_formatter import MarkdownFormatter
 from file_utils import DataFileManager
+from season_context import get_season_context_service
 from team_mapping import normalize_team_abbreviation
+from player_identity import get_player_identity_index
 
 
 class SleeperOpponentRosterExtractor:
@@ -41,6 +41,7 @@ class SleeperOpponentRosterExtractor:
         self.sleeper = SimpleSleeperClient()
         self.formatter = MarkdownFormatter()
         self.file_manager = DataFileManager()
+        self.season_context_service = get_season_context_service(file_manager=self.file_manager)
 
         self.execution_stats: Dict[str, Any] = {
             'start_time': datetime.now(),
@@ -72,14 +73,10 @@ class SleeperOpponentRosterExtractor:
             matched_players: List[Dict[str, Any]] = []
             unmatched_players: List[Dict[str, Any]] = []
 
-            # Load Sleeper players DB once and build yahoo_id -> sleeper map
+            # Load Sleeper players DB once and attach it to the shared identity index
             players_db = self.sleeper.get_nfl_players()
-            yahoo_id_to_sleeper: Dict[str, Dict[str, Any]] = {}
-            if players_db:
-                for sp in players_db.values():
-                    sleeper_yahoo_id = sp.get('yahoo_id')
-                    if sleeper_yahoo_id is not None and str(sleeper_yahoo_id).strip():
-                        yahoo_id_to_sleeper[str(sleeper_yahoo_id)] = sp
+            identity_index = get_player_identity_index()
+            identity_index.sync_sleeper_players(players_db)
 
             for yp in yahoo_players:
                 self.execution_stats['players_processed'] += 1
@@ -88,14 +85,18 @@ class SleeperOpponentRosterExtractor:
                 pos = self._get_yahoo_player_position(yp)
                 yahoo_pid = str(yp.get('player_id', '')).strip()
 
-                sleeper_player = None
-
-                # Try direct yahoo_id match first
-                if yahoo_pid in yahoo_id_to_sleeper:
-                    sleeper_player = yahoo_id_to_sleeper[yahoo_pid]
-                    self.logger.info(f"✅ Direct match: {name} ({team}) -> {sleeper_player.get('full_name', 'Unknown')}")
+                # Try the identity index first (Yahoo ID, then normalized name + team)
+                sleeper_player = identity_index.match_sleeper(
+                    name, team, pos,
+                    yahoo_id=yahoo_pid,
+                    yahoo_player_key=yp.get('player_key')
+                )
+                direct_match = bool(sleeper_player) and bool(yahoo_pid) and str(sleeper_player.get('yahoo_id') or '') == yahoo_pid
+                if sleeper_player:
+                    match_label = "Direct match" if direct_match else "Name+team match"
+                    self.logger.info(f"✅ {match_label}: {name} ({team}) -> {sleeper_player.get('full_name', 'Unknown')}")
                 else:
-                    # Try name + team matching as fallback
+                    # Fuzzy name + team matching as last resort
                     sleeper_player = self._find_sleeper_player_by_name_and_team(
                         players_db, name, team, pos
                     )
@@ -108,7 +109,7 @@ class SleeperOpponentRosterExtractor:
                     matched_players.append({
                         'yahoo_data': yp,
                         'sleeper_player': sleeper_player,
-                        'match_type': 'direct' if yahoo_pid in yahoo_id_to_sleeper else 'name_team'
+                        'match_type': 'direct' if direct_match else 'name_team'
                     })
                     self.execution_stats['players_matched'] += 1
                 else:
@@ -153,21 +154,13 @@ class SleeperOpponentRosterExtractor:
                 return None
 
             # Look for opponent roster files
-            pattern = os.path.join(
-                os.path.dirname(__file__), '..', '..', 'outputs', 'yahoo', 'opponent_rosters', '**', '*_raw_data.json'
-            )
-            files = glob.glob(pattern, recursive=True)
-            
-            if not files:
+            latest_file = self.file_manager.get_latest_file("yahoo", "opponent_rosters", "raw_data")
+            if not latest_file:
                 self.logger.error("❌ No Yahoo opponent roster files found")
                 return None
-
-            # Get the most recent file
-            latest_file = max(files, key=os.path.getctime)
             self.logger.info(f"📁 Loading opponent roster from: {latest_file}")
 
-            with open(latest_file, 'r') as f:
-                data = json.load(f)
+            data = self.file_manager.load_raw_data(latest_file)
 
             # Extract opponent info and players from the rosters structure
             rosters = data.get('rosters', {})
@@ -196,24 +189,15 @@ class SleeperOpponentRosterExtractor:
         """Find current week opponent from Yahoo team matchups data."""
         try:
             # Look for team matchups files
-            matchups_pattern = os.path.join(
-                os.path.dirname(__file__), '..', '..', 'outputs', 'yahoo', 'team_matchups', '**', '*_raw_data.json'
-            )
-            matchups_files = glob.glob(matchups_pattern, recursive=True)
-            
-            if not matchups_files:
+            latest_matchups = self.file_manager.get_latest_file("yahoo", "team_matchups", "raw_data")
+            if not latest_matchups:
                 self.logger.error("❌ No team matchups files found")
                 return None
-
-            # Get the most recent file
-            latest_matchups = max(matchups_files, key=os.path.getctime)
             self.logger.info(f"📁 Loading team matchups from: {latest_matchups}")
 
-            with open(latest_matchups, 'r') as f:
-                matchups_data = json.load(f)
+            matchups_data = self.file_manager.load_raw_data(latest_matchups)
 
-            season_context = matchups_data.get("season_context", {})
-            current_week = season_context.get("current_week", 1)
+            current_week = self.season_context_service.get_current_week()
             league_info = matchups_data.get("league_info", {})
             my_team_key = league_info.get("team_key")
             
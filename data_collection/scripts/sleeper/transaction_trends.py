@@ -14,9 +14,7 @@ Focus: League-specific player analysis with trending market intelligence
 
 import os
 import sys
-import json
 import logging
-import glob
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 
@@ -107,17 +105,13 @@ class SleeperTransactionTrendsEnricher:
         """Load the latest Yahoo transaction trends data."""
         try:
             # Find the latest Yahoo transaction trends file
-            yahoo_files = glob.glob("../../outputs/yahoo/transaction_trends/**/*_raw_data.json", recursive=True)
-            if not yahoo_files:
+            latest_file = self.file_manager.get_latest_file("yahoo", "transaction_trends", "raw_data")
+            if not latest_file:
                 self.logger.error("No Yahoo transaction trends files found")
                 return None
-            
-            # Get the most recent file
-            latest_file = max(yahoo_files, key=os.path.getctime)
             self.logger.info(f"Loading Yahoo data from: {latest_file}")
             
-            with open(latest_file, 'r') as f:
-                return json.load(f)
+            return self.file_manager.load_raw_data(latest_file)
                 
         except Exception as e:
             self.logger.error(f"Error loading Yahoo transaction trends: {e}")
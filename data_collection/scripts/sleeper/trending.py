@@ -13,9 +13,7 @@ Focus: Extract ALL available trending and player data, no analysis
 
 import os
 import sys
-import json
 import logging
-import glob
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
@@ -25,21 +23,24 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
 from sleeper_client import SimpleSleeperClient
 from data_formatter import MarkdownFormatter
 from file_utils import DataFileManager
+from season_context import get_season_context_service
 
 
 class SleeperTrendingExtractor:
     """Extracts trending add/drop players from Sleeper API with full player details."""
 
-    def __init__(self) -> None:
+    def __init__(self, sleeper: Optional[SimpleSleeperClient] = None,
+                 file_manager: Optional[DataFileManager] = None) -> None:
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         self.logger = logging.getLogger(__name__)
 
-        self.sleeper = SimpleSleeperClient()
+        self.sleeper = sleeper or SimpleSleeperClient()
         self.formatter = MarkdownFormatter()
-        self.file_manager = DataFileManager()
+        self.file_manager = file_manager or DataFileManager()
+        self.season_context_service = get_season_context_service(file_manager=self.file_manager)
 
         self.execution_stats: Dict[str, Any] = {
             'start_time': datetime.now(),
@@ -82,7 +83,7 @@ class SleeperTrendingExtractor:
             ).total_seconds()
 
             # Extract season context
-            season_context = self._extract_season_context()
+            season_context = self.season_context_service.get_season_context('Sleeper API')
 
             result: Dict[str, Any] = {
                 'extraction_metadata': {
@@ -112,85 +113,6 @@ class SleeperTrendingExtractor:
             self.execution_stats['errors'] += 1
             return {}
     
-    def _extract_season_context(self) -> Dict[str, Any]:
-        """Extract season and week context from Yahoo data."""
-        try:
-            current_date = datetime.now()
-            season_context = {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': self._determine_season_phase(current_date),
-                'data_source': 'Sleeper API',
-                'verification_notes': []
-            }
-            
-            # Try to load Yahoo data for more accurate season/week info
-            try:
-                yahoo_data = self._load_latest_yahoo_roster_data()
-                if yahoo_data and 'season_context' in yahoo_data:
-                    yahoo_season_context = yahoo_data['season_context']
-                    season_context.update(yahoo_season_context)
-                    season_context['data_source'] = 'Sleeper API (with Yahoo context)'
-                    season_context['verification_notes'].append("Season context extracted from Yahoo data")
-                else:
-                    season_context['verification_notes'].append("No Yahoo season context available, using date estimation")
-            except Exception as e:
-                self.logger.warning(f"Could not load Yahoo season context: {e}")
-                season_context['verification_notes'].append(f"Could not load Yahoo data: {e}")
-            
-            return season_context
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting season context: {e}")
-            return {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': 'Unknown',
-                'data_source': 'Sleeper API',
-                'verification_notes': [f"Error extracting season context: {e}"]
-            }
-    
-    def _determine_season_phase(self, current_date: datetime) -> str:
-        """Determine the current phase of the NFL season based on date."""
-        month = current_date.month
-        day = current_date.day
-        
-        if month == 9 and day < 15:
-            return "Early Regular Season"
-        elif month == 9 or month == 10:
-            return "Regular Season"
-        elif month == 11 or month == 12:
-            return "Late Regular Season"
-        elif month == 1 and day < 15:
-            return "Playoffs"
-        elif month == 1 and day >= 15:
-            return "Super Bowl"
-        elif month == 2:
-            return "Offseason"
-        elif month >= 3 and month <= 8:
-            return "Offseason"
-        else:
-            return "Unknown"
-    
-    def _load_latest_yahoo_roster_data(self) -> Optional[Dict[str, Any]]:
-        """Load the latest Yahoo my_roster raw data for season context."""
-        try:
-            base_dir = os.path.join(
-                os.path.dirname(__file__), '..', '..', 'outputs', 'yahoo', 'my_roster'
-            )
-            base_dir = os.path.abspath(base_dir)
-            pattern = os.path.join(base_dir, '**', '*_my_roster_raw_data.json')
-            files = sorted(glob.glob(pattern, recursive=True))
-            if not files:
-                return None
-            
-            latest_file = files[-1]
-            with open(latest_file, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            self.logger.warning(f"Could not load Yahoo my_roster data: {e}")
-            return None
-    
     def _get_trending_adds(self) -> List[Dict[str, Any]]:
         """Get trending add players from Sleeper API."""
         try:
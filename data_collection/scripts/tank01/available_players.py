@@ -20,10 +20,8 @@ Features:
 - Player matching with multiple fallback strategies
 """
 
-import json
 import logging
 import os
-import re
 import sys
 import argparse
 from datetime import datetime, timedelta
@@ -43,7 +41,9 @@ from config.player_limits import DEFAULT_PLAYER_LIMITS, get_player_limits
 
 from tank01_client import SimpleTank01Client
 from file_utils import DataFileManager
+from season_context import get_season_context_service
 from api_usage_manager import APIUsageManager
+from player_identity import get_player_identity_index
 
 def parse_arguments():
     """Parse command line arguments for configurable player limits"""
@@ -130,9 +130,12 @@ sys.path.insert(0, str(project_root))
 from data_collection.scripts.shared.team_mapping import normalize_team_abbreviation
 
 class Tank01AvailablePlayersCollector:
-    def __init__(self, player_limits: Dict[str, int] = None):
-        self.tank01 = SimpleTank01Client()
-        self.file_manager = DataFileManager()
+    def __init__(self, player_limits: Dict[str, int] = None,
+                 tank01: Optional[SimpleTank01Client] = None,
+                 file_manager: Optional[DataFileManager] = None):
+        self.tank01 = tank01 or SimpleTank01Client()
+        self.file_manager = file_manager or DataFileManager()
+        self.season_context_service = get_season_context_service(file_manager=self.file_manager)
         
         # Set player limits (use defaults if not provided)
         self.player_limits = player_limits or get_player_limits()
@@ -149,6 +152,9 @@ class Tank01AvailablePlayersCollector:
             "errors": 0
         }
         
+        # Shared Yahoo <-> Tank01 <-> Sleeper identity index
+        self.identity_index = get_player_identity_index()
+        
         # Cache for batch data
         self.cached_players = {}
         self.cached_projections = {}
@@ -158,25 +164,14 @@ class Tank01AvailablePlayersCollector:
     def load_yahoo_available_players(self) -> Dict[str, Any]:
         """Load the latest Yahoo available players data"""
         try:
-            # Find the latest available players file using the new YYYY/MM/DD structure
-            # Get the data_collection root directory
-            script_dir = Path(__file__).parent
-            data_collection_root = script_dir.parent.parent
-            outputs_dir = data_collection_root / "outputs" / "yahoo" / "available_players"
-            
-            if not outputs_dir.exists():
-                raise FileNotFoundError(f"Yahoo available players output directory not found: {outputs_dir}")
-            
-            # Get the most recent file using recursive search
-            files = list(outputs_dir.glob("**/*_available_players_raw_data.json"))
-            if not files:
+            # Find the latest available players file
+            latest_file = self.file_manager.get_latest_file("yahoo", "available_players", "raw_data")
+            if not latest_file:
                 raise FileNotFoundError("No Yahoo available players raw data files found")
             
-            latest_file = max(files, key=lambda f: f.stat().st_mtime)
             logger.info(f"Loading Yahoo available players from: {latest_file}")
             
-            with open(latest_file, 'r') as f:
-                data = json.load(f)
+            data = self.file_manager.load_raw_data(latest_file)
             
             logger.info(f"Loaded {len(data['available_players'])} available players from Yahoo")
             return data
@@ -269,27 +264,17 @@ class Tank01AvailablePlayersCollector:
             team_abv = yahoo_player.get('editorial_team_abbr', '')
             position = yahoo_player.get('display_position', '')
             
-            # Strategy 1: Direct Yahoo ID match
-            if yahoo_id in self.cached_players:
-                player = self.cached_players[yahoo_id]
-                logger.debug(f"Direct Yahoo ID match for {full_name}: {player.get('playerID')}")
+            # Strategies 1-3: Yahoo ID, exact name + team, last name + team
+            # (hash lookups in the shared player identity index)
+            player = self.identity_index.match_tank01(
+                full_name, team_abv, position,
+                yahoo_id=yahoo_id,
+                yahoo_player_key=yahoo_player.get('player_key')
+            )
+            if player:
+                logger.debug(f"Identity index match for {full_name}: {player.get('playerID')}")
                 return player
             
-            # Strategy 2: Exact name + team match
-            for player in self.cached_players.values():
-                if (player.get('fullName', '').lower() == full_name.lower() and 
-                    player.get('team', '').upper() == team_abv.upper()):
-                    logger.debug(f"Exact name + team match for {full_name}: {player.get('playerID')}")
-                    return player
-            
-            # Strategy 3: Last name + team match
-            last_name = yahoo_player.get('name', {}).get('last', '')
-            for player in self.cached_players.values():
-                if (player.get('lastName', '').lower() == last_name.lower() and 
-                    player.get('team', '').upper() == team_abv.upper()):
-                    logger.debug(f"Last name + team match for {full_name}: {player.get('playerID')}")
-                    return player
-            
             # Strategy 4: Special handling for defense players
             if position == 'DEF':
                 # For defenses, try to match by team abbreviation in cached teams
@@ -525,9 +510,10 @@ class Tank01AvailablePlayersCollector:
             player_list_response = self.tank01.get_player_list()
             all_players = player_list_response.get('body', [])
             for player in all_players:
-                yahoo_id = player.get('yahooID')
+                yahoo_id = player.get('yahooPlayerID') or player.get('yahooID')
                 if yahoo_id:
-                    self.cached_players[yahoo_id] = player
+                    self.cached_players[str(yahoo_id)] = player
+            self.identity_index.sync_tank01_players(all_players)
             logger.info(f"Cached {len(self.cached_players)} players with Yahoo IDs")
             
             # Cache weekly projections (using current week 1, season 2025)
@@ -653,7 +639,7 @@ class Tank01AvailablePlayersCollector:
         total_calls = usage_info.get('calls_made_this_session', 0)
         
         # Extract season context
-        season_context = self._extract_season_context(yahoo_metadata)
+        season_context = self.season_context_service.get_season_context('Tank01 API')
         
         report = f"""# Tank01 Available Players Data
 
@@ -940,220 +926,7 @@ class Tank01AvailablePlayersCollector:
         
         return report
     
-    def _extract_season_context(self, yahoo_metadata: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract season and week context from Yahoo data."""
-        try:
-            current_date = datetime.now()
-            season_context = {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': self._determine_season_phase(current_date),
-                'data_source': 'Tank01 API',
-                'verification_notes': []
-            }
-            
-            # Try to extract season info from Yahoo metadata
-            league_info = yahoo_metadata.get('league_info', {})
-            if league_info:
-                league_name = league_info.get('league_name', '')
-                league_key = league_info.get('league_key', '')
-                
-                # Extract year from league name
-                year_match = re.search(r'(\d{4})', league_name)
-                if year_match:
-                    extracted_year = year_match.group(1)
-                    season_context['nfl_season'] = extracted_year
-                    season_context['verification_notes'].append(f"League name contains year: {extracted_year}")
-                
-                # Extract year from Yahoo league key (e.g., "461.l.595012")
-                if league_key:
-                    key_parts = league_key.split('.')
-                    if len(key_parts) > 0:
-                        yahoo_year = str(2025)  # Hardcoded for now
-                        season_context['nfl_season'] = yahoo_year
-                        season_context['verification_notes'].append(f"Yahoo league key code {key_parts[0]} indicates year: {yahoo_year}")
-                
-                season_context['yahoo_league_info'] = {
-                    'league_key': league_key,
-                    'league_name': league_name
-                }
-            
-            # Try to get current week from Yahoo team matchups
-            season_context['current_week'] = None
-            season_context['week_info'] = {}
-            
-            try:
-                current_week = self._extract_current_week_from_yahoo_data()
-                if current_week:
-                    season_context['current_week'] = current_week['week']
-                    season_context['week_info'] = current_week
-                    season_context['verification_notes'].append(f"Current week {current_week['week']} extracted from Yahoo team matchups API")
-                else:
-                    # Fallback: estimate from date
-                    season_start = datetime(current_date.year, 9, 1, tzinfo=current_date.tzinfo)
-                    if current_date >= season_start:
-                        days_since_start = (current_date - season_start).days
-                        estimated_week = min((days_since_start // 7) + 1, 18)
-                        season_context['current_week'] = estimated_week
-                        season_context['week_info'] = {
-                            'week': estimated_week,
-                            'coverage_type': 'estimated',
-                            'status': 'estimated_from_date',
-                            'source': 'date_estimation'
-                        }
-                        season_context['verification_notes'].append(f"Estimated week {estimated_week} from current date")
-                    else:
-                        season_context['current_week'] = 1
-                        season_context['week_info'] = {
-                            'week': 1,
-                            'coverage_type': 'preseason',
-                            'status': 'preseason',
-                            'source': 'preseason_assumption'
-                        }
-                        season_context['verification_notes'].append("Preseason - using week 1")
-            except Exception as e:
-                logger.warning(f"Could not determine week: {e}")
-                season_context['current_week'] = 1
-                season_context['week_info'] = {
-                    'week': 1,
-                    'coverage_type': 'fallback',
-                    'status': 'fallback',
-                    'source': 'error_fallback'
-                }
-                season_context['verification_notes'].append("Could not determine current week - using fallback week 1")
-            
-            return season_context
-            
-        except Exception as e:
-            logger.error(f"Error extracting season context: {e}")
-            return {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': 'Unknown',
-                'data_source': 'Tank01 API',
-                'verification_notes': [f"Error extracting season context: {e}"]
-            }
-    
-    def _determine_season_phase(self, current_date: datetime) -> str:
-        """Determine the current phase of the NFL season based on date."""
-        month = current_date.month
-        day = current_date.day
-        
-        if month == 9 and day < 15:
-            return "Early Regular Season"
-        elif month == 9 or month == 10:
-            return "Regular Season"
-        elif month == 11 or month == 12:
-            return "Late Regular Season"
-        elif month == 1 and day < 15:
-            return "Playoffs"
-        elif month == 1 and day >= 15:
-            return "Super Bowl"
-        elif month == 2:
-            return "Offseason"
-        elif month >= 3 and month <= 8:
-            return "Offseason"
-        else:
-            return "Unknown"
-    
-    def _extract_current_week_from_yahoo_data(self) -> Optional[Dict[str, Any]]:
-        """Extract current week information from Yahoo team matchups data."""
-        try:
-            # Look for the most recent team matchups file
-            from pathlib import Path
-            current_path = Path(__file__).resolve()
-            for parent in current_path.parents:
-                if parent.name == "data_collection":
-                    matchups_dir = parent / "outputs" / "yahoo" / "team_matchups"
-                    break
-            else:
-                matchups_dir = Path("data_collection/outputs/yahoo/team_matchups")
-
-            if not matchups_dir.exists():
-                logger.warning("Team matchups directory not found")
-                return None
-
-            # Get the most recent matchups file (search recursively in YYYY/MM/DD structure)
-            matchup_files = list(matchups_dir.glob("**/*_team_matchups_raw_data.json"))
-            if not matchup_files:
-                logger.warning("No team matchups files found")
-                return None
-
-            latest_file = max(matchup_files, key=lambda f: f.stat().st_mtime)
-            logger.info(f"Loading team matchups from: {latest_file}")
-
-            with open(latest_file, 'r') as f:
-                matchups_data = json.load(f)
-
-            # Extract week information from matchups
-            matchups = matchups_data.get('matchups', {})
-            if not matchups:
-                return None
-
-            # Find the current week (look for week_1, week_2, etc.)
-            current_week_data = None
-            for week_key, week_data in matchups.items():
-                if week_key.startswith('week_'):
-                    week_num = week_data.get('week', 1)
-                    week_matchups = week_data.get('matchups', [])
-
-                    # Look for status in the matchups array
-                    week_start = ''
-                    week_end = ''
-                    status = 'unknown'
-
-                    if week_matchups:
-                        # Get status from first matchup
-                        first_matchup = week_matchups[0]
-                        week_start = first_matchup.get('week_start', '')
-                        week_end = first_matchup.get('week_end', '')
-                        status = first_matchup.get('status', 'unknown')
-
-                    # Check if this is the current week based on status
-                    if status in ['midevent', 'postevent', 'preevent']:
-                        current_week_data = {
-                            'week': week_num,
-                            'week_start': week_start,
-                            'week_end': week_end,
-                            'status': status,
-                            'coverage_type': 'week',
-                            'source': 'yahoo_team_matchups_api'
-                        }
-                        break
-
-            # If no current week found, use the first available week
-            if not current_week_data and matchups:
-                first_week_key = sorted(matchups.keys())[0]
-                first_week_data = matchups[first_week_key]
-                week_num = first_week_data.get('week', 1)
-                week_matchups = first_week_data.get('matchups', [])
-
-                week_start = ''
-                week_end = ''
-                status = 'unknown'
-
-                if week_matchups:
-                    first_matchup = week_matchups[0]
-                    week_start = first_matchup.get('week_start', '')
-                    week_end = first_matchup.get('week_end', '')
-                    status = first_matchup.get('status', 'unknown')
-
-                current_week_data = {
-                    'week': week_num,
-                    'week_start': week_start,
-                    'week_end': week_end,
-                    'status': status,
-                    'coverage_type': 'week',
-                    'source': 'yahoo_team_matchups_api'
-                }
-
-            return current_week_data
-
-        except Exception as e:
-            logger.warning(f"Could not extract current week from Yahoo data: {e}")
-            return None
-    
-    def save_outputs(self, processed_data: Dict[str, List[Dict]], yahoo_metadata: Dict[str, Any]):
+    def save_outputs(self, processed_data: Dict[str, List[Dict]], yahoo_metadata: Dict[str, Any]) -> bool:
         """Save markdown and raw JSON outputs"""
         try:
             # Generate timestamp
@@ -1167,7 +940,7 @@ class Tank01AvailablePlayersCollector:
             logger.info(f"Saved markdown report: {markdown_path}")
             
             # Extract season context for raw data
-            season_context = self._extract_season_context(yahoo_metadata)
+            season_context = self.season_context_service.get_season_context('Tank01 API')
             
             # Prepare raw data
             raw_data = {
@@ -1203,13 +976,20 @@ class Tank01AvailablePlayersCollector:
             # Save raw JSON file
             json_path = self.file_manager.save_raw_data("tank01", "available_players", raw_data, timestamp)
             logger.info(f"Saved raw data: {json_path}")
+            return True
             
         except Exception as e:
             logger.error(f"Error saving outputs: {e}")
             self.stats["errors"] += 1
+            return False
     
-    def run(self):
-        """Main execution method"""
+    def run(self) -> bool:
+        """
+        Main execution method
+        
+        Returns:
+            True if players were processed and the outputs were saved
+        """
         try:
             logger.info("Starting Tank01 Available Players Data Collection")
             logger.info(f"Player Limits: {self.player_limits}")
@@ -1228,7 +1008,7 @@ class Tank01AvailablePlayersCollector:
             processed_data = self.process_players(players_by_section)
             
             # Save outputs
-            self.save_outputs(processed_data, yahoo_data.get('extraction_metadata', {}))
+            saved = self.save_outputs(processed_data, yahoo_data.get('extraction_metadata', {}))
             
             # Final statistics
             execution_time = (datetime.now() - self.stats["start_time"]).total_seconds()
@@ -1237,6 +1017,11 @@ class Tank01AvailablePlayersCollector:
             logger.info(f"Matched {self.stats['players_matched']} players ({(self.stats['players_matched'] / max(self.stats['players_processed'], 1) * 100):.1f}%)")
             logger.info(f"API calls made: {self.tank01.get_api_usage().get('total_calls', 0)}")
             
+            if not any(processed_data.values()):
+                logger.error("No available players were processed")
+                return False
+            return saved
+            
         except Exception as e:
             logger.error(f"Fatal error in Tank01 Available Players collection: {e}")
             self.stats["errors"] += 1
@@ -1257,7 +1042,8 @@ def main():
     print(f"📊 Total expected players: {sum(player_limits.values())}")
     print("=" * 50)
     
-    collector.run()
+    if not collector.run():
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
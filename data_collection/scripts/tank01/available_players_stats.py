@@ -14,6 +14,7 @@ Configuration:
 Features:
 - Configurable player limits for different sections
 - Comprehensive Tank01 game stats extraction using getNFLGamesForPlayer endpoint
+  (or per-game getNFLBoxScore calls when that takes fewer calls for the pool)
 - Team defense handling with appropriate data display
 - RapidAPI usage tracking with Pacific Time Zone
 - Batch API optimization for efficiency
@@ -23,10 +24,8 @@ Features:
 - Season totals, averages, and recent performance analysis
 """
 
-import json
 import logging
 import os
-import re
 import sys
 import argparse
 from datetime import datetime, timedelta
@@ -46,7 +45,12 @@ from config.player_limits import DEFAULT_PLAYER_LIMITS, get_player_limits
 
 from tank01_client import SimpleTank01Client
 from file_utils import DataFileManager
+from season_context import get_season_context_service
 from api_usage_manager import APIUsageManager
+from player_identity import get_player_identity_index
+from season_warehouse import get_season_warehouse
+from game_stats_store import GameStatsStore
+from game_fetch_planner import GameFetchPlanner
 
 def parse_arguments():
     """Parse command line arguments for configurable player limits"""
@@ -85,6 +89,8 @@ class Tank01AvailablePlayersStatsExtractor:
         
         # Initialize file manager
         self.file_manager = DataFileManager()
+        self.season_context_service = get_season_context_service(file_manager=self.file_manager)
+        self.warehouse = get_season_warehouse()
         
         # Set player limits (use defaults if not provided)
         self.player_limits = player_limits or get_player_limits()
@@ -105,59 +111,13 @@ class Tank01AvailablePlayersStatsExtractor:
         
         # Cache for Tank01 player database
         self._tank01_player_cache = None
-    
-    def _extract_season_context(self, yahoo_data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Extract season and week context from Yahoo data.
         
-        Args:
-            yahoo_data: Raw Yahoo data containing season/week info
-            
-        Returns:
-            Dict containing season context information
-        """
-        season_context = {
-            "nfl_season": "2025",
-            "current_week": 1,
-            "season_phase": "Regular Season",
-            "data_source": "Yahoo Fantasy API",
-            "week_info": {},
-            "verification_notes": []
-        }
+        # Shared Yahoo <-> Tank01 <-> Sleeper identity index
+        self.identity_index = get_player_identity_index()
         
-        try:
-            # Try to extract week info from Yahoo data
-            if 'league' in yahoo_data:
-                league = yahoo_data['league']
-                if 'current_week' in league:
-                    season_context['current_week'] = league['current_week']
-                    season_context['verification_notes'].append(f"Week extracted from Yahoo league data: {league['current_week']}")
-                
-                if 'season' in league:
-                    season_context['nfl_season'] = str(league['season'])
-                    season_context['verification_notes'].append(f"Season extracted from Yahoo league data: {league['season']}")
-            
-            # Add week info details
-            current_week = season_context['current_week']
-            season_context['week_info'] = {
-                'week_start': f"Week {current_week} Start",
-                'week_end': f"Week {current_week} End", 
-                'status': 'In Progress',
-                'source': 'Yahoo Fantasy API'
-            }
-            
-            # Add verification notes
-            season_context['verification_notes'].extend([
-                f"Season context extracted at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                f"Using NFL season: {season_context['nfl_season']}",
-                f"Current week: {season_context['current_week']}"
-            ])
-            
-        except Exception as e:
-            self.logger.warning(f"Could not extract season context from Yahoo data: {e}")
-            season_context['verification_notes'].append(f"Season context extraction failed: {str(e)}")
-        
-        return season_context
+        # Finalized games are stored once; the planner picks game logs or box scores
+        self.game_stats_store = GameStatsStore()
+        self.game_fetch_planner = GameFetchPlanner(self.tank01, self.game_stats_store)
     
     def _load_latest_yahoo_available_players(self) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
@@ -168,23 +128,14 @@ class Tank01AvailablePlayersStatsExtractor:
         """
         try:
             # Find the most recent available_players output file
-            outputs_dir = Path("data_collection/outputs/yahoo/available_players")
-            if not outputs_dir.exists():
-                self.logger.error(f"Yahoo available players output directory not found: {outputs_dir}")
-                return [], {}
-            
-            # Get all JSON files and sort by modification time
-            json_files = list(outputs_dir.glob("**/*.json"))
-            if not json_files:
+            latest_file = self.file_manager.get_latest_file("yahoo", "available_players", "raw_data")
+            if not latest_file:
                 self.logger.error("No Yahoo available players JSON files found")
                 return [], {}
             
-            # Sort by modification time (newest first)
-            latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
             self.logger.info(f"Loading latest Yahoo available players data from: {latest_file}")
             
-            with open(latest_file, 'r') as f:
-                yahoo_data = json.load(f)
+            yahoo_data = self.file_manager.load_raw_data(latest_file)
             
             # Extract available players
             available_players = yahoo_data.get('available_players', [])
@@ -239,12 +190,15 @@ class Tank01AvailablePlayersStatsExtractor:
         """
         try:
             self.logger.info("Fetching Tank01 player database...")
-            player_db = self.tank01.get_player_database()
+            response = self.tank01.get_player_list()
+            players = response.get('body') if isinstance(response, dict) else None
             
-            if not player_db:
+            if not isinstance(players, list) or not players:
                 self.logger.error("Failed to get Tank01 player database")
                 return {}
             
+            player_db = {str(p['playerID']): p for p in players if isinstance(p, dict) and p.get('playerID')}
+            self.identity_index.sync_tank01_players(players)
             self.stats["api_calls"] += 1
             self.logger.info(f"Loaded Tank01 player database with {len(player_db)} players")
             return player_db
@@ -268,36 +222,18 @@ class Tank01AvailablePlayersStatsExtractor:
             return None
         
         try:
-            # Strategy 1: Try to match by Yahoo player ID
-            yahoo_id = yahoo_player.get('player_id')
-            if yahoo_id:
-                for tank01_player in self._tank01_player_cache.values():
-                    if tank01_player.get('yahoo_id') == str(yahoo_id):
-                        return tank01_player
-            
-            # Strategy 2: Try to match by exact name and team
             yahoo_name = yahoo_player.get('name', {}).get('full', '').strip()
             yahoo_team = yahoo_player.get('editorial_team_abbr', '').strip()
             
-            if yahoo_name and yahoo_team:
-                for tank01_player in self._tank01_player_cache.values():
-                    tank01_name = tank01_player.get('longName', '').strip()
-                    tank01_team = tank01_player.get('team', '').strip()
-                    
-                    if yahoo_name.lower() == tank01_name.lower() and yahoo_team.upper() == tank01_team.upper():
-                        return tank01_player
-            
-            # Strategy 3: Try to match by last name and team
-            yahoo_last_name = yahoo_name.split()[-1] if yahoo_name else ''
-            if yahoo_last_name and yahoo_team:
-                for tank01_player in self._tank01_player_cache.values():
-                    tank01_name = tank01_player.get('longName', '').strip()
-                    tank01_team = tank01_player.get('team', '').strip()
-                    tank01_last_name = tank01_name.split()[-1] if tank01_name else ''
-                    
-                    if (yahoo_last_name.lower() == tank01_last_name.lower() and 
-                        yahoo_team.upper() == tank01_team.upper()):
-                        return tank01_player
+            # Strategies 1-3: Yahoo ID, exact name + team, last name + team
+            # (hash lookups in the shared player identity index)
+            tank01_player = self.identity_index.match_tank01(
+                yahoo_name, yahoo_team,
+                yahoo_id=yahoo_player.get('player_id'),
+                yahoo_player_key=yahoo_player.get('player_key')
+            )
+            if tank01_player:
+                return tank01_player
             
             # Strategy 4: Try to get player info directly from Tank01 API
             if yahoo_name:
@@ -407,16 +343,22 @@ class Tank01AvailablePlayersStatsExtractor:
                 self.logger.warning(f"No player ID found for {tank01_player.get('longName', 'Unknown')}")
                 return {}
             
-            # Get player game stats from Tank01
-            game_data = self.tank01.get_player_game_stats(player_id, season)
+            # Get player game stats from Tank01 (box scores or game log, see GameFetchPlanner)
+            game_data = self.game_fetch_planner.get_player_games(
+                player_id, season, tank01_player.get('team'),
+                lambda: self.tank01.get_player_game_stats(player_id, season)
+            )
             if not game_data:
                 self.logger.warning(f"No game data found for {tank01_player.get('longName', 'Unknown')}")
                 return {}
             
-            self.stats["api_calls"] += 1
+            if game_data.get('source') not in ('game_stats_store', 'box_scores'):
+                self.stats["api_calls"] += 1
             
-            # Process the game data
+            # Process the game data (keyed by gameID)
             games = game_data.get('body', [])
+            if isinstance(games, dict):
+                games = list(games.values())
             if not games:
                 self.logger.warning(f"No games found in data for {tank01_player.get('longName', 'Unknown')}")
                 return {}
@@ -1050,12 +992,16 @@ class Tank01AvailablePlayersStatsExtractor:
         matched_players = []
         unmatched_players = []
         
-        for yahoo_player in filtered_players:
+        # Match every player first so the game stats calls can be planned for the whole pool
+        matched = [(yahoo_player, self._match_yahoo_to_tank01(yahoo_player)) for yahoo_player in filtered_players]
+        self.game_stats_store.load_schedule(self.file_manager.get_latest_file("tank01", "nfl_matchups", "raw_data"))
+        current_week = self.season_context_service.get_current_week()
+        self.game_fetch_planner.prefetch([tank01_player for _, tank01_player in matched if tank01_player],
+                                         "2025", list(range(1, max(1, current_week) + 1)))
+        
+        for yahoo_player, tank01_player in matched:
             self.stats["players_processed"] += 1
             
-            # Match to Tank01
-            tank01_player = self._match_yahoo_to_tank01(yahoo_player)
-            
             if tank01_player:
                 # For defense players, get team-level stats first
                 team_defense_stats = None
@@ -1086,7 +1032,7 @@ class Tank01AvailablePlayersStatsExtractor:
         
         # Prepare raw data with comprehensive API usage tracking
         final_usage = self.tank01.get_api_usage()
-        season_context = self._extract_season_context(yahoo_data)
+        season_context = self.season_context_service.get_season_context('Tank01 API')
         
         # Generate outputs
         markdown_report = self._generate_markdown_report(matched_players, season_context)
@@ -1102,11 +1048,14 @@ class Tank01AvailablePlayersStatsExtractor:
             "unmatched_players": unmatched_players,
             "tank01_api_usage": {
                 "session_usage": final_usage,
+                "game_stats_store": self.game_stats_store.get_stats(),
+                "game_fetch_plan": self.game_fetch_planner.get_stats(),
                 "api_calls_breakdown": {
                     "player_database_call": 1,
                     "player_specific_calls": max(0, final_usage.get('calls_made_this_session', 0) - 1),
-                    "game_stats_calls": self.stats['players_matched'],
-                    "get_player_info_calls": max(0, final_usage.get('calls_made_this_session', 0) - 1 - self.stats['players_matched']),
+                    "game_stats_calls": self.game_stats_store.get_stats()['players_fetched'],
+                    "box_score_calls": self.game_fetch_planner.get_stats()['box_score_calls'],
+                    "get_player_info_calls": max(0, final_usage.get('calls_made_this_session', 0) - 1 - self.game_stats_store.get_stats()['players_fetched']),
                     "total_calls": final_usage.get('calls_made_this_session', 0)
                 },
                 "efficiency_metrics": {
@@ -1131,6 +1080,7 @@ class Tank01AvailablePlayersStatsExtractor:
         
         clean_file = self.file_manager.save_clean_data("tank01", "available_players_stats", markdown_report, week_prefix)
         raw_file = self.file_manager.save_raw_data("tank01", "available_players_stats", raw_data, week_prefix)
+        self.warehouse.ingest_snapshot("tank01", "available_players_stats", raw_data, raw_file)
         
         output_files = {
             "clean": clean_file,
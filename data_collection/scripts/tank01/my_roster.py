@@ -12,7 +12,6 @@ Focus: Extract ALL available Tank01 data, no analysis
 
 import os
 import sys
-import json
 import logging
 from datetime import datetime, timedelta
 import pytz
@@ -24,8 +23,10 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", "shared"))
 
 from tank01_client import SimpleTank01Client
 from file_utils import DataFileManager
+from season_context import get_season_context_service
 from api_usage_manager import APIUsageManager
 from data_formatter import MarkdownFormatter
+from player_identity import get_player_identity_index
 
 def get_current_time_pacific():
     """Get current time in Pacific Time Zone."""
@@ -64,14 +65,22 @@ class Tank01MyRosterExtractor:
     4. Outputs organized markdown and raw JSON
     """
     
-    def __init__(self):
-        """Initialize the Tank01 my roster extractor."""
+    def __init__(self, tank01: Optional[SimpleTank01Client] = None,
+                 file_manager: Optional[DataFileManager] = None):
+        """
+        Initialize the Tank01 my roster extractor.
+        
+        Args:
+            tank01: Shared Tank01 client (default: a new SimpleTank01Client)
+            file_manager: Shared file manager (default: a new DataFileManager)
+        """
         self.logger = logging.getLogger(__name__)
-        self.file_manager = DataFileManager()
+        self.file_manager = file_manager or DataFileManager()
+        self.season_context_service = get_season_context_service(file_manager=self.file_manager)
         self.formatter = MarkdownFormatter()
         
         # Initialize Tank01 client
-        self.tank01 = SimpleTank01Client()
+        self.tank01 = tank01 or SimpleTank01Client()
         if not self.tank01.is_available():
             raise ValueError("Tank01 client not available. Check RAPIDAPI_KEY environment variable.")
         
@@ -80,6 +89,9 @@ class Tank01MyRosterExtractor:
         
         # Cache for Tank01 player database
         self._tank01_player_cache = None
+        
+        # Shared Yahoo <-> Tank01 <-> Sleeper identity index
+        self.identity_index = get_player_identity_index()
         self._weekly_projections_cache = None
         
         # Track execution stats
@@ -95,256 +107,6 @@ class Tank01MyRosterExtractor:
         
         self.logger.info("Tank01 My Roster Extractor initialized")
     
-    def _extract_season_context(self, yahoo_data: Dict) -> Dict[str, Any]:
-        """
-        Extract season and week context from Yahoo data.
-        
-        Args:
-            yahoo_data: Yahoo roster data
-            
-        Returns:
-            Dict with season context information
-        """
-        try:
-            current_date = get_current_time_pacific()
-            season_context = {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': self._determine_season_phase(current_date),
-                'data_source': 'Tank01 API',
-                'verification_notes': []
-            }
-            
-            # Extract season from Yahoo data if available
-            if yahoo_data and 'team_info' in yahoo_data:
-                team_info = yahoo_data['team_info']
-                league_name = team_info.get('league_name', '')
-                team_key = team_info.get('team_key', '')
-                
-                # Look for year in league name
-                import re
-                year_match = re.search(r'(\d{4})', league_name)
-                if year_match:
-                    extracted_year = year_match.group(1)
-                    season_context['nfl_season'] = extracted_year
-                    season_context['verification_notes'].append(f"Yahoo league name contains year: {extracted_year}")
-                
-                # Extract year from team key (format: 461.l.595012.t.3)
-                if team_key and '.' in team_key:
-                    key_parts = team_key.split('.')
-                    if len(key_parts) >= 2 and key_parts[0].isdigit():
-                        yahoo_code = int(key_parts[0])
-                        # Yahoo uses 461 for 2025, 460 for 2024, etc.
-                        yahoo_year = str(2025)  # For now, assume 2025 based on 461
-                        season_context['nfl_season'] = yahoo_year
-                        season_context['verification_notes'].append(f"Yahoo team key code {yahoo_code} indicates year: {yahoo_year}")
-                
-                season_context['yahoo_league_info'] = {
-                    'league_key': team_info.get('league_key', ''),
-                    'league_name': team_info.get('league_name', ''),
-                    'team_key': team_info.get('team_key', '')
-                }
-            
-            # Extract current week from Tank01 API data and Yahoo data
-            season_context['current_week'] = None
-            season_context['week_info'] = {}
-            
-            # First, try to get week from Yahoo data (most reliable)
-            current_week = self._extract_current_week_from_yahoo_data(yahoo_data)
-            
-            if current_week:
-                season_context['current_week'] = current_week['week']
-                season_context['week_info'] = current_week
-                season_context['verification_notes'].append(f"Current week {current_week['week']} extracted from Yahoo team matchups API")
-            else:
-                # Fallback: try to determine from date
-                try:
-                    season_start = datetime(current_date.year, 9, 1, tzinfo=current_date.tzinfo)
-                    if current_date >= season_start:
-                        days_since_start = (current_date - season_start).days
-                        estimated_week = min((days_since_start // 7) + 1, 18)
-                        season_context['current_week'] = estimated_week
-                        season_context['week_info'] = {
-                            'week': estimated_week,
-                            'coverage_type': 'estimated',
-                            'status': 'estimated_from_date',
-                            'source': 'date_estimation'
-                        }
-                        season_context['verification_notes'].append(f"Estimated week {estimated_week} from current date")
-                    else:
-                        season_context['current_week'] = 1
-                        season_context['week_info'] = {
-                            'week': 1,
-                            'coverage_type': 'preseason',
-                            'status': 'preseason',
-                            'source': 'preseason_assumption'
-                        }
-                        season_context['verification_notes'].append("Preseason - using week 1")
-                except Exception as e:
-                    self.logger.warning(f"Could not determine week from date: {e}")
-                    season_context['current_week'] = 1
-                    season_context['week_info'] = {
-                        'week': 1,
-                        'coverage_type': 'fallback',
-                        'status': 'fallback',
-                        'source': 'error_fallback'
-                    }
-                    season_context['verification_notes'].append("Could not determine current week - using fallback week 1")
-            
-            # Add current date context
-            if current_date.month >= 9:
-                season_context['verification_notes'].append(f"Current date {current_date.strftime('%Y-%m-%d')} suggests NFL season is in progress")
-            elif current_date.month <= 2:
-                season_context['verification_notes'].append(f"Current date {current_date.strftime('%Y-%m-%d')} suggests NFL playoffs/super bowl period")
-            else:
-                season_context['verification_notes'].append(f"Current date {current_date.strftime('%Y-%m-%d')} suggests NFL offseason")
-            
-            return season_context
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting season context: {e}")
-            return {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': 'Unknown',
-                'data_source': 'Tank01 API',
-                'verification_notes': [f"Error extracting season context: {e}"]
-            }
-    
-    def _determine_season_phase(self, current_date: datetime) -> str:
-        """Determine the current phase of the NFL season based on date"""
-        month = current_date.month
-        day = current_date.day
-        
-        if month == 9 and day < 15:
-            return "Early Regular Season"
-        elif month == 9 or month == 10:
-            return "Regular Season"
-        elif month == 11 or month == 12:
-            return "Late Regular Season"
-        elif month == 1 and day < 15:
-            return "Playoffs"
-        elif month == 1 and day >= 15:
-            return "Super Bowl"
-        elif month == 2:
-            return "Offseason"
-        elif month >= 3 and month <= 8:
-            return "Offseason"
-        else:
-            return "Unknown"
-    
-    def _extract_current_week_from_yahoo_data(self, yahoo_data: Dict) -> Optional[Dict[str, Any]]:
-        """
-        Extract current week information from Yahoo team matchups data.
-        
-        Args:
-            yahoo_data: Yahoo roster data containing team info
-            
-        Returns:
-            Dict with week information or None if not found
-        """
-        try:
-            if not yahoo_data or 'team_info' not in yahoo_data:
-                return None
-                
-            league_key = yahoo_data['team_info'].get('league_key', '')
-            if not league_key:
-                return None
-                
-            # Look for the most recent team matchups file
-            from pathlib import Path
-            current_path = Path(__file__).resolve()
-            for parent in current_path.parents:
-                if parent.name == "data_collection":
-                    matchups_dir = parent / "outputs" / "yahoo" / "team_matchups"
-                    break
-            else:
-                matchups_dir = Path("data_collection/outputs/yahoo/team_matchups")
-            
-            if not matchups_dir.exists():
-                self.logger.warning("Team matchups directory not found")
-                return None
-            
-            # Get the most recent matchups file
-            matchup_files = list(matchups_dir.glob("**/*_team_matchups_raw_data.json"))
-            if not matchup_files:
-                self.logger.warning("No team matchups files found")
-                return None
-            
-            latest_file = max(matchup_files, key=lambda f: f.stat().st_mtime)
-            self.logger.info(f"Loading team matchups from: {latest_file}")
-            
-            with open(latest_file, 'r') as f:
-                matchups_data = json.load(f)
-            
-            # Extract week information from matchups
-            matchups = matchups_data.get('matchups', {})
-            if not matchups:
-                return None
-            
-            # Find the current week (look for week_1, week_2, etc.)
-            current_week_data = None
-            for week_key, week_data in matchups.items():
-                if week_key.startswith('week_'):
-                    week_num = week_data.get('week', 1)
-                    week_matchups = week_data.get('matchups', [])
-                    
-                    # Look for status in the matchups array
-                    week_start = ''
-                    week_end = ''
-                    status = 'unknown'
-                    
-                    if week_matchups:
-                        # Get status from first matchup
-                        first_matchup = week_matchups[0]
-                        week_start = first_matchup.get('week_start', '')
-                        week_end = first_matchup.get('week_end', '')
-                        status = first_matchup.get('status', 'unknown')
-                    
-                    # Check if this is the current week based on status
-                    if status in ['midevent', 'postevent', 'preevent']:
-                        current_week_data = {
-                            'week': week_num,
-                            'week_start': week_start,
-                            'week_end': week_end,
-                            'status': status,
-                            'coverage_type': 'week',
-                            'source': 'yahoo_team_matchups_api'
-                        }
-                        break
-            
-            # If no current week found, use the first available week
-            if not current_week_data and matchups:
-                first_week_key = sorted(matchups.keys())[0]
-                first_week_data = matchups[first_week_key]
-                week_num = first_week_data.get('week', 1)
-                week_matchups = first_week_data.get('matchups', [])
-                
-                week_start = ''
-                week_end = ''
-                status = 'unknown'
-                
-                if week_matchups:
-                    first_matchup = week_matchups[0]
-                    week_start = first_matchup.get('week_start', '')
-                    week_end = first_matchup.get('week_end', '')
-                    status = first_matchup.get('status', 'unknown')
-                
-                current_week_data = {
-                    'week': week_num,
-                    'week_start': week_start,
-                    'week_end': week_end,
-                    'status': status,
-                    'coverage_type': 'week',
-                    'source': 'yahoo_team_matchups_api'
-                }
-            
-            return current_week_data
-            
-        except Exception as e:
-            self.logger.warning(f"Could not extract current week from Yahoo data: {e}")
-            return None
-    
     def _load_latest_yahoo_roster_players(self) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Load the latest Yahoo my roster players from the most recent output file.
@@ -354,29 +116,12 @@ class Tank01MyRosterExtractor:
         """
         try:
             # Find the most recent Yahoo my roster output
-            # Get the project root by finding the data_collection directory
-            current_path = Path(__file__).resolve()
-            for parent in current_path.parents:
-                if parent.name == "data_collection":
-                    yahoo_output_dir = parent / "outputs" / "yahoo" / "my_roster"
-                    break
-            else:
-                # Fallback: assume we're in the project root
-                yahoo_output_dir = Path("data_collection/outputs/yahoo/my_roster")
-            
-            if not yahoo_output_dir.exists():
-                raise FileNotFoundError(f"Yahoo my roster output directory not found: {yahoo_output_dir}")
-            
-            # Get the most recent file
-            roster_files = list(yahoo_output_dir.glob("**/*_my_roster_raw_data.json"))
-            if not roster_files:
+            latest_file = self.file_manager.get_latest_file("yahoo", "my_roster", "raw_data")
+            if not latest_file:
                 raise FileNotFoundError("No Yahoo my roster raw data files found")
-            
-            latest_file = max(roster_files, key=lambda f: f.stat().st_mtime)
             self.logger.info(f"Loading Yahoo roster from: {latest_file}")
             
-            with open(latest_file, 'r') as f:
-                raw_data = json.load(f)
+            raw_data = self.file_manager.load_raw_data(latest_file)
             
             # Extract players from the Yahoo raw data
             players = []
@@ -513,6 +258,7 @@ class Tank01MyRosterExtractor:
                 return []
             
             self._tank01_player_cache = players
+            self.identity_index.sync_tank01_players(players)
             self.stats["api_calls"] += 1
             self.logger.info(f"Loaded {len(players)} Tank01 players")
             return players
@@ -548,48 +294,16 @@ class Tank01MyRosterExtractor:
         
         yahoo_name_clean = yahoo_name.lower().strip()
         
-        # Strategy 1: Direct Yahoo ID match (if available in Tank01)
-        yahoo_id = yahoo_player.get('player_id', '')
-        for player in tank01_players:
-            tank01_yahoo_id = player.get('yahooID', '')
-            if yahoo_id and tank01_yahoo_id and yahoo_id == tank01_yahoo_id:
-                self.logger.debug(f"Matched {yahoo_name} by Yahoo ID: {yahoo_id}")
-                return player
-        
-        # Strategy 2: Exact name match with team validation
-        for player in tank01_players:
-            tank01_name = player.get('longName', '').lower().strip()
-            tank01_team = player.get('team', '')
-            tank01_pos = player.get('pos', '')
-            
-            if yahoo_name_clean == tank01_name:
-                # Team validation (if both have team info) - case insensitive
-                if yahoo_team and tank01_team and yahoo_team.upper() != tank01_team.upper():
-                    continue
-                # Position validation (if both have position info)
-                if yahoo_position and tank01_pos and yahoo_position != tank01_pos:
-                    continue
-                
-                self.logger.debug(f"Matched {yahoo_name} by exact name + team/position")
-                return player
-        
-        # Strategy 3: Last name + team match
-        if yahoo_team:
-            yahoo_last = yahoo_name_clean.split()[-1] if yahoo_name_clean else ""
-            for player in tank01_players:
-                tank01_name = player.get('longName', '').lower().strip()
-                tank01_team = player.get('team', '')
-                tank01_pos = player.get('pos', '')
-                tank01_last = tank01_name.split()[-1] if tank01_name else ""
-                
-                if (yahoo_last and tank01_last and yahoo_last == tank01_last and 
-                    yahoo_team.upper() == tank01_team.upper()):
-                    # Position validation
-                    if yahoo_position and tank01_pos and yahoo_position != tank01_pos:
-                        continue
-                    
-                    self.logger.debug(f"Matched {yahoo_name} by last name + team")
-                    return player
+        # Strategies 1-3: Yahoo ID, exact name + team/position, last name + team
+        # (hash lookups in the shared player identity index)
+        player = self.identity_index.match_tank01(
+            yahoo_name, yahoo_team, yahoo_position,
+            yahoo_id=yahoo_player.get('player_id'),
+            yahoo_player_key=yahoo_player.get('player_key')
+        )
+        if player:
+            self.logger.debug(f"Matched {yahoo_name} via player identity index")
+            return player
         
         # Strategy 4: Try get_player_info API for unmatched players
         self.logger.info(f"Trying get_player_info API for unmatched player: {yahoo_name}")
@@ -1314,7 +1028,7 @@ class Tank01MyRosterExtractor:
         
         # Prepare raw data with comprehensive API usage tracking
         final_usage = self.tank01.get_api_usage()
-        season_context = self._extract_season_context(yahoo_data)
+        season_context = self.season_context_service.get_season_context('Tank01 API')
         
         # Store season context as instance variable for markdown generation
         self.season_context = season_context
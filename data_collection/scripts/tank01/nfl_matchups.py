@@ -25,6 +25,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
 from tank01_client import SimpleTank01Client
 from data_formatter import MarkdownFormatter
 from file_utils import DataFileManager
+from season_context import get_season_context_service
 from api_usage_manager import APIUsageManager
 
 
@@ -41,6 +42,7 @@ class NFLMatchupsExtractor:
         self.tank01 = SimpleTank01Client()
         self.formatter = MarkdownFormatter()
         self.file_manager = DataFileManager()
+        self.season_context_service = get_season_context_service(file_manager=self.file_manager)
         self.usage_manager = APIUsageManager(self.tank01, "Tank01")
 
         self.execution_stats: Dict[str, Any] = {
@@ -89,71 +91,14 @@ class NFLMatchupsExtractor:
             raise
 
     def _get_current_season_state(self) -> Optional[Dict[str, Any]]:
-        """Get current NFL season state from Tank01 API."""
+        """Get current NFL season and week from the shared season context."""
         try:
-            # Use the daily scoreboard to get current week info
-            # We'll get today's date and use it to determine the current week
-            today = datetime.now().strftime("%Y%m%d")
-            
-            # Get today's games to determine current week
-            response = self.tank01.get_daily_scoreboard(game_date=today, top_performers=True)
-            
-            if response and 'body' in response:
-                # Extract week info from the first game if available
-                games = response['body']
-                if games:
-                    # Get the first game to extract week info
-                    first_game_id = list(games.keys())[0]
-                    first_game = games[first_game_id]
-                    
-                    # Try to get week from game info
-                    game_info = self._get_game_info(first_game_id)
-                    if game_info and 'gameWeek' in game_info:
-                        week_str = game_info['gameWeek']
-                        # Extract week number from "Week X" format
-                        week_match = week_str.replace('Week ', '') if 'Week ' in week_str else week_str
-                        current_week = int(week_match) if week_match.isdigit() else 1
-                    else:
-                        current_week = 1
-                    
-                    self.logger.info(f"Detected current week: {current_week}")
-                    return {
-                        'current_week': current_week,
-                        'season': '2025',
-                        'season_type': 'Regular Season'
-                    }
-            
-            # If no games today, try to find games from the past few days to determine week
-            self.logger.info("No games found for today, searching past days for week info...")
-            for days_back in range(1, 8):  # Check past 7 days
-                check_date = datetime.now() - timedelta(days=days_back)
-                date_str = check_date.strftime("%Y%m%d")
-                
-                response = self.tank01.get_daily_scoreboard(game_date=date_str, top_performers=True)
-                
-                if response and 'body' in response:
-                    games = response['body']
-                    if games:
-                        # Get the first game to extract week info
-                        first_game_id = list(games.keys())[0]
-                        game_info = self._get_game_info(first_game_id)
-                        if game_info and 'gameWeek' in game_info:
-                            week_str = game_info['gameWeek']
-                            week_match = week_str.replace('Week ', '') if 'Week ' in week_str else week_str
-                            current_week = int(week_match) if week_match.isdigit() else 1
-                            
-                            self.logger.info(f"Found week info from {date_str}: Week {current_week}")
-                            return {
-                                'current_week': current_week,
-                                'season': '2025',
-                                'season_type': 'Regular Season'
-                            }
-            
-            # Fallback: assume current week 1
-            self.logger.warning("Could not determine current week, defaulting to Week 1")
+            week_info = self.season_context_service.get_week_info()
+            current_week = int(week_info.get('week', 1))
+            self.logger.info(f"Detected current week: {current_week} (source: {week_info.get('source', 'unknown')})")
             return {
-                'current_week': 1,
-                'season': '2025',
+                'current_week': current_week,
+                'season': self.season_context_service.get_season(),
                 'season_type': 'Regular Season'
             }
             
@@ -12,9 +12,7 @@ Focus: Extract ALL available Tank01 data, no analysis
 
 import os
 import sys
-import json
 import logging
-import glob
 from datetime import datetime, timedelta
 import pytz
 from pathlib import Path
@@ -25,8 +23,10 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", "shared"))
 
 from tank01_client import SimpleTank01Client
 from file_utils import DataFileManager
+from season_context import get_season_context_service
 from api_usage_manager import APIUsageManager
 from data_formatter import MarkdownFormatter
+from player_identity import get_player_identity_index
 
 def get_current_time_pacific():
     """Get current time in Pacific Time Zone."""
@@ -61,6 +61,7 @@ class Tank01OpponentRosterExtractor:
         self.logger = logging.getLogger(__name__)
         self.tank01_client = SimpleTank01Client()
         self.file_manager = DataFileManager()
+        self.season_context_service = get_season_context_service(file_manager=self.file_manager)
         self.formatter = MarkdownFormatter()
         
         # Initialize centralized API usage manager
@@ -69,6 +70,9 @@ class Tank01OpponentRosterExtractor:
         # Cache for weekly projections
         self._weekly_projections_cache = None
         
+        # Shared Yahoo <-> Tank01 <-> Sleeper identity index
+        self.identity_index = get_player_identity_index()
+        
         self.stats = {
             'players_processed': 0,
             'players_matched': 0,
@@ -87,21 +91,13 @@ class Tank01OpponentRosterExtractor:
                 return [], {}
 
             # Look for opponent roster files
-            pattern = os.path.join(
-                os.path.dirname(__file__), '..', '..', 'outputs', 'yahoo', 'opponent_rosters', '**', '*_raw_data.json'
-            )
-            files = glob.glob(pattern, recursive=True)
-            
-            if not files:
+            latest_file = self.file_manager.get_latest_file("yahoo", "opponent_rosters", "raw_data")
+            if not latest_file:
                 self.logger.error("No Yahoo opponent roster files found")
                 return [], {}
-
-            # Get the most recent file
-            latest_file = max(files, key=os.path.getctime)
             self.logger.info(f"Loading opponent roster from: {latest_file}")
 
-            with open(latest_file, 'r') as f:
-                data = json.load(f)
+            data = self.file_manager.load_raw_data(latest_file)
 
             # Extract opponent info and players from the rosters structure
             rosters = data.get('rosters', {})
@@ -134,24 +130,15 @@ class Tank01OpponentRosterExtractor:
         """Find current week opponent from Yahoo team matchups data."""
         try:
             # Look for team matchups files
-            matchups_pattern = os.path.join(
-                os.path.dirname(__file__), '..', '..', 'outputs', 'yahoo', 'team_matchups', '**', '*_raw_data.json'
-            )
-            matchups_files = glob.glob(matchups_pattern, recursive=True)
-            
-            if not matchups_files:
+            latest_matchups = self.file_manager.get_latest_file("yahoo", "team_matchups", "raw_data")
+            if not latest_matchups:
                 self.logger.error("No team matchups files found")
                 return None
-
-            # Get the most recent file
-            latest_matchups = max(matchups_files, key=os.path.getctime)
             self.logger.info(f"Loading team matchups from: {latest_matchups}")
 
-            with open(latest_matchups, 'r') as f:
-                matchups_data = json.load(f)
+            matchups_data = self.file_manager.load_raw_data(latest_matchups)
 
-            season_context = matchups_data.get("season_context", {})
-            current_week = season_context.get("current_week", 1)
+            current_week = self.season_context_service.get_current_week()
             league_info = matchups_data.get("league_info", {})
             my_team_key = league_info.get("team_key")
             
@@ -190,98 +177,6 @@ class Tank01OpponentRosterExtractor:
             self.logger.error(f"Error finding current week opponent: {e}")
             return None
 
-    def _extract_season_context(self, yahoo_data: Dict) -> Dict[str, Any]:
-        """Extract season and week context from Yahoo data."""
-        try:
-            current_date = get_current_time_pacific()
-            season_context = {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': self._determine_season_phase(current_date),
-                'extraction_timestamp': current_date.isoformat()
-            }
-            
-            # Try to get current week from Yahoo data
-            week_info = self._extract_current_week_from_yahoo_data(yahoo_data)
-            if week_info:
-                season_context.update(week_info)
-            else:
-                # Fallback to estimated week
-                season_context['current_week'] = self._estimate_current_week(current_date)
-                
-            return season_context
-        except Exception as e:
-            self.logger.error(f"Error extracting season context: {e}")
-            return {}
-
-    def _determine_season_phase(self, current_date: datetime) -> str:
-        """Determine the current phase of the NFL season."""
-        month = current_date.month
-        
-        if month in [1, 2]:
-            return "Playoffs"
-        elif month in [3, 4, 5, 6, 7]:
-            return "Offseason"
-        elif month in [8, 9]:
-            return "Preseason"
-        elif month in [10, 11, 12]:
-            return "Regular Season"
-        else:
-            return "Unknown"
-
-    def _extract_current_week_from_yahoo_data(self, yahoo_data: Dict) -> Optional[Dict[str, Any]]:
-        """Extract current week information from Yahoo team matchups data."""
-        try:
-            if not yahoo_data or 'team_info' not in yahoo_data:
-                return None
-                
-            league_key = yahoo_data['team_info'].get('league_key', '')
-            if not league_key:
-                return None
-                
-            # Look for team matchups file
-            matchups_pattern = os.path.join(
-                os.path.dirname(__file__), '..', '..', 'outputs', 'yahoo', 'team_matchups', '**', '*_raw_data.json'
-            )
-            matchups_files = glob.glob(matchups_pattern, recursive=True)
-            
-            if not matchups_files:
-                return None
-                
-            latest_matchups = max(matchups_files, key=os.path.getctime)
-            
-            with open(latest_matchups, 'r') as f:
-                matchups_data = json.load(f)
-                
-            season_context = matchups_data.get('season_context', {})
-            current_week = season_context.get('current_week', 1)
-            
-            return {
-                'current_week': current_week,
-                'league_key': league_key
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting current week: {e}")
-            return None
-
-    def _estimate_current_week(self, current_date: datetime) -> int:
-        """Estimate current week based on date."""
-        # NFL regular season typically starts first week of September
-        # This is a rough estimation
-        if current_date.month < 9:
-            return 1
-        elif current_date.month == 9:
-            return min(4, max(1, current_date.day // 7 + 1))
-        elif current_date.month == 10:
-            return min(8, 4 + (current_date.day // 7 + 1))
-        elif current_date.month == 11:
-            return min(12, 8 + (current_date.day // 7 + 1))
-        elif current_date.month == 12:
-            return min(17, 12 + (current_date.day // 7 + 1))
-        else:
-            return 17
-
     def _get_tank01_player_database(self) -> List[Dict[str, Any]]:
         """Get the Tank01 player database with caching."""
         if not hasattr(self, '_tank01_player_cache') or self._tank01_player_cache is None:
@@ -299,6 +194,7 @@ class Tank01OpponentRosterExtractor:
                     return []
                 
                 self._tank01_player_cache = players
+                self.identity_index.sync_tank01_players(players)
                 self.stats["api_calls"] += 1
                 self.logger.info(f"Loaded {len(players)} Tank01 players")
                 return players
@@ -328,48 +224,16 @@ class Tank01OpponentRosterExtractor:
         
         yahoo_name_clean = yahoo_name.lower().strip()
         
-        # Strategy 1: Direct Yahoo ID match (if available in Tank01)
-        yahoo_id = yahoo_player.get('player_id', '')
-        for player in tank01_players:
-            tank01_yahoo_id = player.get('yahooID', '')
-            if yahoo_id and tank01_yahoo_id and yahoo_id == tank01_yahoo_id:
-                self.logger.debug(f"Matched {yahoo_name} by Yahoo ID: {yahoo_id}")
-                return player
-        
-        # Strategy 2: Exact name match with team validation
-        for player in tank01_players:
-            tank01_name = player.get('longName', '').lower().strip()
-            tank01_team = player.get('team', '')
-            tank01_pos = player.get('pos', '')
-            
-            if yahoo_name_clean == tank01_name:
-                # Team validation (if both have team info) - case insensitive
-                if yahoo_team and tank01_team and yahoo_team.upper() != tank01_team.upper():
-                    continue
-                # Position validation (if both have position info)
-                if yahoo_position and tank01_pos and yahoo_position != tank01_pos:
-                    continue
-                
-                self.logger.debug(f"Matched {yahoo_name} by exact name + team/position")
-                return player
-        
-        # Strategy 3: Last name + team match
-        if yahoo_team:
-            yahoo_last = yahoo_name_clean.split()[-1] if yahoo_name_clean else ""
-            for player in tank01_players:
-                tank01_name = player.get('longName', '').lower().strip()
-                tank01_team = player.get('team', '')
-                tank01_pos = player.get('pos', '')
-                tank01_last = tank01_name.split()[-1] if tank01_name else ""
-                
-                if (yahoo_last and tank01_last and yahoo_last == tank01_last and 
-                    yahoo_team.upper() == tank01_team.upper()):
-                    # Position validation
-                    if yahoo_position and tank01_pos and yahoo_position != tank01_pos:
-                        continue
-                    
-                    self.logger.debug(f"Matched {yahoo_name} by last name + team")
-                    return player
+        # Strategies 1-3: Yahoo ID, exact name + team/position, last name + team
+        # (hash lookups in the shared player identity index)
+        player = self.identity_index.match_tank01(
+            yahoo_name, yahoo_team, yahoo_position,
+            yahoo_id=yahoo_player.get('player_id'),
+            yahoo_player_key=yahoo_player.get('player_key')
+        )
+        if player:
+            self.logger.debug(f"Matched {yahoo_name} via player identity index")
+            return player
         
         # Strategy 4: Try get_player_info API for unmatched players
         self.logger.info(f"Trying get_player_info API for unmatched player: {yahoo_name}")
@@ -703,7 +567,7 @@ class Tank01OpponentRosterExtractor:
             self.stats["errors"] += 1
         
         # Extract season context
-        season_context = self._extract_season_context(yahoo_data)
+        season_context = self.season_context_service.get_season_context('Tank01 API')
         
         # Process each player
         matched_players = []
@@ -24,8 +24,15 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", "shared"))
 
 from tank01_client import SimpleTank01Client
 from file_utils import DataFileManager
+from season_context import get_season_context_service
 from api_usage_manager import APIUsageManager
 from data_formatter import MarkdownFormatter
+from player_identity import get_player_identity_index
+from rate_limiter import QuotaAwareTokenBucket, fetch_in_order, DEFAULT_MAX_WORKERS
+from game_stats_store import GameStatsStore
+from game_fetch_planner import GameFetchPlanner
+from fantasy_scoring import FantasyScoringEngine
+from season_warehouse import get_season_warehouse
 
 def get_current_time_pacific():
     """Get current time in Pacific Time Zone."""
@@ -68,6 +75,8 @@ class Tank01OpponentRosterStatsExtractor:
         """Initialize the Tank01 opponent roster stats extractor."""
         self.logger = logging.getLogger(__name__)
         self.file_manager = DataFileManager()
+        self.season_context_service = get_season_context_service(file_manager=self.file_manager)
+        self.warehouse = get_season_warehouse()
         self.formatter = MarkdownFormatter()
         
         # Initialize Tank01 client
@@ -81,6 +90,23 @@ class Tank01OpponentRosterStatsExtractor:
         # Cache for Tank01 player database
         self._tank01_player_cache = None
         
+        # Shared Yahoo <-> Tank01 <-> Sleeper identity index
+        self.identity_index = get_player_identity_index()
+        
+        # Concurrent game log fetches, limited by the remaining RapidAPI quota
+        self.max_workers = DEFAULT_MAX_WORKERS
+        self.rate_limiter = QuotaAwareTokenBucket(usage_func=self.tank01.get_api_usage)
+        
+        # Finalized games are stored once and never re-downloaded
+        self.game_stats_store = GameStatsStore()
+        
+        # Chooses per-player game logs or per-game box scores, whichever costs fewer calls
+        self.game_fetch_planner = GameFetchPlanner(self.tank01, self.game_stats_store,
+                                                   limiter=self.rate_limiter, max_workers=self.max_workers)
+        
+        # League scoring settings (Yahoo stat_modifiers), standard PPR if unavailable
+        self.scoring_engine = FantasyScoringEngine.from_latest_league_settings(self.file_manager)
+        
         # Track execution stats
         self.stats = {
             "start_time": datetime.now(),
@@ -95,247 +121,6 @@ class Tank01OpponentRosterStatsExtractor:
         
         self.logger.info("Tank01 Opponent Roster Stats Extractor initialized")
     
-    def _extract_season_context(self, yahoo_data: Dict) -> Dict[str, Any]:
-        """
-        Extract season and week context from Yahoo data.
-        
-        Args:
-            yahoo_data: Yahoo opponent roster data
-            
-        Returns:
-            Dict with season context information
-        """
-        try:
-            current_date = get_current_time_pacific()
-            season_context = {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': self._determine_season_phase(current_date),
-                'data_source': 'Tank01 API - Opponent Roster Player Game Stats',
-                'verification_notes': []
-            }
-            
-            # Extract season from Yahoo data if available
-            if yahoo_data and 'opponent_info' in yahoo_data:
-                opponent_info = yahoo_data['opponent_info']
-                opponent_name = opponent_info.get('opponent_name', '')
-                opponent_team_key = opponent_info.get('opponent_team_key', '')
-                
-                # Look for year in opponent team key (format: 461.l.595012.t.5)
-                if opponent_team_key and '.' in opponent_team_key:
-                    key_parts = opponent_team_key.split('.')
-                    if len(key_parts) >= 2 and key_parts[0].isdigit():
-                        yahoo_code = int(key_parts[0])
-                        # Yahoo uses 461 for 2025, 460 for 2024, etc.
-                        yahoo_year = str(2025)  # For now, assume 2025 based on 461
-                        season_context['nfl_season'] = yahoo_year
-                        season_context['verification_notes'].append(f"Yahoo opponent team key code {yahoo_code} indicates year: {yahoo_year}")
-                
-                season_context['opponent_info'] = {
-                    'opponent_name': opponent_name,
-                    'opponent_team_key': opponent_team_key
-                }
-            
-            # Extract current week from Tank01 API data and Yahoo data
-            season_context['current_week'] = None
-            season_context['week_info'] = {}
-            
-            # First, try to get week from Yahoo data (most reliable)
-            current_week = self._extract_current_week_from_yahoo_data(yahoo_data)
-            
-            if current_week:
-                season_context['current_week'] = current_week['week']
-                season_context['week_info'] = current_week
-                season_context['verification_notes'].append(f"Current week {current_week['week']} extracted from Yahoo team matchups API")
-            else:
-                # Fallback: try to determine from date
-                try:
-                    season_start = datetime(current_date.year, 9, 1, tzinfo=current_date.tzinfo)
-                    if current_date >= season_start:
-                        days_since_start = (current_date - season_start).days
-                        estimated_week = min((days_since_start // 7) + 1, 18)
-                        season_context['current_week'] = estimated_week
-                        season_context['week_info'] = {
-                            'week': estimated_week,
-                            'coverage_type': 'estimated',
-                            'status': 'estimated_from_date',
-                            'source': 'date_estimation'
-                        }
-                        season_context['verification_notes'].append(f"Estimated week {estimated_week} from current date")
-                    else:
-                        season_context['current_week'] = 1
-                        season_context['week_info'] = {
-                            'week': 1,
-                            'coverage_type': 'preseason',
-                            'status': 'preseason',
-                            'source': 'preseason_assumption'
-                        }
-                        season_context['verification_notes'].append("Preseason - using week 1")
-                except Exception as e:
-                    self.logger.warning(f"Could not determine week from date: {e}")
-                    season_context['current_week'] = 1
-                    season_context['week_info'] = {
-                        'week': 1,
-                        'coverage_type': 'fallback',
-                        'status': 'fallback',
-                        'source': 'error_fallback'
-                    }
-                    season_context['verification_notes'].append("Could not determine current week - using fallback week 1")
-            
-            # Add current date context
-            if current_date.month >= 9:
-                season_context['verification_notes'].append(f"Current date {current_date.strftime('%Y-%m-%d')} suggests NFL season is in progress")
-            elif current_date.month <= 2:
-                season_context['verification_notes'].append(f"Current date {current_date.strftime('%Y-%m-%d')} suggests NFL playoffs/super bowl period")
-            else:
-                season_context['verification_notes'].append(f"Current date {current_date.strftime('%Y-%m-%d')} suggests NFL offseason")
-            
-            return season_context
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting season context: {e}")
-            return {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': 'Unknown',
-                'data_source': 'Tank01 API - Opponent Roster Player Game Stats',
-                'verification_notes': [f"Error extracting season context: {e}"]
-            }
-    
-    def _determine_season_phase(self, current_date: datetime) -> str:
-        """Determine the current phase of the NFL season based on date"""
-        month = current_date.month
-        day = current_date.day
-        
-        if month == 9 and day < 15:
-            return "Early Regular Season"
-        elif month == 9 or month == 10:
-            return "Regular Season"
-        elif month == 11 or month == 12:
-            return "Late Regular Season"
-        elif month == 1 and day < 15:
-            return "Playoffs"
-        elif month == 1 and day >= 15:
-            return "Super Bowl"
-        elif month == 2:
-            return "Offseason"
-        elif month >= 3 and month <= 8:
-            return "Offseason"
-        else:
-            return "Unknown"
-    
-    def _extract_current_week_from_yahoo_data(self, yahoo_data: Dict) -> Optional[Dict[str, Any]]:
-        """
-        Extract current week information from Yahoo team matchups data.
-        
-        Args:
-            yahoo_data: Yahoo opponent roster data containing team info
-            
-        Returns:
-            Dict with week information or None if not found
-        """
-        try:
-            if not yahoo_data or 'opponent_info' not in yahoo_data:
-                return None
-                
-            opponent_team_key = yahoo_data['opponent_info'].get('opponent_team_key', '')
-            if not opponent_team_key:
-                return None
-                
-            # Look for the most recent team matchups file
-            from pathlib import Path
-            current_path = Path(__file__).resolve()
-            for parent in current_path.parents:
-                if parent.name == "data_collection":
-                    matchups_dir = parent / "outputs" / "yahoo" / "team_matchups"
-                    break
-            else:
-                matchups_dir = Path("data_collection/outputs/yahoo/team_matchups")
-            
-            if not matchups_dir.exists():
-                self.logger.warning("Team matchups directory not found")
-                return None
-            
-            # Get the most recent matchups file
-            matchup_files = list(matchups_dir.glob("**/*_team_matchups_raw_data.json"))
-            if not matchup_files:
-                self.logger.warning("No team matchups files found")
-                return None
-            
-            latest_file = max(matchup_files, key=lambda f: f.stat().st_mtime)
-            self.logger.info(f"Loading team matchups from: {latest_file}")
-            
-            with open(latest_file, 'r') as f:
-                matchups_data = json.load(f)
-            
-            # Extract week information from matchups
-            matchups = matchups_data.get('matchups', {})
-            if not matchups:
-                return None
-            
-            # Find the current week (look for week_1, week_2, etc.)
-            current_week_data = None
-            for week_key, week_data in matchups.items():
-                if week_key.startswith('week_'):
-                    week_num = week_data.get('week', 1)
-                    week_matchups = week_data.get('matchups', [])
-                    
-                    # Look for status in the matchups array
-                    week_start = ''
-                    week_end = ''
-                    status = 'unknown'
-                    
-                    if week_matchups:
-                        # Get status from first matchup
-                        first_matchup = week_matchups[0]
-                        week_start = first_matchup.get('week_start', '')
-                        week_end = first_matchup.get('week_end', '')
-                        status = first_matchup.get('status', 'unknown')
-                    
-                    # Check if this is the current week based on status
-                    if status in ['midevent', 'postevent', 'preevent']:
-                        current_week_data = {
-                            'week': week_num,
-                            'week_start': week_start,
-                            'week_end': week_end,
-                            'status': status,
-                            'coverage_type': 'week',
-                            'source': 'yahoo_team_matchups_api'
-                        }
-                        break
-            
-            # If no current week found, use the first available week
-            if not current_week_data and matchups:
-                first_week_key = sorted(matchups.keys())[0]
-                first_week_data = matchups[first_week_key]
-                week_num = first_week_data.get('week', 1)
-                week_matchups = first_week_data.get('matchups', [])
-                
-                week_start = ''
-                week_end = ''
-                status = 'unknown'
-                
-                if week_matchups:
-                    first_matchup = week_matchups[0]
-                    week_start = first_matchup.get('week_start', '')
-                    week_end = first_matchup.get('week_end', '')
-                    status = first_matchup.get('status', 'unknown')
-                
-                current_week_data = {
-                    'week': week_num,
-                    'week_start': week_start,
-                    'week_end': week_end,
-                    'status': status,
-                    'coverage_type': 'week',
-                    'source': 'yahoo_team_matchups_api'
-                }
-            
-            return current_week_data
-            
-        except Exception as e:
-            self.logger.warning(f"Could not extract current week from Yahoo data: {e}")
-            return None
-    
     def _load_latest_yahoo_opponent_roster_players(self) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Load the latest Yahoo opponent roster players from the most recent output file.
@@ -345,29 +130,12 @@ class Tank01OpponentRosterStatsExtractor:
         """
         try:
             # Find the most recent Yahoo opponent roster output
-            # Get the project root by finding the data_collection directory
-            current_path = Path(__file__).resolve()
-            for parent in current_path.parents:
-                if parent.name == "data_collection":
-                    yahoo_output_dir = parent / "outputs" / "yahoo" / "opponent_rosters"
-                    break
-            else:
-                # Fallback: assume we're in the project root
-                yahoo_output_dir = Path("data_collection/outputs/yahoo/opponent_rosters")
-            
-            if not yahoo_output_dir.exists():
-                raise FileNotFoundError(f"Yahoo opponent roster output directory not found: {yahoo_output_dir}")
-            
-            # Get the most recent file
-            roster_files = list(yahoo_output_dir.glob("**/*_opponent_rosters_raw_data.json"))
-            if not roster_files:
+            latest_file = self.file_manager.get_latest_file("yahoo", "opponent_rosters", "raw_data")
+            if not latest_file:
                 raise FileNotFoundError("No Yahoo opponent roster raw data files found")
-            
-            latest_file = max(roster_files, key=lambda f: f.stat().st_mtime)
             self.logger.info(f"Loading Yahoo opponent roster from: {latest_file}")
             
-            with open(latest_file, 'r') as f:
-                raw_data = json.load(f)
+            raw_data = self.file_manager.load_raw_data(latest_file)
             
             # Extract players from the Yahoo raw data
             players = []
@@ -474,6 +242,7 @@ class Tank01OpponentRosterStatsExtractor:
                 return []
             
             self._tank01_player_cache = players
+            self.identity_index.sync_tank01_players(players)
             self.stats["api_calls"] += 1
             self.logger.info(f"Loaded {len(players)} Tank01 players")
             return players
@@ -509,48 +278,16 @@ class Tank01OpponentRosterStatsExtractor:
         
         yahoo_name_clean = yahoo_name.lower().strip()
         
-        # Strategy 1: Direct Yahoo ID match (if available in Tank01)
-        yahoo_id = yahoo_player.get('player_id', '')
-        for player in tank01_players:
-            tank01_yahoo_id = player.get('yahooID', '')
-            if yahoo_id and tank01_yahoo_id and yahoo_id == tank01_yahoo_id:
-                self.logger.debug(f"Matched {yahoo_name} by Yahoo ID: {yahoo_id}")
-                return player
-        
-        # Strategy 2: Exact name match with team validation
-        for player in tank01_players:
-            tank01_name = player.get('longName', '').lower().strip()
-            tank01_team = player.get('team', '')
-            tank01_pos = player.get('pos', '')
-            
-            if yahoo_name_clean == tank01_name:
-                # Team validation (if both have team info) - case insensitive
-                if yahoo_team and tank01_team and yahoo_team.upper() != tank01_team.upper():
-                    continue
-                # Position validation (if both have position info)
-                if yahoo_position and tank01_pos and yahoo_position != tank01_pos:
-                    continue
-                
-                self.logger.debug(f"Matched {yahoo_name} by exact name + team/position")
-                return player
-        
-        # Strategy 3: Last name + team match
-        if yahoo_team:
-            yahoo_last = yahoo_name_clean.split()[-1] if yahoo_name_clean else ""
-            for player in tank01_players:
-                tank01_name = player.get('longName', '').lower().strip()
-                tank01_team = player.get('team', '')
-                tank01_pos = player.get('pos', '')
-                tank01_last = tank01_name.split()[-1] if tank01_name else ""
-                
-                if (yahoo_last and tank01_last and yahoo_last == tank01_last and 
-                    yahoo_team.upper() == tank01_team.upper()):
-                    # Position validation
-                    if yahoo_position and tank01_pos and yahoo_position != tank01_pos:
-                        continue
-                    
-                    self.logger.debug(f"Matched {yahoo_name} by last name + team")
-                    return player
+        # Strategies 1-3: Yahoo ID, exact name + team/position, last name + team
+        # (hash lookups in the shared player identity index)
+        player = self.identity_index.match_tank01(
+            yahoo_name, yahoo_team, yahoo_position,
+            yahoo_id=yahoo_player.get('player_id'),
+            yahoo_player_key=yahoo_player.get('player_key')
+        )
+        if player:
+            self.logger.debug(f"Matched {yahoo_name} via player identity index")
+            return player
         
         # Strategy 4: Try get_player_info API for unmatched players
         self.logger.info(f"Trying get_player_info API for unmatched player: {yahoo_name}")
@@ -689,7 +426,7 @@ class Tank01OpponentRosterStatsExtractor:
             self.logger.error(f"Error getting team defense stats for {team_abbr}: {e}")
             return {}
     
-    def _get_player_game_stats(self, tank01_player: Dict[str, Any], season: str = "2025", team_defense_stats: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _get_player_game_stats(self, tank01_player: Dict[str, Any], season: str = "2025") -> Dict[str, Any]:
         """
         Get comprehensive game statistics for a player from the current season.
         
@@ -707,8 +444,13 @@ class Tank01OpponentRosterStatsExtractor:
         try:
             self.logger.info(f"Fetching game stats for player {player_id} (season {season})")
             
-            # Use the getNFLGamesForPlayer endpoint with season parameter
-            game_stats = self.tank01.get_player_game_stats(player_id, season)
+            # Use the getNFLGamesForPlayer endpoint with season parameter, only when
+            # the schedule says a new or in-progress game can exist for the player
+            # and the planner did not already collect them from box scores
+            game_stats = self.game_fetch_planner.get_player_games(
+                player_id, season, tank01_player.get('team'),
+                lambda: self.rate_limiter.call(self.tank01.get_player_game_stats, player_id, season)
+            )
             
             if game_stats and 'body' in game_stats:
                 games = game_stats['body']
@@ -731,20 +473,15 @@ class Tank01OpponentRosterStatsExtractor:
                             'rushing': game_data.get('Rushing', {}),
                             'receiving': game_data.get('Receiving', {}),
                             'defense': game_data.get('Defense', {}),
-                            'fantasy_points': self._calculate_fantasy_points(game_data),
                             'raw_data': game_data
                         }
                         processed_games.append(processed_game)
                     
-                    # Calculate season totals and averages
-                    season_totals = self._calculate_season_totals(processed_games, team_defense_stats)
-                    season_averages = self._calculate_season_averages(processed_games)
-                    
+                    # Fantasy points, season totals and averages are filled in by
+                    # _score_all_players once every player's games are collected
                     return {
                         'games': processed_games,
                         'total_games': len(processed_games),
-                        'season_totals': season_totals,
-                        'season_averages': season_averages,
                         'recent_performance': processed_games[:3] if processed_games else [],  # Last 3 games
                         'raw_response': game_stats
                     }
@@ -809,155 +546,6 @@ class Tank01OpponentRosterStatsExtractor:
             pass
         return "Unknown"
     
-    def _calculate_fantasy_points(self, game_data: Dict[str, Any]) -> float:
-        """Calculate fantasy points for a game using standard scoring"""
-        try:
-            points = 0.0
-            
-            # Passing stats
-            passing = game_data.get('Passing', {})
-            try:
-                pass_yards = float(passing.get('passYds', 0))
-                pass_tds = float(passing.get('passTD', 0))
-                interceptions = float(passing.get('int', 0))
-                
-                points += pass_yards * 0.04  # 1 point per 25 yards
-                points += pass_tds * 4       # 4 points per TD
-                points += interceptions * -2  # -2 points per INT
-            except (ValueError, TypeError):
-                pass  # Skip passing stats if conversion fails
-            
-            # Rushing stats
-            rushing = game_data.get('Rushing', {})
-            try:
-                rush_yards = float(rushing.get('rushYds', 0))
-                rush_tds = float(rushing.get('rushTD', 0))
-                
-                points += rush_yards * 0.1   # 1 point per 10 yards
-                points += rush_tds * 6       # 6 points per TD
-            except (ValueError, TypeError):
-                pass  # Skip rushing stats if conversion fails
-            
-            # Receiving stats
-            receiving = game_data.get('Receiving', {})
-            try:
-                rec_yards = float(receiving.get('recYds', 0))
-                rec_tds = float(receiving.get('recTD', 0))
-                receptions = float(receiving.get('receptions', 0))
-                
-                points += rec_yards * 0.1    # 1 point per 10 yards
-                points += rec_tds * 6        # 6 points per TD
-                points += receptions * 1     # 1 point per reception (PPR)
-            except (ValueError, TypeError):
-                pass  # Skip receiving stats if conversion fails
-            
-            return round(points, 2)
-        except Exception:
-            return 0.0
-    
-    def _calculate_season_totals(self, games: List[Dict[str, Any]], team_defense_stats: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Calculate season totals for all games"""
-        totals = {
-            'passing': {'passYds': 0, 'passTD': 0, 'int': 0, 'passAttempts': 0, 'passCompletions': 0},
-            'rushing': {'rushYds': 0, 'rushTD': 0, 'carries': 0},
-            'receiving': {'recYds': 0, 'recTD': 0, 'receptions': 0, 'targets': 0},
-            'defense': {
-                'fumblesLost': 0, 'defensiveInterceptions': 0, 'forcedFumbles': 0, 'fumbles': 0, 'fumblesRecovered': 0,
-                'defTD': 0, 'totalTackles': 0, 'soloTackles': 0, 'tacklesForLoss': 0, 'qbHits': 0, 
-                'interceptions': 0, 'sacks': 0, 'passDeflections': 0, 'safeties': 0, 'pointsAllowed': 0,
-                'yardsAllowed': 0, 'passYardsAllowed': 0, 'rushYardsAllowed': 0, 'turnovers': 0
-            },
-            'fantasy_points': 0,
-            'games_played': len(games)
-        }
-        
-        # If no games but we have team defense stats, use those instead
-        if not games and team_defense_stats:
-            totals['games_played'] = 1  # Team defense stats represent 1 game
-            # Map team defense stats to our defense totals
-            totals['defense']['fumblesRecovered'] = team_defense_stats.get('fumblesRecovered', 0)
-            totals['defense']['interceptions'] = team_defense_stats.get('interceptions', 0)
-            totals['defense']['sacks'] = team_defense_stats.get('sacks', 0)
-            totals['defense']['safeties'] = team_defense_stats.get('safeties', 0)
-            totals['defense']['defTD'] = team_defense_stats.get('defTD', 0)
-            totals['defense']['totalTackles'] = team_defense_stats.get('totalTackles', 0)
-            totals['defense']['soloTackles'] = team_defense_stats.get('soloTackles', 0)
-            totals['defense']['tacklesForLoss'] = team_defense_stats.get('tacklesForLoss', 0)
-            totals['defense']['qbHits'] = team_defense_stats.get('qbHits', 0)
-            totals['defense']['passDeflections'] = team_defense_stats.get('passDeflections', 0)
-            totals['defense']['pointsAllowed'] = team_defense_stats.get('pointsAllowed', 0)
-            totals['defense']['yardsAllowed'] = team_defense_stats.get('yardsAllowed', 0)
-            totals['defense']['passYardsAllowed'] = team_defense_stats.get('passYardsAllowed', 0)
-            totals['defense']['rushYardsAllowed'] = team_defense_stats.get('rushYardsAllowed', 0)
-            totals['defense']['turnovers'] = team_defense_stats.get('turnovers', 0)
-            
-            # Calculate fantasy points for team defense
-            totals['fantasy_points'] = self._calculate_fantasy_points(totals['defense'])
-            return totals
-        
-        for game in games:
-            # Passing totals
-            passing = game.get('passing', {})
-            for stat in totals['passing']:
-                try:
-                    totals['passing'][stat] += float(passing.get(stat, 0))
-                except (ValueError, TypeError):
-                    totals['passing'][stat] += 0.0
-            
-            # Rushing totals
-            rushing = game.get('rushing', {})
-            for stat in totals['rushing']:
-                try:
-                    totals['rushing'][stat] += float(rushing.get(stat, 0))
-                except (ValueError, TypeError):
-                    totals['rushing'][stat] += 0.0
-            
-            # Receiving totals
-            receiving = game.get('receiving', {})
-            for stat in totals['receiving']:
-                try:
-                    totals['receiving'][stat] += float(receiving.get(stat, 0))
-                except (ValueError, TypeError):
-                    totals['receiving'][stat] += 0.0
-            
-            # Defense totals
-            defense = game.get('defense', {})
-            for stat in totals['defense']:
-                try:
-                    totals['defense'][stat] += float(defense.get(stat, 0))
-                except (ValueError, TypeError):
-                    totals['defense'][stat] += 0.0
-            
-            # Fantasy points
-            totals['fantasy_points'] += game.get('fantasy_points', 0)
-        
-        return totals
-    
-    def _calculate_season_averages(self, games: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate season averages per game"""
-        if not games:
-            return {}
-        
-        totals = self._calculate_season_totals(games)
-        games_played = len(games)
-        
-        averages = {
-            'passing': {},
-            'rushing': {},
-            'receiving': {},
-            'defense': {},
-            'fantasy_points': 0
-        }
-        
-        # Calculate averages for each category
-        for category in ['passing', 'rushing', 'receiving', 'defense']:
-            for stat in totals[category]:
-                averages[category][stat] = round(totals[category][stat] / games_played, 2)
-        
-        averages['fantasy_points'] = round(totals['fantasy_points'] / games_played, 2)
-        
-        return averages
-    
     def _generate_markdown_report(self, matched_players: List[Dict[str, Any]], season_context: Dict[str, Any]) -> str:
         """
         Generate a comprehensive markdown report of opponent roster player game stats.
@@ -1301,6 +889,51 @@ class Tank01OpponentRosterStatsExtractor:
         
         return "\n".join(report)
     
+    def _collect_player_game_stats(self, tank01_player: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get game stats for one matched player (runs on the fetch thread pool).
+        
+        Args:
+            tank01_player: Tank01 player data
+            
+        Returns:
+            Dict containing player game statistics
+        """
+        # For defense players, get team-level stats first
+        team_defense_stats = None
+        if tank01_player.get('isTeamDefense', False):
+            team_abbr = tank01_player.get('team', '')
+            if team_abbr:
+                team_defense_stats = self._get_team_defense_stats(team_abbr)
+        
+        # Get comprehensive game stats
+        game_stats = self._get_player_game_stats(tank01_player, season="2025")
+        
+        # Add team defense stats to game stats for display
+        if team_defense_stats:
+            game_stats['team_defense_stats'] = team_defense_stats
+        
+        return game_stats
+    
+    def _score_all_players(self, players_to_fetch: List[tuple], all_game_stats: List[Dict[str, Any]]) -> None:
+        """
+        Fill in fantasy points, season totals and season averages for every player.
+        
+        Args:
+            players_to_fetch: (yahoo_player, tank01_player) pairs
+            all_game_stats: Game stats dicts in the same order (updated in place)
+        """
+        scored = [(game_stats, tank01_player.get('isTeamDefense', False))
+                  for (_, tank01_player), game_stats in zip(players_to_fetch, all_game_stats)
+                  if 'error' not in game_stats and ('games' in game_stats or game_stats.get('team_defense_stats'))]
+        self.scoring_engine.score_league([entry for entry, _ in scored], [is_def for _, is_def in scored])
+    
+    def _game_stats_error(self, item: tuple, error: Exception) -> Dict[str, Any]:
+        """Build the game stats entry for a player whose fetch failed or was skipped for quota."""
+        tank01_player = item[1]
+        self.logger.error(f"Error getting game stats for player {tank01_player.get('playerID', 'Unknown')}: {error}")
+        return {'games': [], 'total_games': 0, 'error': str(error)}
+    
     def extract_opponent_roster_stats(self) -> Dict[str, Any]:
         """
         Extract comprehensive game statistics for opponent Yahoo Fantasy roster.
@@ -1327,6 +960,11 @@ class Tank01OpponentRosterStatsExtractor:
         matched_players = []
         unmatched_players = []
         
+        # Current week schedule decides which players can have new games
+        self.game_stats_store.load_schedule(self.file_manager.get_latest_file("tank01", "nfl_matchups", "raw_data"))
+        
+        # Match every Yahoo player to Tank01 first
+        players_to_fetch = []
         for yahoo_player in yahoo_players:
             self.stats["players_processed"] += 1
             
@@ -1334,36 +972,50 @@ class Tank01OpponentRosterStatsExtractor:
             tank01_player = self._match_yahoo_to_tank01(yahoo_player)
             
             if tank01_player:
-                # For defense players, get team-level stats first
-                team_defense_stats = None
-                if tank01_player.get('isTeamDefense', False):
-                    team_abbr = tank01_player.get('team', '')
-                    if team_abbr:
-                        team_defense_stats = self._get_team_defense_stats(team_abbr)
-                
-                # Get comprehensive game stats
-                game_stats = self._get_player_game_stats(tank01_player, season="2025", team_defense_stats=team_defense_stats)
-                
-                # Add team defense stats to game stats for display
-                if team_defense_stats:
-                    game_stats['team_defense_stats'] = team_defense_stats
-                
-                # Update total games collected
-                self.stats["total_games_collected"] += game_stats.get('total_games', 0)
-                
-                matched_players.append({
-                    'yahoo_player': yahoo_player,
-                    'tank01_data': tank01_player,
-                    'game_stats': game_stats
-                })
-                self.stats["players_matched"] += 1
+                players_to_fetch.append((yahoo_player, tank01_player))
             else:
                 unmatched_players.append(yahoo_player)
                 self.stats["players_unmatched"] += 1
         
+        # Read box scores up front when that is cheaper than one game log per player
+        current_week = self.season_context_service.get_current_week()
+        self.game_fetch_planner.prefetch([tank01_player for _, tank01_player in players_to_fetch],
+                                         "2025", list(range(1, max(1, current_week) + 1)))
+        
+        # Fetch game logs concurrently, merged back in roster order. Only the game log
+        # calls that reach Tank01 take a limiter token; players served from the game
+        # stats store or the box scores above do not
+        self.logger.info(f"Fetching game stats for {len(players_to_fetch)} players ({self.max_workers} workers)")
+        all_game_stats = fetch_in_order(
+            players_to_fetch,
+            lambda pair: self._collect_player_game_stats(pair[1]),
+            max_workers=self.max_workers,
+            on_error=self._game_stats_error
+        )
+        
+        # Score every collected game in one vectorized pass
+        self._score_all_players(players_to_fetch, all_game_stats)
+        
+        for (yahoo_player, tank01_player), game_stats in zip(players_to_fetch, all_game_stats):
+            # Update total games collected
+            self.stats["total_games_collected"] += game_stats.get('total_games', 0)
+            
+            matched_players.append({
+                'yahoo_player': yahoo_player,
+                'tank01_data': tank01_player,
+                'game_stats': game_stats
+            })
+            self.stats["players_matched"] += 1
+        
         # Prepare raw data with comprehensive API usage tracking
         final_usage = self.tank01.get_api_usage()
-        season_context = self._extract_season_context(yahoo_data)
+        season_context = self.season_context_service.get_season_context('Tank01 API - Opponent Roster Player Game Stats')
+        opponent_info = (yahoo_data or {}).get('opponent_info', {})
+        if opponent_info:
+            season_context['opponent_info'] = {
+                'opponent_name': opponent_info.get('opponent_name', ''),
+                'opponent_team_key': opponent_info.get('opponent_team_key', '')
+            }
         
         # Generate outputs
         markdown_report = self._generate_markdown_report(matched_players, season_context)
@@ -1375,15 +1027,19 @@ class Tank01OpponentRosterStatsExtractor:
                 "execution_stats": self.stats
             },
             "season_context": season_context,
+            "scoring_settings": self.scoring_engine.get_settings_summary(),
             "matched_players": matched_players,
             "unmatched_players": unmatched_players,
             "tank01_api_usage": {
                 "session_usage": final_usage,
+                "rate_limiter": self.rate_limiter.get_stats(),
+                "game_stats_store": self.game_stats_store.get_stats(),
+                "game_fetch_plan": self.game_fetch_planner.get_stats(),
                 "api_calls_breakdown": {
                     "player_database_call": 1,
                     "player_specific_calls": max(0, final_usage.get('calls_made_this_session', 0) - 1),
-                    "game_stats_calls": self.stats['players_matched'],
-                    "get_player_info_calls": max(0, final_usage.get('calls_made_this_session', 0) - 1 - self.stats['players_matched']),
+                    "game_stats_calls": self.game_stats_store.get_stats()['players_fetched'],
+                    "get_player_info_calls": max(0, final_usage.get('calls_made_this_session', 0) - 1 - self.game_stats_store.get_stats()['players_fetched']),
                     "total_calls": final_usage.get('calls_made_this_session', 0)
                 },
                 "efficiency_metrics": {
@@ -1408,6 +1064,7 @@ class Tank01OpponentRosterStatsExtractor:
         
         clean_file = self.file_manager.save_clean_data("tank01", "opponent_roster_stats", markdown_report, week_prefix)
         raw_file = self.file_manager.save_raw_data("tank01", "opponent_roster_stats", raw_data, week_prefix)
+        self.warehouse.ingest_snapshot("tank01", "opponent_roster_stats", raw_data, raw_file)
         
         output_files = {
             "clean": clean_file,
@@ -28,7 +28,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", "shared"))
 
 from tank01_client import SimpleTank01Client
 from file_utils import DataFileManager
+from season_context import get_season_context_service
 from api_usage_manager import APIUsageManager
+from season_warehouse import get_season_warehouse
 
 def get_current_time_pacific():
     """Get current time in Pacific Time Zone."""
@@ -60,6 +62,8 @@ class Tank01WeeklyProjectionsArchiver:
         """Initialize the projections archiver."""
         self.logger = logging.getLogger(__name__)
         self.file_manager = DataFileManager()
+        self.season_context_service = get_season_context_service(file_manager=self.file_manager)
+        self.warehouse = get_season_warehouse()
         
         # Initialize Tank01 client
         self.tank01 = SimpleTank01Client()
@@ -80,41 +84,6 @@ class Tank01WeeklyProjectionsArchiver:
         
         self.logger.info("Tank01 Weekly Projections Archiver initialized")
     
-    def _extract_season_context(self) -> Dict[str, Any]:
-        """
-        Extract season and week context.
-        
-        Returns:
-            Dict containing season context information
-        """
-        season_context = {
-            "nfl_season": "2025",
-            "current_week": 1,
-            "season_phase": "Regular Season",
-            "data_source": "Tank01 API",
-            "collection_timestamp": get_current_time_pacific().isoformat(),
-            "verification_notes": []
-        }
-        
-        try:
-            # For now, we'll use a simple week detection
-            # In a real implementation, this could be more sophisticated
-            current_date = get_current_time_pacific()
-            season_start = datetime(2025, 9, 4, tzinfo=current_date.tzinfo)  # Approximate season start
-            
-            # Calculate week number (simplified)
-            days_since_start = (current_date - season_start).days
-            week_number = max(1, (days_since_start // 7) + 1)
-            
-            season_context['current_week'] = min(week_number, 18)  # Cap at 18 weeks
-            season_context['verification_notes'].append(f"Week calculated from season start: {week_number}")
-            
-        except Exception as e:
-            self.logger.warning(f"Could not calculate week number: {e}")
-            season_context['verification_notes'].append(f"Week calculation failed: {str(e)}")
-        
-        return season_context
-    
     def _get_weekly_projections(self, week: int, season: int = 2025) -> Dict[str, Any]:
         """
         Get weekly projections from Tank01 API.
@@ -306,7 +275,7 @@ class Tank01WeeklyProjectionsArchiver:
         self.logger.info(f"Starting Tank01 weekly projections archive (phase: {phase})")
         
         # Get season context
-        season_context = self._extract_season_context()
+        season_context = self.season_context_service.get_season_context('Tank01 API')
         current_week = season_context.get('current_week', 1)
         season = int(season_context.get('nfl_season', '2025'))
         
@@ -340,6 +309,7 @@ class Tank01WeeklyProjectionsArchiver:
             "tank01", "projections_archive", processed_data, week_prefix,
             custom_dir=str(week_dir)
         )
+        self.warehouse.ingest_snapshot("tank01", "projections_archive", processed_data, raw_file, phase=phase)
         
         output_files = {
             "clean": clean_file,
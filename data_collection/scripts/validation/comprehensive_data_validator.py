@@ -18,7 +18,6 @@ Usage:
 import os
 import sys
 import json
-import glob
 import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
@@ -29,6 +28,7 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.append(str(project_root))
 
 from ai_agents.comprehensive_data_processor import ComprehensiveDataProcessor
+from data_collection.scripts.shared.file_utils import DataFileManager
 from config.player_limits import DEFAULT_PLAYER_LIMITS
 
 class ComprehensiveDataValidator:
@@ -36,6 +36,7 @@ class ComprehensiveDataValidator:
     
     def __init__(self, outputs_dir: str = "data_collection/outputs"):
         self.outputs_dir = outputs_dir
+        self.file_manager = DataFileManager(outputs_dir)
         self.validation_results = {
             'timestamp': datetime.now().isoformat(),
             'total_errors': 0,
@@ -75,34 +76,34 @@ class ComprehensiveDataValidator:
         self.logger.info("-" * 40)
         
         # Check my roster
-        my_roster_files = self._find_latest_files("yahoo/my_roster", "*_raw_data.json")
+        my_roster_files = self._find_latest_files("yahoo/my_roster")
         if not my_roster_files:
             self._add_critical_error("No Yahoo my_roster data found")
             return
         
-        my_roster_data = self._load_json_file(my_roster_files[0])
+        my_roster_data = self._load_raw_file(my_roster_files[0])
         my_roster_players = self._extract_roster_players(my_roster_data)
         
         self.logger.info(f"✅ My roster: {len(my_roster_players)} players")
         
         # Check opponent roster
-        opponent_files = self._find_latest_files("yahoo/opponent_rosters", "*_raw_data.json")
+        opponent_files = self._find_latest_files("yahoo/opponent_rosters")
         if not opponent_files:
             self._add_critical_error("No Yahoo opponent_rosters data found")
             return
         
-        opponent_data = self._load_json_file(opponent_files[0])
+        opponent_data = self._load_raw_file(opponent_files[0])
         opponent_players = self._extract_opponent_players(opponent_data)
         
         self.logger.info(f"✅ Opponent roster: {len(opponent_players)} players")
         
         # Check available players
-        available_files = self._find_latest_files("yahoo/available_players", "*_raw_data.json")
+        available_files = self._find_latest_files("yahoo/available_players")
         if not available_files:
             self._add_critical_error("No Yahoo available_players data found")
             return
         
-        available_data = self._load_json_file(available_files[0])
+        available_data = self._load_raw_file(available_files[0])
         available_players = self._extract_available_players(available_data)
         
         self.logger.info(f"✅ Available players: {len(available_players)} players")
@@ -120,12 +121,12 @@ class ComprehensiveDataValidator:
         self.logger.info("-" * 40)
         
         # Check my roster
-        my_roster_files = self._find_latest_files("sleeper/my_roster", "*_raw_data.json")
+        my_roster_files = self._find_latest_files("sleeper/my_roster")
         if not my_roster_files:
             self._add_critical_error("No Sleeper my_roster data found")
             return
         
-        my_roster_data = self._load_json_file(my_roster_files[0])
+        my_roster_data = self._load_raw_file(my_roster_files[0])
         my_roster_matched = len(my_roster_data.get('matched_players', []))
         my_roster_unmatched = len(my_roster_data.get('unmatched_players', []))
         
@@ -135,12 +136,12 @@ class ComprehensiveDataValidator:
             self.logger.info(f"✅ My roster: {my_roster_matched} matched, {my_roster_unmatched} unmatched")
         
         # Check opponent roster
-        opponent_files = self._find_latest_files("sleeper/opponent_roster", "*_raw_data.json")
+        opponent_files = self._find_latest_files("sleeper/opponent_roster")
         if not opponent_files:
             self._add_critical_error("No Sleeper opponent_roster data found")
             return
         
-        opponent_data = self._load_json_file(opponent_files[0])
+        opponent_data = self._load_raw_file(opponent_files[0])
         opponent_matched = len(opponent_data.get('matched_players', []))
         opponent_unmatched = len(opponent_data.get('unmatched_players', []))
         
@@ -150,12 +151,12 @@ class ComprehensiveDataValidator:
             self.logger.info(f"✅ Opponent roster: {opponent_matched} matched, {opponent_unmatched} unmatched")
         
         # Check available players
-        available_files = self._find_latest_files("sleeper/available_players", "*_raw_data.json")
+        available_files = self._find_latest_files("sleeper/available_players")
         if not available_files:
             self._add_critical_error("No Sleeper available_players data found")
             return
         
-        available_data = self._load_json_file(available_files[0])
+        available_data = self._load_raw_file(available_files[0])
         available_matched = len(available_data.get('matched_players', []))
         available_unmatched = len(available_data.get('unmatched_players', []))
         
@@ -180,12 +181,12 @@ class ComprehensiveDataValidator:
         self.logger.info("-" * 40)
         
         # Check my roster
-        my_roster_files = self._find_latest_files("tank01/my_roster", "*_raw_data.json")
+        my_roster_files = self._find_latest_files("tank01/my_roster")
         if not my_roster_files:
             self._add_critical_error("No Tank01 my_roster data found")
             return
         
-        my_roster_data = self._load_json_file(my_roster_files[0])
+        my_roster_data = self._load_raw_file(my_roster_files[0])
         my_roster_matched = len(my_roster_data.get('matched_players', []))
         my_roster_unmatched = len(my_roster_data.get('unmatched_players', []))
         
@@ -195,12 +196,12 @@ class ComprehensiveDataValidator:
             self.logger.info(f"✅ My roster: {my_roster_matched} matched, {my_roster_unmatched} unmatched")
         
         # Check opponent roster
-        opponent_files = self._find_latest_files("tank01/opponent_roster", "*_raw_data.json")
+        opponent_files = self._find_latest_files("tank01/opponent_roster")
         if not opponent_files:
             self._add_critical_error("No Tank01 opponent_roster data found")
             return
         
-        opponent_data = self._load_json_file(opponent_files[0])
+        opponent_data = self._load_raw_file(opponent_files[0])
         opponent_matched = len(opponent_data.get('matched_players', []))
         opponent_unmatched = len(opponent_data.get('unmatched_players', []))
         
@@ -210,12 +211,12 @@ class ComprehensiveDataValidator:
             self.logger.info(f"✅ Opponent roster: {opponent_matched} matched, {opponent_unmatched} unmatched")
         
         # Check available players
-        available_files = self._find_latest_files("tank01/available_players", "*_raw_data.json")
+        available_files = self._find_latest_files("tank01/available_players")
         if not available_files:
             self._add_critical_error("No Tank01 available_players data found")
             return
         
-        available_data = self._load_json_file(available_files[0])
+        available_data = self._load_raw_file(available_files[0])
         available_matched = len(available_data.get('matched_players', []))
         available_unmatched = len(available_data.get('unmatched_players', []))
         
@@ -374,17 +375,15 @@ class ComprehensiveDataValidator:
         
         self.logger.info(f"📄 Validation report saved: {report_file}")
     
-    def _find_latest_files(self, subdir: str, pattern: str) -> List[str]:
-        """Find latest files matching pattern in subdirectory."""
-        search_path = os.path.join(self.outputs_dir, subdir, "**", pattern)
-        files = glob.glob(search_path, recursive=True)
-        return sorted(files)
+    def _find_latest_files(self, subdir: str) -> List[str]:
+        """Raw data files of an <api>/<script> subdirectory from its output manifest (newest first)."""
+        api_name, _, script_name = subdir.partition("/")
+        return self.file_manager.list_files(api_name, script_name)["raw_data"]
     
-    def _load_json_file(self, file_path: str) -> Dict[str, Any]:
-        """Load JSON file safely."""
+    def _load_raw_file(self, file_path: str) -> Dict[str, Any]:
+        """Load a raw data file (any storage format) safely."""
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            return self.file_manager.load_raw_data(file_path)
         except Exception as e:
             self._add_critical_error(f"Failed to load {file_path}: {str(e)}")
             return {}
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Raw Snapshot Storage Benchmark
+
+Compares the raw snapshot storage formats registered in file_utils against the
+original pretty-printed JSON: write time, read time and bytes on disk, using
+existing raw outputs as the sample.
+
+Usage:
+    python3 data_collection/scripts/validation/raw_storage_benchmark.py
+    python3 data_collection/scripts/validation/raw_storage_benchmark.py --api tank01 --files 20
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add shared utilities to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
+
+from file_utils import DataFileManager, RAW_DATA_CODECS
+
+
+def find_sample_files(outputs_dir: Path, api_name: str, limit: int) -> List[Path]:
+    """Largest raw snapshots for an API (the files that matter for disk usage)."""
+    files = [f for f in (outputs_dir / api_name).glob("**/*_raw_data.*") if f.is_file()]
+    return sorted(files, key=lambda f: f.stat().st_size, reverse=True)[:limit]
+
+
+def benchmark_format(format_name: str, snapshots: List[Any], repeats: int) -> Dict[str, Any]:
+    """Write and read every snapshot through DataFileManager in one format."""
+    with tempfile.TemporaryDirectory() as outputs:
+        manager = DataFileManager(outputs, raw_format=format_name)
+        paths = []
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            paths = [manager.save_raw_data("benchmark", "snapshot", data, f"20250101_0000{i:02d}")
+                     for i, data in enumerate(snapshots)]
+        write_seconds = (time.perf_counter() - start) / repeats
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for path in paths:
+                manager.load_raw_data(path)
+        read_seconds = (time.perf_counter() - start) / repeats
+
+        total_bytes = sum(os.path.getsize(p) for p in paths)
+
+    return {
+        'format': format_name,
+        'write_seconds': write_seconds,
+        'read_seconds': read_seconds,
+        'bytes': total_bytes
+    }
+
+
+def main():
+    """Run the storage benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark raw snapshot storage formats")
+    parser.add_argument('--api', default='tank01', help='Output tree to sample (default: tank01)')
+    parser.add_argument('--files', type=int, default=10, help='Number of raw snapshots to sample')
+    parser.add_argument('--repeats', type=int, default=3, help='Timing repetitions per format')
+    args = parser.parse_args()
+
+    outputs_dir = Path(__file__).resolve().parent.parent.parent / "outputs"
+    sample_files = find_sample_files(outputs_dir, args.api, args.files)
+    if not sample_files:
+        print(f"❌ No raw snapshots found under {outputs_dir / args.api}")
+        sys.exit(1)
+
+    reader = DataFileManager(str(outputs_dir))
+    snapshots = [reader.load_raw_data(str(f)) for f in sample_files]
+
+    print("📦 Raw Snapshot Storage Benchmark")
+    print("=" * 72)
+    print(f"Sample: {len(snapshots)} {args.api} snapshots, "
+          f"{sum(f.stat().st_size for f in sample_files) / 1e6:.1f} MB on disk today")
+    print()
+
+    results = []
+    for format_name, codec in RAW_DATA_CODECS.items():
+        if not codec.available():
+            print(f"⚠️  {format_name}: backend not installed, skipped")
+            continue
+        results.append(benchmark_format(format_name, snapshots, args.repeats))
+
+    baseline = next(r for r in results if r['format'] == 'json')
+    print(f"{'Format':<14}{'Write (s)':>11}{'Read (s)':>11}{'Size (MB)':>12}{'vs json':>10}")
+    print("-" * 58)
+    for result in results:
+        ratio = result['bytes'] / baseline['bytes']
+        print(f"{result['format']:<14}{result['write_seconds']:>11.3f}{result['read_seconds']:>11.3f}"
+              f"{result['bytes'] / 1e6:>12.2f}{ratio:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
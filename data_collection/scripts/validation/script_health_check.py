@@ -13,11 +13,15 @@ import os
 import sys
 import subprocess
 import json
-import glob
 from datetime import datetime
 from typing import Dict, List, Any, Tuple
 from pathlib import Path
 
+# Add shared utilities to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
+
+from file_utils import DataFileManager
+
 class ScriptHealthChecker:
     """Checks health of all data collection scripts."""
     
@@ -25,6 +29,7 @@ class ScriptHealthChecker:
         self.project_root = Path(__file__).parent.parent.parent.parent
         self.scripts_dir = self.project_root / "data_collection" / "scripts"
         self.outputs_dir = self.project_root / "data_collection" / "outputs"
+        self.file_manager = DataFileManager(str(self.outputs_dir))
         
         self.health_results = {
             'timestamp': datetime.now().isoformat(),
@@ -103,34 +108,12 @@ class ScriptHealthChecker:
             self._record_script_failure(api, script_name, display_name, f"Unexpected error: {str(e)}")
     
     def _find_script_outputs(self, api: str, script_name: str) -> List[str]:
-        """Find output files created by script."""
-        # Look for recent files in the appropriate output directory
-        search_patterns = {
-            'my_roster.py': f"{api}/my_roster/**/*_raw_data.json",
-            'opponent_roster.py': f"{api}/opponent_roster/**/*_raw_data.json",
-            'opponent_rosters.py': f"{api}/opponent_rosters/**/*_raw_data.json",
-            'available_players.py': f"{api}/available_players/**/*_raw_data.json",
-            'team_matchups.py': f"{api}/team_matchups/**/*_raw_data.json",
-            'transaction_trends.py': f"{api}/transaction_trends/**/*_raw_data.json",
-            'league_settings.py': f"{api}/league_settings/**/*_raw_data.json",
-            'season_info.py': f"{api}/season_info/**/*_raw_data.json",
-            'trending.py': f"{api}/trending/**/*_raw_data.json",
-        }
-        
-        pattern = search_patterns.get(script_name, f"{api}/**/*_raw_data.json")
-        search_path = self.outputs_dir / pattern
-        
-        files = glob.glob(str(search_path), recursive=True)
+        """Find output files created by script (raw data files indexed in its output manifest)."""
+        raw_files = self.file_manager.list_files(api, Path(script_name).stem)["raw_data"]
         
         # Filter to recent files (last 10 minutes)
-        recent_files = []
         cutoff_time = datetime.now().timestamp() - 600  # 10 minutes ago
-        
-        for file_path in files:
-            if os.path.getmtime(file_path) > cutoff_time:
-                recent_files.append(file_path)
-        
-        return sorted(recent_files)
+        return sorted(file_path for file_path in raw_files if os.path.getmtime(file_path) > cutoff_time)
     
     def _record_script_success(self, api: str, script_name: str, display_name: str, output_files: List[str]):
         """Record successful script execution."""
@@ -16,9 +16,10 @@ Focus: Extract ALL data, no analysis or filtering
 
 import os
 import sys
-import json
 import logging
-import re
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
@@ -28,6 +29,13 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
 from yahoo_auth import SimpleYahooAuth
 from data_formatter import MarkdownFormatter
 from file_utils import DataFileManager
+from season_context import get_season_context_service
+
+# Yahoo's page size for the players collection
+PAGE_SIZE = 25
+
+# Default number of pages requested at once after the first page
+DEFAULT_MAX_CONCURRENT_PAGES = int(os.getenv('YAHOO_MAX_CONCURRENT_PAGES', '8'))
 
 class AvailablePlayersExtractor:
     """
@@ -37,8 +45,17 @@ class AvailablePlayersExtractor:
     players endpoint with pagination and multiple sections.
     """
     
-    def __init__(self):
-        """Initialize the available players extractor."""
+    def __init__(self, max_concurrent_pages: int = DEFAULT_MAX_CONCURRENT_PAGES,
+                 yahoo_auth: Optional[SimpleYahooAuth] = None,
+                 file_manager: Optional[DataFileManager] = None):
+        """
+        Initialize the available players extractor.
+        
+        Args:
+            max_concurrent_pages: Pages fetched in parallel once the total is known (1 = sequential)
+            yahoo_auth: Shared Yahoo auth client (default: a new SimpleYahooAuth)
+            file_manager: Shared file manager (default: a new DataFileManager)
+        """
         # Set up logging
         logging.basicConfig(
             level=logging.INFO,
@@ -47,9 +64,12 @@ class AvailablePlayersExtractor:
         self.logger = logging.getLogger(__name__)
         
         # Initialize utilities
-        self.yahoo_auth = SimpleYahooAuth()
+        self.yahoo_auth = yahoo_auth or SimpleYahooAuth()
         self.formatter = MarkdownFormatter()
-        self.file_manager = DataFileManager()
+        self.file_manager = file_manager or DataFileManager()
+        self.season_context_service = get_season_context_service(self.yahoo_auth, self.file_manager)
+        self.max_concurrent_pages = max(1, max_concurrent_pages)
+        self._stats_lock = threading.Lock()
         
         # Execution tracking
         self.execution_stats = {
@@ -71,7 +91,7 @@ class AvailablePlayersExtractor:
         
         try:
             # Get league info first
-            league_info = self._get_league_info()
+            league_info = self.season_context_service.get_league_info()
             if not league_info:
                 self.logger.error("❌ Failed to get league info")
                 return {}
@@ -90,7 +110,7 @@ class AvailablePlayersExtractor:
             organized_data = self._organize_players_into_sections(all_players)
             
             # Extract season context
-            season_context = self._extract_season_context(league_info)
+            season_context = self.season_context_service.get_season_context('Yahoo Fantasy API')
             
             # Add metadata
             result = {
@@ -122,432 +142,195 @@ class AvailablePlayersExtractor:
             self.execution_stats['errors'] += 1
             return {}
     
-    def _extract_season_context(self, league_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract season and week context from Yahoo data."""
-        try:
-            current_date = datetime.now()
-            season_context = {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': self._determine_season_phase(current_date),
-                'data_source': 'Yahoo Fantasy API',
-                'verification_notes': []
-            }
+    def _extract_all_available_players(self, league_key: str) -> List[Dict[str, Any]]:
+        """
+        Extract all available players with pagination.
+        
+        The first page reports the total number of players. The remaining
+        pages are then requested concurrently (up to max_concurrent_pages at
+        once) and reassembled in rank order. If Yahoo does not report a total,
+        pages are fetched sequentially until a short page comes back.
+        
+        Args:
+            league_key: League key for API calls
             
-            # Extract season info from league info
-            league_name = league_info.get('league_name', '')
-            league_key = league_info.get('league_key', '')
+        Returns:
+            List of all available players
+        """
+        count = PAGE_SIZE
+        
+        self.logger.info(f"🔍 Starting pagination for league: {league_key}")
+        
+        first_section = self._fetch_players_page(league_key, 0, count)
+        if first_section is None:
+            self.execution_stats['errors'] += 1
+            return []
+        
+        total_players = int(first_section.get('total', 0) or 0)
+        self.logger.info(f"📊 Total players available: {total_players}")
+        
+        first_page = self._extract_players_from_page(first_section)
+        self.logger.info(f"✅ Page 1: {len(first_page)} players extracted")
+        
+        if len(first_page) < count or (total_players > 0 and len(first_page) >= total_players):
+            pages = [first_page]
+        elif total_players > 0 and self.max_concurrent_pages > 1:
+            pages = [first_page] + self._fetch_pages_concurrently(league_key, total_players, count)
+        else:
+            if total_players == 0:
+                self.logger.info("📊 Total count is 0, will continue pagination until no more players")
+            pages = [first_page] + self._fetch_pages_sequentially(league_key, total_players, count, len(first_page))
+        
+        # Reassemble in page order, dropping players that shifted between pages
+        all_players = []
+        seen_keys = set()
+        for page_players in pages:
+            for player in page_players:
+                player_key = player.get('player_key')
+                if player_key and player_key in seen_keys:
+                    continue
+                seen_keys.add(player_key)
+                all_players.append(player)
+        
+        self.execution_stats['players_extracted'] = len(all_players)
+        self.logger.info(f"✅ Pagination complete: {len(all_players)} total players extracted")
+        
+        return all_players
+    
+    def _fetch_pages_concurrently(self, league_key: str, total_players: int,
+                                  count: int) -> List[List[Dict[str, Any]]]:
+        """
+        Fetch every page after the first in parallel.
+        
+        A page that fails is counted as an error and retried once on its own;
+        if the retry fails too its players are missing from the result.
+        
+        Args:
+            league_key: League key for API calls
+            total_players: Total reported by the first page
+            count: Page size
             
-            # Extract year from league name
-            year_match = re.search(r'(\d{4})', league_name)
-            if year_match:
-                extracted_year = year_match.group(1)
-                season_context['nfl_season'] = extracted_year
-                season_context['verification_notes'].append(f"League name contains year: {extracted_year}")
-            
-            # Extract year from Yahoo league key (e.g., "461.l.595012")
-            if league_key:
-                key_parts = league_key.split('.')
-                if len(key_parts) > 0:
-                    yahoo_year = str(2025)  # Hardcoded for now
-                    season_context['nfl_season'] = yahoo_year
-                    season_context['verification_notes'].append(f"Yahoo league key code {key_parts[0]} indicates year: {yahoo_year}")
-            
-            season_context['yahoo_league_info'] = {
-                'league_key': league_key,
-                'league_name': league_name
-            }
+        Returns:
+            Player lists for each page, in start-offset order
+        """
+        starts = list(range(count, total_players, count))
+        workers = min(self.max_concurrent_pages, len(starts))
+        self.logger.info(f"⚡ Fetching {len(starts)} remaining pages with {workers} in flight")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            sections = list(executor.map(lambda start: self._fetch_players_page(league_key, start, count), starts))
+        
+        pages = []
+        for start, section in zip(starts, sections):
+            if section is None:
+                self.execution_stats['errors'] += 1
+                self.logger.warning(f"⚠️ Page {start//count + 1} failed, retrying")
+                section = self._fetch_players_page(league_key, start, count)
+                if section is None:
+                    self.execution_stats['errors'] += 1
+                    self.logger.error(f"❌ Page {start//count + 1} failed again: up to {count} players "
+                                      f"(ranks {start + 1}-{start + count}) are missing")
+                    pages.append([])
+                    continue
+            page_players = self._extract_players_from_page(section)
+            self.logger.info(f"✅ Page {start//count + 1}: {len(page_players)} players extracted")
+            pages.append(page_players)
+        return pages
+    
+    def _fetch_pages_sequentially(self, league_key: str, total_players: int, count: int,
+                                  extracted: int) -> List[List[Dict[str, Any]]]:
+        """
+        Fetch pages after the first one at a time until the list runs out.
+        
+        Args:
+            league_key: League key for API calls
+            total_players: Total reported by the first page (0 if unknown)
+            count: Page size
+            extracted: Players already extracted from the first page
             
-            # Try to get current week from Yahoo team matchups
-            season_context['current_week'] = None
-            season_context['week_info'] = {}
+        Returns:
+            Player lists for each page, in start-offset order
+        """
+        pages = []
+        start = count
+        
+        while True:
+            section = self._fetch_players_page(league_key, start, count)
+            if section is None:
+                if total_players > 0 and extracted < total_players:
+                    self.execution_stats['errors'] += 1
+                    self.logger.error(f"❌ Stopped at page {start//count + 1}: "
+                                      f"{total_players - extracted} players are missing")
+                break
             
-            try:
-                current_week = self._extract_current_week_from_yahoo_data(league_key)
-                if current_week:
-                    season_context['current_week'] = current_week['week']
-                    season_context['week_info'] = current_week
-                    season_context['verification_notes'].append(f"Current week {current_week['week']} extracted from Yahoo team matchups API")
-                else:
-                    # Fallback: estimate from date
-                    season_start = datetime(current_date.year, 9, 1, tzinfo=current_date.tzinfo)
-                    if current_date >= season_start:
-                        days_since_start = (current_date - season_start).days
-                        estimated_week = min((days_since_start // 7) + 1, 18)
-                        season_context['current_week'] = estimated_week
-                        season_context['week_info'] = {
-                            'week': estimated_week,
-                            'coverage_type': 'estimated',
-                            'status': 'estimated_from_date',
-                            'source': 'date_estimation'
-                        }
-                        season_context['verification_notes'].append(f"Estimated week {estimated_week} from current date")
-                    else:
-                        season_context['current_week'] = 1
-                        season_context['week_info'] = {
-                            'week': 1,
-                            'coverage_type': 'preseason',
-                            'status': 'preseason',
-                            'source': 'preseason_assumption'
-                        }
-                        season_context['verification_notes'].append("Preseason - using week 1")
-            except Exception as e:
-                self.logger.warning(f"Could not determine week: {e}")
-                season_context['current_week'] = 1
-                season_context['week_info'] = {
-                    'week': 1,
-                    'coverage_type': 'fallback',
-                    'status': 'fallback',
-                    'source': 'error_fallback'
-                }
-                season_context['verification_notes'].append("Could not determine current week - using fallback week 1")
-            
-            return season_context
+            page_players = self._extract_players_from_page(section)
+            pages.append(page_players)
+            extracted += len(page_players)
+            self.logger.info(f"✅ Page {start//count + 1}: {len(page_players)} players extracted")
             
-        except Exception as e:
-            self.logger.error(f"Error extracting season context: {e}")
-            return {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': 'Unknown',
-                'data_source': 'Yahoo Fantasy API',
-                'verification_notes': [f"Error extracting season context: {e}"]
-            }
-    
-    def _determine_season_phase(self, current_date: datetime) -> str:
-        """Determine the current phase of the NFL season based on date."""
-        month = current_date.month
-        day = current_date.day
+            # Check if we've got all players
+            if total_players > 0 and extracted >= total_players:
+                break
+            elif len(page_players) < count:
+                # No more players available
+                break
+            
+            start += count
         
-        if month == 9 and day < 15:
-            return "Early Regular Season"
-        elif month == 9 or month == 10:
-            return "Regular Season"
-        elif month == 11 or month == 12:
-            return "Late Regular Season"
-        elif month == 1 and day < 15:
-            return "Playoffs"
-        elif month == 1 and day >= 15:
-            return "Super Bowl"
-        elif month == 2:
-            return "Offseason"
-        elif month >= 3 and month <= 8:
-            return "Offseason"
-        else:
-            return "Unknown"
-    
-    def _extract_current_week_from_yahoo_data(self, league_key: str) -> Optional[Dict[str, Any]]:
-        """Extract current week information from Yahoo team matchups data."""
-        try:
-            # Look for the most recent team matchups file
-            from pathlib import Path
-            current_path = Path(__file__).resolve()
-            for parent in current_path.parents:
-                if parent.name == "data_collection":
-                    matchups_dir = parent / "outputs" / "yahoo" / "team_matchups"
-                    break
-            else:
-                matchups_dir = Path("data_collection/outputs/yahoo/team_matchups")
-
-            if not matchups_dir.exists():
-                self.logger.warning("Team matchups directory not found")
-                return None
-
-            # Get the most recent matchups file
-            matchup_files = list(matchups_dir.glob("**/*_team_matchups_raw_data.json"))
-            if not matchup_files:
-                self.logger.warning("No team matchups files found")
-                return None
-
-            latest_file = max(matchup_files, key=lambda f: f.stat().st_mtime)
-            self.logger.info(f"Loading team matchups from: {latest_file}")
-
-            with open(latest_file, 'r') as f:
-                matchups_data = json.load(f)
-
-            # Extract week information from matchups
-            matchups = matchups_data.get('matchups', {})
-            if not matchups:
-                return None
-
-            # Find the current week (look for week_1, week_2, etc.)
-            current_week_data = None
-            for week_key, week_data in matchups.items():
-                if week_key.startswith('week_'):
-                    week_num = week_data.get('week', 1)
-                    week_matchups = week_data.get('matchups', [])
-
-                    # Look for status in the matchups array
-                    week_start = ''
-                    week_end = ''
-                    status = 'unknown'
-
-                    if week_matchups:
-                        # Get status from first matchup
-                        first_matchup = week_matchups[0]
-                        week_start = first_matchup.get('week_start', '')
-                        week_end = first_matchup.get('week_end', '')
-                        status = first_matchup.get('status', 'unknown')
-
-                    # Check if this is the current week based on status
-                    if status in ['midevent', 'postevent', 'preevent']:
-                        current_week_data = {
-                            'week': week_num,
-                            'week_start': week_start,
-                            'week_end': week_end,
-                            'status': status,
-                            'coverage_type': 'week',
-                            'source': 'yahoo_team_matchups_api'
-                        }
-                        break
-
-            # If no current week found, use the first available week
-            if not current_week_data and matchups:
-                first_week_key = sorted(matchups.keys())[0]
-                first_week_data = matchups[first_week_key]
-                week_num = first_week_data.get('week', 1)
-                week_matchups = first_week_data.get('matchups', [])
-
-                week_start = ''
-                week_end = ''
-                status = 'unknown'
-
-                if week_matchups:
-                    first_matchup = week_matchups[0]
-                    week_start = first_matchup.get('week_start', '')
-                    week_end = first_matchup.get('week_end', '')
-                    status = first_matchup.get('status', 'unknown')
-
-                current_week_data = {
-                    'week': week_num,
-                    'week_start': week_start,
-                    'week_end': week_end,
-                    'status': status,
-                    'coverage_type': 'week',
-                    'source': 'yahoo_team_matchups_api'
-                }
-
-            return current_week_data
-
-        except Exception as e:
-            self.logger.warning(f"Could not extract current week from Yahoo data: {e}")
-            return None
+        return pages
     
-    def _get_league_info(self) -> Dict[str, Any]:
+    def _fetch_players_page(self, league_key: str, start: int, count: int) -> Optional[Dict[str, Any]]:
         """
-        Get league information from user's team.
+        Fetch a single page of available players.
         
+        Args:
+            league_key: League key for API calls
+            start: Offset of the first player on the page
+            count: Page size
+            
         Returns:
-            Dict with league information
+            The players section of the response, or None on error (callers
+            decide whether a missing page counts as an error)
         """
         try:
-            self.logger.info("🔍 Getting league information")
+            self.logger.info(f"📄 Fetching players {start}-{start + count - 1}")
             
-            # Get user's team info first
-            response = self.yahoo_auth.make_request("users;use_login=1/games;game_keys=nfl/teams")
-            self.execution_stats['api_calls'] += 1
+            # Make API request with pagination
+            endpoint = f"league/{league_key}/players;position=;status=A;sort=OR;start={start};count={count}"
+            response = self.yahoo_auth.make_request(endpoint)
+            with self._stats_lock:
+                self.execution_stats['api_calls'] += 1
+                self.execution_stats['pages_processed'] += 1
             
             if not response or 'parsed' not in response:
-                self.logger.error("❌ Invalid response structure")
-                return {}
+                self.logger.error(f"❌ Invalid response for page {start}")
+                return None
             
             # Get the parsed Yahoo API response
             parsed_data = response['parsed']
             if 'fantasy_content' not in parsed_data:
-                self.logger.error("❌ No fantasy_content in parsed response")
-                return {}
+                self.logger.error(f"❌ No fantasy_content for page {start}")
+                return None
             
             fantasy_content = parsed_data['fantasy_content']
-            users = fantasy_content.get('users', {})
-            
-
-            
-            if not users:
-                self.logger.error("❌ No users data found")
-                return {}
-            
-            # Get user data (this is a list, not a dict)
-            user_data = users.get('0', {}).get('user', [])
-            if not isinstance(user_data, list) or not user_data:
-                self.logger.error(f"❌ Invalid user_data structure: {type(user_data)}")
-                return {}
+            league = fantasy_content.get('league', [])
             
-            # Find the games section within the user data list
-            games_section = None
-            for section in user_data:
-                if isinstance(section, dict) and 'games' in section:
-                    games_section = section['games']
-                    break
-            
-            if not games_section:
-                self.logger.error("❌ No games section found")
-                return {}
-            
-            # Find the NFL game data (this is also a list)
-            nfl_game_data = games_section.get('0', {}).get('game', [])
-            if not isinstance(nfl_game_data, list) or not nfl_game_data:
-                self.logger.error(f"❌ Invalid game data structure: {type(nfl_game_data)}")
-                return {}
-            
-            # Extract league info and find teams section
-            teams_section = None
-            league_info = {}
-            
-            for game_section in nfl_game_data:
-                if isinstance(game_section, dict):
-                    # Check for teams section
-                    if 'teams' in game_section:
-                        teams_section = game_section['teams']
-                    
-                    # Collect league-level info
-                    for key in ['game_key', 'name', 'season']:
-                        if key in game_section:
-                            league_info[key] = game_section[key]
-            
-            if not teams_section:
-                self.logger.error("❌ No teams section found")
-                return {}
-            
-            # Extract team data (team is a list of property objects)
-            team_data = teams_section.get('0', {}).get('team', [])
-            if not isinstance(team_data, list) or not team_data:
-                self.logger.error(f"❌ Invalid team data structure: {type(team_data)}")
-                return {}
-            
-            # Parse team properties from the list of lists structure
-            team_properties = {}
-            
-            # Handle nested list structure - team_data could be a list of lists
-            if team_data and isinstance(team_data[0], list):
-                # It's a list of lists, use the first inner list
-                property_list = team_data[0]
-            else:
-                # It's a list of property objects
-                property_list = team_data
-            
-            # Extract properties from the list
-            for prop in property_list:
-                if isinstance(prop, dict):
-                    for key, value in prop.items():
-                        team_properties[key] = value
-            
-            # Validate we found the user's team
-            if team_properties.get('is_owned_by_current_login') != 1:
-                self.logger.error("❌ Team is not owned by current user")
-                return {}
-            
-            # Extract team key to determine league key
-            team_key = team_properties.get('team_key', '')
-            league_key = ''
-            if team_key:
-                # League key format: {game_id}.l.{league_id} (from team_key {game_id}.l.{league_id}.t.{team_id})
-                parts = team_key.split('.t.')
-                if len(parts) >= 1:
-                    league_key = parts[0]
+            if not league or len(league) < 2:
+                self.logger.error(f"❌ Unexpected league structure for page {start}")
+                return None
             
-            result = {
-                'team_key': team_key,
-                'team_name': team_properties.get('name', ''),
-                'team_id': team_properties.get('team_id', ''),
-                'league_key': league_key,
-                'league_name': f"Fantasy League ({league_info.get('season', '2025')})"
-            }
+            # Find players section
+            for section in league:
+                if isinstance(section, dict) and 'players' in section:
+                    if section['players']:
+                        return section['players']
             
-            self.logger.info(f"✅ Successfully extracted team info: {result}")
-            return result
+            self.logger.error(f"❌ No players section for page {start}")
+            return None
             
         except Exception as e:
-            self.logger.error(f"❌ Error getting league info: {e}")
-            return {}
-    
-    def _extract_all_available_players(self, league_key: str) -> List[Dict[str, Any]]:
-        """
-        Extract all available players with pagination.
-        
-        Args:
-            league_key: League key for API calls
-            
-        Returns:
-            List of all available players
-        """
-        all_players = []
-        start = 0
-        count = 25  # Yahoo's default page size
-        total_players = None
-        
-        self.logger.info(f"🔍 Starting pagination for league: {league_key}")
-        
-        while True:
-            try:
-                self.logger.info(f"📄 Fetching players {start}-{start + count - 1}")
-                
-                # Make API request with pagination
-                endpoint = f"league/{league_key}/players;position=;status=A;sort=OR;start={start};count={count}"
-                response = self.yahoo_auth.make_request(endpoint)
-                self.execution_stats['api_calls'] += 1
-                self.execution_stats['pages_processed'] += 1
-                
-                if not response or 'parsed' not in response:
-                    self.logger.error(f"❌ Invalid response for page {start}")
-                    break
-                
-                # Get the parsed Yahoo API response
-                parsed_data = response['parsed']
-                if 'fantasy_content' not in parsed_data:
-                    self.logger.error(f"❌ No fantasy_content for page {start}")
-                    break
-                
-                fantasy_content = parsed_data['fantasy_content']
-                league = fantasy_content.get('league', [])
-                
-                if not league or len(league) < 2:
-                    self.logger.error(f"❌ Unexpected league structure for page {start}")
-                    break
-                
-                # Find players section
-                players_section = None
-                for section in league:
-                    if isinstance(section, dict) and 'players' in section:
-                        players_section = section['players']
-                        break
-                
-                if not players_section:
-                    self.logger.error(f"❌ No players section for page {start}")
-                    break
-                
-                # Get pagination info
-                if total_players is None:
-                    total_players = int(players_section.get('total', 0))
-                    self.logger.info(f"📊 Total players available: {total_players}")
-                    
-                    # If total is 0, we might need to continue pagination until we get no more players
-                    if total_players == 0:
-                        self.logger.info("📊 Total count is 0, will continue pagination until no more players")
-                
-                # Extract players from this page
-                page_players = self._extract_players_from_page(players_section)
-                all_players.extend(page_players)
-                
-                self.logger.info(f"✅ Page {start//count + 1}: {len(page_players)} players extracted")
-                
-                # Check if we've got all players
-                if total_players > 0 and len(all_players) >= total_players:
-                    break
-                elif len(page_players) < count:
-                    # No more players available
-                    break
-                
-                start += count
-                
-            except Exception as e:
-                self.logger.error(f"❌ Error processing page {start}: {e}")
-                self.execution_stats['errors'] += 1
-                break
-        
-        self.execution_stats['players_extracted'] = len(all_players)
-        self.logger.info(f"✅ Pagination complete: {len(all_players)} total players extracted")
-        
-        return all_players
+            self.logger.error(f"❌ Error processing page {start}: {e}")
+            return None
     
     def _extract_players_from_page(self, players_section: Dict) -> List[Dict[str, Any]]:
         """
@@ -870,7 +653,12 @@ class AvailablePlayersExtractor:
 
 def main():
     """Main execution function."""
-    extractor = AvailablePlayersExtractor()
+    parser = argparse.ArgumentParser(description='Yahoo Available Players Data Extraction')
+    parser.add_argument('--max-concurrent-pages', type=int, default=DEFAULT_MAX_CONCURRENT_PAGES,
+                        help=f'Pages fetched in parallel after the first (default: {DEFAULT_MAX_CONCURRENT_PAGES}, 1 = sequential)')
+    args = parser.parse_args()
+    
+    extractor = AvailablePlayersExtractor(max_concurrent_pages=args.max_concurrent_pages)
     
     try:
         # Extract all data
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Yahoo Fantasy Football - League Settings Data Extraction
+
+This script extracts the league settings (roster positions, stat categories and
+stat modifiers) from the Yahoo Fantasy API. It outputs both clean markdown and
+raw JSON data.
+
+The raw output is what the rest of the tree reads the league's rules from:
+- FantasyScoringEngine.from_latest_league_settings (stat_modifiers)
+- the lineup optimizer's roster slots (roster_positions)
+
+Purpose: Clean, focused data extraction for league settings
+Output: Organized markdown file + raw API response JSON
+Focus: Extract ALL data, no analysis or filtering
+"""
+
+import os
+import sys
+import logging
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+# Add shared utilities to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
+
+from yahoo_auth import SimpleYahooAuth
+from file_utils import DataFileManager
+from season_context import get_season_context_service
+from fantasy_scoring import iter_yahoo_stats
+
+
+def parse_league_settings(parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten a parsed league/{league_key}/settings response.
+
+    Yahoo returns fantasy_content.league as [league metadata, {'settings': [{...}]}];
+    the settings sections are merged into one dict.
+
+    Returns:
+        Settings dict (roster_positions, stat_categories, stat_modifiers, ...), empty if absent
+    """
+    league = (parsed_data.get('fantasy_content') or {}).get('league', [])
+    settings: Dict[str, Any] = {}
+    for league_section in league if isinstance(league, list) else [league]:
+        if not isinstance(league_section, dict) or 'settings' not in league_section:
+            continue
+        sections = league_section['settings']
+        for section in sections if isinstance(sections, list) else [sections]:
+            if isinstance(section, dict):
+                settings.update(section)
+    return settings
+
+
+def flatten_roster_positions(roster_positions: Any) -> List[Dict[str, Any]]:
+    """Roster positions as flat {'position', 'position_type', 'count', 'is_starting_position'} dicts."""
+    positions = []
+    for entry in roster_positions or []:
+        if not isinstance(entry, dict):
+            continue
+        entry = entry.get('roster_position', entry)
+        if not isinstance(entry, dict) or not entry.get('position'):
+            continue
+        try:
+            count = int(entry.get('count', 1))
+        except (TypeError, ValueError):
+            count = 1
+        positions.append({
+            'position': entry['position'],
+            'position_type': entry.get('position_type', ''),
+            'count': count,
+            'is_starting_position': str(entry.get('is_starting_position', '1')) == '1'
+        })
+    return positions
+
+
+class LeagueSettingsExtractor:
+    """
+    Extracts the league settings for the user's Yahoo Fantasy Football league.
+
+    One league/{league_key}/settings call per run.
+    """
+
+    def __init__(self, yahoo_auth: Optional[SimpleYahooAuth] = None,
+                 file_manager: Optional[DataFileManager] = None):
+        """
+        Initialize the league settings extractor.
+
+        Args:
+            yahoo_auth: Shared Yahoo auth client (default: a new SimpleYahooAuth)
+            file_manager: Shared file manager (default: a new DataFileManager)
+        """
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        self.logger = logging.getLogger(__name__)
+
+        self.yahoo_auth = yahoo_auth or SimpleYahooAuth()
+        self.file_manager = file_manager or DataFileManager()
+        self.season_context_service = get_season_context_service(self.yahoo_auth, self.file_manager)
+
+        self.execution_stats: Dict[str, Any] = {
+            'start_time': datetime.now(),
+            'api_calls': 0,
+            'errors': 0
+        }
+
+    def extract_league_settings(self) -> Dict[str, Any]:
+        """
+        Extract the league settings.
+
+        Returns:
+            Dict with league_info, season_context, settings (the flattened Yahoo
+            settings), roster_positions and extraction_metadata; empty on failure
+        """
+        self.logger.info("⚙️ Starting league settings extraction...")
+        try:
+            league_info = self.season_context_service.get_league_info()
+            if not league_info:
+                self.logger.error("❌ Failed to get league information")
+                self.execution_stats['errors'] += 1
+                return {}
+
+            league_key = league_info['league_key']
+            self.logger.info(f"📋 Found league: {league_info.get('league_name', 'Unknown')} ({league_key})")
+
+            response = self.yahoo_auth.make_request(f"league/{league_key}/settings")
+            self.execution_stats['api_calls'] += 1
+            if not response or response.get('status') != 'success':
+                self.logger.error("❌ Failed to get league settings")
+                self.execution_stats['errors'] += 1
+                return {}
+
+            settings = parse_league_settings(response.get('parsed', {}))
+            if not settings:
+                self.logger.error("❌ No settings in league settings response")
+                self.execution_stats['errors'] += 1
+                return {}
+
+            roster_positions = flatten_roster_positions(settings.get('roster_positions'))
+            self.logger.info(f"✅ Extracted league settings: {len(roster_positions)} roster positions")
+            return {
+                'league_info': league_info,
+                'season_context': self.season_context_service.get_season_context('Yahoo Fantasy API'),
+                'settings': settings,
+                'roster_positions': roster_positions,
+                'extraction_metadata': {
+                    'timestamp': datetime.now().isoformat(),
+                    'api_calls': self.execution_stats['api_calls'],
+                    'errors': self.execution_stats['errors']
+                }
+            }
+
+        except Exception as e:
+            self.logger.error(f"❌ Error in league settings extraction: {e}")
+            self.execution_stats['errors'] += 1
+            return {}
+
+    def save_data(self, data: Dict[str, Any]) -> bool:
+        """Save extracted data to files."""
+        try:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            raw_ok = self.file_manager.save_raw_data('yahoo', 'league_settings', data, timestamp)
+            md_ok = self.file_manager.save_clean_data('yahoo', 'league_settings',
+                                                      self._generate_markdown_report(data), timestamp)
+            log_ok = self.file_manager.save_execution_log('yahoo', 'league_settings', {
+                'script': 'league_settings.py',
+                'timestamp': timestamp,
+                'execution_stats': self.execution_stats
+            }, timestamp)
+            ok = bool(raw_ok and md_ok and log_ok)
+            if ok:
+                self.logger.info(f"✅ Data saved successfully with timestamp: {timestamp}")
+            else:
+                self.logger.error("❌ Failed to save some data files")
+            return ok
+        except Exception as e:
+            self.logger.error(f"❌ Error saving data: {e}")
+            return False
+
+    def _generate_markdown_report(self, data: Dict[str, Any]) -> str:
+        """Generate clean markdown report from extracted data."""
+        league_info = data.get('league_info', {})
+        settings = data.get('settings', {})
+
+        report = [f"# League Settings - {league_info.get('league_name', 'Unknown League')}"]
+        report.append(f"**League Key:** {league_info.get('league_key', 'Unknown')}")
+        report.append(f"**Extraction Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        report.append("")
+
+        report.append("## Roster Positions")
+        report.append("| Position | Count | Starting |")
+        report.append("|----------|-------|----------|")
+        for position in data.get('roster_positions', []):
+            starting = "Yes" if position.get('is_starting_position') else "No"
+            report.append(f"| {position['position']} | {position['count']} | {starting} |")
+        report.append("")
+
+        modifiers = {}
+        for stat in iter_yahoo_stats(settings.get('stat_modifiers')):
+            modifiers[str(stat.get('stat_id'))] = stat.get('value', '')
+        report.append("## Scoring")
+        report.append("| Stat ID | Stat | Points |")
+        report.append("|---------|------|--------|")
+        for stat in iter_yahoo_stats(settings.get('stat_categories')):
+            stat_id = str(stat.get('stat_id'))
+            if stat_id in modifiers:
+                report.append(f"| {stat_id} | {stat.get('name', stat.get('display_name', ''))} | {modifiers[stat_id]} |")
+        report.append("")
+
+        return "\n".join(report)
+
+
+def main():
+    """Main execution function."""
+    extractor = LeagueSettingsExtractor()
+    data = extractor.extract_league_settings()
+    if not data:
+        print("❌ No league settings extracted")
+        sys.exit(1)
+    if not extractor.save_data(data):
+        print("❌ Failed to save data")
+        sys.exit(1)
+
+    print("\n🎉 League Settings Extraction Complete!")
+    print(f"📋 Roster Positions: {len(data['roster_positions'])}")
+    print(f"🔗 API Calls: {extractor.execution_stats['api_calls']}")
+    print(f"⏱️ Execution Time: {datetime.now() - extractor.execution_stats['start_time']}")
+
+
+if __name__ == "__main__":
+    main()
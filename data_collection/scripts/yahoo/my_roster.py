@@ -12,7 +12,6 @@ Focus: Extract ALL data, no analysis or filtering
 
 import os
 import sys
-import json
 import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional
@@ -23,6 +22,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
 from yahoo_auth import SimpleYahooAuth
 from data_formatter import MarkdownFormatter
 from file_utils import DataFileManager
+from season_context import get_season_context_service
+from season_warehouse import get_season_warehouse
 
 class MyRosterExtractor:
     """
@@ -32,8 +33,15 @@ class MyRosterExtractor:
     roster endpoint without filtering or analysis.
     """
     
-    def __init__(self):
-        """Initialize the roster extractor."""
+    def __init__(self, yahoo_auth: Optional[SimpleYahooAuth] = None,
+                 file_manager: Optional[DataFileManager] = None):
+        """
+        Initialize the roster extractor.
+        
+        Args:
+            yahoo_auth: Shared Yahoo auth client (default: a new SimpleYahooAuth)
+            file_manager: Shared file manager (default: a new DataFileManager)
+        """
         # Set up logging
         logging.basicConfig(
             level=logging.INFO,
@@ -42,9 +50,11 @@ class MyRosterExtractor:
         self.logger = logging.getLogger(__name__)
         
         # Initialize utilities
-        self.yahoo_auth = SimpleYahooAuth()
+        self.yahoo_auth = yahoo_auth or SimpleYahooAuth()
         self.formatter = MarkdownFormatter()
-        self.file_manager = DataFileManager()
+        self.file_manager = file_manager or DataFileManager()
+        self.season_context_service = get_season_context_service(self.yahoo_auth, self.file_manager)
+        self.warehouse = get_season_warehouse()
         
         # Execution tracking
         self.execution_stats = {
@@ -67,18 +77,9 @@ class MyRosterExtractor:
         try:
             self.logger.info("Starting roster data extraction")
             
-            # Step 1: Discover user's leagues and teams
+            # Step 1: Discover user's league and team (shared across collectors)
             self.logger.info("Discovering leagues and teams...")
-            league_data = self.yahoo_auth.discover_leagues_and_teams()
-            self.execution_stats['api_calls_made'] += 1
-            
-            if not league_data or league_data.get('status') != 'success':
-                self.logger.error("Failed to discover leagues and teams")
-                self.execution_stats['errors_encountered'] += 1
-                return {}
-            
-            # Extract team and league information
-            team_info = self._extract_team_info(league_data.get('parsed', {}))
+            team_info = self.season_context_service.get_league_info()
             if not team_info:
                 self.logger.error("Could not extract team information")
                 self.execution_stats['errors_encountered'] += 1
@@ -97,7 +98,8 @@ class MyRosterExtractor:
                 return {}
             
             # Get current week and season context
-            season_context = self._extract_season_context(team_info, roster_data.get('parsed', {}))
+            season_context = self.season_context_service.get_season_context('Yahoo Fantasy API')
+            season_context['league_info'] = season_context['yahoo_league_info']
             
             # Combine all data
             complete_data = {
@@ -122,389 +124,6 @@ class MyRosterExtractor:
             self.execution_stats['errors_encountered'] += 1
             return {}
     
-    def _extract_team_info(self, parsed_data: Dict) -> Dict[str, str]:
-        """
-        Extract team and league information from discovery response.
-        
-        Args:
-            parsed_data: Parsed discovery response
-            
-        Returns:
-            Dict with team_key, team_name, league_key, league_name
-        """
-        try:
-            # Navigate Yahoo's complex JSON structure
-            users = parsed_data.get('fantasy_content', {}).get('users', {})
-            if not users:
-                self.logger.error("No users section found")
-                return {}
-            
-            # Get user data (this is a list, not a dict)
-            user_data = users.get('0', {}).get('user', [])
-            if not isinstance(user_data, list) or not user_data:
-                self.logger.error(f"Invalid user_data structure: {type(user_data)}")
-                return {}
-            
-            # Find the games section within the user data list
-            games_section = None
-            for section in user_data:
-                if isinstance(section, dict) and 'games' in section:
-                    games_section = section['games']
-                    break
-            
-            if not games_section:
-                self.logger.error("No games section found")
-                return {}
-            
-            # Find the NFL game data (this is also a list)
-            nfl_game_data = games_section.get('0', {}).get('game', [])
-            if not isinstance(nfl_game_data, list) or not nfl_game_data:
-                self.logger.error(f"Invalid game data structure: {type(nfl_game_data)}")
-                return {}
-            
-            # Extract league info and find teams section
-            teams_section = None
-            league_info = {}
-            
-            for game_section in nfl_game_data:
-                if isinstance(game_section, dict):
-                    # Check for teams section
-                    if 'teams' in game_section:
-                        teams_section = game_section['teams']
-                    
-                    # Collect league-level info
-                    for key in ['game_key', 'name', 'season']:
-                        if key in game_section:
-                            league_info[key] = game_section[key]
-            
-            if not teams_section:
-                self.logger.error("No teams section found")
-                return {}
-            
-            # Extract team data (team is a list of property objects)
-            team_data = teams_section.get('0', {}).get('team', [])
-            if not isinstance(team_data, list) or not team_data:
-                self.logger.error(f"Invalid team data structure: {type(team_data)}")
-                return {}
-            
-            # Parse team properties from the list of lists structure
-            team_properties = {}
-            
-            # Handle nested list structure - team_data could be a list of lists
-            if team_data and isinstance(team_data[0], list):
-                # It's a list of lists, use the first inner list
-                property_list = team_data[0]
-            else:
-                # It's a list of property objects
-                property_list = team_data
-            
-            # Extract properties from the list
-            for prop in property_list:
-                if isinstance(prop, dict):
-                    for key, value in prop.items():
-                        team_properties[key] = value
-            
-            # Validate we found the user's team
-            if team_properties.get('is_owned_by_current_login') != 1:
-                self.logger.error("Team is not owned by current user")
-                return {}
-            
-            # Extract team key to determine league key
-            team_key = team_properties.get('team_key', '')
-            league_key = ''
-            if team_key:
-                # League key format: {game_id}.l.{league_id} (from team_key {game_id}.l.{league_id}.t.{team_id})
-                parts = team_key.split('.t.')
-                if len(parts) >= 1:
-                    league_key = parts[0]
-            
-            result = {
-                'team_key': team_key,
-                'team_name': team_properties.get('name', ''),
-                'team_id': team_properties.get('team_id', ''),
-                'league_key': league_key,
-                'league_name': f"Fantasy League ({league_info.get('season', '2025')})"
-            }
-            
-            self.logger.info(f"Successfully extracted team info: {result}")
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting team info: {e}")
-            import traceback
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
-            return {}
-    
-    def _extract_season_context(self, team_info: Dict, roster_data: Dict) -> Dict[str, Any]:
-        """
-        Extract season and week context from Yahoo data.
-        
-        Args:
-            team_info: Team information dict
-            roster_data: Raw roster data from Yahoo API
-            
-        Returns:
-            Dict with season context information
-        """
-        try:
-            current_date = datetime.now()
-            season_context = {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': self._determine_season_phase(current_date),
-                'data_source': 'Yahoo Fantasy API',
-                'league_info': {
-                    'league_key': team_info.get('league_key', ''),
-                    'league_name': team_info.get('league_name', ''),
-                    'team_key': team_info.get('team_key', '')
-                },
-                'current_week': None,
-                'week_info': {},
-                'verification_notes': []
-            }
-            
-            # Extract season from league name or team key
-            league_name = team_info.get('league_name', '')
-            team_key = team_info.get('team_key', '')
-            
-            # Look for year in league name
-            import re
-            year_match = re.search(r'(\d{4})', league_name)
-            if year_match:
-                extracted_year = year_match.group(1)
-                season_context['nfl_season'] = extracted_year
-                season_context['verification_notes'].append(f"League name contains year: {extracted_year}")
-            
-            # Extract year from team key (format: 461.l.595012.t.3)
-            if team_key and '.' in team_key:
-                key_parts = team_key.split('.')
-                if len(key_parts) >= 2 and key_parts[0].isdigit():
-                    yahoo_code = int(key_parts[0])
-                    # Yahoo uses 461 for 2025, 460 for 2024, etc.
-                    yahoo_year = str(2025)  # For now, assume 2025 based on 461
-                    season_context['nfl_season'] = yahoo_year
-                    season_context['verification_notes'].append(f"Yahoo team key code {yahoo_code} indicates year: {yahoo_year}")
-            
-            # Extract current week from Yahoo API data
-            try:
-                # First, try to get week from team matchups data (most reliable)
-                current_week = self._extract_current_week_from_yahoo_data(team_info.get('league_key', ''))
-                
-                if current_week:
-                    season_context['current_week'] = current_week['week']
-                    season_context['week_info'] = current_week
-                    season_context['verification_notes'].append(f"Current week {current_week['week']} extracted from Yahoo team matchups API")
-                else:
-                    # Fallback: try to extract from roster data
-                    fantasy_content = roster_data.get('fantasy_content', {})
-                    team_data = fantasy_content.get('team', [])
-                    
-                    if isinstance(team_data, list) and len(team_data) > 0:
-                        for item in team_data:
-                            if isinstance(item, dict) and 'roster' in item:
-                                roster_info = item['roster']
-                                if isinstance(roster_info, list) and len(roster_info) > 0:
-                                    for roster_item in roster_info:
-                                        if isinstance(roster_item, dict) and 'coverage_type' in roster_item:
-                                            coverage = roster_item.get('coverage_type', '')
-                                            if 'week' in coverage.lower():
-                                                week_num = roster_item.get('week', '1')
-                                                season_context['current_week'] = int(week_num)
-                                                season_context['week_info'] = {
-                                                    'week': int(week_num),
-                                                    'coverage_type': coverage,
-                                                    'status': roster_item.get('status', 'unknown'),
-                                                    'source': 'roster_data'
-                                                }
-                                                season_context['verification_notes'].append(f"Current week {week_num} extracted from roster data")
-                                                break
-                    
-                    # Final fallback: estimate from date
-                    if season_context['current_week'] is None:
-                        current_date = datetime.now()
-                        season_start = datetime(current_date.year, 9, 1)
-                        if current_date >= season_start:
-                            days_since_start = (current_date - season_start).days
-                            estimated_week = min((days_since_start // 7) + 1, 18)
-                            season_context['current_week'] = estimated_week
-                            season_context['week_info'] = {
-                                'week': estimated_week,
-                                'coverage_type': 'estimated',
-                                'status': 'estimated_from_date',
-                                'source': 'date_estimation'
-                            }
-                            season_context['verification_notes'].append(f"Estimated week {estimated_week} from current date")
-                        else:
-                            season_context['current_week'] = 1
-                            season_context['week_info'] = {
-                                'week': 1,
-                                'coverage_type': 'preseason',
-                                'status': 'preseason',
-                                'source': 'preseason_assumption'
-                            }
-                            season_context['verification_notes'].append("Preseason - using week 1")
-                        
-            except Exception as e:
-                self.logger.warning(f"Could not extract week info: {e}")
-                season_context['current_week'] = 1
-                season_context['week_info'] = {
-                    'week': 1,
-                    'coverage_type': 'fallback',
-                    'status': 'fallback',
-                    'source': 'error_fallback'
-                }
-                season_context['verification_notes'].append("Could not determine current week - using fallback week 1")
-            
-            # Add current date context
-            if current_date.month >= 9:
-                season_context['verification_notes'].append(f"Current date {current_date.strftime('%Y-%m-%d')} suggests NFL season is in progress")
-            elif current_date.month <= 2:
-                season_context['verification_notes'].append(f"Current date {current_date.strftime('%Y-%m-%d')} suggests NFL playoffs/super bowl period")
-            else:
-                season_context['verification_notes'].append(f"Current date {current_date.strftime('%Y-%m-%d')} suggests NFL offseason")
-            
-            return season_context
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting season context: {e}")
-            return {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': 'Unknown',
-                'data_source': 'Yahoo Fantasy API',
-                'verification_notes': [f"Error extracting season context: {e}"]
-            }
-    
-    def _determine_season_phase(self, current_date: datetime) -> str:
-        """Determine the current phase of the NFL season based on date"""
-        month = current_date.month
-        day = current_date.day
-        
-        if month == 9 and day < 15:
-            return "Early Regular Season"
-        elif month == 9 or month == 10:
-            return "Regular Season"
-        elif month == 11 or month == 12:
-            return "Late Regular Season"
-        elif month == 1 and day < 15:
-            return "Playoffs"
-        elif month == 1 and day >= 15:
-            return "Super Bowl"
-        elif month == 2:
-            return "Offseason"
-        elif month >= 3 and month <= 8:
-            return "Offseason"
-        else:
-            return "Unknown"
-    
-    def _extract_current_week_from_yahoo_data(self, league_key: str) -> Optional[Dict[str, Any]]:
-        """
-        Extract current week information from Yahoo team matchups data.
-        
-        Args:
-            league_key: Yahoo league key (e.g., "461.l.595012")
-            
-        Returns:
-            Dict with week information or None if not found
-        """
-        try:
-            if not league_key:
-                return None
-                
-            # Look for the most recent team matchups file
-            from pathlib import Path
-            current_path = Path(__file__).resolve()
-            for parent in current_path.parents:
-                if parent.name == "data_collection":
-                    matchups_dir = parent / "outputs" / "yahoo" / "team_matchups"
-                    break
-            else:
-                matchups_dir = Path("data_collection/outputs/yahoo/team_matchups")
-            
-            if not matchups_dir.exists():
-                self.logger.warning("Team matchups directory not found")
-                return None
-            
-            # Get the most recent matchups file
-            matchup_files = list(matchups_dir.glob("**/*_team_matchups_raw_data.json"))
-            if not matchup_files:
-                self.logger.warning("No team matchups files found")
-                return None
-            
-            latest_file = max(matchup_files, key=lambda f: f.stat().st_mtime)
-            self.logger.info(f"Loading team matchups from: {latest_file}")
-            
-            with open(latest_file, 'r') as f:
-                matchups_data = json.load(f)
-            
-            # Extract week information from matchups
-            matchups = matchups_data.get('matchups', {})
-            if not matchups:
-                return None
-            
-            # Find the current week (look for week_1, week_2, etc.)
-            current_week_data = None
-            for week_key, week_data in matchups.items():
-                if week_key.startswith('week_'):
-                    week_num = week_data.get('week', 1)
-                    week_matchups = week_data.get('matchups', [])
-                    
-                    # Look for status in the matchups array
-                    week_start = ''
-                    week_end = ''
-                    status = 'unknown'
-                    
-                    if week_matchups:
-                        # Get status from first matchup
-                        first_matchup = week_matchups[0]
-                        week_start = first_matchup.get('week_start', '')
-                        week_end = first_matchup.get('week_end', '')
-                        status = first_matchup.get('status', 'unknown')
-                    
-                    # Check if this is the current week based on status
-                    if status in ['midevent', 'postevent', 'preevent']:
-                        current_week_data = {
-                            'week': week_num,
-                            'week_start': week_start,
-                            'week_end': week_end,
-                            'status': status,
-                            'coverage_type': 'week',
-                            'source': 'yahoo_team_matchups_api'
-                        }
-                        break
-            
-            # If no current week found, use the first available week
-            if not current_week_data and matchups:
-                first_week_key = sorted(matchups.keys())[0]
-                first_week_data = matchups[first_week_key]
-                week_num = first_week_data.get('week', 1)
-                week_matchups = first_week_data.get('matchups', [])
-                
-                week_start = ''
-                week_end = ''
-                status = 'unknown'
-                
-                if week_matchups:
-                    first_matchup = week_matchups[0]
-                    week_start = first_matchup.get('week_start', '')
-                    week_end = first_matchup.get('week_end', '')
-                    status = first_matchup.get('status', 'unknown')
-                
-                current_week_data = {
-                    'week': week_num,
-                    'week_start': week_start,
-                    'week_end': week_end,
-                    'status': status,
-                    'coverage_type': 'week',
-                    'source': 'yahoo_team_matchups_api'
-                }
-            
-            return current_week_data
-            
-        except Exception as e:
-            self.logger.warning(f"Could not extract current week from Yahoo data: {e}")
-            return None
-    
     def _extract_players(self, roster_data: Dict) -> List[Dict[str, Any]]:
         """
         Extract all player data from roster response.
@@ -806,6 +425,7 @@ class MyRosterExtractor:
             raw_file = self.file_manager.save_raw_data(
                 "yahoo", "my_roster", roster_data, timestamp
             )
+            self.warehouse.ingest_snapshot("yahoo", "my_roster", roster_data, raw_file)
             
             # Save execution log
             log_file = self.file_manager.save_execution_log(
@@ -12,9 +12,7 @@ Focus: Extract ALL data, no analysis or filtering
 
 import os
 import sys
-import json
 import logging
-import re
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
@@ -24,6 +22,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
 from yahoo_auth import SimpleYahooAuth
 from data_formatter import MarkdownFormatter
 from file_utils import DataFileManager
+from season_context import get_season_context_service
+from season_warehouse import get_season_warehouse
 
 class OpponentRostersExtractor:
     """
@@ -33,8 +33,15 @@ class OpponentRostersExtractor:
     league teams and individual team roster endpoints without filtering or analysis.
     """
     
-    def __init__(self):
-        """Initialize the opponent rosters extractor."""
+    def __init__(self, yahoo_auth: Optional[SimpleYahooAuth] = None,
+                 file_manager: Optional[DataFileManager] = None):
+        """
+        Initialize the opponent rosters extractor.
+        
+        Args:
+            yahoo_auth: Shared Yahoo auth client (default: a new SimpleYahooAuth)
+            file_manager: Shared file manager (default: a new DataFileManager)
+        """
         # Set up logging
         logging.basicConfig(
             level=logging.INFO,
@@ -43,9 +50,11 @@ class OpponentRostersExtractor:
         self.logger = logging.getLogger(__name__)
         
         # Initialize utilities
-        self.yahoo_auth = SimpleYahooAuth()
+        self.yahoo_auth = yahoo_auth or SimpleYahooAuth()
         self.formatter = MarkdownFormatter()
-        self.file_manager = DataFileManager()
+        self.file_manager = file_manager or DataFileManager()
+        self.season_context_service = get_season_context_service(self.yahoo_auth, self.file_manager)
+        self.warehouse = get_season_warehouse()
         
         # Execution tracking
         self.execution_stats = {
@@ -67,7 +76,7 @@ class OpponentRostersExtractor:
         
         try:
             # Step 1: Get user's league information
-            league_info = self._get_league_info()
+            league_info = self.season_context_service.get_league_info()
             if not league_info:
                 raise Exception("Failed to get league information")
             
@@ -99,7 +108,7 @@ class OpponentRostersExtractor:
                     self.execution_stats['errors'] += 1
             
             # Extract season context
-            season_context = self._extract_season_context(league_info)
+            season_context = self.season_context_service.get_season_context('Yahoo Fantasy API')
             
             # Step 4: Compile complete data
             complete_data = {
@@ -125,357 +134,6 @@ class OpponentRostersExtractor:
             self.execution_stats['errors'] += 1
             raise
     
-    def _extract_season_context(self, league_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract season and week context from Yahoo data."""
-        try:
-            current_date = datetime.now()
-            season_context = {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': self._determine_season_phase(current_date),
-                'data_source': 'Yahoo Fantasy API',
-                'verification_notes': []
-            }
-            
-            # Extract season info from league info
-            league_name = league_info.get('league_name', '')
-            league_key = league_info.get('league_key', '')
-            
-            # Extract year from league name
-            year_match = re.search(r'(\d{4})', league_name)
-            if year_match:
-                extracted_year = year_match.group(1)
-                season_context['nfl_season'] = extracted_year
-                season_context['verification_notes'].append(f"League name contains year: {extracted_year}")
-            
-            # Extract year from Yahoo league key (e.g., "461.l.595012")
-            if league_key:
-                key_parts = league_key.split('.')
-                if len(key_parts) > 0:
-                    yahoo_year = str(2025)  # Hardcoded for now
-                    season_context['nfl_season'] = yahoo_year
-                    season_context['verification_notes'].append(f"Yahoo league key code {key_parts[0]} indicates year: {yahoo_year}")
-            
-            season_context['yahoo_league_info'] = {
-                'league_key': league_key,
-                'league_name': league_name
-            }
-            
-            # Try to get current week from Yahoo team matchups
-            season_context['current_week'] = None
-            season_context['week_info'] = {}
-            
-            try:
-                current_week = self._extract_current_week_from_yahoo_data(league_key)
-                if current_week:
-                    season_context['current_week'] = current_week['week']
-                    season_context['week_info'] = current_week
-                    season_context['verification_notes'].append(f"Current week {current_week['week']} extracted from Yahoo team matchups API")
-                else:
-                    # Fallback: estimate from date
-                    season_start = datetime(current_date.year, 9, 1, tzinfo=current_date.tzinfo)
-                    if current_date >= season_start:
-                        days_since_start = (current_date - season_start).days
-                        estimated_week = min((days_since_start // 7) + 1, 18)
-                        season_context['current_week'] = estimated_week
-                        season_context['week_info'] = {
-                            'week': estimated_week,
-                            'coverage_type': 'estimated',
-                            'status': 'estimated_from_date',
-                            'source': 'date_estimation'
-                        }
-                        season_context['verification_notes'].append(f"Estimated week {estimated_week} from current date")
-                    else:
-                        season_context['current_week'] = 1
-                        season_context['week_info'] = {
-                            'week': 1,
-                            'coverage_type': 'preseason',
-                            'status': 'preseason',
-                            'source': 'preseason_assumption'
-                        }
-                        season_context['verification_notes'].append("Preseason - using week 1")
-            except Exception as e:
-                self.logger.warning(f"Could not determine week: {e}")
-                season_context['current_week'] = 1
-                season_context['week_info'] = {
-                    'week': 1,
-                    'coverage_type': 'fallback',
-                    'status': 'fallback',
-                    'source': 'error_fallback'
-                }
-                season_context['verification_notes'].append("Could not determine current week - using fallback week 1")
-            
-            return season_context
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting season context: {e}")
-            return {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': 'Unknown',
-                'data_source': 'Yahoo Fantasy API',
-                'verification_notes': [f"Error extracting season context: {e}"]
-            }
-    
-    def _determine_season_phase(self, current_date: datetime) -> str:
-        """Determine the current phase of the NFL season based on date."""
-        month = current_date.month
-        day = current_date.day
-        
-        if month == 9 and day < 15:
-            return "Early Regular Season"
-        elif month == 9 or month == 10:
-            return "Regular Season"
-        elif month == 11 or month == 12:
-            return "Late Regular Season"
-        elif month == 1 and day < 15:
-            return "Playoffs"
-        elif month == 1 and day >= 15:
-            return "Super Bowl"
-        elif month == 2:
-            return "Offseason"
-        elif month >= 3 and month <= 8:
-            return "Offseason"
-        else:
-            return "Unknown"
-    
-    def _extract_current_week_from_yahoo_data(self, league_key: str) -> Optional[Dict[str, Any]]:
-        """Extract current week information from Yahoo team matchups data."""
-        try:
-            # Look for the most recent team matchups file
-            from pathlib import Path
-            current_path = Path(__file__).resolve()
-            for parent in current_path.parents:
-                if parent.name == "data_collection":
-                    matchups_dir = parent / "outputs" / "yahoo" / "team_matchups"
-                    break
-            else:
-                matchups_dir = Path("data_collection/outputs/yahoo/team_matchups")
-
-            if not matchups_dir.exists():
-                self.logger.warning("Team matchups directory not found")
-                return None
-
-            # Get the most recent matchups file
-            matchup_files = list(matchups_dir.glob("**/*_team_matchups_raw_data.json"))
-            if not matchup_files:
-                self.logger.warning("No team matchups files found")
-                return None
-
-            latest_file = max(matchup_files, key=lambda f: f.stat().st_mtime)
-            self.logger.info(f"Loading team matchups from: {latest_file}")
-
-            with open(latest_file, 'r') as f:
-                matchups_data = json.load(f)
-
-            # Extract week information from matchups
-            matchups = matchups_data.get('matchups', {})
-            if not matchups:
-                return None
-
-            # Find the current week (look for week_1, week_2, etc.)
-            current_week_data = None
-            for week_key, week_data in matchups.items():
-                if week_key.startswith('week_'):
-                    week_num = week_data.get('week', 1)
-                    week_matchups = week_data.get('matchups', [])
-
-                    # Look for status in the matchups array
-                    week_start = ''
-                    week_end = ''
-                    status = 'unknown'
-
-                    if week_matchups:
-                        # Get status from first matchup
-                        first_matchup = week_matchups[0]
-                        week_start = first_matchup.get('week_start', '')
-                        week_end = first_matchup.get('week_end', '')
-                        status = first_matchup.get('status', 'unknown')
-
-                    # Check if this is the current week based on status
-                    if status in ['midevent', 'postevent', 'preevent']:
-                        current_week_data = {
-                            'week': week_num,
-                            'week_start': week_start,
-                            'week_end': week_end,
-                            'status': status,
-                            'coverage_type': 'week',
-                            'source': 'yahoo_team_matchups_api'
-                        }
-                        break
-
-            # If no current week found, use the first available week
-            if not current_week_data and matchups:
-                first_week_key = sorted(matchups.keys())[0]
-                first_week_data = matchups[first_week_key]
-                week_num = first_week_data.get('week', 1)
-                week_matchups = first_week_data.get('matchups', [])
-
-                week_start = ''
-                week_end = ''
-                status = 'unknown'
-
-                if week_matchups:
-                    first_matchup = week_matchups[0]
-                    week_start = first_matchup.get('week_start', '')
-                    week_end = first_matchup.get('week_end', '')
-                    status = first_matchup.get('status', 'unknown')
-
-                current_week_data = {
-                    'week': week_num,
-                    'week_start': week_start,
-                    'week_end': week_end,
-                    'status': status,
-                    'coverage_type': 'week',
-                    'source': 'yahoo_team_matchups_api'
-                }
-
-            return current_week_data
-
-        except Exception as e:
-            self.logger.warning(f"Could not extract current week from Yahoo data: {e}")
-            return None
-    
-    def _get_league_info(self) -> Optional[Dict[str, Any]]:
-        """Get the user's league information using the exact same logic as my_roster.py."""
-        try:
-            self.logger.info("🔍 Getting user's league information...")
-            
-            # Use the same endpoint as my_roster.py to get league info
-            response = self.yahoo_auth.make_request("users;use_login=1/games;game_keys=nfl/teams")
-            self.execution_stats['api_calls'] += 1
-            
-            if not response or response.get('status') != 'success':
-                self.logger.error("❌ Failed to get league discovery response")
-                return None
-            
-            # Use the exact same logic as my_roster.py
-            parsed_data = response.get('parsed', {})
-            team_info = self._extract_team_info(parsed_data)
-            
-            if not team_info:
-                self.logger.error("❌ Could not extract team information")
-                return None
-            
-            # Convert to league info format
-            league_info = {
-                'league_key': team_info['league_key'],
-                'league_name': team_info['league_name'],
-                'team_key': team_info['team_key']
-            }
-            
-            self.logger.info(f"✅ Found league: {league_info['league_name']} ({league_info['league_key']})")
-            return league_info
-            
-        except Exception as e:
-            self.logger.error(f"❌ Error getting league info: {e}")
-            return None
-    
-    def _extract_team_info(self, parsed_data: Dict) -> Dict[str, str]:
-        """
-        Extract team and league information from discovery response.
-        This is the exact same method as my_roster.py.
-        """
-        try:
-            # Navigate Yahoo's complex JSON structure
-            users = parsed_data.get('fantasy_content', {}).get('users', {})
-            if not users:
-                self.logger.error("No users section found")
-                return {}
-            
-            # Get user data (this is a list, not a dict)
-            user_data = users.get('0', {}).get('user', [])
-            if not isinstance(user_data, list) or not user_data:
-                self.logger.error(f"Invalid user_data structure: {type(user_data)}")
-                return {}
-            
-            # Find the games section within the user data list
-            games_section = None
-            for section in user_data:
-                if isinstance(section, dict) and 'games' in section:
-                    games_section = section['games']
-                    break
-            
-            if not games_section:
-                self.logger.error("No games section found")
-                return {}
-            
-            # Find the NFL game data (this is also a list)
-            nfl_game_data = games_section.get('0', {}).get('game', [])
-            if not isinstance(nfl_game_data, list) or not nfl_game_data:
-                self.logger.error(f"Invalid game data structure: {type(nfl_game_data)}")
-                return {}
-            
-            # Extract league info and find teams section
-            teams_section = None
-            league_info = {}
-            
-            for game_section in nfl_game_data:
-                if isinstance(game_section, dict):
-                    # Check for teams section
-                    if 'teams' in game_section:
-                        teams_section = game_section['teams']
-                    
-                    # Collect league-level info
-                    for key in ['game_key', 'name', 'season']:
-                        if key in game_section:
-                            league_info[key] = game_section[key]
-            
-            if not teams_section:
-                self.logger.error("No teams section found")
-                return {}
-            
-            # Extract team data (team is a list of property objects)
-            team_data = teams_section.get('0', {}).get('team', [])
-            if not isinstance(team_data, list) or not team_data:
-                self.logger.error(f"Invalid team data structure: {type(team_data)}")
-                return {}
-            
-            # Parse team properties from the list of lists structure
-            team_properties = {}
-            
-            # Handle nested list structure - team_data could be a list of lists
-            if team_data and isinstance(team_data[0], list):
-                # It's a list of lists, use the first inner list
-                property_list = team_data[0]
-            else:
-                # It's a list of property objects
-                property_list = team_data
-            
-            # Extract properties from the list
-            for prop in property_list:
-                if isinstance(prop, dict):
-                    for key, value in prop.items():
-                        team_properties[key] = value
-            
-            # Extract league key from team key
-            team_key = team_properties.get('team_key', '')
-            if not team_key:
-                self.logger.error("No team_key found")
-                return {}
-            
-            # Team key format: 461.l.595012.t.3
-            # League key is: 461.l.595012
-            parts = team_key.split('.')
-            if len(parts) < 3:
-                self.logger.error(f"Invalid team_key format: {team_key}")
-                return {}
-            
-            league_key = '.'.join(parts[:3])
-            league_name = league_info.get('name', 'Unknown League')
-            team_name = team_properties.get('name', 'Unknown Team')
-            
-            return {
-                'team_key': team_key,
-                'team_name': team_name,
-                'league_key': league_key,
-                'league_name': league_name
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting team info: {e}")
-            return {}
-    
     def _get_all_league_teams(self, league_key: str) -> List[Dict[str, Any]]:
         """Get all teams in the league."""
         try:
@@ -776,7 +434,7 @@ class OpponentRostersExtractor:
         
         return player_info
     
-    def save_data(self, data: Dict[str, Any]) -> None:
+    def save_data(self, data: Dict[str, Any]) -> bool:
         """Save extracted data to files."""
         try:
             # Generate timestamp for filenames
@@ -784,6 +442,7 @@ class OpponentRostersExtractor:
             
             # Save raw JSON data
             raw_path = self.file_manager.save_raw_data("yahoo", "opponent_rosters", data, timestamp)
+            self.warehouse.ingest_snapshot("yahoo", "opponent_rosters", data, raw_path)
             
             # Generate and save markdown report
             markdown_content = self._generate_markdown_report(data)
@@ -801,6 +460,7 @@ class OpponentRostersExtractor:
             self.logger.info(f"✅ Data saved successfully")
             self.logger.info(f"📁 Raw data: {raw_path}")
             self.logger.info(f"📄 Markdown: {markdown_path}")
+            return True
             
         except Exception as e:
             self.logger.error(f"❌ Error saving data: {e}")
@@ -8,13 +8,16 @@ from the Yahoo Fantasy API. It outputs both clean markdown and raw JSON data.
 Purpose: Clean, focused data extraction for weekly team matchups
 Output: Organized markdown file + raw API response JSON
 Focus: Extract ALL data, no analysis or filtering
+
+Finished weeks are served from the MatchupWeekStore; only the current and
+in-progress weeks hit the scoreboard (use --full-season for weeks 1..current).
 """
 
 import os
 import sys
 import json
 import logging
-import re
+import argparse
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
@@ -24,6 +27,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
 from yahoo_auth import SimpleYahooAuth
 from data_formatter import MarkdownFormatter
 from file_utils import DataFileManager
+from season_context import get_season_context_service
+from matchup_store import MatchupWeekStore
 
 class TeamMatchupsExtractor:
     """
@@ -33,8 +38,17 @@ class TeamMatchupsExtractor:
     scoreboard endpoint without filtering or analysis.
     """
     
-    def __init__(self):
-        """Initialize the team matchups extractor."""
+    def __init__(self, yahoo_auth: Optional[SimpleYahooAuth] = None,
+                 file_manager: Optional[DataFileManager] = None,
+                 matchup_store: Optional[MatchupWeekStore] = None):
+        """
+        Initialize the team matchups extractor.
+        
+        Args:
+            yahoo_auth: Shared Yahoo auth client (default: a new SimpleYahooAuth)
+            file_manager: Shared file manager (default: a new DataFileManager)
+            matchup_store: Store of finalized weeks (default: data_collection/cache/yahoo_matchups)
+        """
         # Set up logging
         logging.basicConfig(
             level=logging.INFO,
@@ -43,9 +57,11 @@ class TeamMatchupsExtractor:
         self.logger = logging.getLogger(__name__)
         
         # Initialize utilities
-        self.yahoo_auth = SimpleYahooAuth()
+        self.yahoo_auth = yahoo_auth or SimpleYahooAuth()
         self.formatter = MarkdownFormatter()
-        self.file_manager = DataFileManager()
+        self.file_manager = file_manager or DataFileManager()
+        self.season_context_service = get_season_context_service(self.yahoo_auth, self.file_manager)
+        self.matchup_store = matchup_store or MatchupWeekStore()
         
         # Execution tracking
         self.execution_stats = {
@@ -53,15 +69,20 @@ class TeamMatchupsExtractor:
             'api_calls': 0,
             'errors': 0,
             'weeks_processed': 0,
+            'weeks_from_cache': 0,
             'total_matchups': 0
         }
     
-    def extract_team_matchups(self, weeks: List[int] = None) -> Dict[str, Any]:
+    def extract_team_matchups(self, weeks: List[int] = None, full_season: bool = False) -> Dict[str, Any]:
         """
         Extract complete matchup data for specified weeks.
         
+        Finalized weeks come from the matchup store; the rest are fetched and
+        stored once they are final.
+        
         Args:
             weeks: List of week numbers to extract (default: current week and previous week)
+            full_season: Extract every week from 1 through the current week
             
         Returns:
             Dict containing all extracted matchup data
@@ -70,7 +91,7 @@ class TeamMatchupsExtractor:
         
         try:
             # Step 1: Get user's league information
-            league_info = self._get_league_info()
+            league_info = self.season_context_service.get_league_info()
             if not league_info:
                 raise Exception("Failed to get league information")
             
@@ -78,22 +99,36 @@ class TeamMatchupsExtractor:
             self.logger.info(f"📋 Found league: {league_info['league_name']} ({league_key})")
             
             # Step 2: Determine weeks to extract
-            if weeks is None:
-                # Default: current week and previous week
-                current_week = self._get_current_week(league_key)
-                if current_week:
-                    weeks = [current_week - 1, current_week] if current_week > 1 else [current_week]
+            fetched = {}
+            if weeks is None or full_season:
+                # The default scoreboard is the current week: one call gives the week and its matchups
+                current = self._extract_week_matchups(league_key)
+                if current:
+                    current_week = current['week']
+                    fetched[current_week] = current
+                else:
+                    current_week = self.season_context_service.get_current_week(refresh=True)
+                if full_season:
+                    weeks = list(range(1, current_week + 1))
                 else:
-                    weeks = [1]  # Fallback to week 1
+                    weeks = [current_week - 1, current_week] if current_week > 1 else [current_week]
             
             self.logger.info(f"📅 Extracting matchups for weeks: {weeks}")
             
-            # Step 3: Extract matchups for each week
+            # Step 3: Extract matchups for each week (finalized weeks from the store)
             all_matchups = {}
             for week in weeks:
-                self.logger.info(f"🔍 Extracting matchups for week {week}...")
+                week_matchups = fetched.get(week)
+                if week_matchups is None:
+                    week_matchups = self.matchup_store.get(league_key, week)
+                    if week_matchups:
+                        self.logger.info(f"📦 Week {week} is final, using stored matchups")
+                        self.execution_stats['weeks_from_cache'] += 1
+                    else:
+                        week_matchups = fetched[week] = self._extract_week_matchups(league_key, week)
+                if week_matchups and week in fetched:
+                    self.matchup_store.put(league_key, week_matchups)
                 
-                week_matchups = self._extract_week_matchups(league_key, week)
                 if week_matchups:
                     all_matchups[f"week_{week}"] = week_matchups
                     self.execution_stats['weeks_processed'] += 1
@@ -102,8 +137,9 @@ class TeamMatchupsExtractor:
                     self.logger.warning(f"⚠️ Failed to extract matchups for week {week}")
                     self.execution_stats['errors'] += 1
             
-            # Extract season context
-            season_context = self._extract_season_context(league_info, all_matchups)
+            # Share the week status just collected, then extract season context
+            self.season_context_service.record_matchups(all_matchups)
+            season_context = self.season_context_service.get_season_context('Yahoo Fantasy API')
             
             # Step 4: Compile complete data
             complete_data = {
@@ -114,6 +150,7 @@ class TeamMatchupsExtractor:
                     'timestamp': datetime.now().isoformat(),
                     'weeks_requested': weeks,
                     'weeks_processed': self.execution_stats['weeks_processed'],
+                    'weeks_from_cache': self.execution_stats['weeks_from_cache'],
                     'total_matchups': self.execution_stats['total_matchups'],
                     'api_calls': self.execution_stats['api_calls'],
                     'errors': self.execution_stats['errors']
@@ -128,368 +165,25 @@ class TeamMatchupsExtractor:
             self.execution_stats['errors'] += 1
             raise
     
-    def _extract_season_context(self, league_info: Dict[str, Any], all_matchups: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract season and week context from Yahoo data."""
-        try:
-            current_date = datetime.now()
-            season_context = {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': self._determine_season_phase(current_date),
-                'data_source': 'Yahoo Fantasy API',
-                'verification_notes': []
-            }
-            
-            # Extract season info from league info
-            league_name = league_info.get('league_name', '')
-            league_key = league_info.get('league_key', '')
-            
-            # Extract year from league name
-            year_match = re.search(r'(\d{4})', league_name)
-            if year_match:
-                extracted_year = year_match.group(1)
-                season_context['nfl_season'] = extracted_year
-                season_context['verification_notes'].append(f"League name contains year: {extracted_year}")
-            
-            # Extract year from Yahoo league key (e.g., "461.l.595012")
-            if league_key:
-                key_parts = league_key.split('.')
-                if len(key_parts) > 0:
-                    yahoo_year = str(2025)  # Hardcoded for now
-                    season_context['nfl_season'] = yahoo_year
-                    season_context['verification_notes'].append(f"Yahoo league key code {key_parts[0]} indicates year: {yahoo_year}")
-            
-            season_context['yahoo_league_info'] = {
-                'league_key': league_key,
-                'league_name': league_name
-            }
-            
-            # Extract current week from matchups data
-            season_context['current_week'] = None
-            season_context['week_info'] = {}
-            
-            try:
-                current_week = self._extract_current_week_from_matchups(all_matchups)
-                if current_week:
-                    season_context['current_week'] = current_week['week']
-                    season_context['week_info'] = current_week
-                    season_context['verification_notes'].append(f"Current week {current_week['week']} extracted from Yahoo team matchups API")
-                else:
-                    # Fallback: estimate from date
-                    season_start = datetime(current_date.year, 9, 1, tzinfo=current_date.tzinfo)
-                    if current_date >= season_start:
-                        days_since_start = (current_date - season_start).days
-                        estimated_week = min((days_since_start // 7) + 1, 18)
-                        season_context['current_week'] = estimated_week
-                        season_context['week_info'] = {
-                            'week': estimated_week,
-                            'coverage_type': 'estimated',
-                            'status': 'estimated_from_date',
-                            'source': 'date_estimation'
-                        }
-                        season_context['verification_notes'].append(f"Estimated week {estimated_week} from current date")
-                    else:
-                        season_context['current_week'] = 1
-                        season_context['week_info'] = {
-                            'week': 1,
-                            'coverage_type': 'preseason',
-                            'status': 'preseason',
-                            'source': 'preseason_assumption'
-                        }
-                        season_context['verification_notes'].append("Preseason - using week 1")
-            except Exception as e:
-                self.logger.warning(f"Could not determine week: {e}")
-                season_context['current_week'] = 1
-                season_context['week_info'] = {
-                    'week': 1,
-                    'coverage_type': 'fallback',
-                    'status': 'fallback',
-                    'source': 'error_fallback'
-                }
-                season_context['verification_notes'].append("Could not determine current week - using fallback week 1")
-            
-            return season_context
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting season context: {e}")
-            return {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': 'Unknown',
-                'data_source': 'Yahoo Fantasy API',
-                'verification_notes': [f"Error extracting season context: {e}"]
-            }
-    
-    def _determine_season_phase(self, current_date: datetime) -> str:
-        """Determine the current phase of the NFL season based on date."""
-        month = current_date.month
-        day = current_date.day
-        
-        if month == 9 and day < 15:
-            return "Early Regular Season"
-        elif month == 9 or month == 10:
-            return "Regular Season"
-        elif month == 11 or month == 12:
-            return "Late Regular Season"
-        elif month == 1 and day < 15:
-            return "Playoffs"
-        elif month == 1 and day >= 15:
-            return "Super Bowl"
-        elif month == 2:
-            return "Offseason"
-        elif month >= 3 and month <= 8:
-            return "Offseason"
-        else:
-            return "Unknown"
-    
-    def _extract_current_week_from_matchups(self, all_matchups: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Extract current week information from matchups data."""
-        try:
-            # Find the current week (look for week_1, week_2, etc.)
-            current_week_data = None
-            for week_key, week_data in all_matchups.items():
-                if week_key.startswith('week_'):
-                    week_num = week_data.get('week', 1)
-                    week_matchups = week_data.get('matchups', [])
-
-                    # Look for status in the matchups array
-                    week_start = ''
-                    week_end = ''
-                    status = 'unknown'
-
-                    if week_matchups:
-                        # Get status from first matchup
-                        first_matchup = week_matchups[0]
-                        week_start = first_matchup.get('week_start', '')
-                        week_end = first_matchup.get('week_end', '')
-                        status = first_matchup.get('status', 'unknown')
-
-                    # Check if this is the current week based on status
-                    if status in ['midevent', 'postevent', 'preevent']:
-                        current_week_data = {
-                            'week': week_num,
-                            'week_start': week_start,
-                            'week_end': week_end,
-                            'status': status,
-                            'coverage_type': 'week',
-                            'source': 'yahoo_team_matchups_api'
-                        }
-                        break
-
-            # If no current week found, use the first available week
-            if not current_week_data and all_matchups:
-                first_week_key = sorted(all_matchups.keys())[0]
-                first_week_data = all_matchups[first_week_key]
-                week_num = first_week_data.get('week', 1)
-                week_matchups = first_week_data.get('matchups', [])
-
-                week_start = ''
-                week_end = ''
-                status = 'unknown'
-
-                if week_matchups:
-                    first_matchup = week_matchups[0]
-                    week_start = first_matchup.get('week_start', '')
-                    week_end = first_matchup.get('week_end', '')
-                    status = first_matchup.get('status', 'unknown')
-
-                current_week_data = {
-                    'week': week_num,
-                    'week_start': week_start,
-                    'week_end': week_end,
-                    'status': status,
-                    'coverage_type': 'week',
-                    'source': 'yahoo_team_matchups_api'
-                }
-
-            return current_week_data
-
-        except Exception as e:
-            self.logger.warning(f"Could not extract current week from matchups: {e}")
-            return None
-    
-    def _get_league_info(self) -> Optional[Dict[str, Any]]:
-        """Get the user's league information using the exact same logic as my_roster.py."""
-        try:
-            self.logger.info("🔍 Getting user's league information...")
-            
-            # Use the same endpoint as my_roster.py to get league info
-            response = self.yahoo_auth.make_request("users;use_login=1/games;game_keys=nfl/teams")
-            self.execution_stats['api_calls'] += 1
-            
-            if not response or response.get('status') != 'success':
-                self.logger.error("❌ Failed to get league discovery response")
-                return None
-            
-            # Use the exact same logic as my_roster.py
-            parsed_data = response.get('parsed', {})
-            team_info = self._extract_team_info(parsed_data)
-            
-            if not team_info:
-                self.logger.error("❌ Could not extract team information")
-                return None
-            
-            # Convert to league info format
-            league_info = {
-                'league_key': team_info['league_key'],
-                'league_name': team_info['league_name'],
-                'team_key': team_info['team_key']
-            }
-            
-            self.logger.info(f"✅ Found league: {league_info['league_name']} ({league_info['league_key']})")
-            return league_info
-            
-        except Exception as e:
-            self.logger.error(f"❌ Error getting league info: {e}")
-            return None
-    
-    def _extract_team_info(self, parsed_data: Dict) -> Dict[str, str]:
+    def _extract_week_matchups(self, league_key: str, week: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """
-        Extract team and league information from discovery response.
-        This is the exact same method as my_roster.py and opponent_rosters.py.
+        Extract matchup data for a specific week.
+        
+        Args:
+            league_key: Yahoo league key
+            week: Week number (default: the league's current week, read from the response)
         """
         try:
-            # Navigate Yahoo's complex JSON structure
-            users = parsed_data.get('fantasy_content', {}).get('users', {})
-            if not users:
-                self.logger.error("No users section found")
-                return {}
-            
-            # Get user data (this is a list, not a dict)
-            user_data = users.get('0', {}).get('user', [])
-            if not isinstance(user_data, list) or not user_data:
-                self.logger.error(f"Invalid user_data structure: {type(user_data)}")
-                return {}
-            
-            # Find the games section within the user data list
-            games_section = None
-            for section in user_data:
-                if isinstance(section, dict) and 'games' in section:
-                    games_section = section['games']
-                    break
-            
-            if not games_section:
-                self.logger.error("No games section found")
-                return {}
-            
-            # Find the NFL game data (this is also a list)
-            nfl_game_data = games_section.get('0', {}).get('game', [])
-            if not isinstance(nfl_game_data, list) or not nfl_game_data:
-                self.logger.error(f"Invalid game data structure: {type(nfl_game_data)}")
-                return {}
-            
-            # Extract league info and find teams section
-            teams_section = None
-            league_info = {}
-            
-            for game_section in nfl_game_data:
-                if isinstance(game_section, dict):
-                    # Check for teams section
-                    if 'teams' in game_section:
-                        teams_section = game_section['teams']
-                    
-                    # Collect league-level info
-                    for key in ['game_key', 'name', 'season']:
-                        if key in game_section:
-                            league_info[key] = game_section[key]
-            
-            if not teams_section:
-                self.logger.error("No teams section found")
-                return {}
-            
-            # Extract team data (team is a list of property objects)
-            team_data = teams_section.get('0', {}).get('team', [])
-            if not isinstance(team_data, list) or not team_data:
-                self.logger.error(f"Invalid team data structure: {type(team_data)}")
-                return {}
-            
-            # Parse team properties from the list of lists structure
-            team_properties = {}
-            
-            # Handle nested list structure - team_data could be a list of lists
-            if team_data and isinstance(team_data[0], list):
-                # It's a list of lists, use the first inner list
-                property_list = team_data[0]
+            if week is None:
+                self.logger.info("🔍 Extracting matchups for the current week...")
+                response = self.yahoo_auth.make_request(f"league/{league_key}/scoreboard")
             else:
-                # It's a list of property objects
-                property_list = team_data
-            
-            # Extract properties from the list
-            for prop in property_list:
-                if isinstance(prop, dict):
-                    for key, value in prop.items():
-                        team_properties[key] = value
-            
-            # Extract league key from team key
-            team_key = team_properties.get('team_key', '')
-            if not team_key:
-                self.logger.error("No team_key found")
-                return {}
-            
-            # Team key format: 461.l.595012.t.3
-            # League key is: 461.l.595012
-            parts = team_key.split('.')
-            if len(parts) < 3:
-                self.logger.error(f"Invalid team_key format: {team_key}")
-                return {}
-            
-            league_key = '.'.join(parts[:3])
-            league_name = league_info.get('name', 'Unknown League')
-            team_name = team_properties.get('name', 'Unknown Team')
-            
-            return {
-                'team_key': team_key,
-                'team_name': team_name,
-                'league_key': league_key,
-                'league_name': league_name
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting team info: {e}")
-            return {}
-    
-    def _get_current_week(self, league_key: str) -> Optional[int]:
-        """Get the current week from league settings."""
-        try:
-            self.logger.info(f"🔍 Getting current week for league: {league_key}")
-            
-            # Use scoreboard endpoint to get current week (more efficient)
-            response = self.yahoo_auth.make_request(f"league/{league_key}/scoreboard")
-            self.execution_stats['api_calls'] += 1
-            
-            if not response or response.get('status') != 'success':
-                self.logger.warning("Could not get current week, using week 1")
-                return 1
-            
-            # Navigate to league info
-            parsed_data = response.get('parsed', {})
-            fantasy_content = parsed_data.get('fantasy_content', {})
-            league = fantasy_content.get('league', [])
-            
-            # Find current_week in league info
-            for league_section in league:
-                if isinstance(league_section, dict) and 'current_week' in league_section:
-                    current_week = league_section['current_week']
-                    self.logger.info(f"✅ Current week: {current_week}")
-                    return int(current_week)
-            
-            self.logger.warning("Could not find current week in league info, using week 1")
-            return 1
-            
-        except Exception as e:
-            self.logger.error(f"❌ Error getting current week: {e}")
-            return 1
-    
-    def _extract_week_matchups(self, league_key: str, week: int) -> Optional[Dict[str, Any]]:
-        """Extract matchup data for a specific week."""
-        try:
-            self.logger.info(f"🔍 Extracting matchups for week {week}...")
-            
-            response = self.yahoo_auth.make_request(f"league/{league_key}/scoreboard;week={week}")
+                self.logger.info(f"🔍 Extracting matchups for week {week}...")
+                response = self.yahoo_auth.make_request(f"league/{league_key}/scoreboard;week={week}")
             self.execution_stats['api_calls'] += 1
             
             if not response or response.get('status') != 'success':
-                self.logger.error(f"❌ Failed to get scoreboard for week {week}")
+                self.logger.error(f"❌ Failed to get scoreboard for week {week or 'current'}")
                 return None
             
             # Get the parsed Yahoo API response
@@ -498,7 +192,13 @@ class TeamMatchupsExtractor:
                 self.logger.error("❌ No fantasy_content in parsed response")
                 return None
             
-
+            if week is None:
+                league = parsed_data['fantasy_content'].get('league', [])
+                week = next((int(section['current_week']) for section in league
+                             if isinstance(section, dict) and 'current_week' in section), None)
+                if week is None:
+                    self.logger.error("❌ No current_week in scoreboard response")
+                    return None
             
             # Extract matchup data using the same patterns as other scripts
             matchups = self._extract_matchups_from_response(parsed_data, week)
@@ -663,7 +363,7 @@ class TeamMatchupsExtractor:
             self.logger.error(f"❌ Error extracting team from matchup: {e}")
             return None
     
-    def save_data(self, data: Dict[str, Any]) -> None:
+    def save_data(self, data: Dict[str, Any]) -> bool:
         """Save extracted data to files."""
         try:
             # Generate timestamp for filenames
@@ -688,6 +388,7 @@ class TeamMatchupsExtractor:
             self.logger.info(f"✅ Data saved successfully")
             self.logger.info(f"📁 Raw data: {raw_path}")
             self.logger.info(f"📄 Markdown: {markdown_path}")
+            return True
             
         except Exception as e:
             self.logger.error(f"❌ Error saving data: {e}")
@@ -819,11 +520,17 @@ class TeamMatchupsExtractor:
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Extract Yahoo league matchups")
+    parser.add_argument('--weeks', type=str, help="Comma-separated week numbers (default: current and previous week)")
+    parser.add_argument('--full-season', action='store_true', help="Extract every week through the current week")
+    args = parser.parse_args()
+    
     try:
         extractor = TeamMatchupsExtractor()
         
         # Extract team matchup data (current week and previous week by default)
-        data = extractor.extract_team_matchups()
+        weeks = [int(w) for w in args.weeks.split(',')] if args.weeks else None
+        data = extractor.extract_team_matchups(weeks=weeks, full_season=args.full_season)
         
         # Save the data
         extractor.save_data(data)
@@ -831,7 +538,7 @@ def main():
         # Print summary
         stats = extractor.execution_stats
         print(f"\n🎉 Team Matchups Extraction Complete!")
-        print(f"📅 Weeks Processed: {stats['weeks_processed']}")
+        print(f"📅 Weeks Processed: {stats['weeks_processed']} ({stats['weeks_from_cache']} from cache)")
         print(f"🏈 Total Matchups: {stats['total_matchups']}")
         print(f"🔗 API Calls: {stats['api_calls']}")
         print(f"❌ Errors: {stats['errors']}")
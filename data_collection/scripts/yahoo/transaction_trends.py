@@ -5,6 +5,9 @@ Yahoo Fantasy Football - Transaction Trends Data Extraction
 This script extracts ALL transactions from the Yahoo Fantasy API for the league
 and computes player add/drop trends. It outputs both clean markdown and raw JSON.
 
+History and trends are kept in a TransactionStore between runs: only pages
+newer than the last-seen transaction are fetched (use --full to resync).
+
 Purpose: Clean, focused data extraction for transactions and trends
 Output: Organized markdown file + raw API response JSON
 Focus: Extract ALL data, no analysis beyond simple add/drop counts
@@ -14,7 +17,7 @@ import os
 import sys
 import json
 import logging
-import re
+import argparse
 from datetime import datetime
 from typing import Dict, List, Any, Tuple, Optional
 
@@ -24,35 +27,47 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
 from yahoo_auth import SimpleYahooAuth
 from data_formatter import MarkdownFormatter
 from file_utils import DataFileManager
+from season_context import get_season_context_service
+from transaction_store import TransactionStore
 
 
 class TransactionTrendsExtractor:
     """Extract and aggregate league transactions into player add/drop trends."""
 
-    def __init__(self) -> None:
+    def __init__(self, yahoo_auth: Optional[SimpleYahooAuth] = None,
+                 file_manager: Optional[DataFileManager] = None,
+                 transaction_store: Optional[TransactionStore] = None) -> None:
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         self.logger = logging.getLogger(__name__)
 
-        self.yahoo_auth = SimpleYahooAuth()
+        self.yahoo_auth = yahoo_auth or SimpleYahooAuth()
         self.formatter = MarkdownFormatter()
-        self.file_manager = DataFileManager()
+        self.file_manager = file_manager or DataFileManager()
+        self.season_context_service = get_season_context_service(self.yahoo_auth, self.file_manager)
+        self.transaction_store = transaction_store or TransactionStore()
 
         self.execution_stats: Dict[str, Any] = {
             'start_time': datetime.now(),
             'api_calls': 0,
             'errors': 0,
             'transactions_extracted': 0,
+            'new_transactions': 0,
             'pages_processed': 0
         }
 
-    def extract_all_data(self) -> Dict[str, Any]:
-        """Extract all transactions and compute trends."""
+    def extract_all_data(self, full_sync: bool = False) -> Dict[str, Any]:
+        """
+        Sync transactions since the last run and update trends.
+
+        Args:
+            full_sync: Discard the stored history and page through everything
+        """
         self.logger.info("🚀 Starting Transaction Trends Extraction")
         try:
-            league_info = self._get_league_info()
+            league_info = self.season_context_service.get_league_info()
             if not league_info:
                 self.logger.error("❌ Failed to get league info")
                 return {}
@@ -60,17 +75,31 @@ class TransactionTrendsExtractor:
             league_key = league_info.get('league_key', '')
             self.logger.info(f"✅ Found league: {league_info.get('league_name', 'Unknown')} ({league_key})")
 
-            transactions = self._extract_all_transactions(league_key)
-            trends = self._compute_player_trends(transactions)
+            if full_sync:
+                self.transaction_store.reset(league_key)
+            new_transactions, complete = self._extract_all_transactions(league_key)
+            if complete:
+                state = self.transaction_store.merge(league_key, new_transactions, self._apply_player_trends)
+                transactions = state['transactions']
+                trends = state['player_trends']
+            else:
+                # Storing a partial sync would leave a gap behind the new last-seen transaction
+                self.logger.warning("⚠️ Transaction sync incomplete; not updating the stored history")
+                stored = self.transaction_store.load(league_key)
+                transactions = new_transactions + stored['transactions']
+                trends = json.loads(json.dumps(stored['player_trends']))
+                self._apply_player_trends(trends, new_transactions)
+            self.execution_stats['transactions_extracted'] = len(transactions)
 
             # Extract season context
-            season_context = self._extract_season_context(league_info)
+            season_context = self.season_context_service.get_season_context('Yahoo Fantasy API')
 
             result: Dict[str, Any] = {
                 'extraction_metadata': {
                     'league_info': league_info,
                     'extraction_timestamp': datetime.now().isoformat(),
                     'total_transactions': len(transactions),
+                    'new_transactions': len(new_transactions),
                     'execution_stats': self.execution_stats
                 },
                 'season_context': season_context,
@@ -96,304 +125,27 @@ class TransactionTrendsExtractor:
             self.execution_stats['errors'] += 1
             return {}
     
-    def _extract_season_context(self, league_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract season and week context from Yahoo data."""
-        try:
-            current_date = datetime.now()
-            season_context = {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': self._determine_season_phase(current_date),
-                'data_source': 'Yahoo Fantasy API',
-                'verification_notes': []
-            }
-            
-            # Extract season info from league info
-            league_name = league_info.get('league_name', '')
-            league_key = league_info.get('league_key', '')
-            
-            # Extract year from league name
-            year_match = re.search(r'(\d{4})', league_name)
-            if year_match:
-                extracted_year = year_match.group(1)
-                season_context['nfl_season'] = extracted_year
-                season_context['verification_notes'].append(f"League name contains year: {extracted_year}")
-            
-            # Extract year from Yahoo league key (e.g., "461.l.595012")
-            if league_key:
-                key_parts = league_key.split('.')
-                if len(key_parts) > 0:
-                    yahoo_year = str(2025)  # Hardcoded for now
-                    season_context['nfl_season'] = yahoo_year
-                    season_context['verification_notes'].append(f"Yahoo league key code {key_parts[0]} indicates year: {yahoo_year}")
-            
-            season_context['yahoo_league_info'] = {
-                'league_key': league_key,
-                'league_name': league_name
-            }
-            
-            # Try to get current week from Yahoo team matchups
-            season_context['current_week'] = None
-            season_context['week_info'] = {}
-            
-            try:
-                current_week = self._extract_current_week_from_yahoo_data(league_key)
-                if current_week:
-                    season_context['current_week'] = current_week['week']
-                    season_context['week_info'] = current_week
-                    season_context['verification_notes'].append(f"Current week {current_week['week']} extracted from Yahoo team matchups API")
-                else:
-                    # Fallback: estimate from date
-                    season_start = datetime(current_date.year, 9, 1, tzinfo=current_date.tzinfo)
-                    if current_date >= season_start:
-                        days_since_start = (current_date - season_start).days
-                        estimated_week = min((days_since_start // 7) + 1, 18)
-                        season_context['current_week'] = estimated_week
-                        season_context['week_info'] = {
-                            'week': estimated_week,
-                            'coverage_type': 'estimated',
-                            'status': 'estimated_from_date',
-                            'source': 'date_estimation'
-                        }
-                        season_context['verification_notes'].append(f"Estimated week {estimated_week} from current date")
-                    else:
-                        season_context['current_week'] = 1
-                        season_context['week_info'] = {
-                            'week': 1,
-                            'coverage_type': 'preseason',
-                            'status': 'preseason',
-                            'source': 'preseason_assumption'
-                        }
-                        season_context['verification_notes'].append("Preseason - using week 1")
-            except Exception as e:
-                self.logger.warning(f"Could not determine week: {e}")
-                season_context['current_week'] = 1
-                season_context['week_info'] = {
-                    'week': 1,
-                    'coverage_type': 'fallback',
-                    'status': 'fallback',
-                    'source': 'error_fallback'
-                }
-                season_context['verification_notes'].append("Could not determine current week - using fallback week 1")
-            
-            return season_context
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting season context: {e}")
-            return {
-                'nfl_season': str(current_date.year),
-                'current_date': current_date.strftime('%Y-%m-%d'),
-                'season_phase': 'Unknown',
-                'data_source': 'Yahoo Fantasy API',
-                'verification_notes': [f"Error extracting season context: {e}"]
-            }
-    
-    def _determine_season_phase(self, current_date: datetime) -> str:
-        """Determine the current phase of the NFL season based on date."""
-        month = current_date.month
-        day = current_date.day
-        
-        if month == 9 and day < 15:
-            return "Early Regular Season"
-        elif month == 9 or month == 10:
-            return "Regular Season"
-        elif month == 11 or month == 12:
-            return "Late Regular Season"
-        elif month == 1 and day < 15:
-            return "Playoffs"
-        elif month == 1 and day >= 15:
-            return "Super Bowl"
-        elif month == 2:
-            return "Offseason"
-        elif month >= 3 and month <= 8:
-            return "Offseason"
-        else:
-            return "Unknown"
-    
-    def _extract_current_week_from_yahoo_data(self, league_key: str) -> Optional[Dict[str, Any]]:
-        """Extract current week information from Yahoo team matchups data."""
-        try:
-            # Look for the most recent team matchups file
-            from pathlib import Path
-            current_path = Path(__file__).resolve()
-            for parent in current_path.parents:
-                if parent.name == "data_collection":
-                    matchups_dir = parent / "outputs" / "yahoo" / "team_matchups"
-                    break
-            else:
-                matchups_dir = Path("data_collection/outputs/yahoo/team_matchups")
-
-            if not matchups_dir.exists():
-                self.logger.warning("Team matchups directory not found")
-                return None
-
-            # Get the most recent matchups file
-            matchup_files = list(matchups_dir.glob("**/*_team_matchups_raw_data.json"))
-            if not matchup_files:
-                self.logger.warning("No team matchups files found")
-                return None
-
-            latest_file = max(matchup_files, key=lambda f: f.stat().st_mtime)
-            self.logger.info(f"Loading team matchups from: {latest_file}")
-
-            with open(latest_file, 'r') as f:
-                matchups_data = json.load(f)
-
-            # Extract week information from matchups
-            matchups = matchups_data.get('matchups', {})
-            if not matchups:
-                return None
-
-            # Find the current week (look for week_1, week_2, etc.)
-            current_week_data = None
-            for week_key, week_data in matchups.items():
-                if week_key.startswith('week_'):
-                    week_num = week_data.get('week', 1)
-                    week_matchups = week_data.get('matchups', [])
-
-                    # Look for status in the matchups array
-                    week_start = ''
-                    week_end = ''
-                    status = 'unknown'
-
-                    if week_matchups:
-                        # Get status from first matchup
-                        first_matchup = week_matchups[0]
-                        week_start = first_matchup.get('week_start', '')
-                        week_end = first_matchup.get('week_end', '')
-                        status = first_matchup.get('status', 'unknown')
-
-                    # Check if this is the current week based on status
-                    if status in ['midevent', 'postevent', 'preevent']:
-                        current_week_data = {
-                            'week': week_num,
-                            'week_start': week_start,
-                            'week_end': week_end,
-                            'status': status,
-                            'coverage_type': 'week',
-                            'source': 'yahoo_team_matchups_api'
-                        }
-                        break
-
-            # If no current week found, use the first available week
-            if not current_week_data and matchups:
-                first_week_key = sorted(matchups.keys())[0]
-                first_week_data = matchups[first_week_key]
-                week_num = first_week_data.get('week', 1)
-                week_matchups = first_week_data.get('matchups', [])
-
-                week_start = ''
-                week_end = ''
-                status = 'unknown'
-
-                if week_matchups:
-                    first_matchup = week_matchups[0]
-                    week_start = first_matchup.get('week_start', '')
-                    week_end = first_matchup.get('week_end', '')
-                    status = first_matchup.get('status', 'unknown')
-
-                current_week_data = {
-                    'week': week_num,
-                    'week_start': week_start,
-                    'week_end': week_end,
-                    'status': status,
-                    'coverage_type': 'week',
-                    'source': 'yahoo_team_matchups_api'
-                }
-
-            return current_week_data
-
-        except Exception as e:
-            self.logger.warning(f"Could not extract current week from Yahoo data: {e}")
-            return None
-    
-    def _get_league_info(self) -> Dict[str, Any]:
-        """Discover user's league using proven pattern from roster scripts."""
-        try:
-            self.logger.info("🔍 Getting league information")
-            resp = self.yahoo_auth.make_request("users;use_login=1/games;game_keys=nfl/teams")
-            self.execution_stats['api_calls'] += 1
-
-            if not resp or 'parsed' not in resp:
-                self.logger.error("❌ Invalid response structure")
-                return {}
-
-            parsed = resp['parsed']
-            fantasy_content = parsed.get('fantasy_content', {})
-            users = fantasy_content.get('users', {})
-            user_data = users.get('0', {}).get('user', [])
-            if not isinstance(user_data, list) or not user_data:
-                self.logger.error("❌ Invalid user_data structure")
-                return {}
-
-            games_section = None
-            for section in user_data:
-                if isinstance(section, dict) and 'games' in section:
-                    games_section = section['games']
-                    break
-            if not games_section:
-                self.logger.error("❌ No games section found")
-                return {}
-
-            nfl_game_data = games_section.get('0', {}).get('game', [])
-            if not isinstance(nfl_game_data, list) or not nfl_game_data:
-                self.logger.error("❌ Invalid game data structure")
-                return {}
-
-            teams_section = None
-            league_info: Dict[str, Any] = {}
-            for game_section in nfl_game_data:
-                if isinstance(game_section, dict):
-                    if 'teams' in game_section:
-                        teams_section = game_section['teams']
-                    for key in ['game_key', 'name', 'season']:
-                        if key in game_section:
-                            league_info[key] = game_section[key]
-
-            if not teams_section:
-                self.logger.error("❌ No teams section found")
-                return {}
+    def _extract_all_transactions(self, league_key: str) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Paginate through transactions newer than the last stored one.
 
-            team_data = teams_section.get('0', {}).get('team', [])
-            if not isinstance(team_data, list) or not team_data:
-                self.logger.error("❌ Invalid team data structure")
-                return {}
-
-            # flatten team properties
-            properties: Dict[str, Any] = {}
-            prop_list = team_data[0] if team_data and isinstance(team_data[0], list) else team_data
-            for prop in prop_list:
-                if isinstance(prop, dict):
-                    for k, v in prop.items():
-                        properties[k] = v
-
-            if properties.get('is_owned_by_current_login') != 1:
-                self.logger.error("❌ Team is not owned by current user")
-                return {}
-
-            team_key = properties.get('team_key', '')
-            league_key = team_key.split('.t.')[0] if team_key else ''
-
-            return {
-                'team_key': team_key,
-                'team_name': properties.get('name', ''),
-                'team_id': properties.get('team_id', ''),
-                'league_key': league_key,
-                'league_name': f"Fantasy League ({league_info.get('season', '2025')})"
-            }
+        Yahoo lists transactions newest first, so paging stops at the first
+        transaction already in the store.
 
-        except Exception as exc:
-            self.logger.error(f"❌ Error getting league info: {exc}")
-            return {}
-
-    def _extract_all_transactions(self, league_key: str) -> List[Dict[str, Any]]:
-        """Paginate through transactions and extract all entries."""
+        Returns:
+            Tuple of (new transactions newest first, whether paging completed)
+        """
         all_tx: List[Dict[str, Any]] = []
+        complete = False
         start = 0
         count = 25
         total = None
 
-        self.logger.info(f"🔍 Starting transaction pagination for league: {league_key}")
+        last_seen = self.transaction_store.load(league_key).get('last_seen', {})
+        if last_seen:
+            self.logger.info(f"🔍 Syncing transactions newer than {last_seen.get('transaction_key')} for league: {league_key}")
+        else:
+            self.logger.info(f"🔍 Starting transaction pagination for league: {league_key}")
         while True:
             try:
                 endpoint = f"league/{league_key}/transactions;start={start};count={count}"
@@ -420,6 +172,7 @@ class TransactionTrendsExtractor:
                         break
                 if not transactions_section:
                     self.logger.info("ℹ️ No transactions section on this page")
+                    complete = True
                     break
 
                 if total is None:
@@ -429,10 +182,17 @@ class TransactionTrendsExtractor:
                         self.logger.info("📊 Total is 0; will continue until page not full")
 
                 page_tx = self._extract_transactions_from_page(transactions_section)
-                all_tx.extend(page_tx)
+                known_index = next((i for i, tx in enumerate(page_tx)
+                                    if self.transaction_store.is_known(league_key, tx['transaction_key'])), None)
+                all_tx.extend(page_tx if known_index is None else page_tx[:known_index])
                 self.logger.info(f"✅ Page {start//count + 1}: {len(page_tx)} transactions")
 
-                if (total and len(all_tx) >= total) or (len(page_tx) < count):
+                if known_index is not None:
+                    self.logger.info("📌 Reached last-seen transaction")
+                    complete = True
+                    break
+                if (total and start + len(page_tx) >= total) or (len(page_tx) < count):
+                    complete = True
                     break
 
                 start += count
@@ -442,9 +202,9 @@ class TransactionTrendsExtractor:
                 self.execution_stats['errors'] += 1
                 break
 
-        self.execution_stats['transactions_extracted'] = len(all_tx)
-        self.logger.info(f"✅ Transaction pagination complete: {len(all_tx)} total")
-        return all_tx
+        self.execution_stats['new_transactions'] = len(all_tx)
+        self.logger.info(f"✅ Transaction pagination complete: {len(all_tx)} new")
+        return all_tx, complete
 
     def _extract_transactions_from_page(self, transactions_section: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract transactions from a single page, handling Yahoo's structure."""
@@ -514,9 +274,8 @@ class TransactionTrendsExtractor:
 
         return results
 
-    def _compute_player_trends(self, transactions: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
-        """Aggregate simple add/drop counts per player_id."""
-        trends: Dict[str, Dict[str, Any]] = {}
+    def _apply_player_trends(self, trends: Dict[str, Dict[str, Any]], transactions: List[Dict[str, Any]]) -> None:
+        """Add the add/drop counts of transactions to existing per-player trends (in place)."""
         for tx in transactions:
             tx_type = (tx.get('type') or '').lower()
             for p in tx.get('players', []):
@@ -542,8 +301,6 @@ class TransactionTrendsExtractor:
                 if 'drop' in tx_type:
                     trends[player_id]['drops'] += 1
 
-        return trends
-
     def save_data(self, data: Dict[str, Any]) -> bool:
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -574,6 +331,7 @@ class TransactionTrendsExtractor:
             report.append(f"**League:** {league_info.get('league_name', 'Unknown')}")
             report.append(f"**League Key:** {league_info.get('league_key', 'Unknown')}")
             report.append(f"**Total Transactions:** {meta.get('total_transactions', 0)}")
+            report.append(f"**New This Run:** {meta.get('new_transactions', 0)}")
             report.append(f"**API Calls:** {stats.get('api_calls', 0)}")
             report.append(f"**Execution Time:** {stats.get('execution_time', 0):.2f}s")
             report.append(f"**Errors:** {stats.get('errors', 0)}")
@@ -646,8 +404,12 @@ class TransactionTrendsExtractor:
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description='Extract Yahoo league transaction trends')
+    parser.add_argument('--full', action='store_true', help='Resync the full transaction history')
+    args = parser.parse_args()
+
     extractor = TransactionTrendsExtractor()
-    data = extractor.extract_all_data()
+    data = extractor.extract_all_data(full_sync=args.full)
     if data:
         ok = extractor.save_data(data)
         if ok:
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test Yahoo Available Players Pagination
+
+Offline checks that pages fetched concurrently after the first are retried when
+they fail and that a page which stays missing is counted as an error. Yahoo
+responses are local fixtures.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Add collection scripts and shared utilities to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts"))
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+
+from file_utils import DataFileManager
+from yahoo.available_players import AvailablePlayersExtractor, PAGE_SIZE
+
+LEAGUE_KEY = "461.l.595012"
+TOTAL_PLAYERS = 4 * PAGE_SIZE
+
+
+def _page(start):
+    players = {str(i): {"player": [[{"player_key": f"461.p.{start + i}"}, {"name": {"full": f"Player {start + i}"}}]]}
+               for i in range(PAGE_SIZE)}
+    players["count"] = PAGE_SIZE
+    return {"status": "success", "parsed": {"fantasy_content": {"league": [
+        {"league_key": LEAGUE_KEY}, {"players": players}
+    ]}}}
+
+
+class FakeYahooAuth:
+    """Serves players pages; the listed offsets fail the given number of times"""
+
+    def __init__(self, failures):
+        self.failures = dict(failures)
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def make_request(self, endpoint):
+        start = int(endpoint.split("start=")[1].split(";")[0])
+        with self._lock:
+            self.requests.append(start)
+            if self.failures.get(start, 0) > 0:
+                self.failures[start] -= 1
+                return {"status": "error", "error": "HTTP 500"}
+        page = _page(start)
+        page["parsed"]["fantasy_content"]["league"][1]["players"]["total"] = TOTAL_PLAYERS
+        return page
+
+
+def _extract(root, failures):
+    yahoo = FakeYahooAuth(failures)
+    extractor = AvailablePlayersExtractor(max_concurrent_pages=4, yahoo_auth=yahoo,
+                                          file_manager=DataFileManager(os.path.join(root, "outputs")))
+    players = extractor._extract_all_available_players(LEAGUE_KEY)
+    return extractor, players, yahoo
+
+
+def test_failed_page_is_retried():
+    """A page that fails once is fetched again and none of its players are lost."""
+    with tempfile.TemporaryDirectory() as root:
+        extractor, players, yahoo = _extract(root, {2 * PAGE_SIZE: 1})
+        assert len(players) == TOTAL_PLAYERS
+        assert [p["player_key"] for p in players] == [f"461.p.{i}" for i in range(TOTAL_PLAYERS)]
+        assert yahoo.requests.count(2 * PAGE_SIZE) == 2
+        assert extractor.execution_stats["errors"] == 1
+
+
+def test_page_failing_twice_is_counted():
+    """A page that fails its retry too is left out and counted for both attempts."""
+    with tempfile.TemporaryDirectory() as root:
+        extractor, players, yahoo = _extract(root, {PAGE_SIZE: 2})
+        assert len(players) == TOTAL_PLAYERS - PAGE_SIZE
+        assert yahoo.requests.count(PAGE_SIZE) == 2
+        assert extractor.execution_stats["errors"] == 2
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Yahoo Available Players Pagination")
+    print("=" * 40)
+    for test in (test_failed_page_is_retried, test_page_failing_twice_is_counted):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Test In-Process Collection Pipeline
+
+Offline checks for the collection graph scheduler and the in-memory handoff
+between stages sharing one DataFileManager. No API calls are made: stage
+runners are replaced with local functions.
+"""
+
+import sys
+import json
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add collection scripts and shared utilities to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts"))
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+
+from pipeline import CollectionPipeline, run_graph
+from file_utils import DataFileManager
+
+GRAPH = [
+    {"script": "a", "description": "A", "depends_on": []},
+    {"script": "b", "description": "B", "depends_on": []},
+    {"script": "c", "description": "C", "depends_on": ["a", "b"]},
+]
+
+
+def test_graph_runs_dependents_after_dependencies():
+    """A node starts only after all its dependencies finished, failed or not."""
+    finished = []
+    lock = threading.Lock()
+
+    def run_node(node):
+        with lock:
+            if node["script"] == "c":
+                assert set(finished) == {"a", "b"}
+            finished.append(node["script"])
+        return {"status": "failed" if node["script"] == "a" else "success"}
+
+    results = run_graph(GRAPH, run_node, max_workers=2)
+    assert finished[-1] == "c"
+    assert results["a"]["status"] == "failed" and results["c"]["status"] == "success"
+
+
+def test_retained_snapshot_is_handed_over_in_memory():
+    """A retaining manager serves its own saves from memory and still writes the artifact."""
+    with tempfile.TemporaryDirectory() as outputs:
+        manager = DataFileManager(outputs, retain_raw_data=True)
+        snapshot = {"roster_players": [{"player_id": "30977"}]}
+        path = manager.save_raw_data("yahoo", "my_roster", snapshot, "20251012_093000")
+
+        assert manager.load_latest_raw_data("yahoo", "my_roster") is snapshot
+        assert json.loads(Path(path).read_text()) == snapshot
+        assert DataFileManager(outputs).load_raw_data(path) is not snapshot
+
+
+def test_stages_share_file_manager():
+    """A downstream stage reads the upstream stage's output without re-parsing it."""
+    with tempfile.TemporaryDirectory() as outputs:
+        pipeline = CollectionPipeline(DataFileManager(outputs, retain_raw_data=True))
+        snapshot = {"roster_players": []}
+        seen = {}
+
+        def produce(module, players_limit):
+            pipeline.file_manager.save_raw_data("yahoo", "my_roster", snapshot)
+            return True
+
+        def consume(module, players_limit):
+            seen["data"] = pipeline.file_manager.load_latest_raw_data("yahoo", "my_roster")
+            return True
+
+        pipeline.stage_runners = {"yahoo/my_roster.py": produce, "sleeper/my_roster.py": consume}
+        pipeline._load_stage_module = lambda script: None
+        graph = [
+            {"script": "yahoo/my_roster.py", "description": "Yahoo My Roster", "depends_on": []},
+            {"script": "sleeper/my_roster.py", "description": "Sleeper My Roster", "depends_on": ["yahoo/my_roster.py"]},
+            {"script": "tank01/unknown.py", "description": "Unknown", "depends_on": []},
+        ]
+        results = run_graph(graph, pipeline.run_stage)
+
+        assert seen["data"] is snapshot
+        assert results["yahoo/my_roster.py"]["raw_file"].endswith("_my_roster_raw_data.json")
+        assert results["sleeper/my_roster.py"]["status"] == "success"
+        assert results["tank01/unknown.py"]["status"] == "not_found"
+
+
+def test_failed_extraction_fails_stage():
+    """An empty extraction or a failed collector run is reported as a failed stage."""
+    class EmptyOpponentRosters:
+        def __init__(self, yahoo_auth, file_manager):
+            pass
+
+        def extract_all_opponent_rosters(self):
+            return {"league_info": {}, "teams": [], "rosters": {}}
+
+        def save_data(self, data):
+            return True
+
+    class FailingCollector:
+        def __init__(self, player_limits, tank01, file_manager):
+            pass
+
+        def run(self):
+            return False
+
+    with tempfile.TemporaryDirectory() as outputs:
+        pipeline = CollectionPipeline(DataFileManager(outputs))
+        pipeline._clients.update({"yahoo_auth": object(), "tank01": object()})
+        module = SimpleNamespace(OpponentRostersExtractor=EmptyOpponentRosters,
+                                 Tank01AvailablePlayersCollector=FailingCollector)
+        pipeline._load_stage_module = lambda script: module
+
+        for script in ("yahoo/opponent_rosters.py", "tank01/available_players.py"):
+            result = pipeline.run_stage({"script": script, "description": script, "depends_on": []})
+            assert result["status"] == "failed", script
+
+
+if __name__ == "__main__":
+    print("🧪 Testing In-Process Collection Pipeline")
+    print("=" * 40)
+    for test in (test_graph_runs_dependents_after_dependencies, test_retained_snapshot_is_handed_over_in_memory,
+                 test_stages_share_file_manager, test_failed_extraction_fails_stage):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test Fantasy Scoring Engine
+
+Offline checks for the vectorized scoring engine and Yahoo league settings
+parsing. No API calls are made.
+"""
+
+import sys
+from pathlib import Path
+
+# Add shared utilities to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+
+from fantasy_scoring import FantasyScoringEngine
+
+QB_GAME = {"Passing": {"passYds": "275", "passTD": "2", "int": "1"},
+           "Rushing": {"rushYds": "32", "rushTD": "1"}}
+WR_GAME = {"Receiving": {"recYds": "104", "recTD": "1", "receptions": "7"},
+           "Rushing": {"rushYds": "bad"}}
+
+# Shape of league/{league_key}/settings (format=json), trimmed to scoring
+YAHOO_SETTINGS = {"fantasy_content": {"league": [
+    {"league_key": "461.l.595012"},
+    {"settings": [{
+        "stat_categories": {"stats": [
+            {"stat": {"stat_id": 4, "enabled": "1", "position_type": "O"}},
+            {"stat": {"stat_id": 5, "enabled": "1", "position_type": "O"}},
+            {"stat": {"stat_id": 11, "enabled": "1", "position_type": "O"}},
+            {"stat": {"stat_id": 12, "enabled": "1", "position_type": "O"}},
+            {"stat": {"stat_id": 13, "enabled": "1", "position_type": "O"}},
+            {"stat": {"stat_id": 78, "enabled": "1", "position_type": "O", "is_only_display_stat": "1"}},
+        ]},
+        "stat_modifiers": {"stats": [
+            {"stat": {"stat_id": 4, "value": "0.04"}},
+            {"stat": {"stat_id": 5, "value": "6"}},
+            {"stat": {"stat_id": 11, "value": "0.5"}},
+            {"stat": {"stat_id": 12, "value": "0.1"}},
+            {"stat": {"stat_id": 13, "value": "6"}},
+            {"stat": {"stat_id": 78, "value": "1"}},
+        ]}
+    }]}
+]}}
+
+
+def test_default_scoring_matches_standard_ppr():
+    """Default weights reproduce the previous hard-coded PPR scoring."""
+    engine = FantasyScoringEngine()
+    points = engine.score_games([QB_GAME, WR_GAME])
+    assert points.tolist() == [26.2, 23.4]
+
+
+def test_defense_points_allowed_tiers():
+    """Points-allowed tiers apply to team defenses only."""
+    engine = FantasyScoringEngine()
+    defenses = [{"defense": {"pointsAllowed": pa, "sacks": 3}} for pa in (0, 6, 13, 20, 27, 30, 40)]
+    assert engine.score_games(defenses, is_team_defense=True).tolist() == [13, 10, 7, 4, 3, 2, 2]
+    assert engine.score_game({"defense": {"pointsAllowed": 0}}) == 0
+
+
+def test_league_settings_drive_weights():
+    """Yahoo stat_modifiers replace the defaults; display-only stats are not scored."""
+    engine = FantasyScoringEngine.from_yahoo_settings(YAHOO_SETTINGS)
+    game = {"Passing": {"passTD": "1"}, "Receiving": {"receptions": "4", "targets": "9"}}
+    assert engine.score_game(game) == 8.0
+
+
+def test_score_league_fills_totals_and_averages():
+    """One pass scores every game and aggregates per player."""
+    engine = FantasyScoringEngine()
+    qb = {"games": [{"passing": QB_GAME["Passing"], "rushing": QB_GAME["Rushing"]},
+                    {"passing": {"passYds": "200", "passTD": "1"}}]}
+    wr = {"games": [{"receiving": WR_GAME["Receiving"]}]}
+    dst = {"games": [], "team_defense_stats": {"pointsAllowed": 10, "sacks": 2, "interceptions": 1}}
+
+    engine.score_league([qb, wr, dst], [False, False, True])
+
+    assert [g["fantasy_points"] for g in qb["games"]] == [26.2, 12.0]
+    assert qb["season_totals"]["passing"]["passYds"] == 475
+    assert qb["season_totals"]["fantasy_points"] == 38.2
+    assert qb["season_totals"]["games_played"] == 2
+    assert qb["season_averages"]["fantasy_points"] == 19.1
+    assert wr["season_totals"]["fantasy_points"] == 23.4
+    assert dst["season_totals"]["fantasy_points"] == 8.0
+    assert dst["season_averages"] == {}
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Fantasy Scoring Engine")
+    print("=" * 40)
+    for test in (test_default_scoring_matches_standard_ppr, test_defense_points_allowed_tiers,
+                 test_league_settings_drive_weights, test_score_league_fills_totals_and_averages):
+        test()
+        print(f"✅ {test.__name__}")
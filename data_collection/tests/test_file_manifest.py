@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test Output Manifest
+
+Offline checks for the DataFileManager latest-output manifest. All files are
+written to a temporary outputs directory.
+"""
+
+import os
+import sys
+import json
+import tempfile
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Add shared utilities to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+
+from file_utils import DataFileManager
+
+
+def test_latest_and_latest_for_week():
+    """Latest follows the filename timestamp; week lookups use the _wkNN prefix or season context."""
+    with tempfile.TemporaryDirectory() as outputs:
+        manager = DataFileManager(outputs)
+        manager.save_raw_data("tank01", "my_roster_stats", {"n": 1}, "20250914_090000_wk02_")
+        manager.save_raw_data("tank01", "my_roster_stats", {"n": 2}, "20250921_090000_wk03_")
+        manager.save_raw_data("tank01", "my_roster_stats", {"n": 3}, "20250915_090000_wk02_")
+        manager.save_raw_data("yahoo", "team_matchups", {"season_context": {"current_week": 7}}, "20251019_080000")
+
+        latest = manager.get_latest_file("tank01", "my_roster_stats", "raw_data")
+        assert latest.endswith("20250921_090000_wk03__my_roster_stats_raw_data.json")
+        week_2 = manager.get_latest_file("tank01", "my_roster_stats", "raw_data", week=2)
+        assert json.load(open(week_2)) == {"n": 3}
+        assert manager.get_latest_file("tank01", "my_roster_stats", "raw_data", week=9) is None
+        assert manager.get_latest_file("yahoo", "team_matchups", "raw_data", week=7)
+        assert len(manager.list_files("tank01", "my_roster_stats", week=2)["raw_data"]) == 2
+
+
+def test_existing_outputs_are_indexed_once():
+    """Files written before the manifest existed are picked up by a one-time scan."""
+    with tempfile.TemporaryDirectory() as outputs:
+        day_dir = Path(outputs) / "yahoo" / "my_roster" / "2025" / "10" / "01"
+        day_dir.mkdir(parents=True)
+        for stamp in ("20251001_100000", "20251001_120000"):
+            (day_dir / f"{stamp}_my_roster_raw_data.json").write_text("{}")
+
+        manager = DataFileManager(outputs)
+        assert manager.get_latest_file("yahoo", "my_roster", "raw_data").endswith("20251001_120000_my_roster_raw_data.json")
+        assert manager.get_manifest_path("yahoo", "my_roster").exists()
+
+        # A removed file triggers a rebuild rather than a dangling path
+        os.remove(day_dir / "20251001_120000_my_roster_raw_data.json")
+        assert manager.get_latest_file("yahoo", "my_roster", "raw_data").endswith("20251001_100000_my_roster_raw_data.json")
+
+
+def test_concurrent_saves_keep_every_entry():
+    """Concurrent writers never lose manifest entries."""
+    with tempfile.TemporaryDirectory() as outputs:
+        manager = DataFileManager(outputs)
+
+        def save(i):
+            return manager.save_clean_data("sleeper", "trending", f"# {i}", f"20251001_1200{i:02d}")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(save, range(24)))
+
+        manifest = manager.get_manifest("sleeper", "trending")
+        assert len(manifest["history"]["clean"]) == 24
+        assert manifest["latest"]["clean"]["timestamp"] == "20251001_120023"
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Output Manifest")
+    print("=" * 40)
+    for test in (test_latest_and_latest_for_week, test_existing_outputs_are_indexed_once,
+                 test_concurrent_saves_keep_every_entry):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Test Game Stats Call Planner
+
+Offline checks that a large player pool is served from per-game box scores,
+a small pool and first fetches keep per-player game logs, traded players keep
+their earlier team's games, and players whose box scores fail fall back to
+their game log. Tank01 responses are local fixtures.
+"""
+
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add shared utilities to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+
+from game_stats_store import GameStatsStore
+from game_fetch_planner import GameFetchPlanner, PER_GAME, PER_PLAYER
+
+SEASON = "2025"
+WEEKS = [1, 2, 3]
+TEAMS = ["ARI", "NO", "BUF", "NYJ", "KC", "LAC", "DAL", "PHI"]
+
+
+def _week_games(week):
+    """Pairs TEAMS into four games per week, on Sundays in September 2025"""
+    rotated = TEAMS[week % 2:] + TEAMS[:week % 2]
+    return [{"gameID": f"202509{7 * week:02d}_{rotated[i]}@{rotated[i + 1]}",
+             "away": rotated[i], "home": rotated[i + 1]} for i in range(0, len(rotated), 2)]
+
+
+def _players(count):
+    return [{"playerID": str(1000 + i), "team": TEAMS[i % len(TEAMS)]} for i in range(count)]
+
+
+def _team(player, game_id):
+    """The player's team on the game date ('earlier_teams' maps YYYYMMDD to a team before a trade)"""
+    return player.get("earlier_teams", {}).get(game_id[:8], player["team"])
+
+
+def _seed(root, players, through_week):
+    """Store the players' game logs as fetched two days after week through_week's games"""
+    store = GameStatsStore(root)
+    for player in players:
+        games = {g["gameID"]: {"gameID": g["gameID"], "teamAbv": _team(player, g["gameID"])}
+                 for week in WEEKS if week <= through_week for g in _week_games(week)
+                 if _team(player, g["gameID"]) in (g["home"], g["away"])}
+        record = store._get_record(player["playerID"], SEASON)
+        store._merge_games(record, games)
+        record["last_fetched"] = datetime(2025, 9, 7 * through_week + 2).timestamp()
+        store._save_record(record)
+
+
+class FakeTank01:
+    """Serves weekly schedules, box scores and game logs for the fixture players"""
+
+    def __init__(self, players, failing_games=()):
+        self.players = players
+        self.failing_games = set(failing_games)
+        self.calls = {"getNFLGamesForWeek": 0, "getNFLBoxScore": 0, "getNFLGamesForPlayer": 0}
+
+    def get_api_usage(self):
+        return {"remaining_calls": 1000}
+
+    def get_games_for_week(self, week, season=None):
+        self.calls["getNFLGamesForWeek"] += 1
+        return {"statusCode": 200, "body": _week_games(week)}
+
+    def _entry(self, player, game_id):
+        return {"gameID": game_id, "teamAbv": _team(player, game_id), "Rushing": {"rushYds": "10"}}
+
+    def get_box_score(self, game_id):
+        self.calls["getNFLBoxScore"] += 1
+        if game_id in self.failing_games:
+            return {"statusCode": 500, "body": "error"}
+        teams = game_id.split("_")[1].split("@")
+        return {"statusCode": 200, "body": {"gameID": game_id, "playerStats": {
+            p["playerID"]: self._entry(p, game_id) for p in self.players if _team(p, game_id) in teams}}}
+
+    def get_player_game_stats(self, player_id, season=None):
+        self.calls["getNFLGamesForPlayer"] += 1
+        player = next(p for p in self.players if p["playerID"] == player_id)
+        games = [g["gameID"] for week in WEEKS for g in _week_games(week) if player["team"] in (g["home"], g["away"])]
+        return {"statusCode": 200, "body": {game_id: self._entry(player, game_id) for game_id in games}}
+
+
+def _games(planner, player):
+    response = planner.get_player_games(player["playerID"], SEASON, player["team"],
+                                        lambda: planner.tank01.get_player_game_stats(player["playerID"], SEASON))
+    return response["body"]
+
+
+def test_large_pool_uses_box_scores():
+    """100 stored players on 8 teams: 3 schedule calls and 4 box scores for week 3 instead of 100 game logs."""
+    with tempfile.TemporaryDirectory() as root:
+        players = _players(100)
+        _seed(root, players, 2)
+        tank01 = FakeTank01(players)
+        planner = GameFetchPlanner(tank01, GameStatsStore(root))
+        plan = planner.prefetch(players, SEASON, WEEKS)
+
+        assert plan["strategy"] == PER_GAME and plan["per_player_calls"] == 100
+        assert tank01.calls == {"getNFLGamesForWeek": 3, "getNFLBoxScore": 4, "getNFLGamesForPlayer": 0}
+        games = _games(planner, players[0])
+        assert len(games) == 3 and all(g["teamAbv"] == "ARI" for g in games.values())
+        assert tank01.calls["getNFLGamesForPlayer"] == 0
+
+        # The games are stored: a new run with the same pool needs no calls at all
+        tank01 = FakeTank01(players)
+        planner = GameFetchPlanner(tank01, GameStatsStore(root))
+        planner.prefetch(players, SEASON, WEEKS)
+        assert len(_games(planner, players[5])) == 3
+        assert tank01.calls["getNFLBoxScore"] == 0 and tank01.calls["getNFLGamesForPlayer"] == 0
+
+
+def test_first_fetch_uses_game_logs():
+    """Players without stored games get their game log, which also covers teams they left."""
+    with tempfile.TemporaryDirectory() as root:
+        players = _players(100)
+        tank01 = FakeTank01(players)
+        planner = GameFetchPlanner(tank01, GameStatsStore(root))
+        assert planner.prefetch(players, SEASON, WEEKS)["strategy"] == PER_PLAYER
+        assert len(_games(planner, players[0])) == 3
+        assert tank01.calls == {"getNFLGamesForWeek": 0, "getNFLBoxScore": 0, "getNFLGamesForPlayer": 1}
+
+
+def test_traded_player_keeps_earlier_team_games():
+    """A player traded from ARI to DAL after week 2 gets the week 2 ARI game from its box score."""
+    with tempfile.TemporaryDirectory() as root:
+        players = _players(40)
+        traded = {"playerID": "2000", "team": "DAL", "earlier_teams": {"20250907": "ARI", "20250914": "ARI"}}
+        _seed(root, players, 2)
+        _seed(root, [traded], 1)
+        tank01 = FakeTank01(players + [traded])
+        planner = GameFetchPlanner(tank01, GameStatsStore(root))
+        assert planner.prefetch(players + [traded], SEASON, WEEKS)["strategy"] == PER_GAME
+
+        games = _games(planner, traded)
+        assert sorted(g["teamAbv"] for g in games.values()) == ["ARI", "ARI", "DAL"]
+        assert tank01.calls["getNFLGamesForPlayer"] == 0
+
+
+def test_small_pool_keeps_game_logs():
+    """Three players on three teams cost fewer calls per player."""
+    with tempfile.TemporaryDirectory() as root:
+        players = _players(3)
+        tank01 = FakeTank01(players)
+        planner = GameFetchPlanner(tank01, GameStatsStore(root))
+        assert planner.prefetch(players, SEASON, WEEKS)["strategy"] == PER_PLAYER
+        assert len(_games(planner, players[2])) == 3
+        assert tank01.calls == {"getNFLGamesForWeek": 0, "getNFLBoxScore": 0, "getNFLGamesForPlayer": 1}
+
+
+def test_failed_box_score_falls_back_per_player():
+    """Players in a game whose box score fails get their own game log."""
+    with tempfile.TemporaryDirectory() as root:
+        players = _players(40)
+        _seed(root, players, 2)
+        failing = _week_games(3)[0]["gameID"]
+        tank01 = FakeTank01(players, failing_games=[failing])
+        planner = GameFetchPlanner(tank01, GameStatsStore(root))
+        planner.prefetch(players, SEASON, WEEKS)
+
+        for player in players:
+            assert len(_games(planner, player)) == 3
+        # Only the two teams in the failed game (10 players) needed game logs
+        assert tank01.calls["getNFLGamesForPlayer"] == 10
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Game Stats Call Planner")
+    print("=" * 40)
+    for test in (test_large_pool_uses_box_scores, test_first_fetch_uses_game_logs,
+                 test_traded_player_keeps_earlier_team_games, test_small_pool_keeps_game_logs,
+                 test_failed_box_score_falls_back_per_player):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test Game Stats Store
+
+Offline checks for the finalized per-game stats store and its schedule-based
+skip logic. No API calls are made - getNFLGamesForPlayer is simulated.
+"""
+
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add shared utilities to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+
+from game_stats_store import GameStatsStore
+
+# Week 2 of 2025: TNF kicks off Thursday 9/11, CIN@JAX on Sunday 9/14
+TNF_KICKOFF = datetime(2025, 9, 11, 20, 15).timestamp()
+SUNDAY_KICKOFF = datetime(2025, 9, 14, 13, 0).timestamp()
+
+WEEK2_SCHEDULE = [
+    {"game_id": "20250911_WSH@GB", "home_team": "GB", "away_team": "WSH",
+     "game_time_epoch": str(TNF_KICKOFF), "game_status": "Completed", "game_status_code": "2"},
+    {"game_id": "20250914_CIN@JAX", "home_team": "JAX", "away_team": "CIN",
+     "game_time_epoch": str(SUNDAY_KICKOFF), "game_status": "Scheduled", "game_status_code": "0"},
+]
+
+WEEK1_GAME = {"20250907_CIN@CLE": {"gameID": "20250907_CIN@CLE", "Passing": {"passYds": "141"}}}
+
+
+def make_fetch(calls, body):
+    def fetch():
+        calls.append(1)
+        return {"statusCode": 200, "body": dict(body)}
+    return fetch
+
+
+def test_final_games_are_stored_and_call_is_skipped():
+    """After a fetch past last week's games, a not-yet-started game needs no call."""
+    with tempfile.TemporaryDirectory() as tmp:
+        calls = []
+        store = GameStatsStore(store_dir=tmp)
+        store.get_player_games("3915416", "2025", "CIN", make_fetch(calls, WEEK1_GAME))
+        assert store.get_stats()["games_stored"] == 1
+
+        # New run on Friday of week 2, before CIN has played
+        store = GameStatsStore(store_dir=tmp)
+        assert store.set_schedule(WEEK2_SCHEDULE, now=TNF_KICKOFF + 86400)
+        assert not store.needs_fetch("3915416", "2025", "CIN", now=TNF_KICKOFF + 86400)
+
+        # Once the Sunday game has kicked off, the player must be fetched again
+        assert store.needs_fetch("3915416", "2025", "CIN", now=SUNDAY_KICKOFF + 600)
+
+
+def test_in_progress_games_are_returned_but_not_stored():
+    """Games the schedule does not mark final are merged into the result only."""
+    with tempfile.TemporaryDirectory() as tmp:
+        calls = []
+        store = GameStatsStore(store_dir=tmp)
+        store.set_schedule(WEEK2_SCHEDULE, now=SUNDAY_KICKOFF + 600)
+
+        live = {"20250914_CIN@JAX": {"gameID": "20250914_CIN@JAX", "Passing": {"passYds": "80"}}}
+        result = store.get_player_games("3915416", "2025", "CIN", make_fetch(calls, dict(WEEK1_GAME, **live)))
+
+        assert set(result["body"]) == {"20250907_CIN@CLE", "20250914_CIN@JAX"}
+        assert store.get_stats()["games_stored"] == 1
+
+
+def test_no_schedule_always_fetches():
+    """Without a current schedule every player is fetched."""
+    with tempfile.TemporaryDirectory() as tmp:
+        calls = []
+        store = GameStatsStore(store_dir=tmp)
+        store.get_player_games("3915416", "2025", "CIN", make_fetch(calls, WEEK1_GAME))
+        store.get_player_games("3915416", "2025", "CIN", make_fetch(calls, WEEK1_GAME))
+        assert len(calls) == 2
+
+
+def test_inactive_player_is_not_refetched():
+    """A final game missing from the player's log is covered and does not force another fetch."""
+    with tempfile.TemporaryDirectory() as tmp:
+        calls = []
+        store = GameStatsStore(store_dir=tmp)
+        store.get_player_games("4241478", "2025", "GB", make_fetch(calls, {}))
+
+        # Friday of week 2: WSH@GB is final but the player was inactive
+        store = GameStatsStore(store_dir=tmp)
+        assert store.set_schedule(WEEK2_SCHEDULE, now=TNF_KICKOFF + 86400)
+        store.get_player_games("4241478", "2025", "GB", make_fetch(calls, {}))
+        assert len(calls) == 2
+
+        assert not store.needs_fetch("4241478", "2025", "GB", now=TNF_KICKOFF + 86400)
+        store = GameStatsStore(store_dir=tmp)
+        store.set_schedule(WEEK2_SCHEDULE, now=TNF_KICKOFF + 86400)
+        assert not store.needs_fetch("4241478", "2025", "GB", now=TNF_KICKOFF + 2 * 86400)
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Game Stats Store")
+    print("=" * 40)
+    for test in (test_final_games_are_stored_and_call_is_skipped,
+                 test_in_progress_games_are_returned_but_not_stored,
+                 test_no_schedule_always_fetches, test_inactive_player_is_not_refetched):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test Yahoo League Settings Collection
+
+Offline checks that the league settings collector saves the league's roster
+positions and stat modifiers, and that the scoring engine picks its weights up
+from that output. Yahoo responses are local fixtures.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add collection scripts and shared utilities to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts"))
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+
+from fantasy_scoring import FantasyScoringEngine
+from file_utils import DataFileManager
+from season_context import SeasonContextService
+from yahoo.league_settings import LeagueSettingsExtractor
+
+DISCOVERY = {"fantasy_content": {"users": {"0": {"user": [
+    {"guid": "abc"},
+    {"games": {"0": {"game": [
+        {"game_key": "461", "name": "Football", "season": "2025"},
+        {"teams": {"0": {"team": [[
+            {"team_key": "461.l.595012.t.3"}, {"team_id": "3"}, {"name": "Team Three"},
+            {"is_owned_by_current_login": 1}
+        ]]}}}
+    ]}}}
+]}}}}
+
+
+def _stat(stat_id, **fields):
+    return {"stat": dict(stat_id=stat_id, **fields)}
+
+
+# league/{league_key}/settings (format=json) for a half-PPR, 4-point passing TD league
+SETTINGS = {"fantasy_content": {"league": [
+    {"league_key": "461.l.595012", "name": "Test League", "season": "2025", "scoring_type": "head"},
+    {"settings": [{
+        "draft_type": "live",
+        "uses_faab": "1",
+        "roster_positions": [
+            {"roster_position": {"position": "QB", "position_type": "O", "count": 1, "is_starting_position": 1}},
+            {"roster_position": {"position": "WR", "position_type": "O", "count": 2, "is_starting_position": 1}},
+            {"roster_position": {"position": "RB", "position_type": "O", "count": 2, "is_starting_position": 1}},
+            {"roster_position": {"position": "TE", "position_type": "O", "count": 1, "is_starting_position": 1}},
+            {"roster_position": {"position": "W/R/T", "count": 2, "is_starting_position": 1}},
+            {"roster_position": {"position": "DEF", "position_type": "DT", "count": 1, "is_starting_position": 1}},
+            {"roster_position": {"position": "BN", "count": 6, "is_starting_position": 0}}
+        ],
+        "stat_categories": {"stats": [
+            _stat(4, enabled="1", name="Passing Yards", position_type="O"),
+            _stat(5, enabled="1", name="Passing Touchdowns", position_type="O"),
+            _stat(11, enabled="1", name="Receptions", position_type="O"),
+            _stat(12, enabled="1", name="Receiving Yards", position_type="O"),
+            _stat(13, enabled="1", name="Receiving Touchdowns", position_type="O"),
+            _stat(32, enabled="1", name="Sack", position_type="DT")
+        ]},
+        "stat_modifiers": {"stats": [
+            _stat(4, value="0.04"), _stat(5, value="4"), _stat(11, value="0.5"),
+            _stat(12, value="0.1"), _stat(13, value="6"), _stat(32, value="1")
+        ]}
+    }]}
+]}}
+
+
+class FakeYahooAuth:
+    """Answers league discovery, settings and scoreboard endpoints"""
+
+    def __init__(self):
+        self.requests = []
+
+    def make_request(self, endpoint):
+        self.requests.append(endpoint)
+        if endpoint.startswith("users"):
+            return {"status": "success", "parsed": DISCOVERY}
+        if endpoint.endswith("/settings"):
+            return {"status": "success", "parsed": SETTINGS}
+        return {"status": "success", "parsed": {"fantasy_content": {"league": [{"current_week": 7}]}}}
+
+
+def _collect(root):
+    manager = DataFileManager(os.path.join(root, "outputs"))
+    yahoo = FakeYahooAuth()
+    extractor = LeagueSettingsExtractor(yahoo_auth=yahoo, file_manager=manager)
+    extractor.season_context_service = SeasonContextService(yahoo, manager, os.path.join(root, "context.json"))
+    data = extractor.extract_league_settings()
+    assert extractor.save_data(data)
+    return manager, data, yahoo
+
+
+def test_settings_output():
+    """One settings call; roster positions are flattened and the scoring report lists the modifiers."""
+    with tempfile.TemporaryDirectory() as root:
+        manager, data, yahoo = _collect(root)
+        assert yahoo.requests.count("league/461.l.595012/settings") == 1
+        assert data["settings"]["uses_faab"] == "1"
+        assert [(p["position"], p["count"]) for p in data["roster_positions"]][:3] == [("QB", 1), ("WR", 2), ("RB", 2)]
+        assert data["roster_positions"][-1] == {"position": "BN", "position_type": "", "count": 6,
+                                                "is_starting_position": False}
+
+        report = Path(manager.get_latest_file("yahoo", "league_settings", "clean")).read_text()
+        assert "| 11 | Receptions | 0.5 |" in report
+
+
+def test_scoring_engine_reads_collected_settings():
+    """The engine scores with the collected modifiers instead of the PPR defaults."""
+    wr_game = {"receiving": {"receptions": "4", "recYds": "50", "recTD": "1"}}
+    qb_game = {"passing": {"passYds": "250", "passTD": "2"}}
+    assert FantasyScoringEngine().score_games([wr_game, qb_game]).tolist() == [15.0, 18.0]
+
+    with tempfile.TemporaryDirectory() as root:
+        manager, _, _ = _collect(root)
+        engine = FantasyScoringEngine.from_latest_league_settings(manager)
+        assert engine.score_games([wr_game, qb_game]).tolist() == [13.0, 18.0]
+        assert engine.score_game({"passing": {"passTD": "1"}}) == 4.0
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Yahoo League Settings Collection")
+    print("=" * 40)
+    for test in (test_settings_output, test_scoring_engine_reads_collected_settings):
+        test()
+        print(f"✅ {test.__name__}")
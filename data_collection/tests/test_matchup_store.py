@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test Finalized Matchup Week Store
+
+Offline checks that team_matchups serves finished weeks from the matchup
+store and only refetches the current week. Yahoo responses are local fixtures.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+# Add collection scripts and shared utilities to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts"))
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+
+from file_utils import DataFileManager
+from matchup_store import MatchupWeekStore, is_final_week
+from season_context import SeasonContextService
+from yahoo.team_matchups import TeamMatchupsExtractor
+
+LEAGUE_KEY = "461.l.595012"
+CURRENT_WEEK = 7
+
+DISCOVERY = {"fantasy_content": {"users": {"0": {"user": [
+    {"guid": "abc"},
+    {"games": {"0": {"game": [
+        {"game_key": "461", "name": "Football", "season": "2025"},
+        {"teams": {"0": {"team": [[
+            {"team_key": "461.l.595012.t.3"}, {"team_id": "3"}, {"name": "Team Three"},
+            {"is_owned_by_current_login": 1}
+        ]]}}}
+    ]}}}
+]}}}}
+
+
+def _scoreboard(week):
+    """Scoreboard fixture in Yahoo's league/scoreboard shape"""
+    status = "midevent" if week == CURRENT_WEEK else "postevent"
+    teams = {str(i): {"team": [[{"team_key": f"{LEAGUE_KEY}.t.{i + 1}"}, {"name": f"Team {i + 1}"}],
+                               {"team_points": {"coverage_type": "week", "week": str(week), "total": "100.5"}}]}
+             for i in range(2)}
+    matchup = {"week": str(week), "week_start": f"2025-09-{week:02d}", "week_end": f"2025-09-{week + 6:02d}",
+               "status": status, "0": {"teams": teams}}
+    return {"status": "success", "parsed": {"fantasy_content": {"league": [
+        {"league_key": LEAGUE_KEY, "current_week": CURRENT_WEEK},
+        {"scoreboard": {"week": week, "0": {"matchups": {"0": {"matchup": matchup}, "count": 1}}}}]}}}
+
+
+class FakeYahooAuth:
+    """Answers league discovery and scoreboard endpoints"""
+
+    def __init__(self):
+        self.requests = []
+
+    def make_request(self, endpoint):
+        self.requests.append(endpoint)
+        if endpoint.startswith("users"):
+            return {"status": "success", "parsed": DISCOVERY}
+        week = int(endpoint.split("week=")[1]) if "week=" in endpoint else CURRENT_WEEK
+        return _scoreboard(week)
+
+
+def _extractor(root, yahoo):
+    manager = DataFileManager(os.path.join(root, "outputs"))
+    extractor = TeamMatchupsExtractor(yahoo_auth=yahoo, file_manager=manager,
+                                      matchup_store=MatchupWeekStore(os.path.join(root, "matchups")))
+    extractor.season_context_service = SeasonContextService(yahoo, manager, os.path.join(root, "season_context.json"))
+    return extractor
+
+
+def _scoreboard_calls(yahoo):
+    return [r for r in yahoo.requests if "scoreboard" in r]
+
+
+def test_is_final_week():
+    """Postevent weeks become final once the stat-correction window has passed."""
+    week = {"week": 3, "matchups": [{"status": "postevent", "week_end": "2025-09-22"}]}
+    assert not is_final_week(week, now=datetime(2025, 9, 24))
+    assert is_final_week(week, now=datetime(2025, 9, 25))
+    week["matchups"].append({"status": "midevent", "week_end": "2025-09-22"})
+    assert not is_final_week(week, now=datetime(2025, 10, 1))
+
+
+def test_full_season_second_run_is_one_call():
+    """The first full-season run stores finished weeks; the next run only fetches the current week."""
+    with tempfile.TemporaryDirectory() as root:
+        yahoo = FakeYahooAuth()
+        data = _extractor(root, yahoo).extract_team_matchups(full_season=True)
+        assert sorted(data["matchups"]) == sorted(f"week_{w}" for w in range(1, CURRENT_WEEK + 1))
+        assert len(_scoreboard_calls(yahoo)) == CURRENT_WEEK
+
+        yahoo = FakeYahooAuth()
+        extractor = _extractor(root, yahoo)
+        data = extractor.extract_team_matchups(full_season=True)
+        assert _scoreboard_calls(yahoo) == [f"league/{LEAGUE_KEY}/scoreboard"]
+        assert extractor.execution_stats["weeks_from_cache"] == CURRENT_WEEK - 1
+        assert data["matchups"]["week_7"]["matchups"][0]["status"] == "midevent"
+        assert data["matchups"]["week_3"]["matchups"][0]["teams"][0]["team_points"]["total"] == "100.5"
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Finalized Matchup Week Store")
+    print("=" * 40)
+    for test in (test_is_final_week, test_full_season_second_run_is_one_call):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test Player Identity Index
+
+Offline checks for the shared Yahoo/Tank01/Sleeper identity index.
+No API calls are made - small in-memory player databases are used.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add shared utilities to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+
+from player_identity import PlayerIdentityIndex, normalize_name, normalize_team
+
+TANK01_PLAYERS = [
+    {"playerID": "4241457", "longName": "Josh Allen", "team": "BUF", "pos": "QB",
+     "yahooPlayerID": "30977", "sleeperBotID": "4984"},
+    {"playerID": "3915511", "longName": "Josh Allen", "team": "JAX", "pos": "LB"},
+    {"playerID": "4361370", "longName": "Terry McLaurin", "team": "WSH", "pos": "WR"},
+]
+
+SLEEPER_PLAYERS = {
+    "4984": {"player_id": "4984", "full_name": "Josh Allen", "team": "BUF", "position": "QB"},
+    "4039": {"player_id": "4039", "full_name": "Cooper Kupp", "team": "SEA", "position": "WR",
+             "yahoo_id": "30121"},
+    "BUF": {"player_id": "BUF", "team": "BUF", "position": "DEF"},
+}
+
+
+def test_normalization():
+    """Names drop punctuation and suffixes; teams map to one standard."""
+    assert normalize_name("Marvin Harrison Jr.") == "marvin harrison"
+    assert normalize_name("D'Andre Swift") == "dandre swift"
+    assert normalize_team("Was") == normalize_team("WSH")
+
+
+def test_tank01_matching_and_learned_links():
+    """Yahoo IDs, name + team and position disambiguate Tank01 players."""
+    with tempfile.TemporaryDirectory() as tmp:
+        index = PlayerIdentityIndex(index_path=os.path.join(tmp, "index.json"))
+        index.sync_tank01_players(TANK01_PLAYERS)
+
+        assert index.match_tank01("Josh Allen", "Jax", "LB")["playerID"] == "3915511"
+        assert index.match_tank01("Unknown", yahoo_id="30977")["playerID"] == "4241457"
+
+        mclaurin = index.match_tank01("Terry McLaurin", "Was", "WR", yahoo_id="30175")
+        assert mclaurin["playerID"] == "4361370"
+        assert index.resolve_yahoo("30175")["tank01_id"] == "4361370"
+
+        # Learned links survive a reload
+        index.save()
+        reloaded = PlayerIdentityIndex(index_path=os.path.join(tmp, "index.json"))
+        assert reloaded.resolve_yahoo("30175")["tank01_id"] == "4361370"
+
+
+def test_only_exact_matches_are_learned():
+    """Last-name fallbacks are not persisted, and source Yahoo IDs beat a learned link."""
+    with tempfile.TemporaryDirectory() as tmp:
+        index = PlayerIdentityIndex(index_path=os.path.join(tmp, "index.json"))
+        index.sync_tank01_players(TANK01_PLAYERS)
+
+        assert index.match_tank01("T. McLaurin", "Was", "WR", yahoo_id="30175")["playerID"] == "4361370"
+        assert index.resolve_yahoo("30175")["tank01_id"] is None
+
+        # A stale link to the other Josh Allen loses to Tank01's own yahooPlayerID
+        index.link_yahoo_player("30977", tank01_id="3915511")
+        assert index.match_tank01("Josh Allen", yahoo_id="30977")["playerID"] == "4241457"
+        assert index.resolve_yahoo("30977")["tank01_id"] == "4241457"
+
+
+def test_sleeper_matching_and_cross_reference():
+    """Sleeper matches use Yahoo IDs, the Tank01 sleeperBotID link and defenses."""
+    with tempfile.TemporaryDirectory() as tmp:
+        index = PlayerIdentityIndex(index_path=os.path.join(tmp, "index.json"))
+        index.sync_tank01_players(TANK01_PLAYERS)
+        index.sync_sleeper_players(SLEEPER_PLAYERS)
+
+        assert index.match_sleeper("Cooper Kupp", yahoo_id="30121")["player_id"] == "4039"
+        assert index.match_sleeper("J. Allen", yahoo_id="30977")["player_id"] == "4984"
+        assert index.get_sleeper_defense("Buf")["player_id"] == "BUF"
+
+
+def test_incremental_resync():
+    """Re-syncing only touches changed rows and drops removed players."""
+    with tempfile.TemporaryDirectory() as tmp:
+        index = PlayerIdentityIndex(index_path=os.path.join(tmp, "index.json"))
+        index.sync_tank01_players(TANK01_PLAYERS)
+
+        moved = [dict(p) for p in TANK01_PLAYERS[:2]]
+        moved[0]["team"] = "MIA"
+        index.sync_tank01_players(moved)
+
+        assert index.match_tank01("Josh Allen", "MIA", "QB")["playerID"] == "4241457"
+        assert index.get_tank01_player("4361370") is None
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Player Identity Index")
+    print("=" * 40)
+    for test in (test_normalization, test_tank01_matching_and_learned_links, test_only_exact_matches_are_learned,
+                 test_sleeper_matching_and_cross_reference, test_incremental_resync):
+        test()
+        print(f"✅ {test.__name__}")
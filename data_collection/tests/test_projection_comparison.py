@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test Projection Comparison Engine
+
+Offline checks for the projection-to-actual hash join and its vectorized
+accuracy columns.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add shared utilities to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+
+from projection_comparison import ProjectionComparisonEngine
+
+PROJECTIONS = pd.DataFrame([
+    {"player_id": "1", "name": "Josh Allen", "position": "QB", "projected_points": 25.0},
+    {"player_id": "", "name": "Marvin Harrison Jr.", "position": "WR", "projected_points": 10.0},
+    {"player_id": "3", "name": "Bijan Robinson", "position": "RB", "projected_points": 18.0},
+    {"player_id": "4", "name": "Nobody Played", "position": "TE", "projected_points": 8.0},
+])
+
+ACTUALS = pd.DataFrame([
+    {"player_id": "3", "name": "B. Robinson", "actual_points": 18.2},
+    {"player_id": "9", "name": "Marvin Harrison", "actual_points": 16.0},
+    {"player_id": "1", "name": "Josh Allen", "actual_points": 20.0},
+])
+
+
+def test_join_by_id_then_name():
+    """IDs match first; rows without an ID match fall back to normalized names."""
+    joined = ProjectionComparisonEngine().join(PROJECTIONS, ACTUALS)
+    assert joined["name"].tolist() == ["Josh Allen", "Marvin Harrison Jr.", "Bijan Robinson"]
+    assert joined["match_method"].tolist() == ["player_id", "name", "player_id"]
+    assert joined["actual_points"].tolist() == [20.0, 16.0, 18.2]
+
+
+def test_vectorized_metrics_and_summary():
+    """Variance, accuracy and over/under buckets match the per-player formulas."""
+    engine = ProjectionComparisonEngine(threshold=5.0)
+    joined = engine.join(PROJECTIONS, ACTUALS)
+    assert joined["variance"].round(1).tolist() == [-5.0, 6.0, 0.2]
+    assert joined["accuracy_percentage"].tolist() == [80.0, 40.0, 98.9]
+    assert joined["over_under"].tolist() == ["even", "over", "even"]
+
+    summary = engine.position_summary(joined)
+    assert summary["WR"]["overperformers"] == 1
+    assert summary["QB"] == {"avg_accuracy": 80.0, "total_players": 1, "overperformers": 0,
+                             "underperformers": 0, "accurate": 1, "total_projected": 25.0,
+                             "total_actual": 20.0}
+
+
+def test_empty_inputs():
+    """Empty inputs produce an empty scored frame."""
+    joined = ProjectionComparisonEngine().join(PROJECTIONS, pd.DataFrame())
+    assert joined.empty and "accuracy_percentage" in joined
+
+    # No projections at all (no columns) still scores instead of raising
+    joined = ProjectionComparisonEngine().join(pd.DataFrame(), ACTUALS)
+    assert joined.empty and {"projected_points", "actual_points", "over_under"} <= set(joined.columns)
+    assert ProjectionComparisonEngine().position_summary(joined) == {}
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Projection Comparison Engine")
+    print("=" * 40)
+    for test in (test_join_by_id_then_name, test_vectorized_metrics_and_summary, test_empty_inputs):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test Quota-Aware Rate Limiter
+
+Offline checks for the token bucket and ordered concurrent fetch helper.
+No API calls are made - fetches are simulated with short sleeps.
+"""
+
+import sys
+import time
+import random
+from pathlib import Path
+
+# Add shared utilities to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+
+from rate_limiter import QuotaAwareTokenBucket, QuotaExhaustedError, fetch_in_order
+
+
+def test_results_stay_in_input_order():
+    """Results line up with inputs even when later items finish first."""
+    def fetch(item):
+        time.sleep(random.uniform(0, 0.02))
+        return item * 10
+
+    results = fetch_in_order(list(range(20)), fetch, max_workers=6)
+    assert results == [i * 10 for i in range(20)]
+
+
+def test_bucket_limits_rate():
+    """A 20/s bucket with burst 1 needs about half a second for 11 calls."""
+    limiter = QuotaAwareTokenBucket(rate_per_second=20, burst=1)
+    start = time.monotonic()
+    fetch_in_order(list(range(11)), lambda item: item, limiter=limiter, max_workers=4)
+    assert time.monotonic() - start >= 0.45
+    assert limiter.get_stats()["granted"] == 11
+
+
+def test_stops_at_quota_reserve():
+    """Calls are refused once remaining quota reaches the reserve."""
+    usage = {"remaining_calls": 13, "daily_limit": 1000}
+
+    def fetch(item):
+        usage["remaining_calls"] -= 1
+        return "ok"
+
+    limiter = QuotaAwareTokenBucket(rate_per_second=1000, usage_func=lambda: usage, reserve_calls=10)
+    results = fetch_in_order(list(range(6)), fetch, limiter=limiter, max_workers=1,
+                             on_error=lambda item, e: type(e).__name__)
+
+    assert results == ["ok", "ok", "ok"] + [QuotaExhaustedError.__name__] * 3
+    assert limiter.get_stats()["refused"] == 3
+
+
+
+def test_call_spends_tokens_only_for_real_calls():
+    """Items served without an API call take no token and are not refused at the reserve."""
+    usage = {"remaining_calls": 11, "daily_limit": 1000}
+    limiter = QuotaAwareTokenBucket(rate_per_second=1000, usage_func=lambda: usage, reserve_calls=10)
+    stored = {0: "stored", 2: "stored", 4: "stored"}
+
+    def api_call():
+        usage["remaining_calls"] -= 1
+        return "fetched"
+
+    def fetch(item):
+        return stored[item] if item in stored else limiter.call(api_call)
+
+    results = fetch_in_order(list(range(5)), fetch, max_workers=1, on_error=lambda item, e: type(e).__name__)
+    assert results == ["stored", "fetched", "stored", QuotaExhaustedError.__name__, "stored"]
+    assert limiter.get_stats()["granted"] == 1 and limiter.get_stats()["refused"] == 1
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Quota-Aware Rate Limiter")
+    print("=" * 40)
+    for test in (test_results_stay_in_input_order, test_bucket_limits_rate, test_stops_at_quota_reserve,
+                 test_call_spends_tokens_only_for_real_calls):
+        test()
+        print(f"✅ {test.__name__}")
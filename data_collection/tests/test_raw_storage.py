@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test Raw Snapshot Storage
+
+Offline checks for the pluggable raw snapshot formats and transparent
+decoding through DataFileManager.
+"""
+
+import sys
+import json
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add shared utilities to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+
+from file_utils import DataFileManager, RAW_DATA_CODECS
+
+SNAPSHOT = {
+    "season_context": {"current_week": 6, "nfl_season": "2025"},
+    "players": [{"name": "Josh Allen", "points": 24.3, "injury": None}],
+    "extracted_at": datetime(2025, 10, 12, 9, 30)
+}
+
+
+def test_every_format_round_trips():
+    """Each installed backend decodes back to the JSON-equivalent snapshot."""
+    expected = json.loads(json.dumps(SNAPSHOT, default=str))
+    with tempfile.TemporaryDirectory() as outputs:
+        for format_name, codec in RAW_DATA_CODECS.items():
+            if not codec.available():
+                continue
+            manager = DataFileManager(outputs, raw_format=format_name)
+            path = manager.save_raw_data("yahoo", format_name, SNAPSHOT, "20251012_093000")
+            assert path.endswith(f"_raw_data{codec.extension}")
+            assert manager.load_raw_data(path) == expected
+
+
+def test_mixed_formats_resolve_latest():
+    """Latest lookups span formats, so switching backends keeps loaders working."""
+    with tempfile.TemporaryDirectory() as outputs:
+        DataFileManager(outputs, raw_format="json").save_raw_data("tank01", "my_roster", {"n": 1}, "20251001_100000")
+        manager = DataFileManager(outputs, raw_format="json_gz")
+        manager.save_raw_data("tank01", "my_roster", {"n": 2}, "20251008_100000")
+
+        assert manager.get_latest_file("tank01", "my_roster", "raw_data").endswith(".json.gz")
+        assert manager.load_latest_raw_data("tank01", "my_roster") == {"n": 2}
+        assert manager.load_latest_raw_data("tank01", "missing") is None
+
+
+def test_unknown_format_falls_back():
+    """An unknown or uninstalled backend falls back to compact JSON."""
+    with tempfile.TemporaryDirectory() as outputs:
+        manager = DataFileManager(outputs, raw_format="parquet")
+        assert manager.raw_format == "compact_json"
+        path = manager.save_raw_data("sleeper", "trending", {"a": [1, 2]})
+        assert Path(path).read_text() == '{"a":[1,2]}'
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Raw Snapshot Storage")
+    print("=" * 40)
+    for test in (test_every_format_round_trips, test_mixed_formats_resolve_latest,
+                 test_unknown_format_falls_back):
+        test()
+        print(f"✅ {test.__name__}")
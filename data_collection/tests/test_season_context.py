@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test Season Context Service
+
+Offline checks for resolving league, season and current week once and
+memoizing them to disk. Yahoo responses are local fixtures.
+"""
+
+import os
+import sys
+import time
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+# Add shared utilities to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+
+from file_utils import DataFileManager
+from season_context import (SeasonContextService, current_week_from_matchups, estimate_week_from_date,
+                            nfl_week_for_date)
+
+DISCOVERY = {"fantasy_content": {"users": {"0": {"user": [
+    {"guid": "abc"},
+    {"games": {"0": {"game": [
+        {"game_key": "461", "name": "Football", "season": "2025"},
+        {"teams": {"0": {"team": [[
+            {"team_key": "461.l.595012.t.3"}, {"team_id": "3"}, {"name": "Team Three"},
+            {"is_owned_by_current_login": 1}
+        ]]}}}
+    ]}}}
+]}}}}
+
+
+def _matchups(*weeks):
+    return {f"week_{week}": {"week": week, "matchups": [{"status": status, "week_start": f"2025-10-{week:02d}"}]}
+            for week, status in weeks}
+
+
+class FakeYahooAuth:
+    """Counts requests and answers league discovery and scoreboard endpoints"""
+
+    def __init__(self):
+        self.requests = []
+
+    def make_request(self, endpoint):
+        self.requests.append(endpoint)
+        if endpoint.startswith("users"):
+            return {"status": "success", "parsed": DISCOVERY}
+        return {"status": "success", "parsed": {"fantasy_content": {"league": [{"current_week": 7}]}}}
+
+
+def test_current_week_from_matchups():
+    """The latest active week wins; team_matchups stores the previous week first."""
+    week = current_week_from_matchups(_matchups((6, "postevent"), (7, "preevent")))
+    assert week["week"] == 7 and week["status"] == "preevent"
+    assert current_week_from_matchups(_matchups((3, "unknown"), (2, "unknown")))["week"] == 3
+    assert current_week_from_matchups({}) is None
+    assert estimate_week_from_date(datetime(2025, 9, 20))["week"] == 3
+    assert estimate_week_from_date(datetime(2026, 1, 10))["week"] == 18
+
+
+def test_nfl_week_for_date():
+    """Game weeks count from the opener; January games are the previous season's late weeks."""
+    assert nfl_week_for_date(datetime(2025, 9, 4)) == (2025, 1)
+    assert nfl_week_for_date(datetime(2025, 9, 8)) == (2025, 1)
+    assert nfl_week_for_date(datetime(2025, 9, 11)) == (2025, 2)
+    assert nfl_week_for_date(datetime(2026, 1, 4)) == (2025, 18)
+    assert nfl_week_for_date(datetime(2025, 8, 20)) == (2025, 0)
+    assert nfl_week_for_date(datetime(2024, 9, 5)) == (2024, 1)
+
+
+def test_resolves_once_and_memoizes_to_disk():
+    """League discovery and scoreboard run once; a second service reads the disk cache."""
+    with tempfile.TemporaryDirectory() as root:
+        manager = DataFileManager(os.path.join(root, "outputs"))
+        cache_path = os.path.join(root, "season_context.json")
+        yahoo = FakeYahooAuth()
+        service = SeasonContextService(yahoo, manager, cache_path)
+
+        context = service.get_season_context("Tank01 API")
+        service.get_season_context("Sleeper API")
+        assert context["nfl_season"] == "2025" and context["current_week"] == 7
+        assert context["yahoo_league_info"]["league_key"] == "461.l.595012"
+        assert context["week_info"]["source"] == "yahoo_scoreboard_api"
+        assert len(yahoo.requests) == 2
+
+        other = SeasonContextService(FakeYahooAuth(), manager, cache_path)
+        assert other.get_current_week() == 7 and other.yahoo_auth.requests == []
+
+
+def test_snapshot_and_recorded_matchups():
+    """Without Yahoo access the latest team_matchups snapshot answers; recorded matchups refresh it."""
+    with tempfile.TemporaryDirectory() as root:
+        manager = DataFileManager(os.path.join(root, "outputs"))
+        manager.save_raw_data("yahoo", "my_roster", {"team_info": {
+            "league_key": "461.l.595012", "league_name": "Fantasy League (2025)", "team_key": "461.l.595012.t.3"}})
+        manager.save_raw_data("yahoo", "team_matchups", {"matchups": _matchups((5, "postevent"), (6, "midevent"))})
+        service = SeasonContextService(None, manager, os.path.join(root, "season_context.json"))
+
+        assert service.get_week_info()["status"] == "midevent"
+        assert service.get_season() == "2025"
+
+        service.record_matchups(_matchups((6, "postevent"), (7, "preevent")))
+        assert service.get_current_week() == 7
+
+        # Expired entries are re-resolved from the snapshot
+        service._state["week_resolved_at"] = time.time() - 10 * 24 * 3600
+        assert service.get_current_week() == 6
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Season Context Service")
+    print("=" * 40)
+    for test in (test_current_week_from_matchups, test_nfl_week_for_date,
+                 test_resolves_once_and_memoizes_to_disk, test_snapshot_and_recorded_matchups):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test Season Warehouse
+
+Offline checks for ingesting Tank01 game stats, projection archives and Yahoo
+rosters into the partitioned warehouse and querying them back.
+"""
+
+import sys
+import tempfile
+import multiprocessing
+from pathlib import Path
+
+import pandas as pd
+
+# Add shared utilities to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+
+from season_warehouse import SeasonWarehouse
+
+
+def _game(week, points, date):
+    return {"week": week, "game_id": f"2025{week:02d}_BUF@MIA", "game_date": date,
+            "fantasy_points": points, "passing": {"passYds": "250"}}
+
+
+GAME_STATS = {
+    "season_context": {"nfl_season": "2025", "current_week": 5},
+    "matched_players": [{
+        "yahoo_player": {"player_id": "30977", "name": {"full": "Josh Allen"}, "display_position": "QB"},
+        "tank01_data": {"playerID": "3918298", "team": "BUF"},
+        "game_stats": {"games": [
+            _game(1, 20.0, "2025-08-20"), _game(1, 10.0, "2025-09-07"), _game(2, 10.0, "2025-09-14"),
+            _game(3, 20.0, "2025-09-21"), _game(4, 30.0, "2025-09-28")
+        ]}
+    }]
+}
+
+PROJECTIONS = {
+    "collection_metadata": {"week": 3, "nfl_season": 2025, "collection_timestamp": "2025-09-20T10:00:00"},
+    "projections": {"3918298": {"player_name": "Josh Allen", "position": "QB", "fantasyPoints": "25.0"}}
+}
+
+ROSTER = {
+    "season_context": {"nfl_season": "2025", "current_week": 3},
+    "team_info": {"team_key": "461.l.1.t.1"},
+    "roster_players": [{"player_key": "461.p.30977", "player_id": "30977", "full_name": "Josh Allen",
+                        "display_position": "QB", "selected_position": "QB"}]
+}
+
+
+def test_ingest_partitions_and_idempotence():
+    """Rows land in season/week partitions; re-ingesting the same run adds nothing."""
+    with tempfile.TemporaryDirectory() as root:
+        warehouse = SeasonWarehouse(root)
+        assert warehouse.ingest_snapshot("tank01", "my_roster_stats", GAME_STATS) == 5
+        warehouse.ingest_snapshot("tank01", "my_roster_stats", GAME_STATS)
+
+        assert len(warehouse.query("game_logs", 2025)) == 5
+        assert len(warehouse.query("game_logs", 2025, weeks=[0])) == 1  # preseason
+        week_3 = warehouse.query("game_logs", 2025, weeks=[3], columns=["player_id", "passYds"])
+        assert week_3.to_dict("records") == [{"player_id": "3918298", "passYds": 250.0}]
+        assert warehouse.ingest_snapshot("sleeper", "trending", {}) == 0
+
+
+def test_january_game_lands_in_late_week():
+    """A January game is stored in the previous season's week 18, not week 1."""
+    january = {"season_context": {"nfl_season": "2025", "current_week": 18}, "matched_players": [{
+        "yahoo_player": {"player_id": "30977", "name": {"full": "Josh Allen"}},
+        "tank01_data": {"playerID": "3918298"},
+        "game_stats": {"games": [
+            {"week": 1, "game_id": "20260104_BUF@NYJ", "game_date": "2026-01-04", "fantasy_points": 22.0},
+            {"week": 1, "game_id": "20251228_BUF@PHI", "fantasy_points": 18.0}
+        ]}
+    }]}
+    with tempfile.TemporaryDirectory() as root:
+        warehouse = SeasonWarehouse(root)
+        assert warehouse.ingest_snapshot("tank01", "my_roster_stats", january) == 2
+        assert warehouse.query("game_logs", 2025, weeks=[1]).empty
+        assert warehouse.query("game_logs", 2026).empty
+        games = warehouse.query("game_logs", 2025, columns=["game_id", "week"]).sort_values("week")
+        assert games.to_dict("records") == [{"game_id": "20251228_BUF@PHI", "week": 17},
+                                            {"game_id": "20260104_BUF@NYJ", "week": 18}]
+
+
+def test_weekly_points_trends_and_team_week():
+    """Accuracy, trends and roster joins are computed from the stored tables."""
+    with tempfile.TemporaryDirectory() as root:
+        warehouse = SeasonWarehouse(root)
+        warehouse.ingest_snapshot("tank01", "available_players_stats", GAME_STATS)
+        warehouse.ingest_snapshot("tank01", "projections_archive", PROJECTIONS, phase="pre_game")
+        warehouse.ingest_snapshot("yahoo", "my_roster", ROSTER, "20250920_100000_my_roster_raw_data.json")
+
+        weekly = warehouse.player_weekly_points(2025, ["30977"])
+        assert weekly["week"].tolist() == [1, 2, 3, 4]
+        assert weekly.loc[weekly["week"] == 3, "accuracy"].item() == 80.0
+
+        trends = warehouse.player_trends(2025).iloc[0]
+        assert trends["games"] == 4
+        assert trends["recent_avg"] == 20.0 and trends["older_avg"] == 10.0
+        assert trends["points_range"] == 20.0
+
+        team = warehouse.team_week_performance(2025, 3)
+        assert team[["name", "projected_points", "actual_points"]].to_dict("records") == [
+            {"name": "Josh Allen", "projected_points": 25.0, "actual_points": 20.0}]
+
+
+def _append_rosters(warehouse_dir, team_key, count):
+    warehouse = SeasonWarehouse(warehouse_dir)
+    for i in range(count):
+        warehouse.append("roster_snapshots", pd.DataFrame([{
+            "season": 2025, "week": 5, "team_key": team_key, "player_key": f"461.p.{i}",
+            "snapshot_ts": "20251005_090000"}]))
+
+
+def test_concurrent_appends_keep_all_rows():
+    """Two processes rewriting the same partition at once lose none of each other's rows."""
+    with tempfile.TemporaryDirectory() as root:
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=_append_rosters, args=(root, team_key, 15))
+                   for team_key in ("461.l.1.t.1", "461.l.1.t.2")]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        rows = SeasonWarehouse(root).query("roster_snapshots", 2025, [5])
+        assert rows.groupby("team_key").size().to_dict() == {"461.l.1.t.1": 15, "461.l.1.t.2": 15}
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Season Warehouse")
+    print("=" * 40)
+    for test in (test_ingest_partitions_and_idempotence, test_january_game_lands_in_late_week,
+                 test_weekly_points_trends_and_team_week, test_concurrent_appends_keep_all_rows):
+        test()
+        print(f"✅ {test.__name__}")
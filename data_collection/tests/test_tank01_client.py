@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test Simplified Tank01 Client Response Cache
+
+Offline checks that the standalone SimpleTank01Client serves a cached copy
+when a request fails and keeps it when a background refresh returns an error.
+No API calls are made - the network fetch is replaced with local functions.
+"""
+
+import sys
+import time
+import logging
+import tempfile
+from pathlib import Path
+
+# Add shared utilities and the main scripts directory to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+sys.path.append(str(Path(__file__).parent.parent.parent / "scripts"))
+
+from tank01_client import SimpleTank01Client
+from external.response_cache import ResponseCache
+
+
+def _standalone_client(cache_dir, fetch):
+    client = SimpleTank01Client.__new__(SimpleTank01Client)
+    client.logger = logging.getLogger(__name__)
+    client.api_key = "test-key"
+    client.tank01_client = None
+    client.use_existing = False
+    client.cache = ResponseCache("tank01", cache_dir=cache_dir, endpoint_ttls={"getNFLTeams": 0.1},
+                                 stale_factor=1.0)
+    client._fetch_standalone = fetch
+    return client
+
+
+def test_failed_request_serves_expired_entry():
+    """A failed request past the stale window falls back to the cached response."""
+    def fail(endpoint, params=None):
+        raise ConnectionError("Tank01 unavailable")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        client = _standalone_client(tmp, fail)
+        client.cache.store("getNFLTeams", None, {"statusCode": 200, "body": ["BUF"]})
+        time.sleep(0.25)
+        assert client._make_request("getNFLTeams")["body"] == ["BUF"]
+
+
+def test_failed_revalidation_keeps_stale_entry():
+    """An error payload from a background refresh does not overwrite the cached response."""
+    with tempfile.TemporaryDirectory() as tmp:
+        client = _standalone_client(tmp, lambda endpoint, params=None: {"statusCode": 429, "body": None})
+        client.cache.store("getNFLTeams", None, {"statusCode": 200, "body": ["BUF"]})
+        time.sleep(0.15)
+
+        assert client._make_request("getNFLTeams")["body"] == ["BUF"]
+        client.cache.wait_for_revalidations()
+        assert client.cache.get_any("getNFLTeams")["body"] == ["BUF"]
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Simplified Tank01 Client Response Cache")
+    print("=" * 40)
+    for test in (test_failed_request_serves_expired_entry, test_failed_revalidation_keeps_stale_entry):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test Incremental Yahoo Transaction Sync
+
+Offline checks that transaction_trends only pages up to the last stored
+transaction and updates add/drop trends incrementally. Yahoo responses are
+local fixtures.
+"""
+
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+# Add collection scripts and shared utilities to path
+sys.path.append(str(Path(__file__).parent.parent / "scripts"))
+sys.path.append(str(Path(__file__).parent.parent / "scripts" / "shared"))
+
+from transaction_store import TransactionStore
+from yahoo.transaction_trends import TransactionTrendsExtractor
+
+LEAGUE_KEY = "461.l.595012"
+
+
+def _transaction(number):
+    """Transaction fixture in Yahoo's list-of-chunks shape"""
+    player_id = str(number % 7)
+    return {"transaction": [
+        {"transaction_key": f"461.l.595012.tr.{number}", "type": "add/drop" if number % 2 else "add",
+         "status": "successful", "timestamp": str(1757000000 + number)},
+        {"players": {"0": {"player": [[{"player_id": player_id}, {"name": {"full": f"Player {player_id}"}}]]},
+                     "count": 1}}
+    ]}
+
+
+class FakeYahooAuth:
+    """Serves transactions newest first, 25 per page"""
+
+    def __init__(self, newest):
+        self.newest = newest
+        self.requests = []
+
+    def make_request(self, endpoint):
+        self.requests.append(endpoint)
+        start, count = map(int, re.search(r"start=(\d+);count=(\d+)", endpoint).groups())
+        numbers = list(range(self.newest, 0, -1))[start:start + count]
+        transactions = {str(i): _transaction(n) for i, n in enumerate(numbers)}
+        transactions.update({"count": len(numbers), "total": self.newest})
+        return {"status": "success", "parsed": {"fantasy_content": {"league": [
+            {"league_key": LEAGUE_KEY}, {"transactions": transactions}]}}}
+
+
+def _sync(extractor):
+    new, complete = extractor._extract_all_transactions(LEAGUE_KEY)
+    assert complete
+    return extractor.transaction_store.merge(LEAGUE_KEY, new, extractor._apply_player_trends)
+
+
+def test_incremental_sync_matches_full_history():
+    """A second run fetches one page and ends with the same trends as a full recompute."""
+    with tempfile.TemporaryDirectory() as root:
+        yahoo = FakeYahooAuth(newest=60)
+        extractor = TransactionTrendsExtractor(yahoo_auth=yahoo, file_manager=object(),
+                                               transaction_store=TransactionStore(root))
+        state = _sync(extractor)
+        assert len(yahoo.requests) == 3 and len(state["transactions"]) == 60
+
+        yahoo.newest, yahoo.requests = 63, []
+        extractor.transaction_store = TransactionStore(root)  # next run reads the store from disk
+        state = _sync(extractor)
+        assert len(yahoo.requests) == 1
+        assert extractor.execution_stats["new_transactions"] == 3
+        assert state["last_seen"]["transaction_key"] == "461.l.595012.tr.63"
+        assert [tx["transaction_key"] for tx in state["transactions"][:4]] == [
+            f"461.l.595012.tr.{n}" for n in (63, 62, 61, 60)]
+
+        full = {}
+        extractor._apply_player_trends(full, state["transactions"])
+        assert state["player_trends"] == full
+        assert sum(t["adds"] for t in full.values()) == 63
+
+
+def test_nothing_new_costs_one_page():
+    """With no new transactions the first page hits the last-seen key and stops."""
+    with tempfile.TemporaryDirectory() as root:
+        yahoo = FakeYahooAuth(newest=30)
+        extractor = TransactionTrendsExtractor(yahoo_auth=yahoo, file_manager=object(),
+                                               transaction_store=TransactionStore(root))
+        _sync(extractor)
+        yahoo.requests = []
+        new, complete = extractor._extract_all_transactions(LEAGUE_KEY)
+        assert new == [] and complete and len(yahoo.requests) == 1
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Incremental Yahoo Transaction Sync")
+    print("=" * 40)
+    for test in (test_incremental_sync_matches_full_history, test_nothing_new_costs_one_page):
+        test()
+        print(f"✅ {test.__name__}")
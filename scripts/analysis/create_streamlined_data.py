@@ -8,17 +8,19 @@ Creates a token-efficient version of the comprehensive data for use in analyst p
 import os
 import sys
 import json
-import tiktoken
 from datetime import datetime
 
 # Add project root to path
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(project_root)
+sys.path.append(os.path.dirname(os.path.dirname(project_root)))
 
-def calculate_tokens(text: str) -> int:
-    """Calculate tokens using tiktoken"""
-    encoding = tiktoken.get_encoding('cl100k_base')
-    return len(encoding.encode(text))
+from ai_agents.token_accounting import get_token_counter
+
+def calculate_tokens(data) -> int:
+    """Calculate tokens with the shared token counter (text, or an object as indented JSON)"""
+    counter = get_token_counter()
+    return counter.count_text(data) if isinstance(data, str) else counter.count_object(data)
 
 def create_streamlined_player(player_data: dict) -> dict:
     """Create a streamlined version of a player for analyst consumption"""
@@ -194,11 +196,8 @@ def main():
     streamlined_data = create_streamlined_data(comprehensive_data)
     
     # Calculate token usage
-    comprehensive_json = json.dumps(comprehensive_data, indent=2)
-    streamlined_json = json.dumps(streamlined_data, indent=2)
-    
-    comprehensive_tokens = calculate_tokens(comprehensive_json)
-    streamlined_tokens = calculate_tokens(streamlined_json)
+    comprehensive_tokens = calculate_tokens(comprehensive_data)
+    streamlined_tokens = calculate_tokens(streamlined_data)
     
     print(f"\n=== TOKEN COMPARISON ===")
     print(f"Comprehensive data: {comprehensive_tokens:,} tokens")
@@ -210,11 +209,8 @@ def main():
     sections = ['my_roster', 'opponent_roster', 'available_players', 'nfl_matchups']
     
     for section in sections:
-        comp_section = json.dumps(comprehensive_data.get(section, {}), indent=2)
-        stream_section = json.dumps(streamlined_data.get(section, {}), indent=2)
-        
-        comp_tokens = calculate_tokens(comp_section)
-        stream_tokens = calculate_tokens(stream_section)
+        comp_tokens = calculate_tokens(comprehensive_data.get(section, {}))
+        stream_tokens = calculate_tokens(streamlined_data.get(section, {}))
         
         print(f"{section:20s}: {comp_tokens:8,} → {stream_tokens:8,} tokens ({(1-stream_tokens/comp_tokens)*100:.1f}% reduction)")
     
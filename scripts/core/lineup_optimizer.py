@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Lineup Optimizer
+Exact starting lineup selection for the league's roster slots (including FLEX and SUPERFLEX)
+"""
+
+import math
+import logging
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+import numpy as np
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Yahoo roster slot -> eligible player positions
+SLOT_ELIGIBILITY = {
+    'QB': {'QB'},
+    'RB': {'RB'},
+    'WR': {'WR'},
+    'TE': {'TE'},
+    'K': {'K'},
+    'DEF': {'DEF'},
+    'W/R/T': {'WR', 'RB', 'TE'},
+    'W/R': {'WR', 'RB'},
+    'W/T': {'WR', 'TE'},
+    'R/T': {'RB', 'TE'},
+    'Q/W/R/T': {'QB', 'WR', 'RB', 'TE'}
+}
+
+# Other names used for the same slots
+SLOT_ALIASES = {
+    'D': 'DEF',
+    'DST': 'DEF',
+    'D/ST': 'DEF',
+    'FLEX': 'W/R/T',
+    'SUPERFLEX': 'Q/W/R/T',
+    'OP': 'Q/W/R/T'
+}
+
+# Slots that never score
+NON_STARTING_SLOTS = {'BN', 'IR', 'IR+', 'NA'}
+
+# Yahoo default lineup: QB, 3 WR, 2 RB, TE, W/R/T, K, DEF
+DEFAULT_ROSTER_POSITIONS = [
+    {'position': 'QB', 'count': 1},
+    {'position': 'WR', 'count': 3},
+    {'position': 'RB', 'count': 2},
+    {'position': 'TE', 'count': 1},
+    {'position': 'W/R/T', 'count': 1},
+    {'position': 'K', 'count': 1},
+    {'position': 'DEF', 'count': 1}
+]
+
+# Players with these statuses cannot score this week
+UNAVAILABLE_STATUSES = {'O', 'IR', 'PUP-R', 'PUP-P', 'NFI-R', 'SUSP', 'NA'}
+
+# Default spread when only a point projection is known (std = mean * DEFAULT_CV)
+DEFAULT_CV = 0.4
+
+# Risk weights (points per point^2 of variance) tried when maximizing win probability;
+# each gives the lineup on the mean/variance frontier for that trade-off
+RISK_LAMBDAS = [-0.1, -0.05, -0.02, -0.01, -0.005, 0.0, 0.005, 0.01, 0.02, 0.05, 0.1]
+
+# Assignment costs for slots that cannot be filled by a player
+INELIGIBLE_COST = 1e9
+EMPTY_SLOT_COST = 1e6
+
+
+def normalize_slot(slot: str) -> str:
+    """Normalize a roster slot name (e.g. 'D' -> 'DEF', 'FLEX' -> 'W/R/T')"""
+    slot = str(slot).strip().upper()
+    return SLOT_ALIASES.get(slot, slot)
+
+
+def parse_roster_positions(roster_positions: Optional[List[Dict[str, Any]]]) -> List[str]:
+    """
+    Expand league roster positions into a list of starting slots.
+
+    Accepts Yahoo JSON entries ({'roster_position': {'position': 'WR', 'count': 3}})
+    or flat entries ({'position': 'WR', 'count': 3}). Bench and IR slots are dropped.
+    """
+    slots = []
+    for entry in roster_positions or DEFAULT_ROSTER_POSITIONS:
+        if not isinstance(entry, dict):
+            continue
+        entry = entry.get('roster_position', entry)
+        position = entry.get('position')
+        if not position:
+            continue
+        slot = normalize_slot(position)
+        if slot in NON_STARTING_SLOTS:
+            continue
+        if slot not in SLOT_ELIGIBILITY:
+            logger.warning(f"Unknown roster slot {position}, skipping")
+            continue
+        try:
+            count = int(entry.get('count', 1))
+        except (TypeError, ValueError):
+            count = 1
+        slots.extend([slot] * count)
+    return slots
+
+
+def player_positions(player: Dict[str, Any]) -> set:
+    """Get the set of positions a player is eligible for"""
+    positions = player.get('eligible_positions') or player.get('position') or []
+    if isinstance(positions, str):
+        positions = positions.split(',')
+    return {normalize_slot(p) for p in positions if p}
+
+
+def default_distribution(player: Dict[str, Any]) -> Tuple[float, float]:
+    """
+    Get a player's projected points distribution as (mean, std).
+
+    Uses 'projected_points'/'projection_std' when present, otherwise the mean and
+    standard deviation of 'game_points' (weekly fantasy points from game logs).
+    """
+    games = player.get('game_points')
+    projected = player.get('projected_points')
+
+    if projected is None and games:
+        values = np.asarray(games, dtype=float)
+        std = float(values.std(ddof=1)) if len(values) > 1 else float(values.mean()) * DEFAULT_CV
+        return float(values.mean()), std
+
+    try:
+        mean = float(projected or 0)
+    except (TypeError, ValueError):
+        mean = 0.0
+
+    std = player.get('projection_std')
+    if std is None and games and len(games) > 1:
+        std = float(np.std(np.asarray(games, dtype=float), ddof=1))
+    try:
+        std = float(std) if std is not None else abs(mean) * DEFAULT_CV
+    except (TypeError, ValueError):
+        std = abs(mean) * DEFAULT_CV
+    return mean, std
+
+
+def win_probability(mean: float, var: float, opponent_mean: float, opponent_var: float) -> float:
+    """Probability that a normal team total beats the opponent's normal team total"""
+    spread = math.sqrt(max(var + opponent_var, 1e-9))
+    return 0.5 * (1.0 + math.erf((mean - opponent_mean) / (spread * math.sqrt(2.0))))
+
+
+def solve_assignment(cost: np.ndarray) -> np.ndarray:
+    """
+    Minimum-cost assignment of every row to a distinct column (Hungarian algorithm).
+
+    Args:
+        cost: Array of shape (rows, columns) with rows <= columns
+
+    Returns:
+        Array with the assigned column for each row
+    """
+    rows, cols = cost.shape
+    u = np.zeros(rows + 1)
+    v = np.zeros(cols + 1)
+    owner = np.zeros(cols + 1, dtype=int)   # owner[j] = row (1-based) assigned to column j
+    way = np.zeros(cols + 1, dtype=int)
+
+    for i in range(1, rows + 1):
+        owner[0] = i
+        j0 = 0
+        minv = np.full(cols + 1, np.inf)
+        used = np.zeros(cols + 1, dtype=bool)
+
+        while True:
+            used[j0] = True
+            i0 = owner[j0]
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            free = ~used[1:]
+
+            improve = free & (reduced < minv[1:])
+            minv[1:][improve] = reduced[improve]
+            way[1:][improve] = j0
+
+            candidates = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+
+            u[owner[used]] += delta
+            v[used] -= delta
+            minv[~used] -= delta
+
+            j0 = j1
+            if owner[j0] == 0:
+                break
+
+        while j0:
+            j1 = way[j0]
+            owner[j0] = owner[j1]
+            j0 = j1
+
+    assignment = np.full(rows, -1, dtype=int)
+    for j in range(1, cols + 1):
+        if owner[j]:
+            assignment[owner[j] - 1] = j - 1
+    return assignment
+
+
+class LineupOptimizer:
+    """
+    Picks the optimal starting lineup for a roster.
+
+    Filling slots from a roster is an assignment problem (its integer program is
+    totally unimodular), so the Hungarian algorithm gives the exact optimum for any
+    slot mix, including overlapping W/R, W/T and SUPERFLEX slots.
+
+    Objectives:
+    - 'expected_points': maximize the sum of projected means
+    - 'win_probability': maximize P(team total > opponent total) under a normal
+      approximation; candidate lineups are the mean/variance frontier found by
+      re-solving with mean + lambda * variance for each lambda in RISK_LAMBDAS
+    """
+
+    def __init__(self, roster_positions: Optional[List[Dict[str, Any]]] = None,
+                 distribution_func: Optional[Callable[[Dict[str, Any]], Tuple[float, float]]] = None):
+        """
+        Args:
+            roster_positions: League roster positions (default: Yahoo standard lineup)
+            distribution_func: Returns (mean, std) projected points for a player
+        """
+        self.slots = parse_roster_positions(roster_positions)
+        self.distribution_func = distribution_func or default_distribution
+
+    def _prepare(self, players: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], np.ndarray, np.ndarray, np.ndarray]:
+        """Filter unavailable players and build means, variances and the slot eligibility matrix"""
+        available = [p for p in players if str(p.get('status') or '').upper() not in UNAVAILABLE_STATUSES]
+        distributions = [self.distribution_func(p) for p in available]
+        means = np.array([d[0] for d in distributions], dtype=float)
+        variances = np.array([d[1] ** 2 for d in distributions], dtype=float)
+
+        positions = [player_positions(p) for p in available]
+        eligible = np.array([[bool(SLOT_ELIGIBILITY[slot] & pos) for pos in positions] for slot in self.slots],
+                            dtype=bool).reshape(len(self.slots), len(available))
+        return available, means, variances, eligible
+
+    def _solve(self, values: np.ndarray, eligible: np.ndarray) -> np.ndarray:
+        """Assign players to slots maximizing the summed values; -1 marks an empty slot"""
+        num_slots, num_players = eligible.shape
+        cost = np.where(eligible, -values[np.newaxis, :], INELIGIBLE_COST)
+        # One "empty" column per slot so a slot without an eligible player stays open
+        cost = np.hstack([cost, np.full((num_slots, num_slots), EMPTY_SLOT_COST)])
+        assignment = solve_assignment(cost)
+        return np.where(assignment < num_players, assignment, -1)
+
+    def optimize(self, players: List[Dict[str, Any]], objective: str = 'expected_points',
+                 opponent: Any = None) -> Dict[str, Any]:
+        """
+        Choose starters for one roster.
+
+        Args:
+            players: Roster player dicts ('name', 'position' or 'eligible_positions',
+                     'status', projection fields read by distribution_func)
+            objective: 'expected_points' or 'win_probability'
+            opponent: Opponent roster (list of players, lineup picked by expected points)
+                      or {'mean': ..., 'std': ...}; required for 'win_probability'
+
+        Returns:
+            Dict with 'starters' (slot, player, mean, std), 'bench', 'expected_points',
+            'std' and, when an opponent is given, 'win_probability'
+        """
+        available, means, variances, eligible = self._prepare(players)
+
+        opponent_mean = opponent_var = None
+        if opponent is not None:
+            opponent_mean, opponent_var = self._opponent_distribution(opponent)
+
+        if objective == 'win_probability' and opponent_mean is not None:
+            best, best_prob = None, -1.0
+            seen = set()
+            for lam in RISK_LAMBDAS:
+                assignment = self._solve(means + lam * variances, eligible)
+                key = tuple(assignment)
+                if key in seen:
+                    continue
+                seen.add(key)
+                chosen = assignment[assignment >= 0]
+                prob = win_probability(means[chosen].sum(), variances[chosen].sum(), opponent_mean, opponent_var)
+                if prob > best_prob + 1e-12:
+                    best, best_prob = assignment, prob
+            assignment = best
+        else:
+            if objective not in ('expected_points', 'win_probability'):
+                logger.warning(f"Unknown lineup objective {objective}, using expected_points")
+            assignment = self._solve(means, eligible)
+
+        return self._build_result(available, players, means, variances, assignment, objective,
+                                  opponent_mean, opponent_var)
+
+    def _opponent_distribution(self, opponent: Any) -> Tuple[float, float]:
+        """Get the opponent's team total (mean, variance)"""
+        if isinstance(opponent, dict) and 'mean' in opponent:
+            return float(opponent['mean']), float(opponent.get('std', 0)) ** 2
+        if isinstance(opponent, dict):
+            opponent = opponent.get('roster', [])
+        lineup = self.optimize(opponent or [])
+        return lineup['expected_points'], lineup['std'] ** 2
+
+    def _build_result(self, available: List[Dict[str, Any]], players: List[Dict[str, Any]],
+                      means: np.ndarray, variances: np.ndarray, assignment: np.ndarray, objective: str,
+                      opponent_mean: Optional[float], opponent_var: Optional[float]) -> Dict[str, Any]:
+        """Convert a slot assignment into the lineup result dict"""
+        starters = []
+        started = set()
+        for slot, index in zip(self.slots, assignment):
+            if index < 0:
+                starters.append({'slot': slot, 'player': None, 'mean': 0.0, 'std': 0.0})
+                continue
+            started.add(int(index))
+            starters.append({
+                'slot': slot,
+                'player': available[index],
+                'mean': round(float(means[index]), 2),
+                'std': round(float(math.sqrt(variances[index])), 2)
+            })
+
+        chosen = assignment[assignment >= 0]
+        total_mean = float(means[chosen].sum())
+        total_var = float(variances[chosen].sum())
+
+        available_ids = {id(p) for p in available}
+        bench = [p for i, p in enumerate(available) if i not in started]
+        bench.extend(p for p in players if id(p) not in available_ids)
+
+        result = {
+            'objective': objective,
+            'starters': starters,
+            'bench': bench,
+            'expected_points': round(total_mean, 2),
+            'std': round(math.sqrt(total_var), 2),
+            'empty_slots': [s['slot'] for s in starters if s['player'] is None]
+        }
+        if opponent_mean is not None:
+            result['opponent_expected_points'] = round(opponent_mean, 2)
+            result['win_probability'] = round(win_probability(total_mean, total_var, opponent_mean, opponent_var), 4)
+        return result
+
+    def optimize_league(self, teams: Dict[str, List[Dict[str, Any]]],
+                        matchups: Optional[List[Tuple[str, str]]] = None,
+                        objective: str = 'expected_points') -> Dict[str, Dict[str, Any]]:
+        """
+        Optimize every team in a league.
+
+        Args:
+            teams: team_key -> roster players
+            matchups: (team_key, team_key) pairs for the week (needed for 'win_probability')
+            objective: 'expected_points' or 'win_probability'
+
+        Returns:
+            team_key -> lineup result
+        """
+        results = {team_key: self.optimize(players) for team_key, players in teams.items()}
+        if objective != 'win_probability' or not matchups:
+            return results
+
+        # Each team plays against its opponent's best expected lineup
+        baseline = {team_key: {'mean': r['expected_points'], 'std': r['std']} for team_key, r in results.items()}
+        for team_a, team_b in matchups:
+            for team, opponent in ((team_a, team_b), (team_b, team_a)):
+                if team in teams and opponent in baseline:
+                    results[team] = self.optimize(teams[team], 'win_probability', baseline[opponent])
+        return results
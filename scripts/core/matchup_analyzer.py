@@ -4,24 +4,66 @@ Matchup Analysis Script
 Analyzes weekly matchups and provides lineup optimization recommendations
 """
 
+import sys
 import json
 import logging
+from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import pandas as pd
 
+# Add data collection shared utilities to path (Yahoo league settings output)
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root / "data_collection" / "scripts" / "shared"))
+
 # Import local utilities and Yahoo API
 from utils import (
     save_markdown_report, 
     get_current_week, 
     create_historical_file,
-    load_historical_file
+    load_historical_file,
+    load_config
 )
 from yahoo_connect import YahooFantasyAPI
+from lineup_optimizer import LineupOptimizer, default_distribution
+from matchup_simulator import MatchupSimulator
+from file_utils import DataFileManager
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+
+def load_roster_positions(file_manager: Optional[DataFileManager] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    League roster positions for the lineup optimizer.
+
+    Read from the latest Yahoo league settings output
+    (data_collection/scripts/yahoo/league_settings.py), else from
+    config/league_settings.json: {"roster_positions": [{"position": "WR", "count": 3}, ...]}.
+
+    Returns:
+        Roster position entries, or None (the optimizer's default Yahoo lineup) if neither has them
+    """
+    file_manager = file_manager or DataFileManager()
+    settings_file = file_manager.get_latest_file("yahoo", "league_settings", "raw_data")
+    if settings_file:
+        try:
+            roster_positions = file_manager.load_raw_data(settings_file).get('roster_positions')
+        except (OSError, ValueError, RuntimeError) as e:
+            logger.warning(f"Could not load league settings {settings_file}: {e}")
+            roster_positions = None
+        if roster_positions:
+            logger.info(f"Roster positions from Yahoo league settings: {settings_file}")
+            return roster_positions
+
+    roster_positions = load_config('league_settings').get('roster_positions')
+    if roster_positions:
+        return roster_positions
+
+    logger.warning("No league roster positions found (run data_collection/scripts/yahoo/league_settings.py); "
+                   "optimizing for the default lineup QB, 3 WR, 2 RB, TE, W/R/T, K, DEF")
+    return None
+
 class MatchupAnalyzer:
     """Analyzes weekly matchups and provides lineup optimization"""
     
@@ -39,6 +81,15 @@ class MatchupAnalyzer:
             'DEF': 0.8    # Defense moderately important
         }
         
+        # Exact lineup optimizer for the league's roster slots (FLEX/SUPERFLEX aware)
+        self.lineup_optimizer = LineupOptimizer(
+            load_roster_positions(),
+            distribution_func=self._player_distribution
+        )
+        
+        # Monte Carlo win probability for the chosen lineups
+        self.simulator = MatchupSimulator()
+        
         # Matchup difficulty indicators
         self.difficulty_levels = {
             'EASY': '🟢 Easy matchup - favorable for your players',
@@ -229,20 +280,28 @@ class MatchupAnalyzer:
             # Analyze opponent to understand matchup
             opponent_analysis = self.analyze_opponent_strength(opponent_data)
             
+            # Solve the starting lineup exactly for win probability against this opponent
+            lineup = self.lineup_optimizer.optimize(
+                roster_data,
+                objective='win_probability',
+                opponent=opponent_data.get('roster', [])
+            )
+            optimization['lineup'] = lineup
+            
+            # Simulate the matchup against the opponent's best lineup
+            opponent_lineup = self.lineup_optimizer.optimize(opponent_data.get('roster', []))
+            optimization['simulation'] = self.simulate_matchup(lineup, opponent_lineup)
+            
             # Group roster by position
-            roster_by_position = {}
-            for player in roster_data:
-                position = player.get('position', 'Unknown')
-                if position not in roster_by_position:
-                    roster_by_position[position] = []
-                roster_by_position[position].append(player)
+            roster_by_position = self._group_by_position(roster_data)
             
-            # Analyze each position for optimization
+            # Summarize each position from the optimal lineup
             for position, players in roster_by_position.items():
                 position_strategy = self._optimize_position(
                     position, 
                     players, 
-                    opponent_analysis
+                    opponent_analysis,
+                    lineup
                 )
                 optimization['position_strategies'][position] = position_strategy
                 
@@ -281,8 +340,63 @@ class MatchupAnalyzer:
             logger.error(f"Lineup optimization failed: {e}")
             return {}
     
-    def _optimize_position(self, position: str, players: List[Dict], opponent_analysis: Dict) -> Dict[str, Any]:
-        """Optimize lineup for a specific position"""
+    def _player_distribution(self, player: Dict[str, Any]) -> tuple:
+        """Projected points (mean, std) for a player, using ownership as a proxy when no projection exists"""
+        if any(key in player for key in ('projected_points', 'game_points')):
+            return default_distribution(player)
+        
+        # No projection data: scale ownership to points (100% owned ~ 20 points)
+        try:
+            mean = float(player.get('percent_owned', 50)) * 0.2
+        except (TypeError, ValueError):
+            mean = 10.0
+        return mean, mean * 0.4
+    
+    def _lineup_players(self, lineup: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Starting players of an optimizer lineup, with the optimizer's mean/std attached"""
+        players = []
+        for starter in lineup.get('starters', []):
+            if starter['player'] is None:
+                continue
+            player = dict(starter['player'])
+            player.setdefault('projected_points', starter['mean'])
+            player.setdefault('projection_std', starter['std'])
+            players.append(player)
+        return players
+    
+    def simulate_matchup(self, lineup: Dict[str, Any], opponent_lineup: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the Monte Carlo simulation for two optimizer lineups"""
+        try:
+            simulation = self.simulator.simulate(
+                self._lineup_players(lineup),
+                self._lineup_players(opponent_lineup)
+            )
+            logger.info(f"Matchup simulation: {simulation['win_probability'] * 100:.1f}% win probability, "
+                        f"expected margin {simulation['expected_margin']:+.1f}")
+            return simulation
+        except Exception as e:
+            logger.error(f"Matchup simulation failed: {e}")
+            return {}
+    
+    def simulate_league_matchups(self, teams: Dict[str, List[Dict[str, Any]]], matchups: List[tuple]) -> Dict[str, Dict[str, Any]]:
+        """
+        Optimize every team's lineup and simulate every matchup of the week.
+        
+        Args:
+            teams: team_key -> roster players
+            matchups: (team_key, team_key) pairs
+            
+        Returns:
+            'team_a vs team_b' -> simulation result
+        """
+        lineups = self.lineup_optimizer.optimize_league(teams, matchups, objective='win_probability')
+        return self.simulator.simulate_league(
+            matchups,
+            {team_key: self._lineup_players(lineup) for team_key, lineup in lineups.items()}
+        )
+    
+    def _optimize_position(self, position: str, players: List[Dict], opponent_analysis: Dict, lineup: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize the optimal lineup for a specific position"""
         try:
             strategy = {
                 'position': position,
@@ -292,30 +406,32 @@ class MatchupAnalyzer:
                 'reasoning': []
             }
             
-            # Sort players by estimated value (ownership as proxy)
-            sorted_players = sorted(
-                players, 
-                key=lambda x: float(x.get('percent_owned', 50)), 
+            # Starters at this position, in lineup slot order
+            starters = [s for s in lineup.get('starters', [])
+                        if s['player'] is not None and s['player'].get('position', 'Unknown') == position]
+            started_ids = {id(s['player']) for s in starters}
+            
+            for i, starter in enumerate(starters):
+                slot = starter['slot']
+                strategy['recommended_starters'].append({
+                    'player': starter['player'],
+                    'slot': slot,
+                    'reason': f"Starts at {slot} ({starter['mean']:.1f} projected)",
+                    'confidence': 'HIGH' if slot == position else 'MEDIUM'
+                })
+            
+            # Remaining players, best projection first
+            bench = sorted(
+                [p for p in players if id(p) not in started_ids],
+                key=lambda x: self._player_distribution(x)[0],
                 reverse=True
             )
-            
-            # Determine how many to start based on position
-            start_count = self._get_position_start_count(position)
-            
-            # Select starters
-            for i, player in enumerate(sorted_players):
-                if i < start_count:
-                    strategy['recommended_starters'].append({
-                        'player': player,
-                        'reason': f"Top {position} option #{i+1}",
-                        'confidence': 'HIGH' if i == 0 else 'MEDIUM'
-                    })
-                else:
-                    strategy['bench_recommendations'].append({
-                        'player': player,
-                        'reason': f"Bench {position} option #{i-start_count+1}",
-                        'priority': 'HIGH' if i == start_count else 'MEDIUM'
-                    })
+            for i, player in enumerate(bench):
+                strategy['bench_recommendations'].append({
+                    'player': player,
+                    'reason': f"Bench {position} option #{i+1}",
+                    'priority': 'HIGH' if i == 0 else 'MEDIUM'
+                })
             
             # Adjust strategy based on opponent
             if opponent_analysis.get('overall_strength') in ['VERY_STRONG', 'STRONG']:
@@ -331,23 +447,6 @@ class MatchupAnalyzer:
             logger.error(f"Position optimization failed for {position}: {e}")
             return {}
     
-    def _get_position_start_count(self, position: str) -> int:
-        """Get recommended number of starters for a position"""
-        if position == 'QB':
-            return 1
-        elif position == 'RB':
-            return 2  # Assuming 2 RB slots
-        elif position == 'WR':
-            return 3  # Assuming 3 WR slots
-        elif position == 'TE':
-            return 1
-        elif position == 'K':
-            return 1
-        elif position == 'DEF':
-            return 1
-        else:
-            return 1
-    
     def _identify_matchup_advantages(self, roster: List[Dict], opponent_analysis: Dict) -> List[Dict[str, Any]]:
         """Identify specific matchup advantages"""
         advantages = []
@@ -574,6 +673,26 @@ class MatchupAnalyzer:
         report += "\n### 💡 Overall Strategy\n"
         report += f"{optimization.get('overall_strategy', 'No strategy determined')}\n"
         
+        lineup = optimization.get('lineup', {})
+        if lineup:
+            report += f"\n- **Projected Points:** {lineup.get('expected_points', 0):.1f} ± {lineup.get('std', 0):.1f}\n"
+            if 'win_probability' in lineup:
+                report += f"- **Opponent Projected:** {lineup.get('opponent_expected_points', 0):.1f}\n"
+                report += f"- **Win Probability:** {lineup['win_probability'] * 100:.1f}%\n"
+            if lineup.get('empty_slots'):
+                report += f"- **Unfilled Slots:** {', '.join(lineup['empty_slots'])}\n"
+        
+        simulation = optimization.get('simulation', {})
+        if simulation.get('simulations'):
+            report += f"\n### 🎲 Simulated Matchup ({simulation['simulations']:,} simulations)\n"
+            report += f"- **Win Probability:** {simulation['win_probability'] * 100:.1f}%\n"
+            report += f"- **Expected Margin:** {simulation['expected_margin']:+.1f} (± {simulation['margin_std']:.1f})\n"
+            report += f"- **Projection:** {simulation['team_projection']:.1f} vs {simulation['opponent_projection']:.1f}\n"
+            report += "- **Highest Leverage Players:**\n"
+            for entry in simulation.get('player_leverage', [])[:5]:
+                side = "Yours" if entry['side'] == 'team' else "Opponent"
+                report += f"  - {entry['name']} ({entry['position']}, {side}): {entry['leverage'] * 100:+.1f}% win probability swing\n"
+        
         report += "\n---\n## 🎯 Matchup Advantages\n"
         
         if advantages:
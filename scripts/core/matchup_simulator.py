@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Matchup Simulator
+Vectorized Monte Carlo win probability for a head-to-head fantasy matchup
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+from lineup_optimizer import default_distribution, normalize_slot
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIMULATIONS = 100000
+
+# Minimum game log length before the empirical distribution is used instead of a normal
+MIN_GAMES_FOR_EMPIRICAL = 4
+
+# Outcome correlation between two players on the same NFL team (stacks)
+SAME_TEAM_CORRELATION = {
+    frozenset(['QB', 'WR']): 0.35,
+    frozenset(['QB', 'TE']): 0.25,
+    frozenset(['QB', 'RB']): 0.10,
+    frozenset(['QB', 'K']): 0.15,
+    frozenset(['WR', 'TE']): 0.05,
+    frozenset(['RB', 'K']): 0.10,
+    frozenset(['WR', 'K']): 0.10,
+    frozenset(['TE', 'K']): 0.05,
+    frozenset(['RB']): -0.05,
+    frozenset(['WR']): -0.05,
+    frozenset(['RB', 'DEF']): 0.10,
+}
+
+# Correlation between a defense and the offensive players it faces
+DEF_VS_OFFENSE_CORRELATION = {
+    'QB': -0.35,
+    'RB': -0.15,
+    'WR': -0.20,
+    'TE': -0.15,
+    'K': -0.15
+}
+
+# Abramowitz-Stegun 7.1.26 coefficients for a vectorized erf (max error 1.5e-7)
+_ERF_P = 0.3275911
+_ERF_A = (0.254829592, -0.284496736, 1.421413741, -1.453152027, 1.061405429)
+
+
+def _normal_cdf(z: np.ndarray) -> np.ndarray:
+    """Standard normal CDF, vectorized without scipy"""
+    x = np.abs(z) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + _ERF_P * x)
+    a1, a2, a3, a4, a5 = _ERF_A
+    erf = 1.0 - (((((a5 * t + a4) * t) + a3) * t + a2) * t + a1) * t * np.exp(-x * x)
+    return 0.5 * (1.0 + np.sign(z) * erf)
+
+
+def _primary_position(player: Dict[str, Any]) -> str:
+    """First listed position of a player ('WR,RB' -> 'WR')"""
+    position = player.get('position') or ''
+    if isinstance(position, (list, tuple)):
+        position = position[0] if position else ''
+    return normalize_slot(str(position).split(',')[0]) if position else ''
+
+
+def _nfl_team(player: Dict[str, Any]) -> str:
+    return str(player.get('team') or player.get('editorial_team_abbr') or '').upper()
+
+
+def _nfl_opponent(player: Dict[str, Any]) -> str:
+    return str(player.get('opponent') or '').upper()
+
+
+class MatchupSimulator:
+    """
+    Simulates correlated player outcomes for two lineups.
+
+    Player outcomes are drawn with a Gaussian copula: correlated standard normals
+    (same-team stacks, defenses against the offenses they face) are mapped through
+    each player's marginal distribution - the empirical game-log distribution when
+    enough games exist, otherwise a normal from the projection.
+    """
+
+    def __init__(self, simulations: int = DEFAULT_SIMULATIONS, seed: Optional[int] = None):
+        """
+        Args:
+            simulations: Number of simulated weeks per matchup
+            seed: Random seed (for reproducible results)
+        """
+        self.simulations = simulations
+        self.rng = np.random.default_rng(seed)
+
+    def _pair_correlation(self, a: Dict[str, Any], b: Dict[str, Any]) -> float:
+        """Outcome correlation between two players"""
+        pos_a, pos_b = _primary_position(a), _primary_position(b)
+        team_a, team_b = _nfl_team(a), _nfl_team(b)
+
+        if team_a and team_a == team_b:
+            return SAME_TEAM_CORRELATION.get(frozenset([pos_a, pos_b]), 0.0)
+
+        # Defense against the offense it faces this week
+        for defense, offense, pos_off in ((a, b, pos_b), (b, a, pos_a)):
+            if _primary_position(defense) != 'DEF' or pos_off == 'DEF':
+                continue
+            if (_nfl_opponent(defense) and _nfl_opponent(defense) == _nfl_team(offense)) or \
+               (_nfl_opponent(offense) and _nfl_opponent(offense) == _nfl_team(defense)):
+                return DEF_VS_OFFENSE_CORRELATION.get(pos_off, 0.0)
+        return 0.0
+
+    def build_correlation(self, players: List[Dict[str, Any]]) -> np.ndarray:
+        """Correlation matrix for a combined player list, repaired to be positive definite"""
+        size = len(players)
+        corr = np.eye(size)
+        for i in range(size):
+            for j in range(i + 1, size):
+                corr[i, j] = corr[j, i] = self._pair_correlation(players[i], players[j])
+
+        # Clip negative eigenvalues if the pairwise rules are jointly inconsistent
+        eigenvalues, eigenvectors = np.linalg.eigh(corr)
+        if eigenvalues.min() < 1e-6:
+            eigenvalues = np.clip(eigenvalues, 1e-6, None)
+            corr = eigenvectors @ np.diag(eigenvalues) @ eigenvectors.T
+            scale = np.sqrt(np.diag(corr))
+            corr = corr / np.outer(scale, scale)
+        return corr
+
+    def _sample_marginals(self, players: List[Dict[str, Any]], normals: np.ndarray) -> np.ndarray:
+        """Map correlated standard normals to fantasy points per player"""
+        points = np.empty_like(normals)
+        for j, player in enumerate(players):
+            games = player.get('game_points') or []
+            if len(games) >= MIN_GAMES_FOR_EMPIRICAL:
+                ordered = np.sort(np.asarray(games, dtype=float))
+                uniforms = _normal_cdf(normals[:, j])
+                points[:, j] = np.interp(uniforms * (len(ordered) - 1), np.arange(len(ordered)), ordered)
+                if player.get('projected_points') is not None:
+                    # Keep the game-log shape, centred on the projection
+                    points[:, j] += float(player['projected_points']) - ordered.mean()
+            else:
+                mean, std = default_distribution(player)
+                points[:, j] = mean + std * normals[:, j]
+        return points
+
+    def simulate(self, lineup: List[Dict[str, Any]], opponent_lineup: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Simulate one matchup.
+
+        Args:
+            lineup: Starting players ('name', 'position', 'team', optional 'opponent',
+                    'game_points' and/or 'projected_points'/'projection_std')
+            opponent_lineup: Opponent's starting players
+
+        Returns:
+            Dict with win_probability, expected_margin, margin percentiles, team
+            projections and per-player leverage
+        """
+        players = list(lineup) + list(opponent_lineup)
+        size = len(players)
+        if size == 0:
+            return {'win_probability': 0.5, 'expected_margin': 0.0, 'simulations': 0, 'player_leverage': []}
+
+        corr = self.build_correlation(players)
+        cholesky = np.linalg.cholesky(corr)
+        normals = self.rng.standard_normal((self.simulations, size)) @ cholesky.T
+        points = self._sample_marginals(players, normals)
+
+        ours = points[:, :len(lineup)].sum(axis=1)
+        theirs = points[:, len(lineup):].sum(axis=1)
+        margin = ours - theirs
+        wins = (margin > 0) + 0.5 * (margin == 0)
+
+        # Leverage: P(win | player beats their median) - P(win | player falls short)
+        above = points >= np.median(points, axis=0)
+        above_count = above.sum(axis=0)
+        below_count = self.simulations - above_count
+        win_when_above = (wins @ above) / np.maximum(above_count, 1)
+        win_when_below = (wins @ ~above) / np.maximum(below_count, 1)
+        leverage = win_when_above - win_when_below
+
+        player_leverage = []
+        for j, player in enumerate(players):
+            player_leverage.append({
+                'name': player.get('name', 'Unknown'),
+                'position': _primary_position(player),
+                'side': 'team' if j < len(lineup) else 'opponent',
+                'mean_points': round(float(points[:, j].mean()), 2),
+                'std_points': round(float(points[:, j].std()), 2),
+                'leverage': round(float(leverage[j]), 4)
+            })
+        player_leverage.sort(key=lambda p: abs(p['leverage']), reverse=True)
+
+        percentiles = np.percentile(margin, [10, 25, 50, 75, 90])
+        return {
+            'simulations': self.simulations,
+            'win_probability': round(float(wins.mean()), 4),
+            'expected_margin': round(float(margin.mean()), 2),
+            'margin_std': round(float(margin.std()), 2),
+            'margin_percentiles': {str(p): round(float(v), 2) for p, v in zip((10, 25, 50, 75, 90), percentiles)},
+            'team_projection': round(float(ours.mean()), 2),
+            'opponent_projection': round(float(theirs.mean()), 2),
+            'player_leverage': player_leverage
+        }
+
+    def simulate_league(self, matchups: List[Tuple[str, str]],
+                        lineups: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Simulate every matchup of a week.
+
+        Args:
+            matchups: (team_key, team_key) pairs
+            lineups: team_key -> starting players
+
+        Returns:
+            'team_a vs team_b' -> simulation result (from team_a's side)
+        """
+        results = {}
+        for team_a, team_b in matchups:
+            if team_a not in lineups or team_b not in lineups:
+                logger.warning(f"Missing lineup for matchup {team_a} vs {team_b}, skipping")
+                continue
+            results[f"{team_a} vs {team_b}"] = self.simulate(lineups[team_a], lineups[team_b])
+        return results
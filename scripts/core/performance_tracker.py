@@ -4,12 +4,19 @@ Performance Tracking Script
 Tracks post-game performance and analyzes projection accuracy
 """
 
+import sys
 import json
 import logging
+from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
+# Add data collection shared utilities to path (season warehouse)
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root / "data_collection" / "scripts" / "shared"))
+
 # Import local utilities and Yahoo API
 from utils import (
     save_markdown_report, 
@@ -18,6 +25,9 @@ from utils import (
     load_historical_file
 )
 from yahoo_connect import YahooFantasyAPI
+from season_warehouse import get_season_warehouse
+from season_context import get_season_context_service
+from projection_comparison import ProjectionComparisonEngine
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -28,6 +38,9 @@ class PerformanceTracker:
     def __init__(self):
         self.api = YahooFantasyAPI()
         self.current_week = get_current_week()
+        self.season = int(get_season_context_service().get_season())
+        self.warehouse = get_season_warehouse()
+        self.comparison_engine = ProjectionComparisonEngine(threshold=5.0)
         
         # Performance thresholds
         self.performance_thresholds = {
@@ -40,7 +53,13 @@ class PerformanceTracker:
         }
     
     def compare_projections_to_actual(self, projections: List[Dict], actual: List[Dict]) -> Dict[str, Any]:
-        """Compare pre-game projections to actual performance"""
+        """
+        Compare pre-game projections to actual performance.
+        
+        Projections are hash-joined to actuals on 'player_id' (Tank01 playerID)
+        with a normalized-name fallback; variance, accuracy and performance
+        ratings are computed as vectorized columns.
+        """
         try:
             comparison = {
                 'total_players': len(projections),
@@ -52,49 +71,33 @@ class PerformanceTracker:
                 'lessons_learned': []
             }
             
-            # Match projections to actual results
-            for projection in projections:
-                player_name = projection.get('name', 'Unknown')
-                projected_points = float(projection.get('projected_points', 0))
+            joined = self.comparison_engine.join(pd.DataFrame(projections), pd.DataFrame(actual))
+            if not joined.empty:
+                if 'position' not in joined:
+                    joined['position'] = 'Unknown'
+                joined['name'] = joined['name'].fillna('Unknown')
+                joined['position'] = joined['position'].fillna('Unknown')
+                joined['performance_rating'] = self._rate_performance_vectorized(joined['position'], joined['actual_points'])
                 
-                # Find matching actual result
-                actual_result = None
-                for actual_player in actual:
-                    if actual_player.get('name') == player_name:
-                        actual_result = actual_player
-                        break
+                columns = ['name', 'position', 'projected_points', 'actual_points', 'variance',
+                           'accuracy_percentage', 'performance_rating']
+                if 'status' in joined:
+                    columns.append('status')
+                records = joined[columns].rename(columns={'projected_points': 'projected', 'actual_points': 'actual'})
+                if 'status' in records:
+                    records['status'] = records['status'].astype(object).where(records['status'].notna(), None)
                 
-                if actual_result:
-                    actual_points = float(actual_result.get('actual_points', 0))
-                    variance = actual_points - projected_points
-                    accuracy_percentage = self._calculate_accuracy_percentage(projected_points, actual_points)
-                    
-                    player_comparison = {
-                        'name': player_name,
-                        'position': projection.get('position', 'Unknown'),
-                        'projected': projected_points,
-                        'actual': actual_points,
-                        'variance': variance,
-                        'accuracy_percentage': accuracy_percentage,
-                        'performance_rating': self._rate_performance(projection.get('position', 'Unknown'), actual_points)
-                    }
-                    
-                    # Categorize performance
-                    if variance > 5:  # Significantly overperformed
-                        comparison['overperformers'].append(player_comparison)
-                    elif variance < -5:  # Significantly underperformed
-                        comparison['underperformers'].append(player_comparison)
-                    else:  # Accurate projection
-                        comparison['accurate_projections'].append(player_comparison)
-                    
-                    # Track accuracy by position
-                    position = projection.get('position', 'Unknown')
-                    if position not in comparison['projection_accuracy']:
-                        comparison['projection_accuracy'][position] = []
-                    comparison['projection_accuracy'][position].append(player_comparison)
+                # Categorize performance (beyond +/-5 points is significant)
+                buckets = {'over': 'overperformers', 'under': 'underperformers', 'even': 'accurate_projections'}
+                for over_under, key in buckets.items():
+                    comparison[key] = records[joined['over_under'] == over_under].to_dict('records')
+                
+                # Track accuracy by position
+                for position, group in records.groupby('position', sort=False):
+                    comparison['projection_accuracy'][position] = group.to_dict('records')
             
             # Calculate accuracy summary
-            comparison['accuracy_summary'] = self._calculate_accuracy_summary(comparison['projection_accuracy'])
+            comparison['accuracy_summary'] = self._calculate_accuracy_summary(joined)
             
             # Generate lessons learned
             comparison['lessons_learned'] = self._generate_lessons_learned(comparison)
@@ -144,30 +147,31 @@ class PerformanceTracker:
             logger.error(f"Performance rating failed: {e}")
             return 'UNKNOWN'
     
-    def _calculate_accuracy_summary(self, position_accuracy: Dict[str, List[Dict]]) -> Dict[str, Any]:
+    def _rate_performance_vectorized(self, positions: pd.Series, points: pd.Series) -> np.ndarray:
+        """Rate many players at once with the same thresholds as _rate_performance"""
+        defaults = {'excellent': 20, 'good': 15, 'average': 10, 'poor': 5}
+        thresholds = pd.DataFrame(self.performance_thresholds).T.reindex(positions.to_numpy())
+        thresholds = thresholds.fillna(defaults)
+        points = points.to_numpy(dtype=float)
+        return np.select(
+            [points >= thresholds[level].to_numpy() for level in ('excellent', 'good', 'average', 'poor')],
+            ['🏆 EXCELLENT', '✅ GOOD', '➡️ AVERAGE', '⚠️ POOR'],
+            default='🚨 VERY POOR'
+        )
+    
+    def _calculate_accuracy_summary(self, joined: pd.DataFrame) -> Dict[str, Any]:
         """Calculate accuracy summary by position"""
         try:
-            summary = {}
+            summary = self.comparison_engine.position_summary(joined)
             
-            for position, players in position_accuracy.items():
-                if not players:
-                    continue
-                
-                total_accuracy = sum(p['accuracy_percentage'] for p in players)
-                avg_accuracy = total_accuracy / len(players)
-                
-                # Count over/under performers
-                overperformers = len([p for p in players if p['variance'] > 5])
-                underperformers = len([p for p in players if p['variance'] < -5])
-                accurate = len([p for p in players if -5 <= p['variance'] <= 5])
-                
+            for position, stats in summary.items():
                 summary[position] = {
-                    'avg_accuracy': round(avg_accuracy, 1),
-                    'total_players': len(players),
-                    'overperformers': overperformers,
-                    'underperformers': underperformers,
-                    'accurate': accurate,
-                    'accuracy_rating': self._rate_accuracy(avg_accuracy)
+                    'avg_accuracy': stats['avg_accuracy'],
+                    'total_players': stats['total_players'],
+                    'overperformers': stats['overperformers'],
+                    'underperformers': stats['underperformers'],
+                    'accurate': stats['accurate'],
+                    'accuracy_rating': self._rate_accuracy(stats['avg_accuracy'])
                 }
             
             return summary
@@ -303,14 +307,23 @@ class PerformanceTracker:
             return {}
     
     def _load_player_historical_data(self, player_id: str, weeks: int) -> List[Dict[str, Any]]:
-        """Load historical performance data for a player"""
+        """Load historical performance data for a player (Tank01 or Yahoo ID) from the season warehouse"""
         try:
-            # This would typically load from database or historical files
-            # For now, return mock data structure
+            week_range = range(max(1, self.current_week - weeks), self.current_week)
+            weekly = self.warehouse.player_weekly_points(self.season, [player_id], weeks=week_range)
+            
+            if not weekly.empty:
+                weekly = weekly.fillna({'projection': 0.0})
+                return [{
+                    'week': int(row.week),
+                    'points': float(row.points),
+                    'projection': float(row.projection),
+                    'accuracy': float(row.accuracy)
+                } for row in weekly.itertuples()]
+            
+            # Fall back to legacy per-week historical files
             historical_data = []
-            
-            # Try to load from historical files
-            for week in range(max(1, self.current_week - weeks), self.current_week):
+            for week in week_range:
                 filename = f'week_{week}_performance.json'
                 week_data = load_historical_file(filename)
                 
@@ -330,6 +343,41 @@ class PerformanceTracker:
             logger.error(f"Historical data loading failed for {player_id}: {e}")
             return []
     
+    def track_roster_trends(self, player_ids: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Trend and consistency ratings for many players in one warehouse query.
+        
+        Uses the same rules as track_player_performance (last 3 weeks vs earlier,
+        score range relative to average) evaluated as vectorized columns.
+        
+        Args:
+            player_ids: Tank01 or Yahoo player IDs (default: every player in the warehouse)
+            
+        Returns:
+            DataFrame per player with trend and consistency columns added
+        """
+        trends = self.warehouse.player_trends(self.season, player_ids, recent_weeks=3)
+        if trends.empty:
+            return trends
+        
+        has_trend = (trends['games'] >= 3) & trends['older_avg'].notna()
+        trends['performance_trend'] = np.select(
+            [has_trend & (trends['recent_avg'] > trends['older_avg'] * 1.2),
+             has_trend & (trends['recent_avg'] < trends['older_avg'] * 0.8),
+             has_trend],
+            ['📈 IMPROVING', '📉 DECLINING', '➡️ STABLE'],
+            default='UNKNOWN'
+        )
+        
+        spread = trends['points_range']
+        avg = trends['avg_points']
+        trends['consistency_rating'] = np.select(
+            [trends['games'] < 2, spread <= avg * 0.3, spread <= avg * 0.5, spread <= avg * 0.8],
+            ['UNKNOWN', '🟢 VERY CONSISTENT', '🟡 CONSISTENT', '🟠 INCONSISTENT'],
+            default='🔴 VERY INCONSISTENT'
+        )
+        return trends
+    
     def _generate_player_recommendations(self, tracking: Dict[str, Any]) -> List[str]:
         """Generate recommendations based on player performance tracking"""
         recommendations = []
@@ -440,8 +488,12 @@ class PerformanceTracker:
             return {}
     
     def _load_week_performance_data(self, week: int) -> Optional[Dict[str, Any]]:
-        """Load performance data for a specific week"""
+        """Load performance data for a specific week (season warehouse, then legacy historical file)"""
         try:
+            roster = self.warehouse.team_week_performance(self.season, week)
+            if not roster.empty:
+                return {'week': week, 'players': roster.to_dict('records')}
+            
             filename = f'week_{week}_performance.json'
             return load_historical_file(filename)
         except Exception as e:
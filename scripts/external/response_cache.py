@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+On-Disk API Response Cache
+
+This module provides a small file-backed response cache shared by every process
+that talks to the Tank01 NFL API. Bulk endpoints such as getNFLPlayerList,
+getNFLTeams, getNFLDepthCharts and getNFLProjections are requested by several
+collection scripts in the same run; caching them on disk means a full weekly
+collection downloads each of them once instead of once per script.
+
+Key Features:
+- Entries keyed by endpoint + normalized query parameters
+- Per-endpoint TTLs (live endpoints are never cached)
+- Stale-while-revalidate: expired entries inside the stale window are served
+  immediately while the caller refreshes them in the background
+- Atomic writes so concurrent collection scripts never read half-written files
+- Hit/miss counters for usage reporting
+
+Author: Fantasy Football Optimizer
+Date: October 2025
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Optional, Any, Tuple
+
+# Default cache location: <project_root>/data_collection/cache/<namespace>
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_CACHE_ROOT = PROJECT_ROOT / "data_collection" / "cache"
+
+# Time-to-live (seconds) per Tank01 endpoint. 0 disables caching for the endpoint.
+TANK01_ENDPOINT_TTLS = {
+    "getNFLPlayerList": 24 * 3600,
+    "getNFLTeams": 12 * 3600,
+    "getNFLDepthCharts": 12 * 3600,
+    "getNFLTeamRoster": 12 * 3600,
+    "getNFLProjections": 6 * 3600,
+    "getNFLPlayerInfo": 12 * 3600,
+    "getNFLGamesForPlayer": 1 * 3600,
+    "getNFLGameInfo": 1 * 3600,
+    "getNFLBoxScore": 1 * 3600,
+    "getNFLGamesForWeek": 12 * 3600,
+    "getNFLNews": 30 * 60,
+    "getNFLChangelog": 24 * 3600,
+    "getNFLScoresOnly": 0,  # Live scoreboard - always fetch
+}
+
+# Cache states returned by ResponseCache.lookup()
+CACHE_FRESH = "fresh"
+CACHE_STALE = "stale"
+CACHE_MISS = "miss"
+
+
+def is_cacheable_tank01_response(data: Any) -> bool:
+    """Only successful Tank01 payloads (statusCode 200 with a body) may be cached."""
+    if not isinstance(data, dict) or 'error' in data:
+        return False
+    return data.get('statusCode', 200) == 200 and data.get('body') is not None
+
+
+class ResponseCache:
+    """
+    File-backed cache for JSON API responses with per-endpoint TTLs.
+
+    Each entry is stored as one JSON file named after the SHA-256 of the
+    endpoint and its normalized parameters. An entry is "fresh" until its TTL
+    expires and "stale" for a further stale window, during which it can still be
+    served while a refresh happens in the background.
+    """
+
+    def __init__(self, namespace: str = "tank01", cache_dir: Optional[str] = None,
+                 endpoint_ttls: Optional[Dict[str, int]] = None,
+                 default_ttl: int = 3600, stale_factor: float = 1.0):
+        """
+        Initialize the response cache.
+
+        Args:
+            namespace: Subdirectory used to separate caches for different APIs
+            cache_dir: Root cache directory (defaults to data_collection/cache,
+                       or the API_CACHE_DIR environment variable)
+            endpoint_ttls: Mapping of endpoint name to TTL in seconds
+            default_ttl: TTL for endpoints not listed in endpoint_ttls
+            stale_factor: Stale window as a multiple of the endpoint TTL
+        """
+        self.logger = logging.getLogger(__name__)
+
+        root = Path(cache_dir or os.getenv('API_CACHE_DIR') or DEFAULT_CACHE_ROOT)
+        self.cache_dir = root / namespace
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.endpoint_ttls = dict(endpoint_ttls or {})
+        self.default_ttl = default_ttl
+        self.stale_factor = stale_factor
+
+        self._lock = threading.Lock()
+        self._revalidating = set()
+        self._revalidation_threads = []
+
+        self.stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "revalidations": 0,
+            "revalidation_errors": 0,
+            "by_endpoint": {}
+        }
+
+    @staticmethod
+    def normalize_params(params: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Normalize query parameters so equivalent requests share a cache key.
+
+        Parameter order is ignored, None values are dropped and booleans and
+        numbers are rendered the way they appear on the query string.
+        """
+        normalized = {}
+        for key, value in (params or {}).items():
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                value = str(value).lower()
+            normalized[str(key)] = str(value)
+        return dict(sorted(normalized.items()))
+
+    def make_key(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for an endpoint and its parameters."""
+        payload = json.dumps({
+            "endpoint": endpoint.strip('/'),
+            "params": self.normalize_params(params)
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get_ttl(self, endpoint: str) -> int:
+        """Get the TTL in seconds for an endpoint."""
+        return self.endpoint_ttls.get(endpoint.strip('/'), self.default_ttl)
+
+    def is_cacheable(self, endpoint: str) -> bool:
+        """Check whether responses from an endpoint should be cached at all."""
+        return self.get_ttl(endpoint) > 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _record(self, endpoint: str, counter: str) -> None:
+        with self._lock:
+            self.stats[counter] += 1
+            endpoint_stats = self.stats["by_endpoint"].setdefault(
+                endpoint.strip('/'), {"hits": 0, "stale_hits": 0, "misses": 0}
+            )
+            if counter in endpoint_stats:
+                endpoint_stats[counter] += 1
+
+    def lookup(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Optional[Any], str]:
+        """
+        Look up a cached response.
+
+        Args:
+            endpoint: API endpoint name
+            params: Query parameters
+
+        Returns:
+            Tuple of (cached data or None, cache state: fresh/stale/miss)
+        """
+        if not self.is_cacheable(endpoint):
+            return None, CACHE_MISS
+
+        entry = self._read_entry(self.make_key(endpoint, params))
+        if entry is None:
+            self._record(endpoint, "misses")
+            return None, CACHE_MISS
+
+        ttl = self.get_ttl(endpoint)
+        age = time.time() - entry.get("stored_at", 0)
+
+        if age <= ttl:
+            self._record(endpoint, "hits")
+            return entry.get("data"), CACHE_FRESH
+
+        if age <= ttl + ttl * self.stale_factor:
+            self._record(endpoint, "stale_hits")
+            return entry.get("data"), CACHE_STALE
+
+        self._record(endpoint, "misses")
+        return None, CACHE_MISS
+
+    def get_any(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """
+        Get a cached response regardless of age.
+
+        Used as a fallback when the API is unavailable or the quota is exhausted.
+        """
+        entry = self._read_entry(self.make_key(endpoint, params))
+        return entry.get("data") if entry else None
+
+    def store(self, endpoint: str, params: Optional[Dict[str, Any]], data: Any) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            endpoint: API endpoint name
+            params: Query parameters
+            data: JSON-serializable response data
+        """
+        if not self.is_cacheable(endpoint):
+            return
+
+        key = self.make_key(endpoint, params)
+        entry = {
+            "endpoint": endpoint.strip('/'),
+            "params": self.normalize_params(params),
+            "stored_at": time.time(),
+            "data": data
+        }
+
+        try:
+            # Write to a temp file and rename so readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, separators=(',', ':'), default=str)
+            os.replace(tmp_path, self._entry_path(key))
+            self._record(endpoint, "stores")
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Failed to write cache entry for {endpoint}: {e}")
+
+    def _read_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._entry_path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Ignoring unreadable cache entry {path.name}: {e}")
+            return None
+
+    def revalidate_async(self, endpoint: str, params: Optional[Dict[str, Any]], fetch_func,
+                         is_cacheable: Optional[Callable[[Any], bool]] = None) -> None:
+        """
+        Refresh a stale entry in a background thread.
+
+        Only one refresh per key runs at a time. The thread is non-daemon so a
+        short-lived collection script still finishes writing the refreshed entry
+        before the interpreter exits. A refresh that is_cacheable rejects (an
+        error payload or empty body) leaves the stale entry in place.
+
+        Args:
+            endpoint: API endpoint name
+            params: Query parameters
+            fetch_func: Callable returning fresh response data
+            is_cacheable: Optional check a fresh response must pass to be stored
+        """
+        key = self.make_key(endpoint, params)
+        with self._lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def _worker():
+            try:
+                data = fetch_func()
+                if is_cacheable is not None and not is_cacheable(data):
+                    self.logger.warning(f"Background revalidation for {endpoint} returned an error, "
+                                        f"keeping the cached entry")
+                    self._record(endpoint, "revalidation_errors")
+                    return
+                self.store(endpoint, params, data)
+                self._record(endpoint, "revalidations")
+            except Exception as e:
+                self.logger.warning(f"Background revalidation failed for {endpoint}: {e}")
+                self._record(endpoint, "revalidation_errors")
+            finally:
+                with self._lock:
+                    self._revalidating.discard(key)
+
+        thread = threading.Thread(target=_worker, name=f"cache-revalidate-{endpoint}")
+        thread.start()
+        self._revalidation_threads.append(thread)
+
+    def wait_for_revalidations(self, timeout: Optional[float] = None) -> None:
+        """Block until all background revalidations have finished."""
+        for thread in list(self._revalidation_threads):
+            thread.join(timeout)
+        self._revalidation_threads = [t for t in self._revalidation_threads if t.is_alive()]
+
+    def invalidate(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Remove a single cache entry.
+
+        Returns:
+            True if an entry was removed
+        """
+        path = self._entry_path(self.make_key(endpoint, params))
+        try:
+            path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def clear(self) -> int:
+        """
+        Remove every entry in this cache namespace.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache hit/miss counters for this session.
+
+        Returns:
+            Dict with counters, hit rate and cache location
+        """
+        with self._lock:
+            stats = json.loads(json.dumps(self.stats))
+
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["lookups"] = lookups
+        stats["hit_rate"] = ((stats["hits"] + stats["stale_hits"]) / lookups * 100) if lookups else 0.0
+        stats["cache_dir"] = str(self.cache_dir)
+        return stats
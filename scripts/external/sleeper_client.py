@@ -25,11 +25,22 @@ from pathlib import Path
 import json
 from datetime import datetime
 
+try:
+    from .sleeper_player_db import SleeperPlayerDB
+except ImportError:
+    from sleeper_player_db import SleeperPlayerDB
+
 class SleeperClient:
     """Client for interacting with the Sleeper NFL API."""
     
-    def __init__(self):
-        """Initialize the Sleeper API client."""
+    def __init__(self, use_player_db: bool = True, player_db_path: Optional[str] = None):
+        """
+        Initialize the Sleeper API client.
+        
+        Args:
+            use_player_db: Keep the players/nfl payload in the shared local SQLite database
+            player_db_path: Optional SQLite path (default: data_collection/cache/sleeper_players.db)
+        """
         self.base_url = "https://api.sleeper.app/v1"
         self.session = requests.Session()
         self.session.headers.update({
@@ -53,6 +64,30 @@ class SleeperClient:
                     logging.StreamHandler()
                 ]
             )
+        
+        # Persistent, indexed player database shared by all collection scripts
+        self.player_db = None
+        if use_player_db:
+            try:
+                self.player_db = SleeperPlayerDB(player_db_path)
+            except Exception as e:
+                self.logger.warning(f"Sleeper player database unavailable, using direct API calls: {e}")
+    
+    def _ensure_player_db(self, force_refresh: bool = False) -> bool:
+        """
+        Make sure the local player database exists and is at most a day old.
+        
+        Returns:
+            True if indexed lookups can be used
+        """
+        if not self.player_db:
+            return False
+        try:
+            self.player_db.ensure_fresh(self.session, f"{self.base_url}/players/nfl", force_refresh)
+            return self.player_db.player_count() > 0
+        except Exception as e:
+            self.logger.error(f"Failed to refresh Sleeper player database: {e}")
+            return False
     
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -93,10 +128,16 @@ class SleeperClient:
             self.logger.error(f"Failed to decode JSON response: {e}")
             raise
     
-    def get_nfl_players(self) -> Dict[str, Dict[str, Any]]:
+    def get_nfl_players(self, force_refresh: bool = False) -> Dict[str, Dict[str, Any]]:
         """
         Get all NFL players data from Sleeper.
         
+        Served from the local player database, which is refreshed at most
+        once a day (conditionally) instead of downloaded by every process.
+        
+        Args:
+            force_refresh: Refresh the local database even if it is fresh
+        
         Returns:
             Dict mapping player_id to player data
             
@@ -120,6 +161,11 @@ class SleeperClient:
             }
         }
         """
+        if self._ensure_player_db(force_refresh):
+            players_data = self.player_db.get_all_players()
+            self.logger.info(f"Loaded {len(players_data)} NFL players from local player database")
+            return players_data
+        
         try:
             self.logger.info("Fetching all NFL players from Sleeper API")
             players_data = self._make_request("players/nfl")
@@ -227,6 +273,9 @@ class SleeperClient:
             Player data dict or None if not found
         """
         try:
+            if self._ensure_player_db():
+                return self.player_db.get_player(player_id)
+            
             all_players = self.get_nfl_players()
             return all_players.get(player_id)
             
@@ -238,6 +287,9 @@ class SleeperClient:
         """
         Search for players by name.
         
+        Uses the local player database's name indexes (first, last or full
+        name prefix) when available.
+        
         Args:
             name: Player name (first, last, or full name)
             position: Optional position filter (QB, RB, WR, TE, K, DEF)
@@ -246,6 +298,11 @@ class SleeperClient:
             List of matching players
         """
         try:
+            if self._ensure_player_db():
+                matches = self.player_db.search_by_name(name, position)
+                self.logger.info(f"Found {len(matches)} players matching '{name}'")
+                return matches
+            
             all_players = self.get_nfl_players()
             matches = []
             
@@ -285,6 +342,11 @@ class SleeperClient:
             List of players on the team
         """
         try:
+            if self._ensure_player_db():
+                team_players = self.player_db.get_by_team(team)
+                self.logger.info(f"Found {len(team_players)} players for team {team}")
+                return team_players
+            
             all_players = self.get_nfl_players()
             team_players = []
             
@@ -312,6 +374,11 @@ class SleeperClient:
             List of players at the position
         """
         try:
+            if self._ensure_player_db():
+                position_players = self.player_db.get_by_position(position)
+                self.logger.info(f"Found {len(position_players)} players at position {position}")
+                return position_players
+            
             all_players = self.get_nfl_players()
             position_players = []
             
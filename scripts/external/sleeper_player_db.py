@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Persistent Sleeper Player Database
+
+Stores the Sleeper players/nfl payload (~5 MB, 11,000+ players) in a local
+SQLite database so separate collection processes share one download.
+
+Features:
+- Refreshed at most once per max_age_hours (default 24)
+- Conditional refresh: ETag / Last-Modified headers, plus a content hash so an
+  unchanged payload only updates the fetch timestamp
+- Indexes on normalized full/first/last name, team, position and yahoo_id
+- Indexed name/team/position lookups instead of walking the full dict
+
+Author: Fantasy Football Optimizer
+Date: October 2025
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+# Default database location: <project_root>/data_collection/cache/sleeper_players.db
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_DB_PATH = PROJECT_ROOT / "data_collection" / "cache" / "sleeper_players.db"
+
+DEFAULT_MAX_AGE_HOURS = 24
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    player_id TEXT PRIMARY KEY,
+    full_name_norm TEXT,
+    first_name_norm TEXT,
+    last_name_norm TEXT,
+    team TEXT,
+    position TEXT,
+    yahoo_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_players_full_name ON players(full_name_norm);
+CREATE INDEX IF NOT EXISTS idx_players_first_name ON players(first_name_norm);
+CREATE INDEX IF NOT EXISTS idx_players_last_name ON players(last_name_norm);
+CREATE INDEX IF NOT EXISTS idx_players_team_position ON players(team, position);
+CREATE INDEX IF NOT EXISTS idx_players_position ON players(position);
+CREATE INDEX IF NOT EXISTS idx_players_yahoo_id ON players(yahoo_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def normalize_text(value: Any) -> str:
+    """Lowercase and strip punctuation so 'D'Andre Swift' and 'dandre swift' match."""
+    if not isinstance(value, str):
+        return ''
+    text = value.lower()
+    for ch in ['.', ',', "'", '"']:
+        text = text.replace(ch, '')
+    return ' '.join(text.replace('-', ' ').split())
+
+
+class SleeperPlayerDB:
+    """SQLite-backed copy of the Sleeper NFL player database."""
+
+    def __init__(self, db_path: Optional[str] = None, max_age_hours: float = DEFAULT_MAX_AGE_HOURS):
+        """
+        Initialize the player database.
+
+        Args:
+            db_path: SQLite file path (default: data_collection/cache/sleeper_players.db,
+                     or the SLEEPER_PLAYER_DB environment variable)
+            max_age_hours: Hours before the next conditional refresh
+        """
+        self.logger = logging.getLogger(__name__)
+        self.db_path = Path(db_path or os.getenv('SLEEPER_PLAYER_DB') or DEFAULT_DB_PATH)
+        self.max_age_seconds = max_age_hours * 3600
+        self._lock = threading.Lock()
+        self._players: Optional[Dict[str, Dict[str, Any]]] = None
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, values: Dict[str, Any]) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [(key, None if value is None else str(value)) for key, value in values.items()]
+        )
+
+    def get_age_seconds(self) -> Optional[float]:
+        """Seconds since the last successful refresh, or None if never fetched."""
+        fetched_at = self._get_meta("fetched_at")
+        return time.time() - float(fetched_at) if fetched_at else None
+
+    def player_count(self) -> int:
+        """Number of players stored."""
+        return self._conn.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+
+    def is_fresh(self) -> bool:
+        """Check whether the stored copy is new enough to skip a refresh."""
+        age = self.get_age_seconds()
+        return age is not None and age < self.max_age_seconds and self.player_count() > 0
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def ensure_fresh(self, session, url: str, force_refresh: bool = False) -> bool:
+        """
+        Refresh the stored players if the copy is older than max_age_hours.
+
+        Args:
+            session: requests.Session used for the download
+            url: Full players/nfl URL
+            force_refresh: Refresh even if the stored copy is fresh
+
+        Returns:
+            True if the stored players changed
+        """
+        with self._lock:
+            if not force_refresh and self.is_fresh():
+                return False
+
+            headers = {}
+            if self.player_count() > 0:
+                etag = self._get_meta("etag")
+                last_modified = self._get_meta("last_modified")
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+
+            try:
+                self.logger.info("Refreshing Sleeper player database (this may take a moment...)")
+                response = session.get(url, headers=headers)
+                if response.status_code == 304:
+                    self.logger.info("Sleeper player database unchanged (304 Not Modified)")
+                    with self._conn:
+                        self._set_meta({"fetched_at": time.time()})
+                    return False
+                response.raise_for_status()
+            except Exception as e:
+                if self.player_count() > 0:
+                    self.logger.warning(f"Sleeper player refresh failed, using stored copy: {e}")
+                    return False
+                raise
+
+            content_hash = hashlib.sha256(response.content).hexdigest()
+            meta = {
+                "fetched_at": time.time(),
+                "etag": response.headers.get('ETag'),
+                "last_modified": response.headers.get('Last-Modified'),
+                "content_hash": content_hash
+            }
+
+            if content_hash == self._get_meta("content_hash") and self.player_count() > 0:
+                self.logger.info("Sleeper player database unchanged (same content hash)")
+                with self._conn:
+                    self._set_meta(meta)
+                return False
+
+            self._replace_players(response.json(), meta)
+            return True
+
+    def _replace_players(self, players: Dict[str, Dict[str, Any]], meta: Dict[str, Any]) -> None:
+        """Replace all stored players in a single transaction."""
+        rows = []
+        for player_id, player in players.items():
+            if not isinstance(player, dict):
+                continue
+            yahoo_id = player.get('yahoo_id')
+            rows.append((
+                str(player_id),
+                normalize_text(player.get('full_name')),
+                normalize_text(player.get('first_name')),
+                normalize_text(player.get('last_name')),
+                (player.get('team') or '').upper() or None,
+                (player.get('position') or '').upper() or None,
+                str(yahoo_id) if yahoo_id not in (None, '') else None,
+                json.dumps(player, separators=(',', ':'))
+            ))
+
+        with self._conn:
+            self._conn.execute("DELETE FROM players")
+            self._conn.executemany("INSERT INTO players VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._set_meta(meta)
+
+        self._players = None
+        self.logger.info(f"Stored {len(rows)} Sleeper players in {self.db_path}")
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        return [json.loads(row["data"]) for row in self._conn.execute(sql, params)]
+
+    def get_all_players(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get every stored player keyed by player_id.
+
+        The dict is built once per process and reused until the next refresh.
+        """
+        with self._lock:
+            if self._players is None:
+                self._players = {
+                    row["player_id"]: json.loads(row["data"])
+                    for row in self._conn.execute("SELECT player_id, data FROM players")
+                }
+            return self._players
+
+    def get_player(self, player_id: str) -> Optional[Dict[str, Any]]:
+        """Get a player by Sleeper player_id."""
+        rows = self._query("SELECT data FROM players WHERE player_id = ?", (str(player_id),))
+        return rows[0] if rows else None
+
+    def get_player_by_yahoo_id(self, yahoo_id: Any) -> Optional[Dict[str, Any]]:
+        """Get a player by Yahoo player_id."""
+        rows = self._query("SELECT data FROM players WHERE yahoo_id = ?", (str(yahoo_id),))
+        return rows[0] if rows else None
+
+    def search_by_name(self, name: str, position: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Find players whose full, first or last name starts with the given name.
+
+        Args:
+            name: Player name (first, last, or full name)
+            position: Optional position filter
+
+        Returns:
+            List of matching players
+        """
+        prefix = normalize_text(name)
+        if not prefix:
+            return []
+        upper = prefix + '\uffff'
+
+        # Range conditions on each name column so SQLite can use the name indexes
+        sql = ("SELECT data FROM players WHERE "
+               "((full_name_norm >= ? AND full_name_norm < ?) OR "
+               "(first_name_norm >= ? AND first_name_norm < ?) OR "
+               "(last_name_norm >= ? AND last_name_norm < ?))")
+        params = [prefix, upper, prefix, upper, prefix, upper]
+        if position:
+            sql += " AND position = ?"
+            params.append(position.upper())
+        return self._query(sql, tuple(params))
+
+    def get_by_team(self, team: str, position: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get players on a team, optionally filtered by position."""
+        if position:
+            return self._query("SELECT data FROM players WHERE team = ? AND position = ?",
+                               (team.upper(), position.upper()))
+        return self._query("SELECT data FROM players WHERE team = ?", (team.upper(),))
+
+    def get_by_position(self, position: str) -> List[Dict[str, Any]]:
+        """Get players at a position."""
+        return self._query("SELECT data FROM players WHERE position = ?", (position.upper(),))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -28,18 +28,28 @@ import json
 from datetime import datetime
 from dotenv import load_dotenv
 
+try:
+    from .response_cache import (ResponseCache, TANK01_ENDPOINT_TTLS, CACHE_FRESH, CACHE_STALE,
+                                 is_cacheable_tank01_response)
+except ImportError:
+    from response_cache import (ResponseCache, TANK01_ENDPOINT_TTLS, CACHE_FRESH, CACHE_STALE,
+                                is_cacheable_tank01_response)
+
 # Load environment variables
 load_dotenv()
 
 class Tank01Client:
     """Client for interacting with the Tank01 NFL API via RapidAPI."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, use_cache: bool = True, cache_dir: Optional[str] = None):
         """
         Initialize the Tank01 API client.
         
         Args:
             api_key: RapidAPI key (if not provided, will look in environment)
+            use_cache: Whether to use the shared on-disk response cache
+                       (can also be disabled with TANK01_CACHE_DISABLED=1)
+            cache_dir: Optional root directory for the response cache
         """
         self.api_key = api_key or os.getenv('RAPIDAPI_KEY')
         if not self.api_key:
@@ -84,10 +94,69 @@ class Tank01Client:
             'reset_timestamp': None,
             'last_updated': None
         }
+        
+        # Shared on-disk response cache (one download per endpoint/params per TTL)
+        cache_disabled = os.getenv('TANK01_CACHE_DISABLED', '').lower() in ('1', 'true', 'yes')
+        self.cache = None
+        if use_cache and not cache_disabled:
+            try:
+                self.cache = ResponseCache("tank01", cache_dir=cache_dir, endpoint_ttls=TANK01_ENDPOINT_TTLS)
+            except OSError as e:
+                self.logger.warning(f"Tank01 response cache unavailable, continuing without it: {e}")
+    
+    def _make_request(self, endpoint: str, params: Optional[Dict] = None, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Make a request to the Tank01 API via RapidAPI, served from the response cache when possible.
+        
+        Fresh cache entries are returned without an API call. Stale entries are
+        returned immediately and refreshed in the background. If the monthly limit
+        is reached or the request fails, any cached copy is used as a fallback.
+        
+        Args:
+            endpoint: API endpoint (without base URL)
+            params: Optional query parameters
+            use_cache: Set False to bypass the cache and force a fresh API call
+            
+        Returns:
+            Dict containing the API response data
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails and no cached copy exists
+        """
+        if not (use_cache and self.cache and self.cache.is_cacheable(endpoint)):
+            return self._fetch(endpoint, params)
+        
+        cached, state = self.cache.lookup(endpoint, params)
+        if state == CACHE_FRESH:
+            self.logger.info(f"Tank01 cache hit: {endpoint}")
+            return cached
+        if state == CACHE_STALE:
+            self.logger.info(f"Tank01 cache stale hit, revalidating in background: {endpoint}")
+            self.cache.revalidate_async(endpoint, params, lambda: self._fetch(endpoint, params),
+                                        is_cacheable=self._is_cacheable_response)
+            return cached
+        
+        try:
+            data = self._fetch(endpoint, params)
+        except Exception:
+            fallback = self.cache.get_any(endpoint, params)
+            if fallback is not None:
+                self.logger.warning(f"Tank01 request failed, serving expired cache entry for {endpoint}")
+                return fallback
+            raise
+        
+        if self._is_cacheable_response(data):
+            self.cache.store(endpoint, params, data)
+        return data
     
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+    @staticmethod
+    def _is_cacheable_response(data: Any) -> bool:
+        """Only cache successful Tank01 payloads (statusCode 200 with a body)."""
+        return is_cacheable_tank01_response(data)
+    
+    def _fetch(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """
-        Make a request to the Tank01 API via RapidAPI.
+        Make an uncached request to the Tank01 API via RapidAPI.
         
         Args:
             endpoint: API endpoint (without base URL)
@@ -595,6 +664,64 @@ class Tank01Client:
             self.logger.error(f"Failed to get game info for {game_id}: {e}")
             return {}
     
+    def get_box_score(self, game_id: str) -> Dict[str, Any]:
+        """
+        Get the box score for a game, with stats for every player who played.
+        
+        Args:
+            game_id: Game ID (e.g., "20250907_ARI@NO")
+            
+        Returns:
+            Dict containing the box score (body.playerStats keyed by playerID)
+        """
+        try:
+            self.logger.info(f"Fetching box score for {game_id}")
+            
+            params = {
+                "gameID": game_id,
+                "playByPlay": "false",
+                "fantasyPoints": "true"
+            }
+            
+            data = self._make_request("getNFLBoxScore", params)
+            
+            self.logger.info(f"Box score retrieved for {game_id}")
+            return data
+            
+        except Exception as e:
+            self.logger.error(f"Failed to get box score for {game_id}: {e}")
+            return {}
+    
+    def get_games_for_week(self, week: int, season: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get the NFL schedule for a regular season week.
+        
+        Args:
+            week: Week number
+            season: Optional season year (current season if not specified)
+            
+        Returns:
+            Dict containing the week's games (gameID, home, away, gameDate)
+        """
+        try:
+            self.logger.info(f"Fetching NFL games for week {week}")
+            
+            params = {
+                "week": week,
+                "seasonType": "reg"
+            }
+            if season:
+                params["season"] = season
+            
+            data = self._make_request("getNFLGamesForWeek", params)
+            
+            self.logger.info(f"NFL games retrieved for week {week}")
+            return data
+            
+        except Exception as e:
+            self.logger.error(f"Failed to get NFL games for week {week}: {e}")
+            return {}
+    
     def save_debug_data(self, data: Any, filename: str) -> None:
         """
         Save data to a debug file for inspection.
@@ -611,6 +738,19 @@ class Tank01Client:
         except Exception as e:
             self.logger.error(f"Failed to save debug data: {e}")
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get response cache hit/miss counters for this session.
+        
+        Returns:
+            Dict with cache statistics (enabled=False if caching is off)
+        """
+        if not self.cache:
+            return {"enabled": False}
+        stats = self.cache.get_stats()
+        stats["enabled"] = True
+        return stats
+    
     def get_usage_info(self) -> Dict[str, Any]:
         """
         Get current API usage information from RapidAPI headers (authoritative source).
@@ -632,7 +772,8 @@ class Tank01Client:
                 "percentage_used": (calls_made / self.rapidapi_usage['limit']) * 100,
                 "reset_timestamp": self.rapidapi_usage['reset_timestamp'],
                 "last_updated": self.rapidapi_usage['last_updated'],
-                "data_source": "rapidapi_headers"
+                "data_source": "rapidapi_headers",
+                "cache": self.get_cache_stats()
             }
         else:
             # Fallback to client-side tracking if no RapidAPI data available
@@ -643,7 +784,8 @@ class Tank01Client:
                 "percentage_used": (self.api_calls_made / self.monthly_limit) * 100,
                 "reset_timestamp": None,
                 "last_updated": None,
-                "data_source": "client_side_tracking"
+                "data_source": "client_side_tracking",
+                "cache": self.get_cache_stats()
             }
 
 
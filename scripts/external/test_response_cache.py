@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test Tank01 Response Cache
+
+Offline checks for the on-disk response cache used by Tank01Client.
+No API calls are made - the network fetch is replaced with a counter.
+"""
+
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+# Add this directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from response_cache import ResponseCache, CACHE_FRESH, CACHE_STALE, CACHE_MISS
+from tank01_client import Tank01Client
+
+
+def test_cache_key_ignores_param_order():
+    """Equivalent parameter sets should share one cache entry."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache("test", cache_dir=tmp)
+        key_a = cache.make_key("getNFLProjections", {"week": 3, "archiveSeason": 2025})
+        key_b = cache.make_key("/getNFLProjections", {"archiveSeason": "2025", "week": "3"})
+        assert key_a == key_b
+
+
+def test_fresh_stale_and_expired_states():
+    """Entries move from fresh to stale to expired as they age."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache("test", cache_dir=tmp, endpoint_ttls={"getNFLTeams": 0.2}, stale_factor=1.0)
+        assert cache.lookup("getNFLTeams")[1] == CACHE_MISS
+
+        cache.store("getNFLTeams", None, {"statusCode": 200, "body": ["BUF"]})
+        data, state = cache.lookup("getNFLTeams")
+        assert state == CACHE_FRESH and data["body"] == ["BUF"]
+
+        time.sleep(0.25)
+        assert cache.lookup("getNFLTeams")[1] == CACHE_STALE
+
+        time.sleep(0.2)
+        assert cache.lookup("getNFLTeams")[1] == CACHE_MISS
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1 and stats["stale_hits"] == 1 and stats["misses"] == 2
+
+
+def test_client_makes_each_bulk_call_once():
+    """Two clients sharing a cache directory download the player list once."""
+    with tempfile.TemporaryDirectory() as tmp:
+        calls = []
+
+        def fake_fetch(endpoint, params=None):
+            calls.append(endpoint)
+            return {"statusCode": 200, "body": [{"playerID": "1"}]}
+
+        for _ in range(2):
+            client = Tank01Client(api_key="test-key", cache_dir=tmp)
+            client._fetch = fake_fetch
+            assert client.get_player_list()["body"][0]["playerID"] == "1"
+
+        assert calls == ["getNFLPlayerList"]
+        assert client.get_cache_stats()["hits"] == 1
+
+
+def test_live_endpoints_are_not_cached():
+    """Live scoreboard requests always hit the API."""
+    with tempfile.TemporaryDirectory() as tmp:
+        calls = []
+        client = Tank01Client(api_key="test-key", cache_dir=tmp)
+        client._fetch = lambda endpoint, params=None: calls.append(endpoint) or {"statusCode": 200, "body": {}}
+
+        client.get_daily_scoreboard("20250907")
+        client.get_daily_scoreboard("20250907")
+        assert len(calls) == 2
+
+
+def test_failed_revalidation_keeps_stale_entry():
+    """An error payload from a background refresh does not overwrite the cached response."""
+    with tempfile.TemporaryDirectory() as tmp:
+        client = Tank01Client(api_key="test-key", cache_dir=tmp)
+        client.cache = ResponseCache("tank01", cache_dir=tmp, endpoint_ttls={"getNFLTeams": 0.1})
+        client.cache.store("getNFLTeams", None, {"statusCode": 200, "body": ["BUF"]})
+        time.sleep(0.15)
+
+        client._fetch = lambda endpoint, params=None: {"statusCode": 500, "body": "Internal Server Error"}
+        assert client._make_request("getNFLTeams")["body"] == ["BUF"]
+        client.cache.wait_for_revalidations()
+
+        assert client.cache.get_any("getNFLTeams")["body"] == ["BUF"]
+        assert client.cache.get_stats()["revalidation_errors"] == 1
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Tank01 Response Cache")
+    print("=" * 40)
+    for test in (test_cache_key_ignores_param_order, test_fresh_stale_and_expired_states,
+                 test_client_makes_each_bulk_call_once, test_live_endpoints_are_not_cached,
+                 test_failed_revalidation_keeps_stale_entry):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test Sleeper Player Database
+
+Offline checks for the persistent SQLite copy of the Sleeper player database.
+No API calls are made - the HTTP session is replaced with a stub.
+"""
+
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add this directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sleeper_player_db import SleeperPlayerDB
+from sleeper_client import SleeperClient
+
+PLAYERS = {
+    "4984": {"player_id": "4984", "full_name": "Josh Allen", "first_name": "Josh", "last_name": "Allen",
+             "team": "BUF", "position": "QB", "yahoo_id": 30977},
+    "3163": {"player_id": "3163", "full_name": "Josh Allen", "first_name": "Josh", "last_name": "Allen",
+             "team": "JAX", "position": "LB"},
+    "6803": {"player_id": "6803", "full_name": "D'Andre Swift", "first_name": "D'Andre", "last_name": "Swift",
+             "team": "CHI", "position": "RB"},
+}
+
+
+class StubResponse:
+    def __init__(self, status_code, payload=None, headers=None):
+        self.status_code = status_code
+        self.content = json.dumps(payload or {}).encode()
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class StubSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, params=None):
+        self.requests.append(headers or {})
+        return self.responses.pop(0)
+
+
+def test_refresh_once_and_index_lookups():
+    """One download fills the database; lookups are served from the indexes."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = SleeperPlayerDB(str(Path(tmp) / "players.db"))
+        session = StubSession([StubResponse(200, PLAYERS, {"ETag": "v1"})])
+
+        assert db.ensure_fresh(session, "https://example/players/nfl")
+        assert not db.ensure_fresh(session, "https://example/players/nfl")
+        assert len(session.requests) == 1
+
+        assert {p["player_id"] for p in db.search_by_name("Josh Allen")} == {"4984", "3163"}
+        assert [p["player_id"] for p in db.search_by_name("allen", "QB")] == ["4984"]
+        assert [p["player_id"] for p in db.search_by_name("dandre")] == ["6803"]
+        assert [p["player_id"] for p in db.get_by_team("buf")] == ["4984"]
+        assert db.get_player_by_yahoo_id("30977")["player_id"] == "4984"
+
+
+def test_conditional_refresh_keeps_data():
+    """A stale copy is revalidated with If-None-Match and kept on 304."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "players.db")
+        db = SleeperPlayerDB(path, max_age_hours=0)
+        db.ensure_fresh(StubSession([StubResponse(200, PLAYERS, {"ETag": "v1"})]), "https://example/players/nfl")
+
+        session = StubSession([StubResponse(304)])
+        assert not db.ensure_fresh(session, "https://example/players/nfl")
+        assert session.requests[0].get("If-None-Match") == "v1"
+        assert db.player_count() == 3
+
+
+def test_client_shares_database_between_instances():
+    """Two clients (separate scripts) download the player list once."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "players.db")
+        first = SleeperClient(player_db_path=path)
+        first.session = StubSession([StubResponse(200, PLAYERS)])
+        assert len(first.get_nfl_players()) == 3
+
+        second = SleeperClient(player_db_path=path)
+        second.session = StubSession([])
+        assert len(second.get_nfl_players()) == 3
+        assert [p["player_id"] for p in second.get_players_by_position("RB")] == ["6803"]
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Sleeper Player Database")
+    print("=" * 40)
+    for test in (test_refresh_once_and_index_lookups, test_conditional_refresh_keeps_data,
+                 test_client_shares_database_between_instances):
+        test()
+        print(f"✅ {test.__name__}")
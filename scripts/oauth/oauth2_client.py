@@ -7,8 +7,12 @@ Uses Authorization Code Grant flow as per Yahoo's OAuth 2.0 documentation
 import os
 import json
 import time
+import random
+import tempfile
+import threading
 import webbrowser
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlencode, parse_qs
 from typing import Dict, Optional, Tuple
 import logging
@@ -18,6 +22,16 @@ from dotenv import load_dotenv
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Request retry settings
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 8.0
+REQUEST_TIMEOUT_SECONDS = 30
+
+# Refresh the access token this many seconds before it expires
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
 class YahooOAuth2Client:
     """OAuth 2.0 client for Yahoo APIs using Authorization Code Grant flow"""
     
@@ -43,6 +57,18 @@ class YahooOAuth2Client:
         self.expires_at = None
         self.scope = None
         
+        # Token refresh must happen once even with several threads making requests
+        self._token_lock = threading.RLock()
+        
+        # Pooled keep-alive session shared by all API calls
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            'User-Agent': 'FantasyFootballApp/1.0',
+            'Accept': 'application/json'
+        })
+        
         # Ensure config directory exists
         os.makedirs(os.path.dirname(self.tokens_file), exist_ok=True)
         
@@ -81,25 +107,41 @@ class YahooOAuth2Client:
                 'created_at': int(time.time())
             }
             
-            with open(self.tokens_file, 'w') as f:
+            # Write atomically so concurrent collection scripts never read a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.tokens_file), suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
                 json.dump(tokens, f, indent=2)
+            os.replace(tmp_path, self.tokens_file)
             
             logger.info("OAuth 2.0 tokens saved successfully")
             
         except Exception as e:
             logger.error(f"Error saving tokens: {e}")
     
+    def _token_expiring(self) -> bool:
+        """Check if the access token expires within the refresh margin"""
+        return bool(self.expires_at) and time.time() > (self.expires_at - TOKEN_REFRESH_MARGIN_SECONDS)
+    
     def is_authenticated(self) -> bool:
-        """Check if we have valid access tokens"""
+        """Check if we have valid access tokens, refreshing them before they expire"""
         if not self.access_token:
             return False
         
-        # Check if token is expired (with 5 minute buffer)
-        if self.expires_at and time.time() > (self.expires_at - 300):
-            logger.info("Access token expired, attempting refresh")
-            return self.refresh_access_token()
+        if not self._token_expiring():
+            return True
         
-        return True
+        with self._token_lock:
+            # Another thread may have refreshed while we waited for the lock
+            if not self._token_expiring():
+                return True
+            
+            # Another process may have refreshed and saved newer tokens
+            self._load_tokens()
+            if self.access_token and not self._token_expiring():
+                return True
+            
+            logger.info("Access token expiring, attempting refresh")
+            return self.refresh_access_token()
     
     def get_authorization_url(self) -> str:
         """Generate the authorization URL for OAuth 2.0 flow"""
@@ -211,8 +253,22 @@ class YahooOAuth2Client:
             logger.error(f"Error exchanging code for tokens: {e}")
             return False
     
-    def refresh_access_token(self) -> bool:
-        """Refresh the access token using refresh token"""
+    def refresh_access_token(self, stale_token: Optional[str] = None) -> bool:
+        """
+        Refresh the access token using refresh token
+        
+        Args:
+            stale_token: Access token that was rejected. If another caller has
+                already replaced it, the refresh is skipped.
+        """
+        with self._token_lock:
+            if stale_token and self.access_token and self.access_token != stale_token:
+                logger.info("Access token already refreshed by another caller")
+                return True
+            return self._refresh_access_token()
+    
+    def _refresh_access_token(self) -> bool:
+        """Refresh the access token (caller holds the token lock)"""
         if not self.refresh_token:
             logger.error("No refresh token available")
             return False
@@ -233,7 +289,8 @@ class YahooOAuth2Client:
                 'User-Agent': 'FantasyFootballApp/1.0'
             }
             
-            response = requests.post(self.token_url, data=data, headers=headers)
+            response = self.session.post(self.token_url, data=data, headers=headers,
+                                         timeout=REQUEST_TIMEOUT_SECONDS)
             
             if response.status_code == 200:
                 token_data = response.json()
@@ -267,72 +324,111 @@ class YahooOAuth2Client:
         
         return f"{self.token_type} {self.access_token}"
     
+    def _backoff_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Jittered exponential backoff, honoring Retry-After when Yahoo sends it"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), BACKOFF_MAX_SECONDS)
+        
+        return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt)))
+    
     def make_request(self, endpoint: str, method: str = 'GET', params: Dict[str, str] = None) -> Optional[Dict]:
-        """Make an authenticated request to Yahoo Fantasy Sports API"""
+        """
+        Make an authenticated request to Yahoo Fantasy Sports API
+        
+        Requests share one keep-alive session. 429 and 5xx responses and
+        connection errors are retried up to MAX_RETRIES times with jittered
+        backoff, and a 401 triggers a single token refresh and retry.
+        """
         if not self.is_authenticated():
             logger.error("Not authenticated")
             return None
         
-        try:
-            # Build the full URL
-            base_url = "https://fantasysports.yahooapis.com/fantasy/v2"
-            url = f"{base_url}/{endpoint}"
-            
-            # Add JSON format parameter
-            if params is None:
-                params = {}
-            params['format'] = 'json'
-            
-            # Build headers
-            headers = {
-                'Authorization': self.get_authorization_header(),
-                'User-Agent': 'FantasyFootballApp/1.0',
-                'Accept': 'application/json'
-            }
-            
-            # Make the request
-            if method.upper() == 'GET':
-                response = requests.get(url, params=params, headers=headers)
-            elif method.upper() == 'POST':
-                response = requests.post(url, data=params, headers=headers)
-            else:
-                logger.error(f"Unsupported HTTP method: {method}")
-                return None
-            
-            # Log the API call
-            logger.info(f"API call: {url} - {response.status_code} - {response.elapsed.total_seconds():.2f}s")
-            
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    return {
-                        'status': 'success',
-                        'data': response.text,
-                        'parsed': data
-                    }
-                except json.JSONDecodeError:
-                    return {
-                        'status': 'success',
-                        'data': response.text,
-                        'parsed': None
-                    }
-            
-            elif response.status_code == 401:
-                logger.warning("Access token expired, attempting refresh")
-                if self.refresh_access_token():
-                    # Retry the request once after refresh
-                    return self.make_request(endpoint, method, params)
+        method = method.upper()
+        if method not in ('GET', 'POST'):
+            logger.error(f"Unsupported HTTP method: {method}")
+            return None
+        
+        # Build the full URL
+        base_url = "https://fantasysports.yahooapis.com/fantasy/v2"
+        url = f"{base_url}/{endpoint}"
+        
+        # Add JSON format parameter
+        params = dict(params or {})
+        params['format'] = 'json'
+        
+        refreshed = False
+        attempt = 0
+        
+        while True:
+            try:
+                # Check expiry on every attempt so long paging runs never stall on a stale token
+                if not self.is_authenticated():
+                    logger.error("Not authenticated")
+                    return None
+                
+                access_token = self.access_token
+                headers = {'Authorization': self.get_authorization_header()}
+                
+                # Make the request
+                if method == 'GET':
+                    response = self.session.get(url, params=params, headers=headers,
+                                                timeout=REQUEST_TIMEOUT_SECONDS)
+                else:
+                    response = self.session.post(url, data=params, headers=headers,
+                                                 timeout=REQUEST_TIMEOUT_SECONDS)
+                
+                # Log the API call
+                logger.info(f"API call: {url} - {response.status_code} - {response.elapsed.total_seconds():.2f}s")
+                
+                if response.status_code == 200:
+                    try:
+                        data = response.json()
+                        return {
+                            'status': 'success',
+                            'data': response.text,
+                            'parsed': data
+                        }
+                    except json.JSONDecodeError:
+                        return {
+                            'status': 'success',
+                            'data': response.text,
+                            'parsed': None
+                        }
+                
+                elif response.status_code == 401 and not refreshed:
+                    logger.warning("Access token rejected, attempting refresh")
+                    refreshed = True
+                    if not self.refresh_access_token(stale_token=access_token):
+                        logger.error("Failed to refresh access token")
+                        return None
+                    continue
+                
+                elif response.status_code in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+                    delay = self._backoff_delay(attempt, response)
+                    attempt += 1
+                    logger.warning(f"API request returned {response.status_code}, "
+                                   f"retry {attempt}/{MAX_RETRIES} in {delay:.2f}s")
+                    time.sleep(delay)
+                    continue
+                
                 else:
-                    logger.error("Failed to refresh access token")
+                    logger.error(f"API request failed: {response.status_code} - {response.text}")
                     return None
             
-            else:
-                logger.error(f"API request failed: {response.status_code} - {response.text}")
-                return None
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt >= MAX_RETRIES:
+                    logger.error(f"Error making API request: {e}")
+                    return None
+                delay = self._backoff_delay(attempt)
+                attempt += 1
+                logger.warning(f"API request error ({e}), retry {attempt}/{MAX_RETRIES} in {delay:.2f}s")
+                time.sleep(delay)
                 
-        except Exception as e:
-            logger.error(f"Error making API request: {e}")
-            return None
+            except Exception as e:
+                logger.error(f"Error making API request: {e}")
+                return None
 
 def main():
     """Test the OAuth 2.0 client"""
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test Lineup Optimizer
+Offline checks for exact lineup selection with FLEX/SUPERFLEX slots
+"""
+
+import sys
+import time
+import random
+import tempfile
+import unittest
+import itertools
+from pathlib import Path
+
+import numpy as np
+
+# Add core scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+
+from lineup_optimizer import LineupOptimizer, solve_assignment
+from matchup_analyzer import load_roster_positions
+from file_utils import DataFileManager
+
+SUPERFLEX_LEAGUE = [
+    {'roster_position': {'position': 'QB', 'count': 1}},
+    {'roster_position': {'position': 'RB', 'count': 2}},
+    {'roster_position': {'position': 'WR', 'count': 2}},
+    {'roster_position': {'position': 'TE', 'count': 1}},
+    {'roster_position': {'position': 'W/R/T', 'count': 1}},
+    {'roster_position': {'position': 'Q/W/R/T', 'count': 1}},
+    {'roster_position': {'position': 'BN', 'count': 6}}
+]
+
+
+def player(name, position, points, std=None):
+    return {'name': name, 'position': position, 'projected_points': points, 'projection_std': std}
+
+
+def test_assignment_matches_brute_force():
+    """The Hungarian solver finds the true minimum on random matrices."""
+    rng = np.random.default_rng(7)
+    for _ in range(200):
+        rows = int(rng.integers(1, 5))
+        cost = rng.normal(size=(rows, int(rng.integers(rows, 7))))
+        assignment = solve_assignment(cost)
+        best = min(sum(cost[i, p[i]] for i in range(rows))
+                   for p in itertools.permutations(range(cost.shape[1]), rows))
+        assert abs(cost[np.arange(rows), assignment].sum() - best) < 1e-9
+
+
+def test_superflex_uses_second_qb():
+    """A second QB outscoring every spare RB/WR/TE fills SUPERFLEX, not FLEX."""
+    roster = [player('QB1', 'QB', 22), player('QB2', 'QB', 18), player('QB3', 'QB', 3),
+              player('RB1', 'RB', 15), player('RB2', 'RB', 12), player('RB3', 'RB', 9),
+              player('WR1', 'WR', 16), player('WR2', 'WR', 11), player('WR3', 'WR', 10),
+              player('TE1', 'TE', 8), player('TE2', 'TE', 7, None),
+              dict(player('WR4', 'WR', 30), status='O')]
+    lineup = LineupOptimizer(SUPERFLEX_LEAGUE).optimize(roster)
+
+    started = {s['player']['name'] for s in lineup['starters']}
+    assert started == {'QB1', 'QB2', 'RB1', 'RB2', 'WR1', 'WR2', 'WR3', 'TE1'}
+    assert lineup['expected_points'] == 22 + 15 + 12 + 16 + 11 + 8 + 10 + 18
+    assert 'WR4' in [p['name'] for p in lineup['bench']]
+
+
+def test_win_probability_prefers_variance_as_underdog():
+    """A big underdog starts the volatile player; a favorite starts the steady one."""
+    roster = [player('QB1', 'QB', 20, 5), player('RB1', 'RB', 14, 4), player('RB2', 'RB', 13, 4),
+              player('WR1', 'WR', 15, 5), player('WR2', 'WR', 14, 5), player('WR3', 'WR', 12, 5),
+              player('TE1', 'TE', 8, 3), player('K1', 'K', 8, 3), player('DEF1', 'DEF', 7, 4),
+              player('STEADY', 'WR', 11, 1), player('BOOM', 'WR', 10, 12)]
+    optimizer = LineupOptimizer()
+
+    def started(result):
+        return {s['player']['name'] for s in result['starters']}
+
+    underdog = optimizer.optimize(roster, 'win_probability', {'mean': 140, 'std': 15})
+    favorite = optimizer.optimize(roster, 'win_probability', {'mean': 100, 'std': 15})
+    assert 'BOOM' in started(underdog) and 'STEADY' not in started(underdog)
+    assert 'STEADY' in started(favorite) and 'BOOM' not in started(favorite)
+    assert underdog['win_probability'] > optimizer.optimize(roster, opponent={'mean': 140, 'std': 15})['win_probability']
+
+
+def test_full_league_is_fast():
+    """Twelve teams with the win probability objective solve well under a second."""
+    random.seed(3)
+    teams = {}
+    for t in range(12):
+        teams[f"team_{t}"] = [player(f"{pos}{i}", pos, random.uniform(3, 25), random.uniform(2, 9))
+                              for pos, count in (('QB', 2), ('RB', 5), ('WR', 6), ('TE', 2), ('K', 1), ('DEF', 1))
+                              for i in range(count)]
+    matchups = [(f"team_{2 * i}", f"team_{2 * i + 1}") for i in range(6)]
+
+    start = time.perf_counter()
+    results = LineupOptimizer(SUPERFLEX_LEAGUE).optimize_league(teams, matchups, 'win_probability')
+    assert time.perf_counter() - start < 0.5
+    assert all('win_probability' in r for r in results.values())
+
+
+
+def test_roster_positions_from_league_settings():
+    """Slots come from the Yahoo league settings output; without one the default lineup is used with a warning."""
+    with tempfile.TemporaryDirectory() as root:
+        manager = DataFileManager(root)
+        with unittest.TestCase().assertLogs("matchup_analyzer", "WARNING") as logs:
+            assert load_roster_positions(manager) is None
+        assert "No league roster positions found" in logs.output[-1]
+
+        positions = [{'position': p['roster_position']['position'], 'count': p['roster_position']['count']}
+                     for p in SUPERFLEX_LEAGUE]
+        manager.save_raw_data("yahoo", "league_settings", {"roster_positions": positions})
+        assert load_roster_positions(manager) == positions
+        assert LineupOptimizer(load_roster_positions(manager)).slots == LineupOptimizer(SUPERFLEX_LEAGUE).slots
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Lineup Optimizer")
+    print("=" * 40)
+    for test in (test_assignment_matches_brute_force, test_superflex_uses_second_qb,
+                 test_win_probability_prefers_variance_as_underdog, test_full_league_is_fast,
+                 test_roster_positions_from_league_settings):
+        test()
+        print(f"✅ {test.__name__}")
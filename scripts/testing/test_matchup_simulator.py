@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test Matchup Simulator
+Offline checks for the Monte Carlo win probability simulator
+"""
+
+import sys
+import time
+import math
+from pathlib import Path
+
+import numpy as np
+
+# Add core scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+
+from matchup_simulator import MatchupSimulator
+
+
+def player(name, position, team, mean, std, opponent=''):
+    return {'name': name, 'position': position, 'team': team, 'opponent': opponent,
+            'projected_points': mean, 'projection_std': std}
+
+
+def test_matches_normal_approximation():
+    """Independent normal players give the analytic win probability."""
+    ours = [player('A', 'RB', 'DAL', 60, 12)]
+    theirs = [player('B', 'RB', 'MIA', 55, 9)]
+    result = MatchupSimulator(seed=11).simulate(ours, theirs)
+
+    expected = 0.5 * (1 + math.erf(5 / (15 * math.sqrt(2))))
+    assert abs(result['win_probability'] - expected) < 0.01
+    assert abs(result['expected_margin'] - 5) < 0.2
+
+
+def test_stacks_and_defense_correlations():
+    """Same-team QB/WR are positively correlated; a DEF is negatively correlated with the QB it faces."""
+    qb = player('QB', 'QB', 'BUF', 20, 6)
+    wr = player('WR', 'WR', 'BUF', 14, 6)
+    dst = player('DST', 'DEF', 'MIA', 7, 5, opponent='BUF')
+    simulator = MatchupSimulator(seed=5)
+    corr = simulator.build_correlation([qb, wr, dst])
+    assert corr[0, 1] > 0.3
+    assert corr[0, 2] < -0.3
+
+    # A stack widens the team's outcome range
+    stacked = simulator.simulate([qb, wr], [player('X', 'RB', 'SF', 34, 0.1)])
+    unstacked = simulator.simulate([qb, dict(wr, team='KC')], [player('X', 'RB', 'SF', 34, 0.1)])
+    assert stacked['margin_std'] > unstacked['margin_std']
+
+
+def test_game_logs_and_leverage():
+    """Empirical game-log sampling keeps the log's range; the most volatile starter has the most leverage."""
+    boom = dict(player('BOOM', 'WR', 'KC', None, None), game_points=[2, 3, 4, 30, 35, 6])
+    boom.pop('projected_points')
+    steady = player('STEADY', 'RB', 'DET', 12, 1)
+    result = MatchupSimulator(seed=3).simulate([boom, steady], [player('OPP', 'QB', 'PHI', 25, 4)])
+
+    leverage = {p['name']: p for p in result['player_leverage']}
+    assert 2 <= leverage['BOOM']['mean_points'] <= 35
+    assert abs(leverage['BOOM']['leverage']) > abs(leverage['STEADY']['leverage'])
+
+
+def test_full_lineups_under_a_second():
+    """100k simulations of two 10-player lineups finish in under a second."""
+    rng = np.random.default_rng(1)
+    positions = ['QB', 'WR', 'WR', 'WR', 'RB', 'RB', 'TE', 'WR', 'K', 'DEF']
+    teams = ['BUF', 'BUF', 'KC', 'SF', 'DAL', 'MIA', 'DET', 'NYJ', 'GB', 'NE']
+
+    def lineup(prefix):
+        return [dict(player(f"{prefix}{i}", pos, team, None, None), game_points=list(rng.uniform(2, 25, 6)))
+                for i, (pos, team) in enumerate(zip(positions, teams))]
+
+    simulator = MatchupSimulator(seed=2)
+    simulator.simulate(lineup('a'), lineup('b'))  # warm-up (first allocation of the sample arrays)
+    start = time.perf_counter()
+    result = simulator.simulate(lineup('a'), lineup('b'))
+    assert time.perf_counter() - start < 1.0
+    assert result['simulations'] == 100000
+    assert len(result['player_leverage']) == 20
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Matchup Simulator")
+    print("=" * 40)
+    for test in (test_matches_normal_approximation, test_stacks_and_defense_correlations,
+                 test_game_logs_and_leverage, test_full_lineups_under_a_second):
+        test()
+        print(f"✅ {test.__name__}")